@@ -2,7 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 
 from confluent_kafka.schema_registry import AsyncSchemaRegistryClient
 
@@ -11,6 +16,9 @@ from app.registry_connections.domain.repositories import ISchemaRegistryReposito
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_CLIENTS = 32
+DEFAULT_IDLE_TIMEOUT_SECONDS = 600.0
+
 
 class IConnectionManager(ABC):
     @property
@@ -20,6 +28,13 @@ class IConnectionManager(ABC):
     @abstractmethod
     async def get_schema_registry_client(self, registry_id: str) -> AsyncSchemaRegistryClient: ...
 
+    @asynccontextmanager
+    async def borrow_schema_registry_client(
+        self, registry_id: str
+    ) -> AsyncIterator[AsyncSchemaRegistryClient]:
+        """작업이 끝날 때까지 Client를 대여 (대여 중에는 캐시에서 제거돼도 닫히지 않음)"""
+        yield await self.get_schema_registry_client(registry_id)
+
     @abstractmethod
     async def test_schema_registry_connection(self, registry_id: str) -> ConnectionTestResult: ...
 
@@ -27,30 +42,84 @@ class IConnectionManager(ABC):
     def invalidate_cache(self, resource_type: str, resource_id: str) -> None: ...
 
 
+@dataclass(slots=True)
+class _CachedClient:
+    """캐시된 Schema Registry Client 엔트리 (마지막 사용 시각/대여 수 추적)"""
+
+    client: AsyncSchemaRegistryClient
+    last_used_at: float
+    leases: int = 0
+    evicted: bool = False
+
+
 class ConnectionManager(IConnectionManager):
+    """Schema Registry Client 캐시 관리자
+
+    - LRU 순서로 최대 ``max_clients`` 개까지만 유지
+    - ``idle_timeout_seconds`` 동안 사용되지 않은 Client는 제거
+    - 제거/무효화된 Client는 HTTP 세션을 닫아 커넥션 누수를 방지
+    - ``borrow_schema_registry_client`` 로 대여 중인 Client는 유휴 판정에서 제외되고,
+      캐시에서 제거되더라도 마지막 대여자가 반납할 때 닫힌다
+    """
+
     def __init__(
         self,
         schema_registry_repo: ISchemaRegistryRepository,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
     ) -> None:
+        if max_clients < 1:
+            raise ValueError("max_clients must be >= 1")
         self._schema_registry_repo = schema_registry_repo
-        self._schema_registry_clients: dict[str, AsyncSchemaRegistryClient] = {}
+        self._max_clients = max_clients
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._schema_registry_clients: OrderedDict[str, _CachedClient] = OrderedDict()
         self._locks: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
+        self._pending_closes: set[asyncio.Task[None]] = set()
 
     @property
     def schema_registry_repo(self) -> ISchemaRegistryRepository:
         return self._schema_registry_repo
 
+    @property
+    def cached_registry_ids(self) -> list[str]:
+        """LRU 순서(오래된 것 → 최근)의 캐시된 레지스트리 ID 목록"""
+        return list(self._schema_registry_clients)
+
     async def get_schema_registry_client(self, registry_id: str) -> AsyncSchemaRegistryClient:
-        if registry_id in self._schema_registry_clients:
+        entry = await self._acquire(registry_id, lease=False)
+        return entry.client
+
+    @asynccontextmanager
+    async def borrow_schema_registry_client(
+        self, registry_id: str
+    ) -> AsyncIterator[AsyncSchemaRegistryClient]:
+        entry = await self._acquire(registry_id, lease=True)
+        try:
+            yield entry.client
+        finally:
+            entry.leases -= 1
+            entry.last_used_at = time.monotonic()
+            if entry.evicted and entry.leases == 0:
+                await self._close_client(registry_id, entry.client)
+
+    async def _acquire(self, registry_id: str, *, lease: bool) -> _CachedClient:
+        # 대여 수는 await 없이 증가시켜, 반환 직후의 eviction이 Client를 닫지 못하게 한다
+        entry = self._touch(registry_id)
+        if entry is not None:
             logger.debug("Schema Registry Client cache hit: %s", registry_id)
-            return self._schema_registry_clients[registry_id]
+            entry.leases += int(lease)
+            return entry
 
+        # 동일 레지스트리에 대한 동시 최초 요청은 하나의 생성만 수행 (single-flight)
         lock_key = f"schema_{registry_id}"
         lock = self._get_loop_scoped_lock(lock_key)
 
         async with lock:
-            if registry_id in self._schema_registry_clients:
-                return self._schema_registry_clients[registry_id]
+            entry = self._touch(registry_id)
+            if entry is not None:
+                entry.leases += int(lease)
+                return entry
 
             registry = await self.schema_registry_repo.get_by_id(registry_id)
             if not registry:
@@ -59,17 +128,20 @@ class ConnectionManager(IConnectionManager):
                 raise ValueError(f"Schema Registry is inactive: {registry_id}")
 
             logger.info("Creating new Schema Registry Client: %s", registry_id)
-            client = AsyncSchemaRegistryClient(registry.to_client_config())
-            self._schema_registry_clients[registry_id] = client
-            return client
+            entry = _CachedClient(
+                client=AsyncSchemaRegistryClient(registry.to_client_config()),
+                last_used_at=time.monotonic(),
+                leases=int(lease),
+            )
+            self._schema_registry_clients[registry_id] = entry
+            await self._evict_expired(exclude=registry_id)
+            return entry
 
     async def test_schema_registry_connection(self, registry_id: str) -> ConnectionTestResult:
-        import time
-
         try:
             start_time = time.time()
-            client = await self.get_schema_registry_client(registry_id)
-            subjects = await client.get_subjects()
+            async with self.borrow_schema_registry_client(registry_id) as client:
+                subjects = await client.get_subjects()
             latency_ms = (time.time() - start_time) * 1000
 
             return ConnectionTestResult(
@@ -86,19 +158,104 @@ class ConnectionManager(IConnectionManager):
             )
 
     def invalidate_cache(self, resource_type: str, resource_id: str) -> None:
-        if resource_type == "schema_registry" and resource_id in self._schema_registry_clients:
-            del self._schema_registry_clients[resource_id]
-            logger.info("Schema Registry Client cache invalidated: %s", resource_id)
+        if resource_type == "schema_registry":
+            entry = self._schema_registry_clients.pop(resource_id, None)
+            if entry is not None:
+                self._retire(resource_id, entry)
+                logger.info("Schema Registry Client cache invalidated: %s", resource_id)
 
         lock_key = f"{resource_type}_{resource_id}"
         if lock_key in self._locks:
             del self._locks[lock_key]
 
     def clear_all_caches(self) -> None:
+        for registry_id, entry in self._schema_registry_clients.items():
+            self._retire(registry_id, entry)
         self._schema_registry_clients.clear()
         self._locks.clear()
         logger.info("All connection locks cleared")
 
+    async def aclose(self) -> None:
+        """모든 Client를 닫고 캐시를 비움 (애플리케이션 종료 시 호출)"""
+        entries = list(self._schema_registry_clients.items())
+        self._schema_registry_clients.clear()
+        self._locks.clear()
+
+        await asyncio.gather(
+            *(self._close_client(registry_id, entry.client) for registry_id, entry in entries)
+        )
+        if self._pending_closes:
+            await asyncio.gather(*self._pending_closes, return_exceptions=True)
+        logger.info("Schema Registry Clients drained: %d", len(entries))
+
+    def _touch(self, registry_id: str) -> _CachedClient | None:
+        entry = self._schema_registry_clients.get(registry_id)
+        if entry is None:
+            return None
+
+        now = time.monotonic()
+        if self._is_idle(entry, now):
+            # 유휴 시간이 초과된 Client는 재사용하지 않고 새로 생성
+            del self._schema_registry_clients[registry_id]
+            self._retire(registry_id, entry)
+            return None
+
+        entry.last_used_at = now
+        self._schema_registry_clients.move_to_end(registry_id)
+        return entry
+
+    def _is_idle(self, entry: _CachedClient, now: float) -> bool:
+        # 대여 중인 Client는 마지막 조회 시각과 무관하게 사용 중으로 본다
+        return entry.leases == 0 and now - entry.last_used_at > self._idle_timeout_seconds
+
+    async def _evict_expired(self, exclude: str) -> None:
+        now = time.monotonic()
+        evicted: list[tuple[str, _CachedClient]] = []
+
+        for registry_id, entry in list(self._schema_registry_clients.items()):
+            if registry_id == exclude:
+                continue
+            if self._is_idle(entry, now):
+                del self._schema_registry_clients[registry_id]
+                evicted.append((registry_id, entry))
+
+        # 최대 개수 초과 시 가장 오래 사용되지 않은 Client부터 제거
+        while len(self._schema_registry_clients) > self._max_clients:
+            evicted.append(self._schema_registry_clients.popitem(last=False))
+
+        # 대여 중인 Client는 캐시에서만 빼고, 마지막 반납 시점에 닫는다
+        closable = [(registry_id, entry) for registry_id, entry in evicted if entry.leases == 0]
+        for _, entry in evicted:
+            entry.evicted = True
+        if closable:
+            await asyncio.gather(
+                *(self._close_client(registry_id, entry.client) for registry_id, entry in closable)
+            )
+
+    def _retire(self, registry_id: str, entry: _CachedClient) -> None:
+        """캐시에서 제거된 엔트리를 닫음 (대여 중이면 마지막 반납 시점으로 미룸)"""
+        entry.evicted = True
+        if entry.leases == 0:
+            self._schedule_close(registry_id, entry.client)
+
+    def _schedule_close(self, registry_id: str, client: AsyncSchemaRegistryClient) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.debug("No running loop; Schema Registry Client dropped: %s", registry_id)
+            return
+
+        task = loop.create_task(self._close_client(registry_id, client))
+        self._pending_closes.add(task)
+        task.add_done_callback(self._pending_closes.discard)
+
+    async def _close_client(self, registry_id: str, client: AsyncSchemaRegistryClient) -> None:
+        try:
+            await client.aclose()
+            logger.info("Schema Registry Client closed: %s", registry_id)
+        except Exception as e:
+            logger.warning("Failed to close Schema Registry Client %s: %s", registry_id, e)
+
     def _get_loop_scoped_lock(self, key: str) -> asyncio.Lock:
         loop = asyncio.get_running_loop()
         entry = self._locks.get(key)
@@ -110,3 +267,11 @@ class ConnectionManager(IConnectionManager):
         lock = asyncio.Lock()
         self._locks[key] = (loop, lock)
         return lock
+
+
+async def connection_manager_lifespan(
+    connection_manager: ConnectionManager,
+) -> AsyncIterator[ConnectionManager]:
+    """DI Resource: 컨테이너 종료(shutdown_resources) 시 Client 캐시를 정리"""
+    yield connection_manager
+    await connection_manager.aclose()
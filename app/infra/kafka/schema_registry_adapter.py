@@ -23,14 +23,18 @@ from app.schema.domain.models import (
 from app.schema.domain.repositories.interfaces import ISchemaRegistryRepository
 from app.schema.infrastructure.error_handlers import handle_schema_registry_error
 from app.shared.logging_config import get_logger
+from app.shared.metrics import observe_schema_registry_call
+from app.shared.tracing import traced_class
 
 logger = get_logger(__name__)
 
 
+@traced_class("adapter")
 class ConfluentSchemaRegistryAdapter(ISchemaRegistryRepository):
     def __init__(self, client: AsyncSchemaRegistryClient) -> None:
         self.client: AsyncSchemaRegistryClient = client
 
+    @observe_schema_registry_call("describe_subjects")
     async def describe_subjects(self, subjects: Iterable[SubjectName]) -> DescribeResult:
         subject_list: list[SubjectName] = list(subjects)
         result: DescribeResult = {}
@@ -58,6 +62,7 @@ class ConfluentSchemaRegistryAdapter(ISchemaRegistryRepository):
 
         return result
 
+    @observe_schema_registry_call("check_compatibility")
     async def check_compatibility(
         self,
         spec: DomainSchemaSpec,
@@ -89,7 +94,7 @@ class ConfluentSchemaRegistryAdapter(ISchemaRegistryRepository):
                 issues=(),
             )
         except SchemaRegistryError as e:
-            logger.warning(f"Compatibility check failed for {spec.subject}: {e}")
+            logger.warning("compatibility_check_failed", subject=spec.subject, error_message=str(e))
             issue = DomainSchemaCompatibilityIssue(
                 path="$",
                 message=str(e),
@@ -102,6 +107,7 @@ class ConfluentSchemaRegistryAdapter(ISchemaRegistryRepository):
                 issues=(issue,),
             )
 
+    @observe_schema_registry_call("check_compatibility_batch")
     async def check_compatibility_batch(self, specs: list[DomainSchemaSpec]) -> CompatibilityResult:
         tasks = [
             self.check_compatibility(
@@ -121,7 +127,9 @@ class ConfluentSchemaRegistryAdapter(ISchemaRegistryRepository):
         compatibility_result: CompatibilityResult = {}
         for spec, result in zip(specs, results, strict=True):
             if isinstance(result, Exception):
-                logger.error(f"Compatibility check failed for {spec.subject}: {result}")
+                logger.error(
+                    "compatibility_check_failed", subject=spec.subject, error_message=str(result)
+                )
                 issue = DomainSchemaCompatibilityIssue(
                     path="$",
                     message=str(result),
@@ -138,6 +146,7 @@ class ConfluentSchemaRegistryAdapter(ISchemaRegistryRepository):
 
         return compatibility_result
 
+    @observe_schema_registry_call("register_schema")
     async def register_schema(
         self, spec: DomainSchemaSpec, compatibility: bool = True
     ) -> tuple[int, int]:
@@ -171,44 +180,52 @@ class ConfluentSchemaRegistryAdapter(ISchemaRegistryRepository):
             latest_version = await self._get_latest_schema_version_info(spec.subject)
             if latest_version.version is not None:
                 logger.info(
-                    f"Schema registered: {spec.subject} v{latest_version.version} (ID: {schema_id})"
+                    "schema_registered",
+                    subject=spec.subject,
+                    version=latest_version.version,
+                    schema_id=schema_id,
                 )
                 return (latest_version.version, schema_id)
 
-            logger.warning(f"Could not retrieve version for registered schema {spec.subject}")
+            logger.warning("registered_schema_version_unavailable", subject=spec.subject)
             return (1, schema_id)
         except SchemaRegistryError as exc:
             self._raise_schema_registry_runtime_error("Schema registration", exc, spec.subject)
 
+    @observe_schema_registry_call("delete_subject")
     async def delete_subject(self, subject: SubjectName) -> None:
         try:
             deleted_versions: list[int] = await self.client.delete_subject(subject)
-            logger.info(f"Subject deleted: {subject} ({len(deleted_versions)} versions)")
+            logger.info("subject_deleted", subject=subject, versions=len(deleted_versions))
         except SchemaRegistryError as exc:
             self._raise_schema_registry_runtime_error("Delete subject", exc, subject)
 
+    @observe_schema_registry_call("delete_version")
     async def delete_version(self, subject: SubjectName, version: int) -> None:
         try:
             deleted_version = await self.client.delete_version(subject, version)
-            logger.info(f"Schema version deleted: {subject} v{deleted_version}")
+            logger.info("schema_version_deleted", subject=subject, version=deleted_version)
         except SchemaRegistryError as exc:
             self._raise_schema_registry_runtime_error(
                 "Delete schema version", exc, f"{subject} v{version}"
             )
 
+    @observe_schema_registry_call("list_all_subjects")
     async def list_all_subjects(self) -> list[SubjectName]:
         try:
             subjects: list[str] = await self.client.get_subjects()
-            logger.info(f"Retrieved {len(subjects)} subjects from Schema Registry")
+            logger.info("subjects_listed", count=len(subjects))
             return subjects
         except SchemaRegistryError as exc:
             self._raise_schema_registry_runtime_error("List all subjects", exc)
 
+    @observe_schema_registry_call("get_schema_versions")
     @handle_schema_registry_error("Get schema versions")
     async def get_schema_versions(self, subject: SubjectName) -> list[int]:
         versions = await self.client.get_versions(subject)
         return sorted(versions)
 
+    @observe_schema_registry_call("get_schema_by_version")
     @handle_schema_registry_error(
         "Get schema by version",
         lambda self, subject, version: f"{subject} v{version}",
@@ -233,12 +250,35 @@ class ConfluentSchemaRegistryAdapter(ISchemaRegistryRepository):
 
         raise RuntimeError(f"Schema not found for {subject} version {version}")
 
+    @observe_schema_registry_call("get_latest_schema")
+    @handle_schema_registry_error("Get latest schema")
+    async def get_latest_schema(self, subject: SubjectName) -> SchemaVersionInfo:
+        # versions/latest 한 번으로 조회 (versions 목록 + 버전 조회 2회 왕복 대신)
+        schema_version = await self.client.get_latest_version(subject)
+        if not schema_version or not schema_version.schema:
+            raise RuntimeError(f"Schema not found for {subject}")
+
+        schema_str = schema_version.schema.schema_str or ""
+        return SchemaVersionInfo(
+            version=schema_version.version,
+            schema_id=schema_version.schema_id,
+            schema=schema_str,
+            schema_type=schema_version.schema.schema_type,
+            references=[
+                Reference(name=ref.name, subject=ref.subject, version=ref.version)
+                for ref in (getattr(schema_version, "references", None) or [])
+            ],
+            hash=self._calculate_schema_hash(schema_str),
+            canonical_hash=self._canonicalize_and_hash(schema_str),
+        )
+
+    @observe_schema_registry_call("set_compatibility_mode")
     async def set_compatibility_mode(self, subject: SubjectName, mode: str) -> None:
         try:
             compatibility_level = ConfigCompatibilityLevel(mode)
             config = ServerConfig(compatibility=cast(Any, compatibility_level))
             await self.client.set_config(subject_name=subject, config=config)
-            logger.info(f"Compatibility mode set: {subject} -> {mode}")
+            logger.info("compatibility_mode_set", subject=subject, mode=mode)
         except SchemaRegistryError as exc:
             self._raise_schema_registry_runtime_error("Set compatibility mode", exc, subject)
 
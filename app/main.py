@@ -8,7 +8,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import ORJSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 from .container import AppContainer
 from .registry_connections.interface.router import router as registry_connection_router
@@ -16,10 +16,13 @@ from .schema.interface.router import router as schema_router
 from .schema.interface.routers.policy_router import router as schema_policy_router
 from .shared.error_handlers import format_validation_error
 from .shared.logging_config import configure_structlog, get_logger
+from .shared.metrics import METRICS_CONTENT_TYPE, render_metrics
 from .shared.middleware import RequestLoggingMiddleware
 from .shared.settings import settings
+from .shared.tracing import configure_tracing
 
 configure_structlog()
+configure_tracing(settings.tracing_exporter, settings.tracing_file_path)
 logger = get_logger(__name__)
 
 
@@ -29,7 +32,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     container = app.state.container  # type: ignore[attr-defined]
 
     try:
-        container.init_resources()
+        # 비동기 Resource가 있으면 init/shutdown이 awaitable을 반환
+        init_result = container.init_resources()
+        if init_result is not None:
+            await init_result
 
         logger.info("app_startup_completed", environment=settings.environment)
         yield
@@ -42,7 +48,9 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         )
         raise
     finally:
-        container.shutdown_resources()
+        shutdown_result = container.shutdown_resources()
+        if shutdown_result is not None:
+            await shutdown_result
         logger.info("app_shutdown_completed")
 
 
@@ -87,7 +95,7 @@ def create_app() -> FastAPI:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS"],
         allow_headers=["*"],
-        expose_headers=["X-Request-ID"],
+        expose_headers=["X-Request-ID", "X-Next-Cursor"],
     )
 
     container = AppContainer()
@@ -119,6 +127,10 @@ def create_app() -> FastAPI:
     async def health_check() -> dict[str, str]:
         return {"status": "healthy"}
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
         logger.error(
@@ -9,10 +9,12 @@ from app.infra.kafka.connection_manager import IConnectionManager
 from app.registry_connections.domain.models import ConnectionTestResult, SchemaRegistry
 from app.registry_connections.domain.repositories import ISchemaRegistryRepository
 from app.shared.security import get_encryption_service
+from app.shared.tracing import traced_class
 
 logger = logging.getLogger(__name__)
 
 
+@traced_class("usecase")
 class CreateSchemaRegistryUseCase:
     """Schema Registry 생성 Use Case"""
 
@@ -62,6 +64,7 @@ class CreateSchemaRegistryUseCase:
         return created_registry
 
 
+@traced_class("usecase")
 class ListSchemaRegistriesUseCase:
     """Schema Registry 목록 조회 Use Case"""
 
@@ -73,6 +76,7 @@ class ListSchemaRegistriesUseCase:
         return await self.registry_repo.list_all(active_only=active_only)
 
 
+@traced_class("usecase")
 class GetSchemaRegistryUseCase:
     """Schema Registry 단일 조회 Use Case"""
 
@@ -84,6 +88,7 @@ class GetSchemaRegistryUseCase:
         return await self.registry_repo.get_by_id(registry_id)
 
 
+@traced_class("usecase")
 class UpdateSchemaRegistryUseCase:
     """Schema Registry 수정 Use Case"""
 
@@ -139,6 +144,7 @@ class UpdateSchemaRegistryUseCase:
         return result
 
 
+@traced_class("usecase")
 class DeleteSchemaRegistryUseCase:
     """Schema Registry 삭제 Use Case"""
 
@@ -159,6 +165,7 @@ class DeleteSchemaRegistryUseCase:
         return success
 
 
+@traced_class("usecase")
 class TestSchemaRegistryConnectionUseCase:
     """Schema Registry 연결 테스트 Use Case"""
 
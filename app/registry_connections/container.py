@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dependency_injector import containers, providers
 
-from app.infra.kafka.connection_manager import ConnectionManager
+from app.infra.kafka.connection_manager import ConnectionManager, connection_manager_lifespan
 from app.registry_connections.application.use_cases import (
     CreateSchemaRegistryUseCase,
     DeleteSchemaRegistryUseCase,
@@ -29,6 +29,14 @@ class RegistryConnectionContainer(containers.DeclarativeContainer):
     connection_manager = providers.Singleton(
         ConnectionManager,
         schema_registry_repo=schema_registry_repository,
+        max_clients=infrastructure.infra_container.provided.registry_client_max_size,
+        idle_timeout_seconds=infrastructure.infra_container.provided.registry_client_idle_timeout,
+    )
+
+    # 컨테이너 종료 시 캐시된 Schema Registry Client 정리
+    connection_manager_resource = providers.Resource(
+        connection_manager_lifespan,
+        connection_manager=connection_manager,
     )
 
     create_schema_registry_use_case = providers.Factory(
@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.registry_connections.domain.models import SchemaRegistry
 from app.registry_connections.domain.repositories import ISchemaRegistryRepository
+from app.shared.tracing import traced_class
 
 from .models import SchemaRegistryModel
 
@@ -18,6 +19,7 @@ logger = logging.getLogger(__name__)
 SessionFactory = Callable[..., AbstractAsyncContextManager[AsyncSession]]
 
 
+@traced_class("repository")
 class MySQLSchemaRegistryRepository(ISchemaRegistryRepository):
     def __init__(self, session_factory: SessionFactory) -> None:
         self.session_factory = session_factory
@@ -0,0 +1,362 @@
+"""Catalog-wide PII / Risk Scoring
+
+catalog의 subject별 최신 Avro 스키마를 모든 (중첩 포함) 필드 단위의 컬럼형 feature table로
+펼친 뒤, NumPy 벡터 연산으로 subject별 PII/리스크 점수를 한 번에 계산한다.
+
+- PII 매칭: 소문자로 바꾼 모든 필드명을 개행으로 이어 붙인 문자열에 컴파일된 다중 패턴 정규식을
+  한 번만 돌리고, 매치 위치를 ``searchsorted`` 로 필드 인덱스에 매핑한다.
+- 점수 집계: 필드별 가중치를 ``bincount`` 로 subject별 합산한다.
+
+가중치는 lint 정책의 심각도(WARN 0.3 / INFO 0.1)를 따른다.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import orjson
+from numpy.typing import NDArray
+from sqlalchemy import and_, bindparam, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schema.domain.models import CatalogRescoreSummary
+from app.schema.domain.policies.security import PiiCandidatePolicy, PiiKeywordMatcher
+from app.schema.domain.policies.structure import DeepMapPolicy
+from app.schema.infrastructure.catalog_models import SchemaSubjectModel, SchemaVersionModel
+from app.shared.cpu_executor import CpuTaskExecutor, get_cpu_executor
+from app.shared.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 필드 타입 코드 (feature table의 type 컬럼)
+TYPE_CODES: dict[str, int] = {
+    name: code
+    for code, name in enumerate(
+        (
+            "null",
+            "boolean",
+            "int",
+            "long",
+            "float",
+            "double",
+            "bytes",
+            "string",
+            "record",
+            "enum",
+            "array",
+            "map",
+            "fixed",
+            "union",
+            "named_ref",
+        )
+    )
+}
+
+_WARN_WEIGHT = 0.3
+_INFO_WEIGHT = 0.1
+_MAX_UNION_ARITY = 3
+_MAX_BYTES_FIELDS = 3
+_UPDATE_CHUNK_SIZE = 1_000
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+
+
+@dataclass(slots=True)
+class FieldFeatureTable:
+    """catalog 전체 필드의 컬럼형 feature table (행 = 필드)"""
+
+    subjects: list[str]
+    subject_index: NDArray[np.int32]
+    path: list[str]
+    match_names: list[str]
+    type_code: NDArray[np.int8]
+    depth: NDArray[np.int16]
+    union_arity: NDArray[np.int16]
+    map_depth: NDArray[np.int16]
+    nullable_without_default: NDArray[np.bool_]
+
+    def __len__(self) -> int:
+        return len(self.path)
+
+
+@dataclass(slots=True)
+class _FeatureColumns:
+    subject_index: list[int]
+    path: list[str]
+    match_names: list[str]
+    type_code: list[int]
+    depth: list[int]
+    union_arity: list[int]
+    map_depth: list[int]
+    nullable_without_default: list[bool]
+
+
+def normalize_field_name(name: str) -> str:
+    """camelCase/snake_case 필드명을 소문자 snake 토큰 문자열로 정규화"""
+    return _CAMEL_BOUNDARY.sub("_", name).lower()
+
+
+def _type_name(avro_type: Any) -> str:
+    if isinstance(avro_type, list):
+        return "union"
+    if isinstance(avro_type, dict):
+        return _type_name(avro_type.get("type"))
+    if isinstance(avro_type, str):
+        return avro_type if avro_type in TYPE_CODES else "named_ref"
+    return "null"
+
+
+def _map_depth(avro_type: Any) -> int:
+    """DeepMapPolicy와 같은 방식으로 map 중첩 깊이 계산"""
+    if isinstance(avro_type, dict):
+        if avro_type.get("type") == "map":
+            return 1 + _map_depth(avro_type.get("values"))
+        if isinstance(avro_type.get("type"), dict):
+            return _map_depth(avro_type["type"])
+    return 0
+
+
+def nested_records(avro_type: Any) -> Iterable[dict[str, Any]]:
+    """필드 타입 안에 정의된 record (union 분기, array items, map values 포함)"""
+    if isinstance(avro_type, list):
+        for branch in avro_type:
+            yield from nested_records(branch)
+    elif isinstance(avro_type, dict):
+        kind = avro_type.get("type")
+        if kind == "record":
+            yield avro_type
+        elif kind == "array":
+            yield from nested_records(avro_type.get("items"))
+        elif kind == "map":
+            yield from nested_records(avro_type.get("values"))
+        elif isinstance(kind, dict | list):
+            yield from nested_records(kind)
+
+
+def _collect_fields(
+    record: dict[str, Any], subject_idx: int, prefix: str, depth: int, columns: _FeatureColumns
+) -> None:
+    fields = record.get("fields")
+    if not isinstance(fields, list):
+        return
+    for avro_field in fields:
+        if not isinstance(avro_field, dict):
+            continue
+        name = str(avro_field.get("name", ""))
+        avro_type = avro_field.get("type")
+        is_union = isinstance(avro_type, list)
+        non_null = [branch for branch in avro_type if branch != "null"] if is_union else []
+
+        columns.subject_index.append(subject_idx)
+        columns.path.append(f"{prefix}{name}")
+        # lint(PiiCandidatePolicy)/catalog 동기화와 같은 기준: 소문자로 바꾼 원래 필드명
+        columns.match_names.append(name.lower())
+        columns.type_code.append(
+            TYPE_CODES[_type_name(non_null[0] if len(non_null) == 1 else avro_type)]
+        )
+        columns.depth.append(depth)
+        columns.union_arity.append(len(avro_type) if is_union else 1)
+        columns.map_depth.append(_map_depth(avro_type))
+        columns.nullable_without_default.append(
+            is_union and "null" in avro_type and "default" not in avro_field
+        )
+
+        for nested in nested_records(avro_type):
+            _collect_fields(nested, subject_idx, f"{prefix}{name}.", depth + 1, columns)
+
+
+def build_feature_table(rows: Iterable[tuple[str, str]]) -> FieldFeatureTable:
+    """(subject, schema_str) 목록을 필드 단위 feature table로 변환 (파싱 실패 subject는 필드 0개)"""
+    subjects: list[str] = []
+    columns = _FeatureColumns([], [], [], [], [], [], [], [])
+    for subject, schema_str in rows:
+        subject_idx = len(subjects)
+        subjects.append(subject)
+        try:
+            schema = orjson.loads(schema_str)
+        except orjson.JSONDecodeError:
+            continue
+        if isinstance(schema, dict):
+            _collect_fields(schema, subject_idx, "", 0, columns)
+
+    return FieldFeatureTable(
+        subjects=subjects,
+        subject_index=np.asarray(columns.subject_index, dtype=np.int32),
+        path=columns.path,
+        match_names=columns.match_names,
+        type_code=np.asarray(columns.type_code, dtype=np.int8),
+        depth=np.asarray(columns.depth, dtype=np.int16),
+        union_arity=np.asarray(columns.union_arity, dtype=np.int16),
+        map_depth=np.asarray(columns.map_depth, dtype=np.int16),
+        nullable_without_default=np.asarray(columns.nullable_without_default, dtype=np.bool_),
+    )
+
+
+def match_pii_fields(table: FieldFeatureTable, matcher: PiiKeywordMatcher) -> NDArray[np.bool_]:
+    """필드별 PII 후보 여부 (정규식 1회 스캔 + 위치→필드 매핑)"""
+    is_pii = np.zeros(len(table), dtype=np.bool_)
+    if not len(table):
+        return is_pii
+    lengths = np.fromiter(map(len, table.match_names), dtype=np.int64, count=len(table))
+    starts = np.concatenate(([0], np.cumsum(lengths + 1)[:-1]))
+    blob = "\n".join(table.match_names)
+    positions = np.fromiter(
+        (match.start() for match in matcher.pattern.finditer(blob)), dtype=np.int64
+    )
+    if positions.size:
+        is_pii[np.searchsorted(starts, positions, side="right") - 1] = True
+    return is_pii
+
+
+def score_feature_table(
+    table: FieldFeatureTable, matcher: PiiKeywordMatcher
+) -> tuple[NDArray[np.float64], NDArray[np.float64]]:
+    """subject별 (pii_score, risk_score) 계산"""
+    n_subjects = len(table.subjects)
+    is_pii = match_pii_fields(table, matcher)
+
+    field_counts = np.bincount(table.subject_index, minlength=n_subjects)
+    pii_counts = np.bincount(table.subject_index, weights=is_pii, minlength=n_subjects)
+    pii_scores = np.divide(
+        pii_counts,
+        field_counts,
+        out=np.zeros(n_subjects, dtype=np.float64),
+        where=field_counts > 0,
+    )
+
+    field_risk = (
+        _INFO_WEIGHT * is_pii
+        + _INFO_WEIGHT * (table.union_arity > _MAX_UNION_ARITY)
+        + _INFO_WEIGHT * (table.map_depth > DeepMapPolicy.MAX_DEPTH)
+        + _WARN_WEIGHT * table.nullable_without_default
+    )
+    bytes_counts = np.bincount(
+        table.subject_index,
+        weights=table.type_code == TYPE_CODES["bytes"],
+        minlength=n_subjects,
+    )
+    risk_scores = np.bincount(table.subject_index, weights=field_risk, minlength=n_subjects) + (
+        _WARN_WEIGHT * (bytes_counts > _MAX_BYTES_FIELDS)
+    )
+
+    return (
+        np.round(np.clip(pii_scores, 0.0, 1.0), 4),
+        np.round(np.clip(risk_scores, 0.0, 1.0), 4),
+    )
+
+
+def score_catalog(
+    rows: list[tuple[str, str]], keywords: list[str]
+) -> tuple[list[tuple[str, float, float]], int]:
+    """catalog 행 전체 점수 계산 (CPU 작업 실행기에서 실행)
+
+    Returns:
+        ([(subject, pii_score, risk_score)], 스캔한 필드 수)
+    """
+    table = build_feature_table(rows)
+    pii_scores, risk_scores = score_feature_table(table, PiiKeywordMatcher(keywords))
+    return (
+        list(zip(table.subjects, pii_scores.tolist(), risk_scores.tolist(), strict=True)),
+        len(table),
+    )
+
+
+def default_pii_keywords() -> list[str]:
+    return sorted(settings.schema_pii_keywords or PiiCandidatePolicy.PII_KEYWORDS)
+
+
+class CatalogScoringService:
+    """subject별 최신 Avro 스키마로 ``schema_subjects.pii_score/risk_score`` 를 일괄 갱신"""
+
+    def __init__(self, session: AsyncSession, cpu_executor: CpuTaskExecutor | None = None) -> None:
+        self.session = session
+        self.cpu_executor = cpu_executor or get_cpu_executor()
+
+    async def rescore(
+        self,
+        *,
+        subjects: Iterable[str] | None = None,
+        keywords: Iterable[str] | None = None,
+    ) -> CatalogRescoreSummary:
+        """점수 재계산
+
+        Args:
+            subjects: 대상 subject (None이면 catalog 전체)
+            keywords: PII 키워드 (None이면 설정값 또는 기본 사전)
+        """
+        started = time.perf_counter()
+        keyword_list = sorted(set(keywords)) if keywords is not None else default_pii_keywords()
+        rows = await self._load_latest_schemas(subjects)
+
+        scores, fields_scanned = await self.cpu_executor.run(
+            score_catalog,
+            rows,
+            keyword_list,
+            size_hint=sum(len(schema_str) for _, schema_str in rows),
+        )
+        await self._write_scores(scores)
+
+        return CatalogRescoreSummary(
+            subjects_scored=len(scores),
+            fields_scanned=fields_scanned,
+            pii_subjects=sum(1 for _, pii_score, _ in scores if pii_score > 0),
+            keywords=keyword_list,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+
+    async def _load_latest_schemas(self, subjects: Iterable[str] | None) -> list[tuple[str, str]]:
+        versions = SchemaVersionModel
+        latest = (
+            select(versions.subject, func.max(versions.version).label("version"))
+            .group_by(versions.subject)
+            .subquery()
+        )
+        query = (
+            select(versions.subject, versions.schema_str)
+            .join(
+                latest,
+                and_(versions.subject == latest.c.subject, versions.version == latest.c.version),
+            )
+            .join(SchemaSubjectModel, SchemaSubjectModel.subject == versions.subject)
+            .where(versions.schema_type == "AVRO")
+        )
+        if subjects is None:
+            result = await self.session.execute(query)
+            return [(subject, schema_str or "") for subject, schema_str in result]
+
+        targets = list(subjects)
+        rows: list[tuple[str, str]] = []
+        for start in range(0, len(targets), _UPDATE_CHUNK_SIZE):
+            result = await self.session.execute(
+                query.where(versions.subject.in_(targets[start : start + _UPDATE_CHUNK_SIZE]))
+            )
+            rows.extend((subject, schema_str or "") for subject, schema_str in result)
+        return rows
+
+    async def _write_scores(self, scores: list[tuple[str, float, float]]) -> None:
+        table = SchemaSubjectModel.__table__
+        # updated_at(onupdate)은 동기화 시각 의미이므로 점수 갱신으로 바뀌지 않게 그대로 유지
+        statement = (
+            update(table)
+            .where(table.c.subject == bindparam("b_subject"))
+            .values(
+                pii_score=bindparam("b_pii"),
+                risk_score=bindparam("b_risk"),
+                updated_at=table.c.updated_at,
+            )
+        )
+        for start in range(0, len(scores), _UPDATE_CHUNK_SIZE):
+            chunk = scores[start : start + _UPDATE_CHUNK_SIZE]
+            await self.session.execute(
+                statement,
+                [
+                    {"b_subject": subject, "b_pii": pii_score, "b_risk": risk_score}
+                    for subject, pii_score, risk_score in chunk
+                ],
+            )
+        await self.session.commit()
@@ -7,6 +7,7 @@ SR → DB 증분 동기화 (jobs.md 스펙 준수)
 """
 
 import asyncio
+import functools
 import hashlib
 import logging
 import re
@@ -21,8 +22,25 @@ from confluent_kafka.schema_registry.error import SchemaRegistryError
 from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.schema.infrastructure.catalog_models import SchemaSubjectModel, SchemaVersionModel
+from app.schema.application.services.catalog_scoring import (
+    CatalogScoringService,
+    default_pii_keywords,
+)
+from app.schema.application.services.field_index import extract_field_rows, replace_field_rows
+from app.schema.domain.policies.security import PiiKeywordMatcher
+from app.schema.infrastructure.catalog_models import (
+    SchemaFieldIndexModel,
+    SchemaReferenceEdgeModel,
+    SchemaSubjectModel,
+    SchemaVersionModel,
+)
 from app.schema.infrastructure.models import SchemaArtifactModel, SchemaMetadataModel
+from app.schema.infrastructure.repository.reference_repository import (
+    invalidate_reference_graph,
+    replace_reference_edges,
+)
+from app.shared.cpu_executor import CpuTaskExecutor, get_cpu_executor
+from app.shared.metrics import observe_catalog_sync
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +60,7 @@ class SyncMetrics:
     errors: int = 0
     duration_seconds: float = 0.0
     removed_subjects: set[str] = field(default_factory=set, repr=False)
+    updated_subjects: set[str] = field(default_factory=set, repr=False)
 
 
 class CatalogSyncService:
@@ -61,6 +80,7 @@ class CatalogSyncService:
         max_concurrent: int = 15,
         timeout_seconds: float = 3.0,
         max_retries: int = 3,
+        cpu_executor: CpuTaskExecutor | None = None,
     ) -> None:
         """
         Args:
@@ -69,12 +89,16 @@ class CatalogSyncService:
             max_concurrent: 동시 SR 호출 제한 (세마포어)
             timeout_seconds: 개별 호출 타임아웃
             max_retries: 재시도 횟수
+            cpu_executor: 정규화/필드 메타 추출용 CPU 작업 실행기 (기본: 공용 실행기)
         """
         self.sr_client = sr_client
         self.session = session
         self.semaphore = asyncio.Semaphore(max_concurrent)
+        # AsyncSession은 동시 연산을 허용하지 않으므로 SR 호출만 병렬로 두고 DB 접근은 직렬화
+        self._session_lock = asyncio.Lock()
         self.timeout = timeout_seconds
         self.max_retries = max_retries
+        self.cpu_executor = cpu_executor or get_cpu_executor()
 
     async def sync_all(self) -> SyncMetrics:
         """전체 증분 동기화 실행
@@ -93,7 +117,7 @@ class CatalogSyncService:
                 timeout=self.timeout * 2,  # list 호출은 여유
             )
             metrics.subjects_total = len(subjects)
-            logger.info(f"[CatalogSync] Found {len(subjects)} subjects")
+            logger.info("[CatalogSync] Found %d subjects", len(subjects))
 
             # 1-1. 제거 대상 계산 (SR에 없어진 subject)
             existing_subjects: set[str] = set()
@@ -131,6 +155,16 @@ class CatalogSyncService:
                 await self.session.execute(
                     delete(SchemaVersionModel).where(SchemaVersionModel.subject.in_(stale_subjects))
                 )
+                await self.session.execute(
+                    delete(SchemaFieldIndexModel).where(
+                        SchemaFieldIndexModel.subject.in_(stale_subjects)
+                    )
+                )
+                await self.session.execute(
+                    delete(SchemaReferenceEdgeModel).where(
+                        SchemaReferenceEdgeModel.subject.in_(stale_subjects)
+                    )
+                )
                 await self.session.execute(
                     delete(SchemaArtifactModel).where(
                         SchemaArtifactModel.subject.in_(stale_subjects)
@@ -155,22 +189,38 @@ class CatalogSyncService:
             # 2. 각 subject별 증분 동기화 (세마포어 제한)
             tasks = [self._sync_subject(subject, metrics) for subject in subjects]
             await asyncio.gather(*tasks, return_exceptions=True)
+            if metrics.updated_subjects or stale_subjects:
+                invalidate_reference_graph()
+
+            # 3. 새 버전이 들어온 subject만 PII/리스크 점수 일괄 재계산
+            if metrics.updated_subjects:
+                await self._rescore_subjects(metrics.updated_subjects)
 
         except TimeoutError:
             logger.error("[CatalogSync] Timeout fetching subjects list")
             metrics.errors += 1
         except Exception as e:
-            logger.error(f"[CatalogSync] Unexpected error: {e}", exc_info=True)
+            logger.error("[CatalogSync] Unexpected error: %s", e, exc_info=True)
             metrics.errors += 1
 
         # 메트릭 계산
         metrics.duration_seconds = (datetime.now() - start_time).total_seconds()
+        observe_catalog_sync(
+            duration_seconds=metrics.duration_seconds,
+            subjects_total=metrics.subjects_total,
+            subjects_new=metrics.subjects_new,
+            subjects_removed=metrics.subjects_removed,
+            versions_new=metrics.versions_new,
+            versions_removed=metrics.versions_removed,
+            errors=metrics.errors,
+        )
 
         logger.info(
-            f"[CatalogSync] Complete: {metrics.subjects_new} new subjects, "
-            f"{metrics.versions_new} new versions, "
-            f"{metrics.errors} errors, "
-            f"{metrics.duration_seconds:.2f}s"
+            "[CatalogSync] Complete: %d new subjects, %d new versions, %d errors, %.2fs",
+            metrics.subjects_new,
+            metrics.versions_new,
+            metrics.errors,
+            metrics.duration_seconds,
         )
 
         return metrics
@@ -185,12 +235,13 @@ class CatalogSyncService:
         async with self.semaphore:
             try:
                 # DB에서 현재 latest_version 조회
-                stmt = await self.session.execute(
-                    select(SchemaSubjectModel.latest_version).where(
-                        SchemaSubjectModel.subject == subject
+                async with self._session_lock:
+                    stmt = await self.session.execute(
+                        select(SchemaSubjectModel.latest_version).where(
+                            SchemaSubjectModel.subject == subject
+                        )
                     )
-                )
-                current_latest = stmt.scalar_one_or_none()
+                    current_latest = stmt.scalar_one_or_none()
 
                 # SR에서 최신 버전 조회
                 latest_registered = await self._get_latest_version_with_retry(subject)
@@ -199,7 +250,7 @@ class CatalogSyncService:
 
                 # 증분 체크: 새 버전이 없으면 skip
                 if current_latest and latest_registered.version <= current_latest:
-                    logger.debug(f"[{subject}] No new versions")
+                    logger.debug("[%s] No new versions", subject)
                     return
 
                 # 새 버전들 수집
@@ -213,12 +264,13 @@ class CatalogSyncService:
 
                 # Subject 메타 업데이트
                 await self._update_subject_meta(subject, int(latest_registered.version))
+                metrics.updated_subjects.add(subject)
 
                 if not current_latest:
                     metrics.subjects_new += 1
 
             except Exception as e:
-                logger.warning(f"[{subject}] Sync failed: {e}")
+                logger.warning("[%s] Sync failed: %s", subject, e)
                 metrics.errors += 1
 
     async def _get_latest_version_with_retry(self, subject: str):
@@ -233,7 +285,7 @@ class CatalogSyncService:
                     await asyncio.sleep(0.5 * (2**attempt))  # 지수 백오프
                 continue
             except SchemaRegistryError as e:
-                logger.debug(f"[{subject}] SR error: {e}")
+                logger.debug("[%s] SR error: %s", subject, e)
                 return None
         return None
 
@@ -253,8 +305,14 @@ class CatalogSyncService:
 
             schema_str = registered_schema.schema.schema_str or ""
 
-            # 정규화 & 해시 (중복 감지용)
-            canonical_hash = self._canonicalize_and_hash(schema_str)
+            # 정규화 & 해시 (중복 감지용) + fields_meta/필드 색인 추출 (Avro만 지원)
+            # - CPU 작업은 오프로딩
+            canonical_hash, fields_meta, field_rows = await self.cpu_executor.run(
+                _analyze_schema_body,
+                schema_str,
+                registered_schema.schema.schema_type,
+                size_hint=len(schema_str),
+            )
 
             # rule_set, metadata 추출 (있으면)
             rule_set = getattr(registered_schema, "rule_set", None)
@@ -268,11 +326,6 @@ class CatalogSyncService:
                     for ref in registered_schema.references
                 ]
 
-            # fields_meta 추출 (Avro만 지원)
-            fields_meta = None
-            if registered_schema.schema.schema_type == "AVRO":
-                fields_meta = self._extract_fields_meta(schema_str)
-
             # DB 저장
             version_model = SchemaVersionModel(
                 subject=subject,
@@ -287,17 +340,32 @@ class CatalogSyncService:
                 if sr_metadata and hasattr(sr_metadata, "to_dict")
                 else None,
                 fields_meta=fields_meta,
-                lint_report=None,  # lint는 별도 서비스에서
+                # lint_report는 SchemaLintWorker가 백그라운드에서 채운다 (merge 시 기존 값 유지)
             )
 
-            await self.session.merge(version_model)  # upsert
-            await self.session.commit()
+            async with self._session_lock:
+                try:
+                    await self.session.merge(version_model)  # upsert
+                    await replace_reference_edges(
+                        self.session,
+                        subject,
+                        version,
+                        [(ref["name"], ref["subject"], ref["version"]) for ref in references],
+                    )
+                    await replace_field_rows(
+                        self.session,
+                        [(subject, version)],
+                        [{"subject": subject, "version": version, **row} for row in field_rows],
+                    )
+                    await self.session.commit()
+                except Exception:
+                    await self.session.rollback()
+                    raise
 
-            logger.debug(f"[{subject}] v{version} synced (hash: {canonical_hash[:8]}...)")
+            logger.debug("[%s] v%s synced (hash: %.8s...)", subject, version, canonical_hash)
 
         except Exception as e:
-            logger.warning(f"[{subject}] v{version} sync failed: {e}")
-            await self.session.rollback()
+            logger.warning("[%s] v%s sync failed: %s", subject, version, e)
 
     async def _update_subject_meta(self, subject: str, latest_version: int) -> None:
         """Subject 메타데이터 업데이트"""
@@ -338,30 +406,36 @@ class CatalogSyncService:
                 mode_readonly=mode_readonly,
                 env=env,
                 owner_team=None,  # 추후 naming 전략으로 추출
-                pii_score=0.0,
-                risk_score=0.0,
+                # pii_score/risk_score는 동기화 후 CatalogScoringService가 일괄 계산
             )
 
-            await self.session.merge(subject_model)
-            await self.session.commit()
+            async with self._session_lock:
+                try:
+                    await self.session.merge(subject_model)
+                    await self.session.commit()
+                except Exception:
+                    await self.session.rollback()
+                    raise
 
         except Exception as e:
-            logger.warning(f"[{subject}] Meta update failed: {e}")
+            logger.warning("[%s] Meta update failed: %s", subject, e)
+
+    async def _rescore_subjects(self, subjects: set[str]) -> None:
+        try:
+            summary = await CatalogScoringService(
+                self.session, cpu_executor=self.cpu_executor
+            ).rescore(subjects=sorted(subjects))
+            logger.info(
+                "[CatalogSync] Rescored %d subjects (%d fields)",
+                summary.subjects_scored,
+                summary.fields_scanned,
+            )
+        except Exception as e:
             await self.session.rollback()
+            logger.warning("[CatalogSync] Scoring failed: %s", e)
 
     def _canonicalize_and_hash(self, schema_str: str) -> str:
-        """스키마 정규화 & SHA-256 해시
-
-        중복/변형 감지를 위해 공백·주석 제거 후 해싱
-        """
-        try:
-            # JSON 파싱 후 재직렬화 (공백 제거, 키 정렬)
-            schema_dict = orjson.loads(schema_str)
-            canonical = orjson.dumps(schema_dict, option=orjson.OPT_SORT_KEYS)
-            return hashlib.sha256(canonical).hexdigest()
-        except Exception:
-            # 파싱 실패 시 원본 해시
-            return hashlib.sha256(schema_str.encode()).hexdigest()
+        return _canonicalize_and_hash(schema_str)
 
     def _extract_env_from_subject(self, subject: str) -> str | None:
         """Subject명에서 환경 추출
@@ -384,34 +458,68 @@ class CatalogSyncService:
         return None
 
     def _extract_fields_meta(self, schema_str: str) -> dict[str, Any] | None:
-        """Avro 스키마에서 필드 메타 추출
+        return _extract_fields_meta(schema_str)
 
-        PII 후보, 네이밍 패턴 등
-        """
-        try:
-            schema_dict = orjson.loads(schema_str)
-            fields = schema_dict.get("fields", [])
-
-            fields_meta = []
-            for field in fields:
-                field_name = field.get("name", "")
-                field_type = field.get("type", "")
-
-                # PII 후보 감지 (간단 패턴)
-                is_pii_candidate = any(
-                    keyword in field_name.lower()
-                    for keyword in ["email", "phone", "ssn", "passport", "address", "name"]
-                )
 
-                fields_meta.append(
-                    {
-                        "name": field_name,
-                        "type": str(field_type),
-                        "pii_candidate": is_pii_candidate,
-                    }
-                )
+@functools.cache
+def _pii_matcher() -> PiiKeywordMatcher:
+    return PiiKeywordMatcher(default_pii_keywords())
+
+
+def _canonicalize_and_hash(schema_str: str) -> str:
+    """스키마 정규화 & SHA-256 해시
+
+    중복/변형 감지를 위해 공백·주석 제거 후 해싱
+    """
+    try:
+        # JSON 파싱 후 재직렬화 (공백 제거, 키 정렬)
+        schema_dict = orjson.loads(schema_str)
+        canonical = orjson.dumps(schema_dict, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(canonical).hexdigest()
+    except Exception:
+        # 파싱 실패 시 원본 해시
+        return hashlib.sha256(schema_str.encode()).hexdigest()
+
+
+def _extract_fields_meta(schema_str: str) -> dict[str, Any] | None:
+    """Avro 스키마에서 필드 메타 추출
+
+    PII 후보, 네이밍 패턴 등
+    """
+    try:
+        schema_dict = orjson.loads(schema_str)
+        fields = schema_dict.get("fields", [])
+
+        fields_meta = []
+        for field in fields:
+            field_name = field.get("name", "")
+            field_type = field.get("type", "")
+
+            # PII 후보 감지 (점수 계산과 같은 키워드 사전/매처 사용)
+            is_pii_candidate = bool(_pii_matcher().find(field_name))
+
+            fields_meta.append(
+                {
+                    "name": field_name,
+                    "type": str(field_type),
+                    "pii_candidate": is_pii_candidate,
+                }
+            )
+
+        return {"fields": fields_meta}
+
+    except Exception:
+        return None
 
-            return {"fields": fields_meta}
 
-        except Exception:
-            return None
+def _analyze_schema_body(
+    schema_str: str, schema_type: str | None
+) -> tuple[str, dict[str, Any] | None, list[dict[str, Any]]]:
+    """정규화 해시 + (Avro인 경우) 필드 메타/필드 색인 행을 한 번에 계산 (CPU 작업 실행기에서 실행)"""
+    if schema_type != "AVRO":
+        return _canonicalize_and_hash(schema_str), None, []
+    return (
+        _canonicalize_and_hash(schema_str),
+        _extract_fields_meta(schema_str),
+        extract_field_rows(schema_str),
+    )
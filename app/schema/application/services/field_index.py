@@ -0,0 +1,163 @@
+"""Catalog Field Index
+
+스키마 버전별 (중첩 포함) 필드를 ``schema_field_index`` 에 한 행씩 펼쳐 저장한다.
+catalog 동기화가 새 버전마다 채우고, 기존 catalog는 ``rebuild`` 로 한 번에 채운다.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from typing import Any
+
+import orjson
+from sqlalchemy import delete, insert, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schema.application.services.catalog_scoring import nested_records, normalize_field_name
+from app.schema.domain.models import FieldIndexRebuildSummary
+from app.schema.infrastructure.catalog_models import SchemaFieldIndexModel, SchemaVersionModel
+from app.shared.cpu_executor import CpuTaskExecutor, get_cpu_executor
+
+# rebuild 시 한 번에 읽고 쓰는 스키마 버전 수
+_REBUILD_CHUNK_SIZE = 500
+
+
+def _field_type(avro_type: Any) -> tuple[str, str | None]:
+    """(타입 이름, logicalType) - named type 참조는 이름 그대로, 다중 union은 ``union``"""
+    if isinstance(avro_type, list):
+        non_null = [branch for branch in avro_type if branch != "null"]
+        return _field_type(non_null[0]) if len(non_null) == 1 else ("union", None)
+    if isinstance(avro_type, dict):
+        kind = avro_type.get("type")
+        if isinstance(kind, dict | list):
+            return _field_type(kind)
+        logical_type = avro_type.get("logicalType")
+        return str(kind), str(logical_type) if logical_type else None
+    if isinstance(avro_type, str):
+        return avro_type, None
+    return "null", None
+
+
+def _collect_rows(
+    record: dict[str, Any], prefix: str, depth: int, rows: list[dict[str, Any]]
+) -> None:
+    fields = record.get("fields")
+    if not isinstance(fields, list):
+        return
+    for avro_field in fields:
+        if not isinstance(avro_field, dict):
+            continue
+        name = str(avro_field.get("name", ""))
+        avro_type = avro_field.get("type")
+        field_type, logical_type = _field_type(avro_type)
+        rows.append(
+            {
+                "field_path": f"{prefix}{name}",
+                "field_name": name,
+                "name_key": normalize_field_name(name),
+                "field_type": field_type,
+                "logical_type": logical_type,
+                "nullable": avro_type == "null"
+                or (isinstance(avro_type, list) and "null" in avro_type),
+                "has_default": "default" in avro_field,
+                "has_doc": bool(avro_field.get("doc")),
+                "depth": depth,
+            }
+        )
+        for nested in nested_records(avro_type):
+            _collect_rows(nested, f"{prefix}{name}.", depth + 1, rows)
+
+
+def extract_field_rows(schema_str: str) -> list[dict[str, Any]]:
+    """Avro 스키마 본문 → 필드 색인 행 (subject/version 제외, 파싱 실패 시 빈 목록)"""
+    try:
+        schema = orjson.loads(schema_str)
+    except orjson.JSONDecodeError:
+        return []
+    rows: list[dict[str, Any]] = []
+    if isinstance(schema, dict):
+        _collect_rows(schema, "", 0, rows)
+    return rows
+
+
+def _extract_versions(
+    versions: list[tuple[str, int, str]],
+) -> list[dict[str, Any]]:
+    """버전 묶음의 필드 색인 행 (CPU 작업 실행기에서 실행)"""
+    return [
+        {"subject": subject, "version": version, **row}
+        for subject, version, schema_str in versions
+        for row in extract_field_rows(schema_str)
+    ]
+
+
+async def replace_field_rows(
+    session: AsyncSession,
+    versions: Iterable[tuple[str, int]],
+    rows: list[dict[str, Any]],
+) -> None:
+    """(subject, version) 들의 색인 행을 교체 (커밋은 호출자가 수행)"""
+    keys = list(versions)
+    if not keys:
+        return
+    index = SchemaFieldIndexModel.__table__
+    await session.execute(delete(index).where(tuple_(index.c.subject, index.c.version).in_(keys)))
+    if rows:
+        await session.execute(insert(index), rows)
+
+
+class CatalogFieldIndexer:
+    """저장된 AVRO 스키마 버전 전체로 필드 색인을 다시 만든다"""
+
+    def __init__(self, session: AsyncSession, cpu_executor: CpuTaskExecutor | None = None) -> None:
+        self.session = session
+        self.cpu_executor = cpu_executor or get_cpu_executor()
+
+    async def rebuild(self) -> FieldIndexRebuildSummary:
+        started = time.perf_counter()
+        versions = SchemaVersionModel
+        keys = (
+            await self.session.execute(
+                select(versions.subject, versions.version)
+                .where(versions.schema_type == "AVRO")
+                .order_by(versions.subject, versions.version)
+            )
+        ).all()
+
+        fields_indexed = 0
+        for start in range(0, len(keys), _REBUILD_CHUNK_SIZE):
+            chunk = [tuple(key) for key in keys[start : start + _REBUILD_CHUNK_SIZE]]
+            bodies = [
+                (subject, version, schema_str or "")
+                for subject, version, schema_str in await self.session.execute(
+                    select(versions.subject, versions.version, versions.schema_str).where(
+                        tuple_(versions.subject, versions.version).in_(chunk)
+                    )
+                )
+            ]
+            rows = await self.cpu_executor.run(
+                _extract_versions,
+                bodies,
+                size_hint=sum(len(schema_str) for _, _, schema_str in bodies),
+            )
+            await replace_field_rows(self.session, chunk, rows)
+            await self.session.commit()
+            fields_indexed += len(rows)
+
+        # 삭제되었거나 AVRO가 아니게 된 버전의 잔여 행 정리
+        index = SchemaFieldIndexModel.__table__
+        await self.session.execute(
+            delete(index).where(
+                tuple_(index.c.subject, index.c.version).not_in(
+                    select(versions.subject, versions.version).where(versions.schema_type == "AVRO")
+                )
+            )
+        )
+        await self.session.commit()
+
+        return FieldIndexRebuildSummary(
+            versions_indexed=len(keys),
+            fields_indexed=fields_indexed,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
@@ -0,0 +1,275 @@
+"""Schema Lint Background Worker
+
+catalog 동기화는 ``schema_versions.lint_report`` 를 비워 두고, 이 워커가 주기적으로 채운다.
+
+- lint 결과가 없거나 ``lint_engine_version`` 이 현재 엔진 버전과 다른 버전만 대상으로 한다.
+  lint 정책이 바뀌어 ``LINT_ENGINE_VERSION`` 을 올리면 해당 버전들만 다시 lint된다.
+- ``schema_canonical_hash`` 가 같은 본문은 한 번만 lint하고, 같은 해시의 모든 버전에
+  한 번의 executemany UPDATE로 기록한다. 이미 현재 엔진 결과가 있는 해시는 재사용한다.
+- lint 자체는 공용 CPU 작업 실행기에서 배치 단위로 실행한다.
+
+배치를 선점(lease)하지 않으므로 여러 프로세스에서 돌리면 같은 밀린 버전을 중복 lint하고 같은
+행을 경쟁적으로 UPDATE한다. ``schema_lint_worker_enabled`` 는 기본 비활성이며, 배포당 한
+프로세스에서만 켠다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import and_, bindparam, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schema.application.services.schema_lint import LINT_ENGINE_VERSION, SchemaLintService
+from app.schema.domain.models.lint import LintReport
+from app.schema.infrastructure.catalog_models import SchemaVersionModel
+from app.shared.cpu_executor import CpuTaskExecutor, get_cpu_executor
+from app.shared.database import SessionFactory
+
+logger = logging.getLogger(__name__)
+
+
+def lint_report_to_dict(report: LintReport, engine_version: int) -> dict[str, Any]:
+    """``schema_versions.lint_report`` 저장 형식"""
+    return {
+        "engine_version": engine_version,
+        "pii_score": report.pii_score,
+        "risk_score": report.risk_score,
+        "violations": [
+            {
+                "code": violation.code,
+                "severity": violation.severity.value,
+                "rule": violation.rule,
+                "actual": violation.actual,
+                "hint": violation.hint,
+                "doc_url": violation.doc_url,
+            }
+            for violation in report.violations
+        ],
+    }
+
+
+def _lint_bodies(bodies: dict[str, str]) -> dict[str, dict[str, Any]]:
+    """본문 묶음 lint (CPU 작업 실행기에서 실행, key는 해시 또는 subject/version)"""
+    service = SchemaLintService()
+    return {
+        key: lint_report_to_dict(service.lint_avro_schema(schema_str), LINT_ENGINE_VERSION)
+        for key, schema_str in bodies.items()
+    }
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LintBatchResult:
+    """lint 배치 1회 처리 결과"""
+
+    linted_bodies: int = 0
+    reused_reports: int = 0
+    updated_versions: int = 0
+
+    @property
+    def is_empty(self) -> bool:
+        return self.linted_bodies == 0 and self.reused_reports == 0
+
+
+class SchemaLintWorker:
+    """lint 결과가 없거나 오래된 스키마 버전을 배치 단위로 lint해서 저장"""
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        *,
+        batch_size: int = 200,
+        interval_seconds: float = 60.0,
+        cpu_executor: CpuTaskExecutor | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.interval_seconds = interval_seconds
+        self.cpu_executor = cpu_executor
+
+    @staticmethod
+    def _is_stale() -> Any:
+        versions = SchemaVersionModel
+        return and_(
+            versions.schema_type == "AVRO",
+            or_(
+                versions.lint_engine_version.is_(None),
+                versions.lint_engine_version != LINT_ENGINE_VERSION,
+            ),
+        )
+
+    async def run_once(self) -> LintBatchResult:
+        """lint 대상 해시 최대 ``batch_size`` 개 처리 (해시 없는 버전은 남는 자리만큼)"""
+        async with self.session_factory() as session:
+            hashed = await self._lint_hashed(session)
+            remaining = self.batch_size - hashed.linted_bodies - hashed.reused_reports
+            unhashed = (
+                await self._lint_unhashed(session, remaining)
+                if remaining > 0
+                else LintBatchResult()
+            )
+        return LintBatchResult(
+            linted_bodies=hashed.linted_bodies + unhashed.linted_bodies,
+            reused_reports=hashed.reused_reports,
+            updated_versions=hashed.updated_versions + unhashed.updated_versions,
+        )
+
+    async def run_until_idle(self) -> LintBatchResult:
+        """대상이 없어질 때까지 배치 반복"""
+        linted = reused = updated = 0
+        while True:
+            result = await self.run_once()
+            if result.is_empty:
+                return LintBatchResult(
+                    linted_bodies=linted, reused_reports=reused, updated_versions=updated
+                )
+            linted += result.linted_bodies
+            reused += result.reused_reports
+            updated += result.updated_versions
+
+    async def run_forever(self) -> None:
+        """``interval_seconds`` 마다 밀린 lint를 모두 처리 (취소될 때까지)"""
+        while True:
+            try:
+                result = await self.run_until_idle()
+                if not result.is_empty:
+                    logger.info(
+                        "[SchemaLint] linted=%d reused=%d versions=%d",
+                        result.linted_bodies,
+                        result.reused_reports,
+                        result.updated_versions,
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("[SchemaLint] Batch failed: %s", e)
+            await asyncio.sleep(self.interval_seconds)
+
+    async def _lint_hashed(self, session: AsyncSession) -> LintBatchResult:
+        versions = SchemaVersionModel
+        stale = self._is_stale()
+        hashes = list(
+            await session.scalars(
+                select(versions.schema_canonical_hash)
+                .where(stale, versions.schema_canonical_hash.is_not(None))
+                .group_by(versions.schema_canonical_hash)
+                .order_by(versions.schema_canonical_hash)
+                .limit(self.batch_size)
+            )
+        )
+        if not hashes:
+            return LintBatchResult()
+
+        # 같은 본문의 다른 버전이 이미 현재 엔진으로 lint되었으면 그대로 복사
+        reports: dict[str, dict[str, Any]] = {}
+        for canonical_hash, lint_report in await session.execute(
+            select(versions.schema_canonical_hash, versions.lint_report).where(
+                versions.schema_canonical_hash.in_(hashes),
+                versions.lint_engine_version == LINT_ENGINE_VERSION,
+                versions.lint_report.is_not(None),
+            )
+        ):
+            reports.setdefault(canonical_hash, lint_report)
+        reused = len(reports)
+
+        bodies: dict[str, str] = {}
+        pending = [canonical_hash for canonical_hash in hashes if canonical_hash not in reports]
+        if pending:
+            for canonical_hash, schema_str in await session.execute(
+                select(versions.schema_canonical_hash, versions.schema_str).where(
+                    stale, versions.schema_canonical_hash.in_(pending)
+                )
+            ):
+                bodies.setdefault(canonical_hash, schema_str or "")
+            reports.update(await self._lint(bodies))
+
+        # synced_at(onupdate)은 SR 동기화 시각 의미이므로 lint 기록으로 바뀌지 않게 유지
+        table = SchemaVersionModel.__table__
+        result = await session.execute(
+            update(table)
+            .where(table.c.schema_canonical_hash == bindparam("b_hash"), stale)
+            .values(
+                lint_report=bindparam("b_report"),
+                lint_engine_version=LINT_ENGINE_VERSION,
+                synced_at=table.c.synced_at,
+            ),
+            [
+                {"b_hash": canonical_hash, "b_report": report}
+                for canonical_hash, report in reports.items()
+            ],
+        )
+        await session.commit()
+        return LintBatchResult(
+            linted_bodies=len(bodies),
+            reused_reports=reused,
+            updated_versions=result.rowcount,  # type: ignore[attr-defined]
+        )
+
+    async def _lint_unhashed(self, session: AsyncSession, limit: int) -> LintBatchResult:
+        versions = SchemaVersionModel
+        rows = (
+            await session.execute(
+                select(versions.subject, versions.version, versions.schema_str)
+                .where(self._is_stale(), versions.schema_canonical_hash.is_(None))
+                .order_by(versions.subject, versions.version)
+                .limit(limit)
+            )
+        ).all()
+        if not rows:
+            return LintBatchResult()
+
+        reports = await self._lint(
+            {f"{version}:{subject}": schema_str or "" for subject, version, schema_str in rows}
+        )
+        table = SchemaVersionModel.__table__
+        await session.execute(
+            update(table)
+            .where(
+                table.c.subject == bindparam("b_subject"),
+                table.c.version == bindparam("b_version"),
+            )
+            .values(
+                lint_report=bindparam("b_report"),
+                lint_engine_version=LINT_ENGINE_VERSION,
+                synced_at=table.c.synced_at,
+            ),
+            [
+                {
+                    "b_subject": subject,
+                    "b_version": version,
+                    "b_report": reports[f"{version}:{subject}"],
+                }
+                for subject, version, _ in rows
+            ],
+        )
+        await session.commit()
+        return LintBatchResult(linted_bodies=len(rows), updated_versions=len(rows))
+
+    async def _lint(self, bodies: dict[str, str]) -> dict[str, dict[str, Any]]:
+        if not bodies:
+            return {}
+        return await (self.cpu_executor or get_cpu_executor()).run(
+            _lint_bodies, bodies, size_hint=sum(map(len, bodies.values()))
+        )
+
+
+async def schema_lint_worker_lifespan(
+    worker: SchemaLintWorker, enabled: bool = True
+) -> AsyncIterator[SchemaLintWorker | None]:
+    """DI Resource: 앱 시작 시 워커 태스크를 띄우고 종료(shutdown_resources) 시 취소"""
+    if not enabled:
+        yield None
+        return
+
+    task = asyncio.create_task(worker.run_forever(), name="schema-lint-worker")
+    try:
+        yield worker
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
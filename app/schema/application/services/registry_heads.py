@@ -0,0 +1,128 @@
+"""Registry Head Index Service
+
+Registry별 subject 최신 버전(head)을 ``versions/latest`` 1회 호출로 수집해
+``schema_registry_heads`` 에 저장한다. drift 스캔과 registry 간 비교가 같은 인덱스를 쓴다.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, func, insert, select
+
+from app.schema.domain.models import SchemaVersionInfo
+from app.schema.domain.repositories.interfaces import ISchemaRegistryRepository
+from app.schema.infrastructure.catalog_models import SchemaRegistryHeadModel
+from app.shared.database import SessionFactory
+
+logger = logging.getLogger(__name__)
+
+# head 행을 한 번에 insert할 개수
+_INSERT_CHUNK_SIZE = 1_000
+
+
+@dataclass
+class RegistryHeadRefresh:
+    """head 인덱스 갱신 결과"""
+
+    registry_id: str
+    refreshed_at: datetime
+    heads: dict[str, SchemaVersionInfo] = field(default_factory=dict)
+    failed: list[str] = field(default_factory=list)
+
+
+class RegistryHeadIndexer:
+    """Registry head 인덱스 갱신/조회 서비스"""
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        *,
+        max_concurrent: int = 16,
+    ) -> None:
+        self.session_factory = session_factory
+        self.max_concurrent = max_concurrent
+
+    async def refresh(
+        self, registry_id: str, registry_repository: ISchemaRegistryRepository
+    ) -> RegistryHeadRefresh:
+        """SR 전체 subject의 최신 버전을 수집하고 해당 registry의 head를 교체
+
+        조회에 실패한 subject는 일시 오류로 보고 기존 head 행을 그대로 둔다. 이 행은
+        ``refreshed_at`` 이 이전 갱신 시각으로 남으므로 :meth:`stale_subjects` 로 다시 찾을 수 있다.
+        """
+        subjects = await registry_repository.list_all_subjects()
+        result = RegistryHeadRefresh(registry_id=registry_id, refreshed_at=datetime.now(UTC))
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
+        async def fetch(subject: str) -> None:
+            async with semaphore:
+                try:
+                    info = await registry_repository.get_latest_schema(subject)
+                except Exception as exc:
+                    logger.warning("[RegistryHeads] %s latest lookup failed: %s", subject, exc)
+                    result.failed.append(subject)
+                    return
+            if info.version is not None:
+                result.heads[subject] = info
+
+        await asyncio.gather(*(fetch(subject) for subject in subjects))
+        result.failed.sort()
+
+        rows = [
+            {
+                "registry_id": registry_id,
+                "subject": subject,
+                "version": info.version,
+                "schema_id": info.schema_id,
+                "schema_type": info.schema_type,
+                "canonical_hash": info.canonical_hash,
+                "schema_str": info.schema,
+                "refreshed_at": result.refreshed_at,
+            }
+            for subject, info in sorted(result.heads.items())
+        ]
+        stale = delete(SchemaRegistryHeadModel).where(
+            SchemaRegistryHeadModel.registry_id == registry_id
+        )
+        if result.failed:
+            stale = stale.where(SchemaRegistryHeadModel.subject.not_in(result.failed))
+        async with self.session_factory() as session:
+            await session.execute(stale)
+            for start in range(0, len(rows), _INSERT_CHUNK_SIZE):
+                await session.execute(
+                    insert(SchemaRegistryHeadModel), rows[start : start + _INSERT_CHUNK_SIZE]
+                )
+
+        logger.info(
+            "[RegistryHeads] registry=%s heads=%d failed=%d",
+            registry_id,
+            len(result.heads),
+            len(result.failed),
+        )
+        return result
+
+    async def last_refreshed_at(self, registry_id: str) -> datetime | None:
+        async with self.session_factory() as session:
+            return await session.scalar(
+                select(func.max(SchemaRegistryHeadModel.refreshed_at)).where(
+                    SchemaRegistryHeadModel.registry_id == registry_id
+                )
+            )
+
+    async def stale_subjects(self, registry_id: str) -> list[str]:
+        """마지막 갱신에서 조회에 실패해 이전 head가 남아 있는 subject 목록"""
+        heads = SchemaRegistryHeadModel
+        latest = (
+            select(func.max(heads.refreshed_at))
+            .where(heads.registry_id == registry_id)
+            .scalar_subquery()
+        )
+        async with self.session_factory() as session:
+            result = await session.scalars(
+                select(heads.subject)
+                .where(heads.registry_id == registry_id, heads.refreshed_at < latest)
+                .order_by(heads.subject)
+            )
+            return list(result)
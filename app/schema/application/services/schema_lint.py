@@ -16,6 +16,10 @@ from app.schema.domain.policies.structure import (
     DeepMapPolicy,
     ExcessiveUnionPolicy,
 )
+from app.shared.cpu_executor import CpuTaskExecutor, get_cpu_executor
+
+# lint 엔진 버전 - 정책 추가/삭제나 판정 규칙이 바뀌면 올린다 (저장된 lint_report 재계산 트리거)
+LINT_ENGINE_VERSION = 1
 
 
 class SchemaLintService:
@@ -82,6 +86,14 @@ class SchemaLintService:
             risk_score=risk_score,
         )
 
+    async def lint_avro_schema_async(
+        self, schema_str: str, cpu_executor: CpuTaskExecutor | None = None
+    ) -> LintReport:
+        """이벤트 루프를 막지 않도록 CPU 작업 실행기에서 린트 (큰 스키마는 프로세스 풀)"""
+        return await (cpu_executor or get_cpu_executor()).run(
+            self.lint_avro_schema, schema_str, size_hint=len(schema_str)
+        )
+
     def _calculate_pii_score(self, schema_dict: dict, violations: list[LintViolation]) -> float:
         """PII 점수 계산 로직"""
         # PII 관련 위반 개수 확인
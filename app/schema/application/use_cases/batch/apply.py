@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 import uuid
 from datetime import datetime
 
@@ -19,6 +20,9 @@ from app.schema.governance_support.constants import AuditAction, AuditStatus, Au
 from app.schema.governance_support.event_bus import get_event_bus
 from app.schema.governance_support.events import SchemaRegisteredEvent
 from app.schema.governance_support.use_cases import CreateApprovalRequestUseCase
+from app.shared.cpu_executor import CpuTaskExecutor, get_cpu_executor
+from app.shared.database import UnitOfWorkFactory, no_unit_of_work
+from app.shared.tracing import traced_class
 
 from ....domain.models import (
     ChangeId,
@@ -27,16 +31,22 @@ from ....domain.models import (
     DomainSchemaArtifact,
     DomainSchemaBatch,
     DomainSchemaPlan,
+    DomainSchemaPlanItem,
     DomainSchemaSpec,
+    SchemaReferenceGraph,
 )
 from ....domain.repositories.interfaces import (
     ISchemaAuditRepository,
     ISchemaMetadataRepository,
     ISchemaPolicyRepository,
+    ISchemaReferenceRepository,
 )
 from ....domain.services import SchemaPlannerService
 
+logger = logging.getLogger(__name__)
 
+
+@traced_class("usecase")
 class SchemaBatchApplyUseCase:
     """스키마 배치 Apply 유스케이스 (멀티 레지스트리/스토리지 지원)"""
 
@@ -47,12 +57,18 @@ class SchemaBatchApplyUseCase:
         audit_repository: ISchemaAuditRepository,
         policy_repository: ISchemaPolicyRepository | None = None,
         approval_request_use_case: CreateApprovalRequestUseCase | None = None,
+        reference_repository: ISchemaReferenceRepository | None = None,
+        unit_of_work: UnitOfWorkFactory | None = None,
+        cpu_executor: CpuTaskExecutor | None = None,
     ) -> None:
         self.connection_manager = connection_manager
         self.metadata_repository = metadata_repository
         self.audit_repository = audit_repository
         self.policy_repository = policy_repository
         self.approval_request_use_case = approval_request_use_case
+        self.reference_repository = reference_repository
+        self.unit_of_work = unit_of_work or no_unit_of_work
+        self.cpu_executor = cpu_executor or get_cpu_executor()
         self.event_bus = get_event_bus()
 
     async def execute(
@@ -64,6 +80,9 @@ class SchemaBatchApplyUseCase:
         approval_override: ApprovalOverride | None = None,
         actor_context: dict[str, str] | None = None,
     ) -> DomainSchemaApplyResult:
+        # STARTED 감사 로그와 plan은 Schema Registry 등록 전에 각각 커밋한다. 등록은 되돌릴 수
+        # 없으므로 등록 루프 전체를 하나의 트랜잭션으로 묶지 않고, 항목마다 등록 직후
+        # 아티팩트/참조 기록만 짧은 unit of work로 커밋한다.
         audit_id = str(uuid.uuid4())
         approval_context = {
             "risk": {"requires_approval": False, "reasons": []},
@@ -83,88 +102,98 @@ class SchemaBatchApplyUseCase:
 
         try:
             # 1. ConnectionManager로 Schema Registry Client 획득
-            registry_client = await self.connection_manager.get_schema_registry_client(registry_id)
-            registry_repository = ConfluentSchemaRegistryAdapter(registry_client)
-
-            # 2. Planner Service 생성 및 계획 수립
-            planner_service = SchemaPlannerService(
-                registry_repository=registry_repository,
-                policy_repository=self.policy_repository,
-            )
-            plan = await planner_service.create_plan(batch)
-            policy_pack_result = DefaultSchemaPolicyPackV1().evaluate(batch, plan)
-            plan = DomainSchemaPlan(
-                change_id=plan.change_id,
-                env=plan.env,
-                items=plan.items,
-                compatibility_reports=plan.compatibility_reports,
-                impacts=plan.impacts,
-                violations=policy_pack_result.violations,
-                risk=policy_pack_result.evaluation.risk_metadata(),
-                approval=policy_pack_result.evaluation.approval_metadata(
-                    mode="apply",
-                    approval_override_present=approval_override is not None,
-                ),
-                policy_evaluation=policy_pack_result.evaluation,
-                requested_total=plan.requested_total,
-                actor_context=actor_context,
-            )
-            await self.metadata_repository.save_plan(plan, actor)
-
-            approval_context = ensure_approval(
-                plan.policy_evaluation
-                if plan.policy_evaluation is not None
-                else assess_schema_batch_risk(batch, plan),
-                approval_override,
-            )
-
-            if not plan.can_apply:
-                if plan.policy_evaluation is not None:
-                    reasons = "; ".join(plan.policy_evaluation.reasons[:3])
-                    raise RuntimeError(f"policy blocked: {reasons}")
-                raise ValueError("Policy violations or incompatibilities detected; apply aborted")
-
-            registered: list[str] = []
-            skipped: list[str] = []
-            failed: list[dict[str, str]] = []
-            artifacts: list[DomainSchemaArtifact] = []
-            specs_by_subject = {spec.subject: spec for spec in batch.specs}
-            actionable_items = [
-                item
-                for item in plan.items
-                if item.action is not DomainPlanAction.NONE
-                and not specs_by_subject[item.subject].dry_run_only
-            ]
-
-            skipped.extend(
-                item.subject
-                for item in plan.items
-                if item.action is DomainPlanAction.NONE
-                or specs_by_subject[item.subject].dry_run_only
-            )
-
-            for item in actionable_items:
-                spec = specs_by_subject[item.subject]
-
-                try:
-                    version, schema_id = await registry_repository.register_schema(spec)  # type: ignore[arg-type]
-
-                    # MinIO 사용 없이 Artifact 메타데이터만 저장
-                    artifact = await self._persist_artifact(spec, version, batch.change_id)
-                    artifacts.append(artifact)
-                    registered.append(spec.subject)
-
-                    # 🆕 Domain Event 발행
-                    await self._publish_schema_registered_event(
-                        spec=spec,
-                        version=version,
-                        schema_id=schema_id,
-                        batch=batch,
-                        actor=actor,
+            async with self.connection_manager.borrow_schema_registry_client(
+                registry_id
+            ) as registry_client:
+                registry_repository = ConfluentSchemaRegistryAdapter(registry_client)
+
+                # 2. Planner Service 생성 및 계획 수립
+                planner_service = SchemaPlannerService(
+                    registry_repository=registry_repository,
+                    policy_repository=self.policy_repository,
+                    cpu_executor=self.cpu_executor,
+                )
+                plan = await planner_service.create_plan(batch)
+                policy_pack_result = DefaultSchemaPolicyPackV1().evaluate(batch, plan)
+                plan = DomainSchemaPlan(
+                    change_id=plan.change_id,
+                    env=plan.env,
+                    items=plan.items,
+                    compatibility_reports=plan.compatibility_reports,
+                    impacts=plan.impacts,
+                    violations=policy_pack_result.violations,
+                    risk=policy_pack_result.evaluation.risk_metadata(),
+                    approval=policy_pack_result.evaluation.approval_metadata(
+                        mode="apply",
+                        approval_override_present=approval_override is not None,
+                    ),
+                    policy_evaluation=policy_pack_result.evaluation,
+                    requested_total=plan.requested_total,
+                    actor_context=actor_context,
+                )
+                await self.metadata_repository.save_plan(plan, actor)
+
+                approval_context = ensure_approval(
+                    plan.policy_evaluation
+                    if plan.policy_evaluation is not None
+                    else assess_schema_batch_risk(batch, plan),
+                    approval_override,
+                )
+
+                if not plan.can_apply:
+                    if plan.policy_evaluation is not None:
+                        reasons = "; ".join(plan.policy_evaluation.reasons[:3])
+                        raise RuntimeError(f"policy blocked: {reasons}")
+                    raise ValueError(
+                        "Policy violations or incompatibilities detected; apply aborted"
                     )
 
-                except Exception as exc:
-                    failed.append({"subject": spec.subject, "error": str(exc)})
+                registered: list[str] = []
+                skipped: list[str] = []
+                failed: list[dict[str, str]] = []
+                artifacts: list[DomainSchemaArtifact] = []
+                specs_by_subject = {spec.subject: spec for spec in batch.specs}
+                actionable_items = self._order_by_references(
+                    batch,
+                    [
+                        item
+                        for item in plan.items
+                        if item.action is not DomainPlanAction.NONE
+                        and not specs_by_subject[item.subject].dry_run_only
+                    ],
+                )
+
+                skipped.extend(
+                    item.subject
+                    for item in plan.items
+                    if item.action is DomainPlanAction.NONE
+                    or specs_by_subject[item.subject].dry_run_only
+                )
+
+                for item in actionable_items:
+                    spec = specs_by_subject[item.subject]
+
+                    try:
+                        version, schema_id = await registry_repository.register_schema(spec)  # type: ignore[arg-type]
+
+                        # MinIO 사용 없이 Artifact 메타데이터만 저장 (등록 직후 커밋)
+                        async with self.unit_of_work():
+                            artifact = await self._persist_artifact(spec, version, batch.change_id)
+                            await self._record_references(spec, version)
+                        artifacts.append(artifact)
+                        registered.append(spec.subject)
+
+                        # 🆕 Domain Event 발행
+                        await self._publish_schema_registered_event(
+                            spec=spec,
+                            version=version,
+                            schema_id=schema_id,
+                            batch=batch,
+                            actor=actor,
+                        )
+
+                    except Exception as exc:
+                        failed.append({"subject": spec.subject, "error": str(exc)})
 
             result = DomainSchemaApplyResult(
                 change_id=batch.change_id,
@@ -190,32 +219,34 @@ class SchemaBatchApplyUseCase:
                 actor_context=actor_context,
             )
 
-            await self.metadata_repository.save_apply_result(result, actor)
-            await self.audit_repository.log_operation(
-                change_id=batch.change_id,
-                action=AuditAction.APPLY,
-                target=AuditTarget.BATCH,
-                actor=actor,
-                status=AuditStatus.COMPLETED,
-                message="Schema apply completed",
-                snapshot=merge_actor_metadata(
-                    {
-                        "summary": result.summary(),
-                        "requested_items": [
-                            {
-                                "subject": spec.subject,
-                                "reason": spec.reason,
-                            }
-                            for spec in batch.specs
-                        ],
-                        "policy_pack": plan.policy_evaluation.to_audit_dict()
-                        if plan.policy_evaluation is not None
-                        else None,
-                        **approval_context,
-                    },
-                    actor_context,
-                ),
-            )
+            # 결과와 COMPLETED 감사 로그는 함께 커밋
+            async with self.unit_of_work():
+                await self.metadata_repository.save_apply_result(result, actor)
+                await self.audit_repository.log_operation(
+                    change_id=batch.change_id,
+                    action=AuditAction.APPLY,
+                    target=AuditTarget.BATCH,
+                    actor=actor,
+                    status=AuditStatus.COMPLETED,
+                    message="Schema apply completed",
+                    snapshot=merge_actor_metadata(
+                        {
+                            "summary": result.summary(),
+                            "requested_items": [
+                                {
+                                    "subject": spec.subject,
+                                    "reason": spec.reason,
+                                }
+                                for spec in batch.specs
+                            ],
+                            "policy_pack": plan.policy_evaluation.to_audit_dict()
+                            if plan.policy_evaluation is not None
+                            else None,
+                            **approval_context,
+                        },
+                        actor_context,
+                    ),
+                )
 
             return result
         except ApprovalRequiredError as exc:
@@ -253,6 +284,35 @@ class SchemaBatchApplyUseCase:
             )
             raise
 
+    @staticmethod
+    def _order_by_references(
+        batch: DomainSchemaBatch, items: list[DomainSchemaPlanItem]
+    ) -> list[DomainSchemaPlanItem]:
+        """배치 안에서 참조되는 subject가 먼저 등록되도록 정렬 (참조가 없으면 순서 유지)"""
+        graph = SchemaReferenceGraph(
+            (spec.subject, reference.subject)
+            for spec in batch.specs
+            for reference in spec.references
+        )
+        if graph.edge_count == 0:
+            return items
+        items_by_subject = {item.subject: item for item in items}
+        return [
+            items_by_subject[subject]
+            for subject in graph.topological_order([item.subject for item in items])
+        ]
+
+    async def _record_references(self, spec: DomainSchemaSpec, version: int) -> None:
+        """등록된 버전의 참조 간선 기록 (실패해도 등록 결과에는 영향 없음, 다음 동기화에서 보정)"""
+        if self.reference_repository is None or not spec.references:
+            return
+        try:
+            await self.reference_repository.record_references(
+                spec.subject, version, spec.references
+            )
+        except Exception as exc:
+            logger.warning("Failed to record references for %s: %s", spec.subject, exc)
+
     async def _create_approval_request(
         self,
         *,
@@ -7,6 +7,9 @@ from app.infra.kafka.schema_registry_adapter import ConfluentSchemaRegistryAdapt
 from app.schema.domain.policies.policy_pack import DefaultSchemaPolicyPackV1
 from app.schema.governance_support.actor import merge_actor_metadata
 from app.schema.governance_support.constants import AuditAction, AuditStatus, AuditTarget
+from app.shared.cpu_executor import CpuTaskExecutor, get_cpu_executor
+from app.shared.database import UnitOfWorkFactory, no_unit_of_work
+from app.shared.tracing import traced_class
 
 from ....domain.models import DomainSchemaBatch, DomainSchemaPlan
 from ....domain.repositories.interfaces import (
@@ -17,6 +20,7 @@ from ....domain.repositories.interfaces import (
 from ....domain.services import SchemaPlannerService
 
 
+@traced_class("usecase")
 class SchemaBatchDryRunUseCase:
     """스키마 배치 Dry-Run 유스케이스 (멀티 레지스트리 지원)"""
 
@@ -26,11 +30,15 @@ class SchemaBatchDryRunUseCase:
         metadata_repository: ISchemaMetadataRepository,
         audit_repository: ISchemaAuditRepository,
         policy_repository: ISchemaPolicyRepository | None = None,
+        unit_of_work: UnitOfWorkFactory | None = None,
+        cpu_executor: CpuTaskExecutor | None = None,
     ) -> None:
         self.connection_manager = connection_manager
         self.metadata_repository = metadata_repository
         self.audit_repository = audit_repository
         self.policy_repository = policy_repository
+        self.unit_of_work = unit_of_work or no_unit_of_work
+        self.cpu_executor = cpu_executor or get_cpu_executor()
 
     async def execute(
         self,
@@ -39,79 +47,84 @@ class SchemaBatchDryRunUseCase:
         actor: str,
         actor_context: dict[str, str] | None = None,
     ) -> DomainSchemaPlan:
-        await self.audit_repository.log_operation(
-            change_id=batch.change_id,
-            action=AuditAction.DRY_RUN,
-            target=AuditTarget.BATCH,
-            actor=actor,
-            status=AuditStatus.STARTED,
-            message=f"Schema dry-run started for {len(batch.specs)} subjects",
-            snapshot=merge_actor_metadata(None, actor_context),
-        )
-
-        try:
-            # 1. ConnectionManager로 Schema Registry Client 획득
-            registry_client = await self.connection_manager.get_schema_registry_client(registry_id)
-            registry_repository = ConfluentSchemaRegistryAdapter(registry_client)
-
-            # 2. Planner Service 생성 및 계획 수립
-            planner_service = SchemaPlannerService(
-                registry_repository,
-                policy_repository=self.policy_repository,
-            )
-            plan = await planner_service.create_plan(batch)
-            policy_pack_result = DefaultSchemaPolicyPackV1().evaluate(batch, plan)
-            plan = DomainSchemaPlan(
-                change_id=plan.change_id,
-                env=plan.env,
-                items=plan.items,
-                compatibility_reports=plan.compatibility_reports,
-                impacts=plan.impacts,
-                violations=policy_pack_result.violations,
-                risk=policy_pack_result.evaluation.risk_metadata(),
-                approval=policy_pack_result.evaluation.approval_metadata(
-                    mode="dry-run",
-                    approval_override_present=False,
-                ),
-                policy_evaluation=policy_pack_result.evaluation,
-                requested_total=plan.requested_total,
-                actor_context=actor_context,
-            )
-
-            await self.metadata_repository.save_plan(plan, actor)
-            await self.audit_repository.log_operation(
-                change_id=batch.change_id,
-                action=AuditAction.DRY_RUN,
-                target=AuditTarget.BATCH,
-                actor=actor,
-                status=AuditStatus.COMPLETED,
-                message="Schema dry-run completed",
-                snapshot=merge_actor_metadata(
-                    {
-                        "summary": plan.summary(),
-                        "requested_items": [
-                            {
-                                "subject": spec.subject,
-                                "reason": spec.reason,
-                            }
-                            for spec in batch.specs
-                        ],
-                        "policy_pack": plan.policy_evaluation.to_audit_dict()
-                        if plan.policy_evaluation is not None
-                        else None,
-                    },
-                    actor_context,
-                ),
-            )
-            return plan
-        except Exception as exc:
+        # 감사 로그/plan 저장을 한 세션, 한 번의 커밋으로 처리
+        async with self.unit_of_work():
             await self.audit_repository.log_operation(
                 change_id=batch.change_id,
                 action=AuditAction.DRY_RUN,
                 target=AuditTarget.BATCH,
                 actor=actor,
-                status=AuditStatus.FAILED,
-                message=f"Schema dry-run failed: {exc!s}",
+                status=AuditStatus.STARTED,
+                message=f"Schema dry-run started for {len(batch.specs)} subjects",
                 snapshot=merge_actor_metadata(None, actor_context),
             )
-            raise
+
+            try:
+                # 1. ConnectionManager로 Schema Registry Client 획득
+                async with self.connection_manager.borrow_schema_registry_client(
+                    registry_id
+                ) as registry_client:
+                    registry_repository = ConfluentSchemaRegistryAdapter(registry_client)
+
+                    # 2. Planner Service 생성 및 계획 수립
+                    planner_service = SchemaPlannerService(
+                        registry_repository,
+                        policy_repository=self.policy_repository,
+                        cpu_executor=self.cpu_executor,
+                    )
+                    plan = await planner_service.create_plan(batch)
+                policy_pack_result = DefaultSchemaPolicyPackV1().evaluate(batch, plan)
+                plan = DomainSchemaPlan(
+                    change_id=plan.change_id,
+                    env=plan.env,
+                    items=plan.items,
+                    compatibility_reports=plan.compatibility_reports,
+                    impacts=plan.impacts,
+                    violations=policy_pack_result.violations,
+                    risk=policy_pack_result.evaluation.risk_metadata(),
+                    approval=policy_pack_result.evaluation.approval_metadata(
+                        mode="dry-run",
+                        approval_override_present=False,
+                    ),
+                    policy_evaluation=policy_pack_result.evaluation,
+                    requested_total=plan.requested_total,
+                    actor_context=actor_context,
+                )
+
+                await self.metadata_repository.save_plan(plan, actor)
+                await self.audit_repository.log_operation(
+                    change_id=batch.change_id,
+                    action=AuditAction.DRY_RUN,
+                    target=AuditTarget.BATCH,
+                    actor=actor,
+                    status=AuditStatus.COMPLETED,
+                    message="Schema dry-run completed",
+                    snapshot=merge_actor_metadata(
+                        {
+                            "summary": plan.summary(),
+                            "requested_items": [
+                                {
+                                    "subject": spec.subject,
+                                    "reason": spec.reason,
+                                }
+                                for spec in batch.specs
+                            ],
+                            "policy_pack": plan.policy_evaluation.to_audit_dict()
+                            if plan.policy_evaluation is not None
+                            else None,
+                        },
+                        actor_context,
+                    ),
+                )
+                return plan
+            except Exception as exc:
+                await self.audit_repository.log_operation(
+                    change_id=batch.change_id,
+                    action=AuditAction.DRY_RUN,
+                    target=AuditTarget.BATCH,
+                    actor=actor,
+                    status=AuditStatus.FAILED,
+                    message=f"Schema dry-run failed: {exc!s}",
+                    snapshot=merge_actor_metadata(None, actor_context),
+                )
+                raise
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from app.shared.tracing import traced_class
+
 from ....domain.models import ChangeId, DomainSchemaPlan
 from ....domain.repositories.interfaces import ISchemaMetadataRepository
 
 
+@traced_class("usecase")
 class SchemaPlanUseCase:
     """스키마 계획 조회 유스케이스"""
 
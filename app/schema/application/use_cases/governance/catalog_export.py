@@ -0,0 +1,305 @@
+"""Bulk schema catalog export use case."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Literal
+
+from sqlalchemy import and_, select
+
+from app.infra.kafka.connection_manager import IConnectionManager
+from app.infra.kafka.schema_registry_adapter import ConfluentSchemaRegistryAdapter
+from app.schema.domain.models import SchemaVersionExport, SubjectName
+from app.schema.governance_support.constants import AuditAction, AuditStatus
+from app.schema.infrastructure.catalog_models import SchemaSubjectModel, SchemaVersionModel
+from app.schema.infrastructure.models import SchemaAuditLogModel
+from app.shared.database import SessionFactory
+from app.shared.settings import settings
+from app.shared.tracing import traced_class
+
+from .versions import _build_export_filename
+
+logger = logging.getLogger(__name__)
+
+type ExportSource = Literal["auto", "catalog", "registry"]
+
+# 카탈로그 스트리밍 시 한 번에 가져올 행 수
+_CATALOG_FETCH_SIZE = 500
+
+
+@dataclass(slots=True, kw_only=True)
+class CatalogExportStream:
+    """일괄 export 스트림
+
+    ``entries`` 를 끝까지 소비한 뒤 ``exported`` / ``failures`` 가 확정된다.
+    """
+
+    source: Literal["catalog", "registry"]
+    include_history: bool
+    catalog_synced_at: datetime | None = None
+    exported: int = 0
+    failures: list[str] = field(default_factory=list)
+    entries: AsyncIterator[SchemaVersionExport] = field(init=False)
+
+    def manifest(self) -> dict[str, Any]:
+        return {
+            "source": self.source,
+            "include_history": self.include_history,
+            "catalog_synced_at": (
+                self.catalog_synced_at.isoformat() if self.catalog_synced_at else None
+            ),
+            "exported": self.exported,
+            "failures": self.failures,
+            "generated_at": datetime.now(UTC).isoformat(),
+        }
+
+
+async def _bounded_map[T, R](
+    items: Iterable[T] | AsyncIterator[T],
+    func: Callable[[T], Awaitable[R]],
+    concurrency: int,
+) -> AsyncIterator[R]:
+    """입력 순서를 유지하며 최대 ``concurrency`` 개만 동시에 실행"""
+    pending: deque[asyncio.Task[R]] = deque()
+
+    async def _iterate() -> AsyncIterator[T]:
+        if isinstance(items, AsyncIterator):
+            async for item in items:
+                yield item
+        else:
+            for item in items:
+                yield item
+
+    try:
+        async for item in _iterate():
+            pending.append(asyncio.create_task(func(item)))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+def _matches(subject: str, subjects: set[str] | None, subject_prefix: str | None) -> bool:
+    if subjects is not None and subject not in subjects:
+        return False
+    return subject_prefix is None or subject.startswith(subject_prefix)
+
+
+def _to_export(
+    *,
+    subject: str,
+    version: int,
+    schema_type: str | None,
+    schema_str: str,
+    canonical_hash: str | None,
+) -> SchemaVersionExport:
+    resolved_type = schema_type or "AVRO"
+    filename, media_type = _build_export_filename(subject, version, resolved_type)
+    return SchemaVersionExport(
+        subject=subject,
+        version=version,
+        schema_type=resolved_type,
+        filename=filename,
+        media_type=media_type,
+        schema_str=schema_str,
+        canonical_hash=canonical_hash,
+    )
+
+
+@traced_class("usecase")
+class ExportSchemaCatalogUseCase:
+    """Stream every (or filtered) subject's latest or full version history.
+
+    Reads the local catalog (``schema_versions``) when the latest sync was a recent,
+    completed sync of the requested registry, otherwise fetches from Schema Registry with
+    bounded concurrency.
+    """
+
+    def __init__(
+        self,
+        connection_manager: IConnectionManager,
+        session_factory: SessionFactory,
+    ) -> None:
+        self.connection_manager = connection_manager
+        self.session_factory = session_factory
+
+    async def last_catalog_sync(self, registry_id: str) -> datetime | None:
+        """``registry_id`` 기준으로 완료된 마지막 카탈로그 동기화 시각
+
+        카탈로그(schema_versions)에는 registry 컬럼이 없고 동기화마다 덮어쓰이므로, 가장
+        최근의 SYNC 감사 로그가 해당 registry의 완료 기록일 때만 카탈로그를 그 registry의
+        것으로 본다. 이후 다른 registry 동기화가 시작됐거나 registry_id가 기록되지 않은
+        이전 로그라면 ``None`` 을 반환한다.
+        """
+        async with self.session_factory() as session:
+            latest = (
+                await session.execute(
+                    select(
+                        SchemaAuditLogModel.timestamp,
+                        SchemaAuditLogModel.status,
+                        SchemaAuditLogModel.snapshot,
+                    )
+                    .where(SchemaAuditLogModel.action == AuditAction.SYNC)
+                    .order_by(SchemaAuditLogModel.timestamp.desc(), SchemaAuditLogModel.id.desc())
+                    .limit(1)
+                )
+            ).first()
+        if latest is None or latest.status != AuditStatus.COMPLETED:
+            return None
+        if (latest.snapshot or {}).get("registry_id") != registry_id:
+            return None
+        synced_at = latest.timestamp
+        if synced_at.tzinfo is None:
+            synced_at = synced_at.replace(tzinfo=UTC)
+        return synced_at
+
+    async def execute(
+        self,
+        registry_id: str,
+        *,
+        include_history: bool = False,
+        subjects: list[SubjectName] | None = None,
+        subject_prefix: str | None = None,
+        source: ExportSource = "auto",
+    ) -> CatalogExportStream:
+        """일괄 export 스트림 생성
+
+        Raises:
+            ValueError: ``source="catalog"`` 인데 카탈로그가 ``registry_id`` 의 최신 동기화
+                결과가 아닐 때
+        """
+        subject_filter = set(subjects) if subjects else None
+        synced_at = await self.last_catalog_sync(registry_id)
+        age = (datetime.now(UTC) - synced_at).total_seconds() if synced_at else None
+        fresh = age is not None and age <= settings.schema_export_catalog_max_age_seconds
+
+        if source == "auto":
+            source = "catalog" if fresh else "registry"
+        elif source == "catalog" and not fresh:
+            raise ValueError(
+                f"catalog is not a fresh sync of registry '{registry_id}'; "
+                "run a sync or use source=registry"
+            )
+
+        if source == "catalog":
+            stream = CatalogExportStream(
+                source="catalog",
+                include_history=include_history,
+                catalog_synced_at=synced_at,
+            )
+            stream.entries = self._iter_catalog(
+                stream, subject_filter, subject_prefix, include_history
+            )
+            return stream
+
+        # registry 연결/목록 오류는 스트리밍 시작 전에 드러나도록 subject 목록은 즉시 조회
+        async with self.connection_manager.borrow_schema_registry_client(
+            registry_id
+        ) as registry_client:
+            all_subjects = await ConfluentSchemaRegistryAdapter(registry_client).list_all_subjects()
+        selected = sorted(
+            subject for subject in all_subjects if _matches(subject, subject_filter, subject_prefix)
+        )
+        stream = CatalogExportStream(
+            source="registry",
+            include_history=include_history,
+            catalog_synced_at=synced_at,
+        )
+        stream.entries = self._iter_registry(stream, registry_id, selected, include_history)
+        return stream
+
+    async def _iter_catalog(
+        self,
+        stream: CatalogExportStream,
+        subject_filter: set[str] | None,
+        subject_prefix: str | None,
+        include_history: bool,
+    ) -> AsyncIterator[SchemaVersionExport]:
+        query = select(
+            SchemaVersionModel.subject,
+            SchemaVersionModel.version,
+            SchemaVersionModel.schema_type,
+            SchemaVersionModel.schema_str,
+            SchemaVersionModel.schema_canonical_hash,
+        )
+        if not include_history:
+            query = query.join(
+                SchemaSubjectModel,
+                and_(
+                    SchemaSubjectModel.subject == SchemaVersionModel.subject,
+                    SchemaSubjectModel.latest_version == SchemaVersionModel.version,
+                ),
+            )
+        if subject_filter is not None:
+            query = query.where(SchemaVersionModel.subject.in_(subject_filter))
+        if subject_prefix:
+            query = query.where(SchemaVersionModel.subject.startswith(subject_prefix))
+        query = query.order_by(SchemaVersionModel.subject, SchemaVersionModel.version)
+
+        async with self.session_factory() as session:
+            result = await session.stream(query.execution_options(yield_per=_CATALOG_FETCH_SIZE))
+            async for row in result:
+                stream.exported += 1
+                yield _to_export(
+                    subject=row.subject,
+                    version=row.version,
+                    schema_type=row.schema_type,
+                    schema_str=row.schema_str,
+                    canonical_hash=row.schema_canonical_hash,
+                )
+
+    async def _iter_registry(
+        self,
+        stream: CatalogExportStream,
+        registry_id: str,
+        subjects: list[str],
+        include_history: bool,
+    ) -> AsyncIterator[SchemaVersionExport]:
+        concurrency = settings.schema_export_registry_concurrency
+        # 스트림을 모두 소비(또는 중단)할 때까지 Client를 대여해 중간에 닫히지 않게 한다
+        async with self.connection_manager.borrow_schema_registry_client(
+            registry_id
+        ) as registry_client:
+            registry_repository = ConfluentSchemaRegistryAdapter(registry_client)
+
+            async def list_versions(subject: str) -> tuple[str, list[int]]:
+                try:
+                    return subject, await registry_repository.get_schema_versions(subject)
+                except Exception as exc:
+                    logger.warning("[CatalogExport] %s versions lookup failed: %s", subject, exc)
+                    stream.failures.append(subject)
+                    return subject, []
+
+            async def version_refs() -> AsyncIterator[tuple[str, int]]:
+                async for subject, versions in _bounded_map(subjects, list_versions, concurrency):
+                    for version in versions if include_history else versions[-1:]:
+                        yield subject, version
+
+            async def fetch(ref: tuple[str, int]) -> SchemaVersionExport | None:
+                subject, version = ref
+                try:
+                    info = await registry_repository.get_schema_by_version(subject, version)
+                except Exception as exc:
+                    logger.warning("[CatalogExport] %s v%d fetch failed: %s", subject, version, exc)
+                    stream.failures.append(f"{subject}:v{version}")
+                    return None
+                return _to_export(
+                    subject=subject,
+                    version=version,
+                    schema_type=info.schema_type,
+                    schema_str=info.schema or "",
+                    canonical_hash=info.canonical_hash,
+                )
+
+            async for exported in _bounded_map(version_refs(), fetch, concurrency):
+                if exported is not None:
+                    stream.exported += 1
+                    yield exported
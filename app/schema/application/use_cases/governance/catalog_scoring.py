@@ -0,0 +1,25 @@
+"""Catalog PII/Risk 점수 재계산 유스케이스"""
+
+from __future__ import annotations
+
+from app.schema.application.services.catalog_scoring import CatalogScoringService
+from app.schema.domain.models import CatalogRescoreSummary
+from app.shared.database import SessionFactory
+from app.shared.tracing import traced_class
+
+
+@traced_class("usecase")
+class RescoreCatalogUseCase:
+    """catalog 전체 subject의 PII/리스크 점수를 재계산
+
+    PII 키워드 사전이 바뀌었을 때 registry 재동기화 없이 저장된 스키마만으로 점수를 갱신한다.
+    """
+
+    def __init__(self, session_factory: SessionFactory) -> None:
+        self.session_factory = session_factory
+
+    async def execute(self, keywords: list[str] | None = None) -> CatalogRescoreSummary:
+        if keywords is not None and not any(keyword.strip() for keyword in keywords):
+            raise ValueError("keywords must contain at least one non-empty keyword")
+        async with self.session_factory() as session:
+            return await CatalogScoringService(session).rescore(keywords=keywords)
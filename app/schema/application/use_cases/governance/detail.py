@@ -18,8 +18,11 @@ from app.schema.domain.repositories.interfaces import (
     ISchemaMetadataRepository,
     ISchemaPolicyRepository,
 )
+from app.shared.database import UnitOfWorkFactory, no_unit_of_work
+from app.shared.tracing import traced_class
 
 
+@traced_class("usecase")
 class GetSubjectDetailUseCase:
     """스키마 상세 정보 조회 (최신 스키마 포함)"""
 
@@ -28,10 +31,12 @@ class GetSubjectDetailUseCase:
         connection_manager: IConnectionManager,
         metadata_repository: ISchemaMetadataRepository,
         policy_repository: ISchemaPolicyRepository | None = None,
+        unit_of_work: UnitOfWorkFactory | None = None,
     ) -> None:
         self.connection_manager = connection_manager
         self.metadata_repository = metadata_repository
         self.policy_repository = policy_repository
+        self.unit_of_work = unit_of_work or no_unit_of_work
         self.logger = logging.getLogger(__name__)
 
     async def execute(self, registry_id: str, subject: str) -> SubjectDetail:
@@ -44,15 +49,17 @@ class GetSubjectDetailUseCase:
             raise ValueError(f"Subject '{subject}' not found in registry '{registry_id}'")
 
         info = describe_res[subject]
-        artifact = await self.metadata_repository.get_latest_artifact(subject)
-        metadata = await self.metadata_repository.get_schema_metadata(subject)
-
-        # Policy 검증 수행
         env_str = subject.split(".")[0] if "." in subject else "dev"
         active_policies = []
-        if self.policy_repository:
-            # 해당 환경 및 전체 정책 로드
-            active_policies = await self.policy_repository.list_active_policies(env=env_str)
+        # 아티팩트/메타데이터/정책 조회를 커넥션 하나로 처리
+        async with self.unit_of_work(read_only=True):
+            artifact = await self.metadata_repository.get_latest_artifact(subject)
+            metadata = await self.metadata_repository.get_schema_metadata(subject)
+
+            # Policy 검증 수행
+            if self.policy_repository:
+                # 해당 환경 및 전체 정책 로드
+                active_policies = await self.policy_repository.list_active_policies(env=env_str)
 
         policy_engine = DynamicSchemaPolicyEngine(active_policies)
 
@@ -2,38 +2,47 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from contextlib import AbstractAsyncContextManager
-from typing import Protocol, cast
+import logging
+import time
+from datetime import UTC, datetime
+from typing import cast
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, delete, func, insert, select
 
 from app.infra.kafka.connection_manager import IConnectionManager
 from app.infra.kafka.schema_registry_adapter import ConfluentSchemaRegistryAdapter
-from app.schema.domain.models import SubjectDriftReport, SubjectName
-from app.schema.domain.repositories.interfaces import ISchemaMetadataRepository
+from app.schema.application.services.registry_heads import RegistryHeadIndexer
+from app.schema.domain.models import (
+    SchemaDriftReportPage,
+    SchemaDriftScanSummary,
+    SubjectDriftReport,
+    SubjectName,
+)
 from app.schema.infrastructure.catalog_models import (
     ObservedUsageModel,
+    SchemaDriftFindingModel,
+    SchemaDriftScanModel,
     SchemaSubjectModel,
     SchemaVersionModel,
 )
+from app.shared.database import SessionFactory
+from app.shared.settings import settings
+from app.shared.tracing import traced_class
 
-
-class _MetadataRepositoryWithSessionFactory(Protocol):
-    session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]]
+logger = logging.getLogger(__name__)
 
 
+@traced_class("usecase")
 class GetSchemaDriftUseCase:
     """Compare live registry latest state with local catalog snapshots."""
 
     def __init__(
         self,
         connection_manager: IConnectionManager,
-        metadata_repository: ISchemaMetadataRepository,
+        session_factory: SessionFactory,
     ) -> None:
         self.connection_manager = connection_manager
-        self.metadata_repository = metadata_repository
+        self.session_factory = session_factory
 
     async def execute(self, registry_id: str, subject: SubjectName) -> SubjectDriftReport:
         registry_client = await self.connection_manager.get_schema_registry_client(registry_id)
@@ -47,11 +56,7 @@ class GetSchemaDriftUseCase:
         if current_info.version is None:
             raise ValueError(f"Subject '{subject}' not found")
 
-        metadata_repository = cast(
-            _MetadataRepositoryWithSessionFactory,
-            cast(object, self.metadata_repository),
-        )
-        async with metadata_repository.session_factory() as session:
+        async with self.session_factory() as session:
             subject_row = await session.scalar(
                 select(SchemaSubjectModel).where(SchemaSubjectModel.subject == subject)
             )
@@ -68,37 +73,308 @@ class GetSchemaDriftUseCase:
                 .limit(1)
             )
 
-        drift_flags: list[str] = []
-        if subject_row is None:
-            drift_flags.append("catalog_subject_missing")
-        elif subject_row.latest_version != current_info.version:
-            drift_flags.append("catalog_subject_version_mismatch")
-
-        if version_row is None:
-            drift_flags.append("catalog_version_missing")
-        else:
-            if version_row.version != current_info.version:
-                drift_flags.append("catalog_snapshot_version_mismatch")
-            if (
-                current_info.canonical_hash is not None
-                and version_row.schema_canonical_hash is not None
-                and current_info.canonical_hash != version_row.schema_canonical_hash
-            ):
-                drift_flags.append("catalog_canonical_hash_mismatch")
-
-        if observed_row is not None and observed_row.version != current_info.version:
-            drift_flags.append("observed_usage_on_non_latest_version")
-
-        return SubjectDriftReport(
+        return _build_drift_report(
             subject=subject,
-            registry_latest_version=current_info.version,
+            registry_version=current_info.version,
             registry_canonical_hash=current_info.canonical_hash,
-            catalog_latest_version=version_row.version if version_row is not None else None,
+            subject_in_catalog=subject_row is not None,
+            subject_latest_version=subject_row.latest_version if subject_row is not None else None,
+            catalog_version=version_row.version if version_row is not None else None,
             catalog_canonical_hash=(
                 version_row.schema_canonical_hash if version_row is not None else None
             ),
             observed_version=observed_row.version if observed_row is not None else None,
-            last_synced_at=subject_row.updated_at.isoformat() if subject_row is not None else None,
-            drift_flags=drift_flags,
-            has_drift=bool(drift_flags),
+            last_synced_at=subject_row.updated_at if subject_row is not None else None,
+        )
+
+
+def _build_drift_report(
+    *,
+    subject: str,
+    registry_version: int,
+    registry_canonical_hash: str | None,
+    subject_in_catalog: bool,
+    subject_latest_version: int | None,
+    catalog_version: int | None,
+    catalog_canonical_hash: str | None,
+    observed_version: int | None,
+    last_synced_at: datetime | None,
+) -> SubjectDriftReport:
+    """라이브 최신 상태와 catalog 값으로 drift 플래그 계산 (단건/전체 스캔 공통)"""
+    drift_flags: list[str] = []
+    if not subject_in_catalog:
+        drift_flags.append("catalog_subject_missing")
+    elif subject_latest_version != registry_version:
+        drift_flags.append("catalog_subject_version_mismatch")
+
+    if catalog_version is None:
+        drift_flags.append("catalog_version_missing")
+    else:
+        if catalog_version != registry_version:
+            drift_flags.append("catalog_snapshot_version_mismatch")
+        if (
+            registry_canonical_hash is not None
+            and catalog_canonical_hash is not None
+            and registry_canonical_hash != catalog_canonical_hash
+        ):
+            drift_flags.append("catalog_canonical_hash_mismatch")
+
+    if observed_version is not None and observed_version != registry_version:
+        drift_flags.append("observed_usage_on_non_latest_version")
+
+    return SubjectDriftReport(
+        subject=subject,
+        registry_latest_version=registry_version,
+        registry_canonical_hash=registry_canonical_hash,
+        catalog_latest_version=catalog_version,
+        catalog_canonical_hash=catalog_canonical_hash,
+        observed_version=observed_version,
+        last_synced_at=last_synced_at.isoformat() if last_synced_at is not None else None,
+        drift_flags=drift_flags,
+        has_drift=bool(drift_flags),
+    )
+
+
+@traced_class("usecase")
+class ScanSchemaDriftUseCase:
+    """Registry 전체 subject drift 스캔
+
+    SR 최신 버전은 head 인덱스 갱신(``versions/latest`` subject당 1회, 제한된 동시성)으로 얻고
+    catalog 쪽은 subject/최신 버전/관측 버전을 각각 집합 쿼리 1회로 읽어 메모리에서
+    조인한다. drift가 있는 subject만 저장해 대시보드가 즉시 조회할 수 있게 한다.
+    """
+
+    def __init__(
+        self,
+        connection_manager: IConnectionManager,
+        session_factory: SessionFactory,
+    ) -> None:
+        self.connection_manager = connection_manager
+        self.session_factory = session_factory
+
+    async def execute(self, registry_id: str) -> SchemaDriftScanSummary:
+        started = time.perf_counter()
+        async with self.connection_manager.borrow_schema_registry_client(
+            registry_id
+        ) as registry_client:
+            # head 인덱스도 함께 갱신되어 registry 간 비교에 재사용된다
+            refresh = await RegistryHeadIndexer(
+                self.session_factory, max_concurrent=settings.schema_drift_scan_concurrency
+            ).refresh(registry_id, ConfluentSchemaRegistryAdapter(registry_client))
+        latest, failed = refresh.heads, refresh.failed
+
+        async with self.session_factory() as session:
+            catalog_subjects = {
+                subject: (latest_version, updated_at)
+                for subject, latest_version, updated_at in await session.execute(
+                    select(
+                        SchemaSubjectModel.subject,
+                        SchemaSubjectModel.latest_version,
+                        SchemaSubjectModel.updated_at,
+                    )
+                )
+            }
+            latest_versions = (
+                select(
+                    SchemaVersionModel.subject,
+                    func.max(SchemaVersionModel.version).label("version"),
+                )
+                .group_by(SchemaVersionModel.subject)
+                .subquery()
+            )
+            catalog_versions = {
+                subject: (version, canonical_hash)
+                for subject, version, canonical_hash in await session.execute(
+                    select(
+                        SchemaVersionModel.subject,
+                        SchemaVersionModel.version,
+                        SchemaVersionModel.schema_canonical_hash,
+                    ).join(
+                        latest_versions,
+                        and_(
+                            SchemaVersionModel.subject == latest_versions.c.subject,
+                            SchemaVersionModel.version == latest_versions.c.version,
+                        ),
+                    )
+                )
+            }
+            observed_versions = dict(
+                (
+                    await session.execute(
+                        select(
+                            ObservedUsageModel.subject, func.max(ObservedUsageModel.version)
+                        ).group_by(ObservedUsageModel.subject)
+                    )
+                )
+                .tuples()
+                .all()
+            )
+            # 조회 실패 subject는 직전 finding을 그대로 유지하므로 drift 수에 포함한다
+            retained = (
+                await session.scalar(
+                    select(func.count())
+                    .select_from(SchemaDriftFindingModel)
+                    .where(
+                        SchemaDriftFindingModel.registry_id == registry_id,
+                        SchemaDriftFindingModel.subject.in_(failed),
+                    )
+                )
+                if failed
+                else 0
+            )
+
+        findings: list[SubjectDriftReport] = []
+        for subject, info in latest.items():
+            subject_row = catalog_subjects.get(subject)
+            version_row = catalog_versions.get(subject)
+            report = _build_drift_report(
+                subject=subject,
+                registry_version=cast(int, info.version),
+                registry_canonical_hash=info.canonical_hash,
+                subject_in_catalog=subject_row is not None,
+                subject_latest_version=subject_row[0] if subject_row is not None else None,
+                catalog_version=version_row[0] if version_row is not None else None,
+                catalog_canonical_hash=version_row[1] if version_row is not None else None,
+                observed_version=observed_versions.get(subject),
+                last_synced_at=subject_row[1] if subject_row is not None else None,
+            )
+            if report.has_drift:
+                findings.append(report)
+
+        # catalog에는 남아 있지만 SR에서 사라진 subject (조회 실패 subject는 판단할 수 없어 제외)
+        for subject in sorted(catalog_subjects.keys() - latest.keys() - set(failed)):
+            version_row = catalog_versions.get(subject)
+            last_synced_at = catalog_subjects[subject][1]
+            findings.append(
+                SubjectDriftReport(
+                    subject=subject,
+                    registry_latest_version=None,
+                    catalog_latest_version=version_row[0] if version_row is not None else None,
+                    catalog_canonical_hash=version_row[1] if version_row is not None else None,
+                    observed_version=observed_versions.get(subject),
+                    last_synced_at=(
+                        last_synced_at.isoformat() if last_synced_at is not None else None
+                    ),
+                    drift_flags=["registry_subject_missing"],
+                    has_drift=True,
+                )
+            )
+
+        summary = SchemaDriftScanSummary(
+            registry_id=registry_id,
+            scanned_at=datetime.now(UTC),
+            subjects_scanned=len(latest),
+            drifted_subjects=len(findings) + (retained or 0),
+            failed_subjects=failed,
+            duration_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+        await self._store(summary, findings)
+        logger.info(
+            "[DriftScan] registry=%s scanned=%d drifted=%d failed=%d",
+            registry_id,
+            summary.subjects_scanned,
+            summary.drifted_subjects,
+            len(failed),
+        )
+        return summary
+
+    async def _store(
+        self, summary: SchemaDriftScanSummary, findings: list[SubjectDriftReport]
+    ) -> None:
+        """직전 스캔 결과를 교체 (registry 단위)
+
+        이번 스캔에서 SR 조회에 실패한 subject는 판단 근거가 없으므로 직전 finding을 유지한다.
+        """
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(SchemaDriftFindingModel).where(
+                    SchemaDriftFindingModel.registry_id == summary.registry_id,
+                    SchemaDriftFindingModel.subject.not_in(summary.failed_subjects),
+                )
+            )
+            if findings:
+                await session.execute(
+                    insert(SchemaDriftFindingModel),
+                    [
+                        {
+                            "registry_id": summary.registry_id,
+                            "subject": report.subject,
+                            "registry_latest_version": report.registry_latest_version,
+                            "registry_canonical_hash": report.registry_canonical_hash,
+                            "catalog_latest_version": report.catalog_latest_version,
+                            "catalog_canonical_hash": report.catalog_canonical_hash,
+                            "observed_version": report.observed_version,
+                            "last_synced_at": report.last_synced_at,
+                            "drift_flags": report.drift_flags,
+                        }
+                        for report in findings
+                    ],
+                )
+            await session.merge(
+                SchemaDriftScanModel(
+                    registry_id=summary.registry_id,
+                    scanned_at=summary.scanned_at,
+                    subjects_scanned=summary.subjects_scanned,
+                    drifted_subjects=summary.drifted_subjects,
+                    failed_subjects=summary.failed_subjects,
+                    duration_ms=summary.duration_ms,
+                )
+            )
+
+
+@traced_class("usecase")
+class GetSchemaDriftReportUseCase:
+    """저장된 전체 drift 스캔 결과 조회 (SR 호출 없음)"""
+
+    def __init__(self, session_factory: SessionFactory) -> None:
+        self.session_factory = session_factory
+
+    async def execute(
+        self, registry_id: str, *, page: int = 1, limit: int = 50
+    ) -> SchemaDriftReportPage:
+        async with self.session_factory() as session:
+            scan = await session.get(SchemaDriftScanModel, registry_id)
+            total = await session.scalar(
+                select(func.count())
+                .select_from(SchemaDriftFindingModel)
+                .where(SchemaDriftFindingModel.registry_id == registry_id)
+            )
+            rows = (
+                await session.scalars(
+                    select(SchemaDriftFindingModel)
+                    .where(SchemaDriftFindingModel.registry_id == registry_id)
+                    .order_by(SchemaDriftFindingModel.subject)
+                    .limit(limit)
+                    .offset((page - 1) * limit)
+                )
+            ).all()
+
+        items = [
+            SubjectDriftReport(
+                subject=row.subject,
+                registry_latest_version=row.registry_latest_version,
+                registry_canonical_hash=row.registry_canonical_hash,
+                catalog_latest_version=row.catalog_latest_version,
+                catalog_canonical_hash=row.catalog_canonical_hash,
+                observed_version=row.observed_version,
+                last_synced_at=row.last_synced_at,
+                drift_flags=list(row.drift_flags or []),
+                has_drift=True,
+            )
+            for row in rows
+        ]
+        summary = (
+            SchemaDriftScanSummary(
+                registry_id=scan.registry_id,
+                scanned_at=scan.scanned_at,
+                subjects_scanned=scan.subjects_scanned,
+                drifted_subjects=scan.drifted_subjects,
+                failed_subjects=list(scan.failed_subjects or []),
+                duration_ms=scan.duration_ms,
+            )
+            if scan is not None
+            else None
+        )
+        return SchemaDriftReportPage(
+            summary=summary, items=items, total=total or 0, page=page, limit=limit
         )
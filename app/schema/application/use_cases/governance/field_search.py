@@ -0,0 +1,114 @@
+"""Catalog 필드 색인 검색/재구축 유스케이스"""
+
+from __future__ import annotations
+
+from sqlalchemy import and_, func, select
+
+from app.schema.application.services.catalog_scoring import normalize_field_name
+from app.schema.application.services.field_index import CatalogFieldIndexer
+from app.schema.domain.models import (
+    FieldIndexRebuildSummary,
+    SchemaFieldHit,
+    SchemaFieldSearchPage,
+)
+from app.schema.infrastructure.catalog_models import SchemaFieldIndexModel, SchemaSubjectModel
+from app.shared.database import SessionFactory
+from app.shared.tracing import traced_class
+
+
+@traced_class("usecase")
+class SearchSchemaFieldsUseCase:
+    """필드 이름/타입으로 subject 검색 (``schema_field_index`` 인덱스만 사용)
+
+    이름은 camelCase/snake_case 구분 없이 정규화해서 비교한다 (``customerId`` == ``customer_id``).
+    기본은 subject별 최신 버전만 검색한다.
+    """
+
+    def __init__(self, session_factory: SessionFactory) -> None:
+        self.session_factory = session_factory
+
+    async def execute(
+        self,
+        *,
+        name: str | None = None,
+        name_prefix: str | None = None,
+        field_type: str | None = None,
+        logical_type: str | None = None,
+        nullable: bool | None = None,
+        subject_prefix: str | None = None,
+        latest_only: bool = True,
+        page: int = 1,
+        limit: int = 50,
+    ) -> SchemaFieldSearchPage:
+        if not (name or name_prefix or field_type):
+            raise ValueError("At least one of name, name_prefix or field_type is required")
+
+        index = SchemaFieldIndexModel
+        conditions = []
+        if name:
+            conditions.append(index.name_key == normalize_field_name(name))
+        if name_prefix:
+            conditions.append(
+                index.name_key.startswith(normalize_field_name(name_prefix), autoescape=True)
+            )
+        if field_type:
+            conditions.append(index.field_type == field_type)
+        if logical_type:
+            conditions.append(index.logical_type == logical_type)
+        if nullable is not None:
+            conditions.append(index.nullable.is_(nullable))
+        if subject_prefix:
+            conditions.append(index.subject.startswith(subject_prefix, autoescape=True))
+
+        base = select(index).where(*conditions)
+        if latest_only:
+            base = base.join(
+                SchemaSubjectModel,
+                and_(
+                    SchemaSubjectModel.subject == index.subject,
+                    SchemaSubjectModel.latest_version == index.version,
+                ),
+            )
+
+        async with self.session_factory() as session:
+            total = await session.scalar(select(func.count()).select_from(base.subquery()))
+            rows = (
+                await session.scalars(
+                    base.order_by(index.subject, index.version, index.field_path)
+                    .limit(limit)
+                    .offset((page - 1) * limit)
+                )
+            ).all()
+
+        return SchemaFieldSearchPage(
+            items=[
+                SchemaFieldHit(
+                    subject=row.subject,
+                    version=row.version,
+                    field_path=row.field_path,
+                    field_name=row.field_name,
+                    field_type=row.field_type,
+                    logical_type=row.logical_type,
+                    nullable=row.nullable,
+                    has_default=row.has_default,
+                    has_doc=row.has_doc,
+                    depth=row.depth,
+                )
+                for row in rows
+            ],
+            total=total or 0,
+            page=page,
+            limit=limit,
+        )
+
+
+@traced_class("usecase")
+class RebuildFieldIndexUseCase:
+    """저장된 스키마 버전 전체로 필드 색인 재구축 (색인 도입 전 catalog 백필용)"""
+
+    def __init__(self, session_factory: SessionFactory) -> None:
+        self.session_factory = session_factory
+
+    async def execute(self) -> FieldIndexRebuildSummary:
+        async with self.session_factory() as session:
+            return await CatalogFieldIndexer(session).rebuild()
@@ -4,12 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
-from contextlib import AbstractAsyncContextManager
-from typing import Protocol, cast
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infra.kafka.connection_manager import IConnectionManager
 from app.infra.kafka.schema_registry_adapter import ConfluentSchemaRegistryAdapter
@@ -19,30 +15,26 @@ from app.schema.domain.models import (
     SubjectHistory,
     SubjectName,
 )
-from app.schema.domain.repositories.interfaces import (
-    ISchemaMetadataRepository,
-)
 from app.schema.infrastructure.models import (
     SchemaArtifactModel,
     SchemaAuditLogModel,
-    SchemaPlanModel,
+    SchemaPlanItemModel,
 )
+from app.shared.database import SessionFactory
+from app.shared.tracing import traced_class
 
 
-class _MetadataRepositoryWithSessionFactory(Protocol):
-    session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]]
-
-
+@traced_class("usecase")
 class GetSchemaHistoryUseCase:
     """스키마 이력 조회 (타임머신)"""
 
     def __init__(
         self,
         connection_manager: IConnectionManager,
-        metadata_repository: ISchemaMetadataRepository,
+        session_factory: SessionFactory,
     ) -> None:
         self.connection_manager = connection_manager
-        self.metadata_repository = metadata_repository
+        self.session_factory = session_factory
         self.logger = logging.getLogger(__name__)
 
     async def execute(self, registry_id: str, subject: SubjectName) -> SubjectHistory:
@@ -53,12 +45,7 @@ class GetSchemaHistoryUseCase:
         versions = await registry_repository.get_schema_versions(subject)
 
         # DB에서 아티팩트 및 감사 로그 조회 (작성자, 시간 등)
-        metadata_repository = cast(
-            _MetadataRepositoryWithSessionFactory,
-            cast(object, self.metadata_repository),
-        )
-        session_factory = metadata_repository.session_factory
-        async with session_factory() as session:
+        async with self.session_factory() as session:
             # 아티팩트 조회
             stmt_art = select(SchemaArtifactModel).where(SchemaArtifactModel.subject == subject)
             res_art = await session.execute(stmt_art)
@@ -76,15 +63,15 @@ class GetSchemaHistoryUseCase:
                 res_audit = await session.execute(stmt_audit)
                 audit_logs = {log.change_id: log.actor for log in res_audit.scalars().all()}
 
-                stmt_plan = select(SchemaPlanModel).where(SchemaPlanModel.change_id.in_(change_ids))
+                stmt_plan = select(SchemaPlanItemModel.change_id, SchemaPlanItemModel.reason).where(
+                    SchemaPlanItemModel.subject == subject,
+                    SchemaPlanItemModel.change_id.in_(change_ids),
+                    SchemaPlanItemModel.reason.is_not(None),
+                )
                 res_plan = await session.execute(stmt_plan)
-                for plan_model in res_plan.scalars().all():
-                    items = plan_model.plan_data.get("items", []) if plan_model.plan_data else []
-                    for item in items:
-                        item_subject = item.get("subject")
-                        reason = item.get("reason")
-                        if isinstance(item_subject, str) and isinstance(reason, str) and reason:
-                            plan_reasons[(plan_model.change_id, item_subject)] = reason
+                plan_reasons = {
+                    (change_id, subject): reason for change_id, reason in res_plan.all()
+                }
 
         # 각 버전별 상세 조회 (병렬)
         tasks = [registry_repository.get_schema_by_version(subject, v) for v in versions]
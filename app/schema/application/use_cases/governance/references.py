@@ -0,0 +1,31 @@
+"""스키마 참조 영향도 조회 유스케이스"""
+
+from __future__ import annotations
+
+from app.schema.domain.models import ReferenceDirection, SchemaReferenceImpact, SubjectName
+from app.schema.domain.repositories.interfaces import ISchemaReferenceRepository
+from app.shared.tracing import traced_class
+
+
+@traced_class("usecase")
+class GetSchemaReferenceImpactUseCase:
+    """subject의 전이적 참조 관계 조회 (dependents: 삭제/비호환 변경 시 영향받는 subject)"""
+
+    def __init__(self, reference_repository: ISchemaReferenceRepository) -> None:
+        self.reference_repository = reference_repository
+
+    async def execute(
+        self,
+        subject: SubjectName,
+        *,
+        direction: ReferenceDirection = "dependents",
+        max_depth: int | None = None,
+    ) -> SchemaReferenceImpact:
+        graph = await self.reference_repository.load_graph()
+        walk = graph.dependents if direction == "dependents" else graph.dependencies
+        return SchemaReferenceImpact(
+            subject=subject,
+            direction=direction,
+            max_depth=max_depth,
+            nodes=walk(subject, max_depth),
+        )
@@ -0,0 +1,340 @@
+"""Cross-registry schema comparison use case."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, cast
+
+from sqlalchemy import and_, case, func, or_, select
+
+from app.infra.kafka.connection_manager import IConnectionManager
+from app.infra.kafka.schema_registry_adapter import ConfluentSchemaRegistryAdapter
+from app.schema.application.services.registry_heads import RegistryHeadIndexer
+from app.schema.domain.models import (
+    DomainCompatibilityMode,
+    DomainSchemaSpec,
+    DomainSchemaType,
+    RegistryComparisonSummary,
+    RegistrySubjectDiff,
+    SchemaVersionInfo,
+)
+from app.schema.domain.services import calculate_schema_diff
+from app.schema.infrastructure.catalog_models import SchemaRegistryHeadModel
+from app.shared.cpu_executor import CpuTaskExecutor, get_cpu_executor
+from app.shared.database import SessionFactory
+from app.shared.settings import settings
+from app.shared.tracing import traced_class
+
+logger = logging.getLogger(__name__)
+
+# 구조 diff 계산 시 스키마 본문을 한 번에 읽을 subject 수
+_DIFF_CHUNK_SIZE = 200
+
+
+@dataclass(frozen=True, slots=True)
+class _HeadMismatch:
+    subject: str
+    source_version: int | None
+    target_version: int | None
+    source_hash: str | None
+    target_hash: str | None
+
+    @property
+    def status(self) -> str:
+        if self.target_version is None:
+            return "only_in_source"
+        if self.source_version is None:
+            return "only_in_target"
+        return "different"
+
+
+@dataclass(slots=True, kw_only=True)
+class RegistryComparisonStream:
+    """Registry 비교 결과 스트림 (요약은 즉시 확정, 구조 diff는 소비 시점에 계산)"""
+
+    summary: RegistryComparisonSummary
+    entries: AsyncIterator[RegistrySubjectDiff] = field(init=False)
+
+
+def _structural_diff(
+    subject: str, source_schema: str, target_info: SchemaVersionInfo
+) -> tuple[str, list[str]]:
+    """target(현재) → source(승격 대상) 방향의 구조 diff"""
+    try:
+        schema_type = DomainSchemaType(target_info.schema_type or "AVRO")
+    except ValueError:
+        schema_type = DomainSchemaType.AVRO
+    spec = DomainSchemaSpec(
+        subject=subject,
+        schema_type=schema_type,
+        compatibility=DomainCompatibilityMode.NONE,
+        schema=source_schema,
+    )
+    diff = calculate_schema_diff(target_info, spec)
+    return diff.type, list(diff.changes)
+
+
+def _structural_diffs(
+    pairs: list[tuple[str, str, SchemaVersionInfo]],
+) -> dict[str, tuple[str, list[str]]]:
+    """청크 단위 구조 diff (CPU 작업 실행기에서 한 번에 실행)"""
+    return {
+        subject: _structural_diff(subject, source_schema, target_info)
+        for subject, source_schema, target_info in pairs
+    }
+
+
+@traced_class("usecase")
+class CompareRegistriesUseCase:
+    """두 registry의 subject 최신 스키마를 비교
+
+    registry별 head 인덱스(``schema_registry_heads``)를 (subject, canonical_hash) 기준으로
+    집합 쿼리 한 번에 비교하고, 해시가 다른 subject만 스키마 본문을 읽어 구조 diff를 만든다.
+    head가 없거나 ``registry_heads_max_age_seconds`` 보다 오래되었으면 먼저 갱신한다.
+    """
+
+    def __init__(
+        self,
+        connection_manager: IConnectionManager,
+        session_factory: SessionFactory,
+        cpu_executor: CpuTaskExecutor | None = None,
+    ) -> None:
+        self.connection_manager = connection_manager
+        self.session_factory = session_factory
+        self.cpu_executor = cpu_executor or get_cpu_executor()
+
+    async def execute(
+        self,
+        source_registry_id: str,
+        target_registry_id: str,
+        *,
+        subject_prefix: str | None = None,
+        refresh: bool = False,
+    ) -> RegistryComparisonStream:
+        if source_registry_id == target_registry_id:
+            raise ValueError("Source and target registries must differ")
+
+        indexer = RegistryHeadIndexer(
+            self.session_factory, max_concurrent=settings.schema_drift_scan_concurrency
+        )
+        # SR 호출은 head 갱신 단계뿐이므로 그동안만 두 Client를 대여한다
+        async with (
+            self.connection_manager.borrow_schema_registry_client(
+                source_registry_id
+            ) as source_client,
+            self.connection_manager.borrow_schema_registry_client(
+                target_registry_id
+            ) as target_client,
+        ):
+            (
+                (source_refreshed_at, source_failed),
+                (target_refreshed_at, target_failed),
+            ) = await asyncio.gather(
+                self._ensure_heads(
+                    indexer,
+                    source_registry_id,
+                    ConfluentSchemaRegistryAdapter(source_client),
+                    refresh=refresh,
+                ),
+                self._ensure_heads(
+                    indexer,
+                    target_registry_id,
+                    ConfluentSchemaRegistryAdapter(target_client),
+                    refresh=refresh,
+                ),
+            )
+        failed_subjects = sorted(
+            subject
+            for subject in {*source_failed, *target_failed}
+            if not subject_prefix or subject.startswith(subject_prefix)
+        )
+
+        identical, mismatches = await self._compare_heads(
+            source_registry_id, target_registry_id, subject_prefix
+        )
+        # 조회 실패로 한쪽 head가 없는 subject는 실제 차이와 구분할 수 없으므로 제외
+        failed = set(failed_subjects)
+        mismatches = [
+            mismatch
+            for mismatch in mismatches
+            if mismatch.status == "different" or mismatch.subject not in failed
+        ]
+        counts = {"only_in_source": 0, "only_in_target": 0, "different": 0}
+        for mismatch in mismatches:
+            counts[mismatch.status] += 1
+
+        stream = RegistryComparisonStream(
+            summary=RegistryComparisonSummary(
+                source_registry_id=source_registry_id,
+                target_registry_id=target_registry_id,
+                source_refreshed_at=source_refreshed_at,
+                target_refreshed_at=target_refreshed_at,
+                identical=identical,
+                **counts,
+                failed_subjects=failed_subjects,
+            )
+        )
+        stream.entries = self._iter_diffs(
+            source_registry_id,
+            target_registry_id,
+            mismatches,
+        )
+        return stream
+
+    async def _ensure_heads(
+        self,
+        indexer: RegistryHeadIndexer,
+        registry_id: str,
+        registry_repository: ConfluentSchemaRegistryAdapter,
+        *,
+        refresh: bool,
+    ) -> tuple[datetime, list[str]]:
+        """head 인덱스를 필요 시 갱신하고 (갱신 시각, 최신 head 조회 실패 subject) 반환"""
+        refreshed_at = await indexer.last_refreshed_at(registry_id)
+        if refreshed_at is not None and refreshed_at.tzinfo is None:
+            refreshed_at = refreshed_at.replace(tzinfo=UTC)
+        stale = (
+            refreshed_at is None
+            or (datetime.now(UTC) - refreshed_at).total_seconds()
+            > settings.registry_heads_max_age_seconds
+        )
+        if not refresh and not stale:
+            return cast(datetime, refreshed_at), await indexer.stale_subjects(registry_id)
+
+        result = await indexer.refresh(registry_id, registry_repository)
+        return result.refreshed_at, result.failed
+
+    async def _compare_heads(
+        self, source_registry_id: str, target_registry_id: str, subject_prefix: str | None
+    ) -> tuple[int, list[_HeadMismatch]]:
+        heads = SchemaRegistryHeadModel
+
+        def pick(registry_id: str, column: Any) -> Any:
+            return func.max(case((heads.registry_id == registry_id, column)))
+
+        source_version = pick(source_registry_id, heads.version)
+        target_version = pick(target_registry_id, heads.version)
+        source_hash = pick(source_registry_id, heads.canonical_hash)
+        target_hash = pick(target_registry_id, heads.canonical_hash)
+
+        conditions = [heads.registry_id.in_((source_registry_id, target_registry_id))]
+        if subject_prefix:
+            conditions.append(heads.subject.startswith(subject_prefix, autoescape=True))
+
+        grouped = select(heads.subject).where(*conditions).group_by(heads.subject)
+        mismatch_query = (
+            select(heads.subject, source_version, target_version, source_hash, target_hash)
+            .where(*conditions)
+            .group_by(heads.subject)
+            .having(
+                or_(
+                    source_version.is_(None),
+                    target_version.is_(None),
+                    source_hash.is_(None),
+                    target_hash.is_(None),
+                    source_hash != target_hash,
+                )
+            )
+            .order_by(heads.subject)
+        )
+        identical_query = select(func.count()).select_from(
+            grouped.having(
+                and_(
+                    func.count(heads.registry_id) == 2,
+                    func.count(heads.canonical_hash) == 2,
+                    func.count(func.distinct(heads.canonical_hash)) == 1,
+                )
+            ).subquery()
+        )
+
+        async with self.session_factory() as session:
+            identical = await session.scalar(identical_query)
+            rows = (await session.execute(mismatch_query)).tuples().all()
+
+        return identical or 0, [_HeadMismatch(*row) for row in rows]
+
+    async def _iter_diffs(
+        self,
+        source_registry_id: str,
+        target_registry_id: str,
+        mismatches: list[_HeadMismatch],
+    ) -> AsyncIterator[RegistrySubjectDiff]:
+        for start in range(0, len(mismatches), _DIFF_CHUNK_SIZE):
+            chunk = mismatches[start : start + _DIFF_CHUNK_SIZE]
+            schemas = await self._load_schemas(
+                source_registry_id,
+                target_registry_id,
+                [mismatch.subject for mismatch in chunk if mismatch.status == "different"],
+            )
+            pairs: list[tuple[str, str, SchemaVersionInfo]] = []
+            for mismatch in chunk:
+                source_row = schemas.get((source_registry_id, mismatch.subject))
+                target_row = schemas.get((target_registry_id, mismatch.subject))
+                if source_row is None or target_row is None:
+                    continue
+                pairs.append(
+                    (
+                        mismatch.subject,
+                        source_row.schema_str or "",
+                        SchemaVersionInfo(
+                            version=target_row.version,
+                            schema_id=target_row.schema_id,
+                            schema=target_row.schema_str,
+                            schema_type=target_row.schema_type,
+                            references=[],
+                            hash="",
+                            canonical_hash=target_row.canonical_hash,
+                        ),
+                    )
+                )
+            structural = (
+                await self.cpu_executor.run(
+                    _structural_diffs,
+                    pairs,
+                    size_hint=sum(
+                        len(source) + len(target.schema or "") for _, source, target in pairs
+                    ),
+                )
+                if pairs
+                else {}
+            )
+
+            for mismatch in chunk:
+                diff_type, changes = structural.get(mismatch.subject, (None, []))
+                yield RegistrySubjectDiff(
+                    subject=mismatch.subject,
+                    status=mismatch.status,
+                    source_version=mismatch.source_version,
+                    target_version=mismatch.target_version,
+                    source_canonical_hash=mismatch.source_hash,
+                    target_canonical_hash=mismatch.target_hash,
+                    diff_type=diff_type,
+                    changes=changes,
+                )
+
+    async def _load_schemas(
+        self, source_registry_id: str, target_registry_id: str, subjects: list[str]
+    ) -> dict[tuple[str, str], Any]:
+        if not subjects:
+            return {}
+        heads = SchemaRegistryHeadModel
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(
+                    heads.registry_id,
+                    heads.subject,
+                    heads.version,
+                    heads.schema_id,
+                    heads.schema_type,
+                    heads.canonical_hash,
+                    heads.schema_str,
+                ).where(
+                    heads.registry_id.in_((source_registry_id, target_registry_id)),
+                    heads.subject.in_(subjects),
+                )
+            )
+            return {(row.registry_id, row.subject): row for row in result}
@@ -18,8 +18,10 @@ from app.schema.domain.repositories.interfaces import (
     ISchemaMetadataRepository,
 )
 from app.schema.governance_support.approval import ApprovalOverride
+from app.shared.tracing import traced_class
 
 
+@traced_class("usecase")
 class RollbackSchemaUseCase:
     """특정 버전으로 롤백 계획 수립"""
 
@@ -78,6 +80,7 @@ class RollbackSchemaUseCase:
         return plan
 
 
+@traced_class("usecase")
 class ExecuteRollbackSchemaUseCase:
     """특정 버전으로 롤백 실행"""
 
@@ -21,8 +21,10 @@ from app.schema.domain.repositories.interfaces import (
     ISchemaMetadataRepository,
     ISchemaPolicyRepository,
 )
+from app.shared.tracing import traced_class
 
 
+@traced_class("usecase")
 class GetGovernanceStatsUseCase:
     """거버넌스 대시보드 통계 조회"""
 
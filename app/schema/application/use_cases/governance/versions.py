@@ -3,13 +3,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable
-from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
-from typing import Protocol, cast
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infra.kafka.connection_manager import IConnectionManager
 from app.infra.kafka.schema_registry_adapter import ConfluentSchemaRegistryAdapter
@@ -25,18 +21,17 @@ from app.schema.domain.models import (
     SubjectVersionList,
     SubjectVersionSummary,
 )
-from app.schema.domain.repositories.interfaces import ISchemaMetadataRepository
-from app.schema.domain.services import SchemaPlannerService, _normalize_schema_text
+from app.schema.domain.services import _normalize_schema_text, calculate_schema_diff
 from app.schema.infrastructure.models import (
     SchemaArtifactModel,
     SchemaAuditLogModel,
     SchemaMetadataModel,
-    SchemaPlanModel,
+    SchemaPlanItemModel,
 )
-
-
-class _MetadataRepositoryWithSessionFactory(Protocol):
-    session_factory: Callable[[], AbstractAsyncContextManager[AsyncSession]]
+from app.shared.cpu_executor import CpuTaskExecutor, get_cpu_executor
+from app.shared.database import SessionFactory
+from app.shared.json_response import dump_json
+from app.shared.tracing import traced_class
 
 
 @dataclass(slots=True)
@@ -83,10 +78,10 @@ class _BaseSchemaVersionUseCase:
     def __init__(
         self,
         connection_manager: IConnectionManager,
-        metadata_repository: ISchemaMetadataRepository,
+        session_factory: SessionFactory,
     ) -> None:
         self.connection_manager = connection_manager
-        self.metadata_repository = metadata_repository
+        self.session_factory = session_factory
 
     async def _get_registry_repository(self, registry_id: str) -> ConfluentSchemaRegistryAdapter:
         registry_client = await self.connection_manager.get_schema_registry_client(registry_id)
@@ -104,11 +99,7 @@ class _BaseSchemaVersionUseCase:
         return current_info
 
     async def _load_context(self, subject: SubjectName) -> _VersionContext:
-        metadata_repository = cast(
-            _MetadataRepositoryWithSessionFactory,
-            cast(object, self.metadata_repository),
-        )
-        async with metadata_repository.session_factory() as session:
+        async with self.session_factory() as session:
             result_artifacts = await session.execute(
                 select(SchemaArtifactModel).where(SchemaArtifactModel.subject == subject)
             )
@@ -130,15 +121,15 @@ class _BaseSchemaVersionUseCase:
                 audit_logs = {log.change_id: log.actor for log in result_audit.scalars().all()}
 
                 result_plan = await session.execute(
-                    select(SchemaPlanModel).where(SchemaPlanModel.change_id.in_(change_ids))
+                    select(SchemaPlanItemModel.change_id, SchemaPlanItemModel.reason).where(
+                        SchemaPlanItemModel.subject == subject,
+                        SchemaPlanItemModel.change_id.in_(change_ids),
+                        SchemaPlanItemModel.reason.is_not(None),
+                    )
                 )
-                for plan_model in result_plan.scalars().all():
-                    items = plan_model.plan_data.get("items", []) if plan_model.plan_data else []
-                    for item in items:
-                        item_subject = item.get("subject")
-                        reason = item.get("reason")
-                        if isinstance(item_subject, str) and isinstance(reason, str) and reason:
-                            plan_reasons[(plan_model.change_id, item_subject)] = reason
+                plan_reasons = {
+                    (change_id, subject): reason for change_id, reason in result_plan.all()
+                }
 
             result_metadata = await session.execute(
                 select(SchemaMetadataModel).where(SchemaMetadataModel.subject == subject)
@@ -216,6 +207,7 @@ class _BaseSchemaVersionUseCase:
         )
 
 
+@traced_class("usecase")
 class GetSchemaVersionsUseCase(_BaseSchemaVersionUseCase):
     """Public subject-version listing use case."""
 
@@ -242,9 +234,36 @@ class GetSchemaVersionsUseCase(_BaseSchemaVersionUseCase):
         )
 
 
+@traced_class("usecase")
 class GetSchemaVersionUseCase(_BaseSchemaVersionUseCase):
     """Public exact schema-version retrieval use case."""
 
+    async def revision(self, subject: SubjectName, version: int) -> tuple[object, ...]:
+        """응답 중 바뀔 수 있는 부분(메타데이터/아티팩트)의 리비전 (SR 호출 없음)
+
+        정확한 버전의 스키마 본문은 불변이므로, 이 값과 (registry, subject, version)만으로
+        조건부 요청을 SR 조회 전에 판정할 수 있다.
+        """
+        async with self.session_factory() as session:
+            metadata = (
+                await session.execute(
+                    select(SchemaMetadataModel.owner, SchemaMetadataModel.tags).where(
+                        SchemaMetadataModel.subject == subject
+                    )
+                )
+            ).first()
+            artifact = (
+                await session.execute(
+                    select(SchemaArtifactModel.change_id, SchemaArtifactModel.created_at).where(
+                        SchemaArtifactModel.subject == subject,
+                        SchemaArtifactModel.version == version,
+                    )
+                )
+            ).first()
+        owner, tags = metadata or (None, None)
+        change_id, created_at = artifact or (None, None)
+        return owner, dump_json(tags).decode(), change_id, created_at
+
     async def execute(
         self,
         registry_id: str,
@@ -266,6 +285,7 @@ class GetSchemaVersionUseCase(_BaseSchemaVersionUseCase):
         )
 
 
+@traced_class("usecase")
 class ExportSchemaVersionUseCase:
     """Schema export use case for latest or exact version."""
 
@@ -295,6 +315,7 @@ class ExportSchemaVersionUseCase:
             filename=filename,
             media_type=media_type,
             schema_str=detail.schema_str,
+            canonical_hash=detail.canonical_hash,
         )
 
     async def execute_latest(self, registry_id: str, subject: SubjectName) -> SchemaVersionExport:
@@ -321,12 +342,39 @@ class ExportSchemaVersionUseCase:
             filename=filename,
             media_type=media_type,
             schema_str=version_list.schema_str,
+            canonical_hash=version_list.canonical_hash,
         )
 
 
+def _compare_version_bodies(
+    from_info: SchemaVersionInfo,
+    to_schema: str | None,
+    spec: DomainSchemaSpec,
+    schema_type: str,
+) -> tuple[bool, str, list[str]]:
+    """정규화 비교 + 구조 diff (CPU 작업 실행기에서 실행)"""
+    changed = _normalize_schema_text(from_info.schema, schema_type) != _normalize_schema_text(
+        to_schema, schema_type
+    )
+    if not changed:
+        return False, "no_change", ["No schema change detected"]
+    diff = calculate_schema_diff(from_info, spec)
+    return True, diff.type, list(diff.changes)
+
+
+@traced_class("usecase")
 class CompareSchemaVersionsUseCase(_BaseSchemaVersionUseCase):
     """Compare two versions of the same subject."""
 
+    def __init__(
+        self,
+        connection_manager: IConnectionManager,
+        session_factory: SessionFactory,
+        cpu_executor: CpuTaskExecutor | None = None,
+    ) -> None:
+        super().__init__(connection_manager, session_factory)
+        self.cpu_executor = cpu_executor or get_cpu_executor()
+
     async def execute(
         self,
         registry_id: str,
@@ -357,7 +405,6 @@ class CompareSchemaVersionsUseCase(_BaseSchemaVersionUseCase):
             except ValueError:
                 compatibility_mode = DomainCompatibilityMode.NONE
 
-        planner = SchemaPlannerService(registry_repository)
         try:
             resolved_schema_type = DomainSchemaType(schema_type)
         except ValueError:
@@ -369,17 +416,14 @@ class CompareSchemaVersionsUseCase(_BaseSchemaVersionUseCase):
             schema=to_info.schema or "",
         )
 
-        changed = _normalize_schema_text(from_info.schema, schema_type) != _normalize_schema_text(
+        changed, diff_type, changes = await self.cpu_executor.run(
+            _compare_version_bodies,
+            from_info,
             to_info.schema,
+            spec,
             schema_type,
+            size_hint=len(from_info.schema or "") + len(to_info.schema or ""),
         )
-        if changed:
-            diff = planner._calculate_schema_diff(from_info, spec)
-            diff_type = diff.type
-            changes = list(diff.changes)
-        else:
-            diff_type = "no_change"
-            changes = ["No schema change detected"]
 
         return SubjectVersionComparison(
             subject=subject,
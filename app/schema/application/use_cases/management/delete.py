@@ -8,15 +8,18 @@ import uuid
 from app.infra.kafka.connection_manager import IConnectionManager
 from app.infra.kafka.schema_registry_adapter import ConfluentSchemaRegistryAdapter
 from app.schema.governance_support.actor import merge_actor_metadata
+from app.shared.tracing import traced_class
 
 from ....domain.models import DomainSchemaDeleteImpact, SubjectName
 from ....domain.repositories.interfaces import (
     ISchemaAuditRepository,
     ISchemaMetadataRepository,
+    ISchemaReferenceRepository,
 )
 from ....domain.services import SchemaDeleteAnalyzer
 
 
+@traced_class("usecase")
 class SchemaDeleteUseCase:
     """스키마 삭제 유스케이스 (멀티 레지스트리 지원)"""
 
@@ -25,10 +28,12 @@ class SchemaDeleteUseCase:
         connection_manager: IConnectionManager,
         metadata_repository: ISchemaMetadataRepository,
         audit_repository: ISchemaAuditRepository,
+        reference_repository: ISchemaReferenceRepository | None = None,
     ) -> None:
         self.connection_manager = connection_manager
         self.metadata_repository = metadata_repository
         self.audit_repository = audit_repository
+        self.reference_repository = reference_repository
 
     async def analyze(
         self,
@@ -53,7 +58,10 @@ class SchemaDeleteUseCase:
         registry_repository = ConfluentSchemaRegistryAdapter(registry_client)
 
         # 2. 영향도 분석 수행
-        delete_analyzer = SchemaDeleteAnalyzer(registry_repository)  # type: ignore[arg-type]
+        delete_analyzer = SchemaDeleteAnalyzer(
+            registry_repository,  # type: ignore[arg-type]
+            self.reference_repository,
+        )
         impact = await delete_analyzer.analyze_delete_impact(subject)
 
         # 감사 로그 기록
@@ -70,6 +78,7 @@ class SchemaDeleteUseCase:
                     "current_version": impact.current_version,
                     "warnings": list(impact.warnings),
                     "safe_to_delete": impact.safe_to_delete,
+                    "dependents": list(impact.dependents),
                 },
                 actor_context,
             ),
@@ -105,7 +114,10 @@ class SchemaDeleteUseCase:
         registry_repository = ConfluentSchemaRegistryAdapter(registry_client)
 
         # 2. 영향도 분석
-        delete_analyzer = SchemaDeleteAnalyzer(registry_repository)  # type: ignore[arg-type]
+        delete_analyzer = SchemaDeleteAnalyzer(
+            registry_repository,  # type: ignore[arg-type]
+            self.reference_repository,
+        )
         impact = await delete_analyzer.analyze_delete_impact(subject)
 
         # 2. 안전성 검증
@@ -128,6 +140,15 @@ class SchemaDeleteUseCase:
                 logger = logging.getLogger(__name__)
                 logger.warning(f"Failed to delete artifact from DB for {subject}: {db_error}")
 
+            # 삭제된 subject가 참조하던 간선 제거 (이 subject를 참조하는 간선은 유지)
+            if self.reference_repository is not None:
+                try:
+                    await self.reference_repository.delete_subject(subject)
+                except Exception as db_error:
+                    logging.getLogger(__name__).warning(
+                        f"Failed to delete reference edges for {subject}: {db_error}"
+                    )
+
             # 4. 감사 로그 기록 (성공)
             await self.audit_repository.log_operation(
                 change_id=f"delete_{uuid.uuid4().hex[:8]}",
@@ -141,6 +162,7 @@ class SchemaDeleteUseCase:
                         "subject": subject,
                         "deleted_version": impact.current_version,
                         "force": force,
+                        "dependents": list(impact.dependents),
                     },
                     actor_context,
                 ),
@@ -21,8 +21,11 @@ from app.schema.domain.repositories.interfaces import (
     ISchemaMetadataRepository,
 )
 from app.schema.domain.services import SchemaPlannerService
+from app.shared.cpu_executor import CpuTaskExecutor, get_cpu_executor
+from app.shared.tracing import traced_class
 
 
+@traced_class("usecase")
 class PlanSchemaChangeUseCase:
     """단일 스키마 변경 계획 수립 (Edit 용)"""
 
@@ -30,9 +33,11 @@ class PlanSchemaChangeUseCase:
         self,
         connection_manager: IConnectionManager,
         metadata_repository: ISchemaMetadataRepository,
+        cpu_executor: CpuTaskExecutor | None = None,
     ) -> None:
         self.connection_manager = connection_manager
         self.metadata_repository = metadata_repository
+        self.cpu_executor = cpu_executor or get_cpu_executor()
         self.logger = logging.getLogger(__name__)
 
     async def execute(
@@ -92,7 +97,7 @@ class PlanSchemaChangeUseCase:
         )
 
         # 3. 계획 수립
-        planner_service = SchemaPlannerService(registry_repository)
+        planner_service = SchemaPlannerService(registry_repository, cpu_executor=self.cpu_executor)
         plan = await planner_service.create_plan(batch)
         plan = replace(plan, actor_context=actor_context)
 
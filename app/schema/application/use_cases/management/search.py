@@ -6,6 +6,7 @@ from typing import NamedTuple
 
 from app.schema.domain.models import DomainSchemaArtifact
 from app.schema.domain.repositories.interfaces import ISchemaMetadataRepository
+from app.shared.tracing import traced_class
 
 
 class SearchResult(NamedTuple):
@@ -13,6 +14,7 @@ class SearchResult(NamedTuple):
     total: int
 
 
+@traced_class("usecase")
 class SchemaSearchUseCase:
     """스키마 검색 유스케이스"""
 
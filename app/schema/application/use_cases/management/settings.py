@@ -13,6 +13,7 @@ from app.schema.domain.repositories.interfaces import (
 )
 from app.schema.governance_support.actor import merge_actor_metadata
 from app.schema.governance_support.constants import AuditAction, AuditStatus
+from app.shared.tracing import traced_class
 
 
 @dataclass(frozen=True, slots=True)
@@ -25,6 +26,7 @@ class SchemaSettingsResult:
     compatibility_mode: str | None = None
 
 
+@traced_class("usecase")
 class UpdateSchemaSettingsUseCase:
     """Update schema metadata and optionally subject compatibility mode."""
 
@@ -14,6 +14,7 @@ from app.infra.kafka.schema_registry_adapter import ConfluentSchemaRegistryAdapt
 from app.schema.application.services.catalog_sync import CatalogSyncService
 from app.schema.governance_support.actor import merge_actor_metadata
 from app.schema.governance_support.constants import AuditAction, AuditStatus, AuditTarget
+from app.shared.tracing import traced_class
 
 from ....domain.models import DomainSchemaArtifact
 from ....domain.repositories.interfaces import (
@@ -24,6 +25,7 @@ from ....domain.repositories.interfaces import (
 logger = logging.getLogger(__name__)
 
 
+@traced_class("usecase")
 class SchemaSyncUseCase:
     """Schema Registry → DB 동기화 유스케이스 (멀티 레지스트리 지원)"""
 
@@ -60,68 +62,74 @@ class SchemaSyncUseCase:
             actor=actor,
             status=AuditStatus.STARTED,
             message="Schema synchronization started",
-            snapshot=merge_actor_metadata(None, actor_context),
+            snapshot=merge_actor_metadata({"registry_id": registry_id}, actor_context),
         )
 
         try:
             # 1. ConnectionManager로 Schema Registry Client 획득
             logger.warning("[Schema Sync] Getting Schema Registry client for: %s", registry_id)
-            registry_client = await self.connection_manager.get_schema_registry_client(registry_id)
-            logger.warning("[Schema Sync] Schema Registry client obtained successfully")
-            registry_repository = ConfluentSchemaRegistryAdapter(registry_client)
-
-            # 2. Schema Registry에서 모든 subject 조회
-            logger.warning("[Schema Sync] Listing all subjects from Schema Registry")
-            all_subjects = await registry_repository.list_all_subjects()
-            logger.warning(f"[Schema Sync] Found {len(all_subjects)} subjects")
-
-            # 3. 각 subject의 최신 버전 정보 조회 (없으면 빈 dict)
-            subjects_info = (
-                await registry_repository.describe_subjects(all_subjects) if all_subjects else {}
-            )
-
-            # 4. DB에 artifact로 저장
-            added_count = 0
-            skipped_count = 0
-            catalog_metrics: dict[str, int] | None = None
-
-            for subject, info in subjects_info.items():
-                from datetime import datetime
-
-                artifact = DomainSchemaArtifact(
-                    subject=subject,
-                    version=info.version,
-                    storage_url=f"registry://{subject}/versions/{info.version}",
-                    checksum=info.hash,
-                    created_at=datetime.now(),
+            async with self.connection_manager.borrow_schema_registry_client(
+                registry_id
+            ) as registry_client:
+                logger.warning("[Schema Sync] Schema Registry client obtained successfully")
+                registry_repository = ConfluentSchemaRegistryAdapter(registry_client)
+
+                # 2. Schema Registry에서 모든 subject 조회
+                logger.warning("[Schema Sync] Listing all subjects from Schema Registry")
+                all_subjects = await registry_repository.list_all_subjects()
+                logger.warning(f"[Schema Sync] Found {len(all_subjects)} subjects")
+
+                # 3. 각 subject의 최신 버전 정보 조회 (없으면 빈 dict)
+                subjects_info = (
+                    await registry_repository.describe_subjects(all_subjects)
+                    if all_subjects
+                    else {}
                 )
 
-                try:
-                    await self.metadata_repository.record_artifact(artifact, change_id)
+                # 4. DB에 artifact로 저장
+                added_count = 0
+                skipped_count = 0
+                catalog_metrics: dict[str, int] | None = None
+
+                for subject, info in subjects_info.items():
+                    from datetime import datetime
 
-                    # placeholder owner/compatibility는 주입하지 않고 동기화 행만 남긴다.
-                    await self.metadata_repository.save_schema_metadata(
-                        subject,
-                        {
-                            "created_by": actor,
-                            "updated_by": actor,
-                        },
+                    artifact = DomainSchemaArtifact(
+                        subject=subject,
+                        version=info.version,
+                        storage_url=f"registry://{subject}/versions/{info.version}",
+                        checksum=info.hash,
+                        created_at=datetime.now(),
                     )
-                    added_count += 1
-                except Exception as e:
-                    logger.warning(f"Failed to record artifact/meta for {subject}: {e}")
-                    skipped_count += 1
-
-            if self.session_factory is not None:
-                async with self.session_factory() as session:
-                    catalog_service = CatalogSyncService(sr_client=registry_client, session=session)
-                    metrics = await catalog_service.sync_all()
-                    catalog_metrics = {
-                        "subjects_total": metrics.subjects_total,
-                        "subjects_new": metrics.subjects_new,
-                        "versions_total": metrics.versions_total,
-                        "versions_new": metrics.versions_new,
-                    }
+
+                    try:
+                        await self.metadata_repository.record_artifact(artifact, change_id)
+
+                        # placeholder owner/compatibility는 주입하지 않고 동기화 행만 남긴다.
+                        await self.metadata_repository.save_schema_metadata(
+                            subject,
+                            {
+                                "created_by": actor,
+                                "updated_by": actor,
+                            },
+                        )
+                        added_count += 1
+                    except Exception as e:
+                        logger.warning(f"Failed to record artifact/meta for {subject}: {e}")
+                        skipped_count += 1
+
+                if self.session_factory is not None:
+                    async with self.session_factory() as session:
+                        catalog_service = CatalogSyncService(
+                            sr_client=registry_client, session=session
+                        )
+                        metrics = await catalog_service.sync_all()
+                        catalog_metrics = {
+                            "subjects_total": metrics.subjects_total,
+                            "subjects_new": metrics.subjects_new,
+                            "versions_total": metrics.versions_total,
+                            "versions_new": metrics.versions_new,
+                        }
 
             result = {
                 "total": len(subjects_info),
@@ -143,7 +151,9 @@ class SchemaSyncUseCase:
                 actor=actor,
                 status=AuditStatus.COMPLETED,
                 message=f"Schema synchronization completed: {result['total']} total, {result['added']} added",
-                snapshot=merge_actor_metadata(result, actor_context),
+                snapshot=merge_actor_metadata(
+                    {"registry_id": registry_id, **result}, actor_context
+                ),
             )
 
             return result
@@ -157,6 +167,6 @@ class SchemaSyncUseCase:
                 actor=actor,
                 status=AuditStatus.FAILED,
                 message=f"Schema synchronization failed: {exc!s}",
-                snapshot=merge_actor_metadata(None, actor_context),
+                snapshot=merge_actor_metadata({"registry_id": registry_id}, actor_context),
             )
             raise
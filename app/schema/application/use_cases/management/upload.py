@@ -18,6 +18,7 @@ from app.schema.governance_support.actor import merge_actor_metadata
 from app.schema.governance_support.constants import AuditAction, AuditStatus, AuditTarget
 from app.schema.governance_support.event_bus import get_event_bus
 from app.schema.governance_support.events import SchemaRegisteredEvent
+from app.shared.tracing import traced_class
 
 from ....domain.models import (
     ChangeId,
@@ -51,6 +52,7 @@ class UploadContext:
     strategy_id: str = "gov:EnvPrefixed"  # Default naming strategy
 
 
+@traced_class("usecase")
 class SchemaUploadUseCase:
     """스키마 업로드 유스케이스 (멀티 레지스트리/스토리지 지원)"""
 
@@ -94,32 +96,34 @@ class SchemaUploadUseCase:
 
         try:
             # 1. ConnectionManager로 클라이언트 획득
-            registry_client = await self.connection_manager.get_schema_registry_client(registry_id)
-            registry_repository = ConfluentSchemaRegistryAdapter(registry_client)
-
-            # 2. 파일 검증
-            validated_files = await self._validate_files(files)
-
-            # 3. 업로드 컨텍스트 생성
-            context = UploadContext(
-                registry_repository=registry_repository,
-                env=env,
-                change_id=change_id,
-                upload_id=upload_id,
-                owner=owner,
-                actor=actor,
-                compatibility_mode=compatibility_mode,
-                strategy_id=strategy_id,
-            )
+            async with self.connection_manager.borrow_schema_registry_client(
+                registry_id
+            ) as registry_client:
+                registry_repository = ConfluentSchemaRegistryAdapter(registry_client)
+
+                # 2. 파일 검증
+                validated_files = await self._validate_files(files)
+
+                # 3. 업로드 컨텍스트 생성
+                context = UploadContext(
+                    registry_repository=registry_repository,
+                    env=env,
+                    change_id=change_id,
+                    upload_id=upload_id,
+                    owner=owner,
+                    actor=actor,
+                    compatibility_mode=compatibility_mode,
+                    strategy_id=strategy_id,
+                )
 
-            # 4. 파일 처리 및 업로드 (MinIO + Schema Registry)
-            artifact_results = [
-                await self._process_and_upload_file(context, file_info)
-                for file_info in validated_files
-            ]
-            artifacts: list[DomainSchemaArtifact] = [
-                artifact for artifact in artifact_results if artifact is not None
-            ]
+                # 4. 파일 처리 및 업로드 (MinIO + Schema Registry)
+                artifact_results = [
+                    await self._process_and_upload_file(context, file_info)
+                    for file_info in validated_files
+                ]
+                artifacts: list[DomainSchemaArtifact] = [
+                    artifact for artifact in artifact_results if artifact is not None
+                ]
 
             # 4. 결과 생성
             result = DomainSchemaUploadResult(upload_id=upload_id, artifacts=tuple(artifacts))
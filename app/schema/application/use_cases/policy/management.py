@@ -5,6 +5,8 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
+from app.shared.tracing import traced_class
+
 from ....domain.models.policy_management import (
     DomainSchemaPolicy,
     SchemaPolicyStatus,
@@ -13,6 +15,7 @@ from ....domain.models.policy_management import (
 from ....domain.repositories.interfaces import ISchemaPolicyRepository
 
 
+@traced_class("usecase")
 class SchemaPolicyUseCase:
     """스키마 정책 관리용 유스케이스 통합 서비스"""
 
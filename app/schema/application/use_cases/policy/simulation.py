@@ -0,0 +1,226 @@
+"""Schema Policy What-if Simulation Use Case"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+import orjson
+from sqlalchemy import and_, func, select
+
+from app.schema.domain.models import (
+    DomainCompatibilityMode,
+    DomainSchemaSpec,
+    DomainSchemaType,
+)
+from app.schema.domain.models.policy_management import (
+    DomainSchemaPolicy,
+    PolicySimulationRuleHit,
+    PolicySimulationSummary,
+)
+from app.schema.domain.policies.dynamic_engine import DynamicSchemaPolicyEngine
+from app.schema.domain.repositories.interfaces import ISchemaPolicyRepository
+from app.schema.infrastructure.catalog_models import SchemaSubjectModel, SchemaVersionModel
+from app.shared.cpu_executor import CpuTaskExecutor, get_cpu_executor
+from app.shared.database import SessionFactory
+from app.shared.settings import settings
+from app.shared.tracing import traced_class
+
+# (subject, schema_type, schema_str, compat_level, env)
+_CatalogRow = tuple[str, str | None, str | None, str | None, str | None]
+# rule -> [severity, violation 수, 위반 subject 목록]
+_ChunkHits = dict[str, list[Any]]
+
+
+def _simulate_chunk(
+    policy: DomainSchemaPolicy, rows: list[_CatalogRow]
+) -> tuple[int, int, _ChunkHits]:
+    """catalog 행 묶음에 정책 하나를 적용 (프로세스 풀 워커에서 실행)
+
+    Returns:
+        (평가한 subject 수, 파싱 실패 수, 룰별 적중)
+    """
+    engine = DynamicSchemaPolicyEngine([policy])
+    evaluated = 0
+    parse_failures = 0
+    hits: _ChunkHits = {}
+
+    for subject, schema_type, schema_str, compat_level, env in rows:
+        subject_env = env or subject.split(".")[0]
+        if policy.target_environment not in ("total", subject_env):
+            continue
+        try:
+            schema_dict = orjson.loads(schema_str or "")
+        except orjson.JSONDecodeError:
+            parse_failures += 1
+            continue
+        if not isinstance(schema_dict, dict):
+            parse_failures += 1
+            continue
+
+        try:
+            compatibility = DomainCompatibilityMode(compat_level or "BACKWARD")
+        except ValueError:
+            compatibility = DomainCompatibilityMode.BACKWARD
+        try:
+            resolved_type = DomainSchemaType(schema_type or "AVRO")
+        except ValueError:
+            resolved_type = DomainSchemaType.AVRO
+        spec = DomainSchemaSpec(
+            subject=subject,
+            schema_type=resolved_type,
+            compatibility=compatibility,
+            schema=schema_str,
+        )
+
+        evaluated += 1
+        for violation in engine.evaluate_parsed(spec, schema_dict, subject_env):
+            hit = hits.setdefault(violation.rule, [violation.severity, 0, []])
+            hit[1] += 1
+            if not hit[2] or hit[2][-1] != subject:
+                hit[2].append(subject)
+
+    return evaluated, parse_failures, hits
+
+
+@dataclass(slots=True, kw_only=True)
+class PolicySimulationResult:
+    """정책 시뮬레이션 결과 (요약 + 룰별 적중, 적중 subject 수 내림차순)"""
+
+    summary: PolicySimulationSummary
+    rule_hits: list[PolicySimulationRuleHit] = field(default_factory=list)
+
+
+@traced_class("usecase")
+class SimulateSchemaPolicyUseCase:
+    """정책을 활성화하기 전에 catalog 전체 최신 스키마에 적용해 보는 what-if 시뮬레이션
+
+    ``schema_versions`` 에서 subject별 최신 버전을 청크 단위로 스트리밍 조회하고,
+    각 청크를 공용 CPU 작업 실행기의 프로세스 풀에서 병렬 평가(파싱 포함)한 뒤
+    룰별 적중 수와 위반 subject를 합산한다.
+    동시에 실행 중인 청크 수를 워커 수의 2배로 제한해 메모리 사용량을 일정하게 유지한다.
+    """
+
+    def __init__(
+        self,
+        policy_repository: ISchemaPolicyRepository,
+        session_factory: SessionFactory,
+        cpu_executor: CpuTaskExecutor | None = None,
+    ) -> None:
+        self.policy_repository = policy_repository
+        self.session_factory = session_factory
+        self.cpu_executor = cpu_executor
+
+    async def execute_stored(
+        self, policy_id: str, version: int | None = None
+    ) -> PolicySimulationResult:
+        """저장된 정책(주로 DRAFT 버전)을 시뮬레이션"""
+        policy = await self.policy_repository.get_by_id(policy_id, version)
+        if policy is None:
+            raise ValueError(f"Policy {policy_id} not found")
+        return await self.execute(policy)
+
+    async def execute(self, policy: DomainSchemaPolicy) -> PolicySimulationResult:
+        started = time.perf_counter()
+        executor = self.cpu_executor or get_cpu_executor()
+        max_in_flight = 2 * executor.process_workers
+
+        scanned = 0
+        evaluated = 0
+        parse_failures = 0
+        severities: dict[str, str] = {}
+        violation_counts: dict[str, int] = {}
+        rule_subjects: dict[str, list[str]] = {}
+
+        def merge(outcome: tuple[int, int, _ChunkHits]) -> None:
+            nonlocal evaluated, parse_failures
+            chunk_evaluated, chunk_failures, hits = outcome
+            evaluated += chunk_evaluated
+            parse_failures += chunk_failures
+            for rule, (severity, count, subjects) in hits.items():
+                severities.setdefault(rule, severity)
+                violation_counts[rule] = violation_counts.get(rule, 0) + count
+                rule_subjects.setdefault(rule, []).extend(subjects)
+
+        pending: set[asyncio.Task[tuple[int, int, _ChunkHits]]] = set()
+        try:
+            async with self.session_factory() as session:
+                result = await session.stream(
+                    self._latest_schemas_query().execution_options(
+                        yield_per=settings.policy_simulation_chunk_size
+                    )
+                )
+                async for partition in result.partitions():
+                    rows = cast(list[_CatalogRow], [tuple(row) for row in partition])
+                    scanned += len(rows)
+                    pending.add(
+                        asyncio.create_task(
+                            executor.run(_simulate_chunk, policy, rows, pool="process")
+                        )
+                    )
+                    if len(pending) >= max_in_flight:
+                        done, pending = await asyncio.wait(
+                            pending, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for future in done:
+                            merge(future.result())
+
+            for outcome in await asyncio.gather(*pending):
+                merge(outcome)
+        finally:
+            for future in pending:
+                future.cancel()
+
+        flagged = {subject for subjects in rule_subjects.values() for subject in subjects}
+        rule_hits = sorted(
+            (
+                PolicySimulationRuleHit(
+                    rule=rule,
+                    severity=severities[rule],
+                    violation_count=violation_counts[rule],
+                    subjects=tuple(sorted(subjects)),
+                )
+                for rule, subjects in rule_subjects.items()
+            ),
+            key=lambda hit: (-hit.subject_count, hit.rule),
+        )
+        return PolicySimulationResult(
+            summary=PolicySimulationSummary(
+                policy_id=policy.policy_id,
+                policy_version=policy.version,
+                policy_type=policy.policy_type,
+                target_environment=policy.target_environment,
+                subjects_scanned=scanned,
+                subjects_evaluated=evaluated,
+                subjects_flagged=len(flagged),
+                parse_failures=parse_failures,
+                duration_ms=round((time.perf_counter() - started) * 1000, 2),
+            ),
+            rule_hits=rule_hits,
+        )
+
+    @staticmethod
+    def _latest_schemas_query() -> Any:
+        versions = SchemaVersionModel
+        latest = (
+            select(versions.subject, func.max(versions.version).label("version"))
+            .group_by(versions.subject)
+            .subquery()
+        )
+        return (
+            select(
+                versions.subject,
+                versions.schema_type,
+                versions.schema_str,
+                SchemaSubjectModel.compat_level,
+                SchemaSubjectModel.env,
+            )
+            .join(
+                latest,
+                and_(versions.subject == latest.c.subject, versions.version == latest.c.version),
+            )
+            .outerjoin(SchemaSubjectModel, SchemaSubjectModel.subject == versions.subject)
+            .order_by(versions.subject)
+        )
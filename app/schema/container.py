@@ -4,13 +4,26 @@ from __future__ import annotations
 
 from dependency_injector import containers, providers
 
+from .application.services.lint_worker import SchemaLintWorker, schema_lint_worker_lifespan
 from .application.services.schema_lint import SchemaLintService
 from .application.use_cases.batch.apply import SchemaBatchApplyUseCase
 from .application.use_cases.batch.dry_run import SchemaBatchDryRunUseCase
 from .application.use_cases.batch.get_plan import SchemaPlanUseCase
+from .application.use_cases.governance.catalog_export import ExportSchemaCatalogUseCase
+from .application.use_cases.governance.catalog_scoring import RescoreCatalogUseCase
 from .application.use_cases.governance.detail import GetSubjectDetailUseCase
-from .application.use_cases.governance.drift import GetSchemaDriftUseCase
+from .application.use_cases.governance.drift import (
+    GetSchemaDriftReportUseCase,
+    GetSchemaDriftUseCase,
+    ScanSchemaDriftUseCase,
+)
+from .application.use_cases.governance.field_search import (
+    RebuildFieldIndexUseCase,
+    SearchSchemaFieldsUseCase,
+)
 from .application.use_cases.governance.history import GetSchemaHistoryUseCase
+from .application.use_cases.governance.references import GetSchemaReferenceImpactUseCase
+from .application.use_cases.governance.registry_compare import CompareRegistriesUseCase
 from .application.use_cases.governance.rollback import (
     ExecuteRollbackSchemaUseCase,
     RollbackSchemaUseCase,
@@ -29,17 +42,21 @@ from .application.use_cases.management.settings import UpdateSchemaSettingsUseCa
 from .application.use_cases.management.sync import SchemaSyncUseCase
 from .application.use_cases.management.upload import SchemaUploadUseCase
 from .application.use_cases.policy.management import SchemaPolicyUseCase
+from .application.use_cases.policy.simulation import SimulateSchemaPolicyUseCase
 from .domain.repositories.interfaces import (
     ISchemaAuditRepository,
     ISchemaMetadataRepository,
     ISchemaPolicyRepository,
+    ISchemaReferenceRepository,
 )
 from .governance_support.infrastructure.repository import (
     MySQLAuditActivityRepository,
+    MySQLAuditArchiveRepository,
     SQLApprovalRequestRepository,
 )
 from .governance_support.use_cases import (
     ApproveApprovalRequestUseCase,
+    ArchiveAuditLogsUseCase,
     CreateApprovalRequestUseCase,
     GetActivityHistoryUseCase,
     GetApprovalRequestUseCase,
@@ -50,6 +67,7 @@ from .governance_support.use_cases import (
 from .infrastructure.repository.audit_repository import MySQLSchemaAuditRepository
 from .infrastructure.repository.mysql_repository import MySQLSchemaMetadataRepository
 from .infrastructure.repository.policy_repository import MySQLSchemaPolicyRepository
+from .infrastructure.repository.reference_repository import MySQLSchemaReferenceRepository
 
 
 class SchemaContainer(containers.DeclarativeContainer):
@@ -70,6 +88,11 @@ class SchemaContainer(containers.DeclarativeContainer):
         MySQLSchemaPolicyRepository,
         session_factory=infrastructure.database_manager.provided.get_db_session,
     )
+    reference_repository: providers.Provider[ISchemaReferenceRepository] = providers.Factory(
+        MySQLSchemaReferenceRepository,
+        session_factory=infrastructure.database_manager.provided.get_db_session,
+        cache_ttl_seconds=infrastructure.infra_container.provided.schema_reference_graph_cache_ttl_seconds,
+    )
     approval_request_repository = providers.Factory(
         SQLApprovalRequestRepository,
         session_factory=infrastructure.database_manager.provided.get_db_session,
@@ -106,6 +129,14 @@ class SchemaContainer(containers.DeclarativeContainer):
         GetActivityHistoryUseCase,
         audit_repository=audit_activity_repository,
     )
+    audit_archive_repository = providers.Factory(
+        MySQLAuditArchiveRepository,
+        session_factory=infrastructure.database_manager.provided.get_db_session,
+    )
+    archive_audit_logs_use_case = providers.Factory(
+        ArchiveAuditLogsUseCase,
+        archive_repository=audit_archive_repository,
+    )
 
     dry_run_use_case: providers.Provider[SchemaBatchDryRunUseCase] = providers.Factory(
         SchemaBatchDryRunUseCase,
@@ -113,6 +144,8 @@ class SchemaContainer(containers.DeclarativeContainer):
         metadata_repository=metadata_repository,
         audit_repository=audit_repository,
         policy_repository=policy_repository,
+        unit_of_work=infrastructure.database_manager.provided.unit_of_work,
+        cpu_executor=infrastructure.cpu_executor,
     )
     apply_use_case: providers.Provider[SchemaBatchApplyUseCase] = providers.Factory(
         SchemaBatchApplyUseCase,
@@ -121,6 +154,9 @@ class SchemaContainer(containers.DeclarativeContainer):
         audit_repository=audit_repository,
         policy_repository=policy_repository,
         approval_request_use_case=create_approval_request_use_case,
+        reference_repository=reference_repository,
+        unit_of_work=infrastructure.database_manager.provided.unit_of_work,
+        cpu_executor=infrastructure.cpu_executor,
     )
     plan_use_case: providers.Provider[SchemaPlanUseCase] = providers.Factory(
         SchemaPlanUseCase,
@@ -144,8 +180,22 @@ class SchemaContainer(containers.DeclarativeContainer):
         connection_manager=registry_connections.connection_manager,
         metadata_repository=metadata_repository,
         audit_repository=audit_repository,
+        reference_repository=reference_repository,
     )
     lint_service: providers.Provider[SchemaLintService] = providers.Factory(SchemaLintService)
+    lint_worker: providers.Provider[SchemaLintWorker] = providers.Singleton(
+        SchemaLintWorker,
+        session_factory=infrastructure.database_manager.provided.get_db_session,
+        batch_size=infrastructure.infra_container.provided.schema_lint_batch_size,
+        interval_seconds=infrastructure.infra_container.provided.schema_lint_interval_seconds,
+        cpu_executor=infrastructure.cpu_executor,
+    )
+    # 앱 기동 시 lint 워커 태스크 시작, 종료 시 취소
+    lint_worker_resource = providers.Resource(
+        schema_lint_worker_lifespan,
+        worker=lint_worker,
+        enabled=infrastructure.infra_container.provided.schema_lint_worker_enabled,
+    )
 
     governance_stats_use_case: providers.Provider[GetGovernanceStatsUseCase] = providers.Factory(
         GetGovernanceStatsUseCase,
@@ -156,28 +206,66 @@ class SchemaContainer(containers.DeclarativeContainer):
     schema_history_use_case: providers.Provider[GetSchemaHistoryUseCase] = providers.Factory(
         GetSchemaHistoryUseCase,
         connection_manager=registry_connections.connection_manager,
-        metadata_repository=metadata_repository,
+        session_factory=infrastructure.database_manager.provided.get_db_session,
     )
     schema_drift_use_case: providers.Provider[GetSchemaDriftUseCase] = providers.Factory(
         GetSchemaDriftUseCase,
         connection_manager=registry_connections.connection_manager,
-        metadata_repository=metadata_repository,
+        session_factory=infrastructure.database_manager.provided.get_db_session,
+    )
+    scan_schema_drift_use_case: providers.Provider[ScanSchemaDriftUseCase] = providers.Factory(
+        ScanSchemaDriftUseCase,
+        connection_manager=registry_connections.connection_manager,
+        session_factory=infrastructure.database_manager.provided.get_db_session,
+    )
+    schema_drift_report_use_case: providers.Provider[GetSchemaDriftReportUseCase] = (
+        providers.Factory(
+            GetSchemaDriftReportUseCase,
+            session_factory=infrastructure.database_manager.provided.get_db_session,
+        )
+    )
+    rescore_catalog_use_case: providers.Provider[RescoreCatalogUseCase] = providers.Factory(
+        RescoreCatalogUseCase,
+        session_factory=infrastructure.database_manager.provided.get_db_session,
+    )
+    search_schema_fields_use_case: providers.Provider[SearchSchemaFieldsUseCase] = (
+        providers.Factory(
+            SearchSchemaFieldsUseCase,
+            session_factory=infrastructure.database_manager.provided.get_db_session,
+        )
+    )
+    rebuild_field_index_use_case: providers.Provider[RebuildFieldIndexUseCase] = providers.Factory(
+        RebuildFieldIndexUseCase,
+        session_factory=infrastructure.database_manager.provided.get_db_session,
+    )
+    schema_reference_impact_use_case: providers.Provider[GetSchemaReferenceImpactUseCase] = (
+        providers.Factory(
+            GetSchemaReferenceImpactUseCase,
+            reference_repository=reference_repository,
+        )
+    )
+    compare_registries_use_case: providers.Provider[CompareRegistriesUseCase] = providers.Factory(
+        CompareRegistriesUseCase,
+        connection_manager=registry_connections.connection_manager,
+        session_factory=infrastructure.database_manager.provided.get_db_session,
+        cpu_executor=infrastructure.cpu_executor,
     )
     schema_versions_use_case: providers.Provider[GetSchemaVersionsUseCase] = providers.Factory(
         GetSchemaVersionsUseCase,
         connection_manager=registry_connections.connection_manager,
-        metadata_repository=metadata_repository,
+        session_factory=infrastructure.database_manager.provided.get_db_session,
     )
     schema_version_use_case: providers.Provider[GetSchemaVersionUseCase] = providers.Factory(
         GetSchemaVersionUseCase,
         connection_manager=registry_connections.connection_manager,
-        metadata_repository=metadata_repository,
+        session_factory=infrastructure.database_manager.provided.get_db_session,
     )
     compare_schema_versions_use_case: providers.Provider[CompareSchemaVersionsUseCase] = (
         providers.Factory(
             CompareSchemaVersionsUseCase,
             connection_manager=registry_connections.connection_manager,
-            metadata_repository=metadata_repository,
+            session_factory=infrastructure.database_manager.provided.get_db_session,
+            cpu_executor=infrastructure.cpu_executor,
         )
     )
     export_schema_version_use_case: providers.Provider[ExportSchemaVersionUseCase] = (
@@ -186,16 +274,25 @@ class SchemaContainer(containers.DeclarativeContainer):
             version_use_case=schema_version_use_case,
         )
     )
+    export_schema_catalog_use_case: providers.Provider[ExportSchemaCatalogUseCase] = (
+        providers.Factory(
+            ExportSchemaCatalogUseCase,
+            connection_manager=registry_connections.connection_manager,
+            session_factory=infrastructure.database_manager.provided.get_db_session,
+        )
+    )
     subject_detail_use_case: providers.Provider[GetSubjectDetailUseCase] = providers.Factory(
         GetSubjectDetailUseCase,
         connection_manager=registry_connections.connection_manager,
         metadata_repository=metadata_repository,
         policy_repository=policy_repository,
+        unit_of_work=infrastructure.database_manager.provided.unit_of_work,
     )
     plan_change_use_case: providers.Provider[PlanSchemaChangeUseCase] = providers.Factory(
         PlanSchemaChangeUseCase,
         connection_manager=registry_connections.connection_manager,
         metadata_repository=metadata_repository,
+        cpu_executor=infrastructure.cpu_executor,
     )
     rollback_use_case: providers.Provider[RollbackSchemaUseCase] = providers.Factory(
         RollbackSchemaUseCase,
@@ -225,3 +322,9 @@ class SchemaContainer(containers.DeclarativeContainer):
         SchemaPolicyUseCase,
         policy_repository=policy_repository,
     )
+    policy_simulation_use_case: providers.Provider[SimulateSchemaPolicyUseCase] = providers.Factory(
+        SimulateSchemaPolicyUseCase,
+        policy_repository=policy_repository,
+        session_factory=infrastructure.database_manager.provided.get_db_session,
+        cpu_executor=infrastructure.cpu_executor,
+    )
@@ -8,8 +8,16 @@
 # Internal Models (for infrastructure)
 # Governance Models
 from .governance import (
+    CatalogRescoreSummary,
+    FieldIndexRebuildSummary,
     GovernanceDashboardStats,
     GovernanceScore,
+    RegistryComparisonSummary,
+    RegistrySubjectDiff,
+    SchemaDriftReportPage,
+    SchemaDriftScanSummary,
+    SchemaFieldHit,
+    SchemaFieldSearchPage,
     SchemaHistoryItem,
     SchemaVersionExport,
     SubjectDetail,
@@ -35,8 +43,6 @@ from .plan_result import (
     DomainSchemaPlanItem,
     DomainSchemaUploadResult,
 )
-
-# Policy Models
 from .policy import (
     DomainPolicyViolation,
     DomainSchemaCompatibilityIssue,
@@ -45,6 +51,14 @@ from .policy import (
     DomainSchemaImpactRecord,
 )
 
+# Policy Models
+from .reference_graph import (
+    ReferenceDirection,
+    SchemaReferenceGraph,
+    SchemaReferenceImpact,
+    SchemaReferenceNode,
+)
+
 # Specs and Batch
 from .spec_batch import (
     DomainSchemaBatch,
@@ -83,6 +97,7 @@ from .value_objects import (
 
 __all__ = [
     "Actor",
+    "CatalogRescoreSummary",
     "ChangeId",
     "CompatibilityResult",
     "DescribeResult",
@@ -109,14 +124,25 @@ __all__ = [
     "DomainSchemaUploadResult",
     "DomainSubjectStat",
     "DomainSubjectStrategy",
+    "FieldIndexRebuildSummary",
     "FileReference",
     "GovernanceDashboardStats",
     "GovernanceScore",
     "ReasonText",
     "Reference",
+    "ReferenceDirection",
+    "RegistryComparisonSummary",
+    "RegistrySubjectDiff",
     "SchemaDefinition",
+    "SchemaDriftReportPage",
+    "SchemaDriftScanSummary",
+    "SchemaFieldHit",
+    "SchemaFieldSearchPage",
     "SchemaHash",
     "SchemaHistoryItem",
+    "SchemaReferenceGraph",
+    "SchemaReferenceImpact",
+    "SchemaReferenceNode",
     "SchemaVersionExport",
     "SchemaVersionInfo",
     "SchemaYamlText",
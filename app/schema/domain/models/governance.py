@@ -141,7 +141,7 @@ class SubjectDriftReport:
     """Registry latest 상태와 로컬 catalog snapshot 간 drift 보고서"""
 
     subject: str
-    registry_latest_version: int
+    registry_latest_version: int | None
     registry_canonical_hash: str | None = None
     catalog_latest_version: int | None = None
     catalog_canonical_hash: str | None = None
@@ -151,6 +151,105 @@ class SubjectDriftReport:
     has_drift: bool = False
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SchemaDriftScanSummary:
+    """전체 subject drift 스캔 결과 요약"""
+
+    registry_id: str
+    scanned_at: datetime
+    subjects_scanned: int
+    drifted_subjects: int
+    failed_subjects: list[str] = field(default_factory=list)
+    duration_ms: float = 0.0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CatalogRescoreSummary:
+    """catalog PII/리스크 점수 일괄 재계산 결과"""
+
+    subjects_scored: int
+    fields_scanned: int
+    pii_subjects: int
+    keywords: list[str] = field(default_factory=list)
+    duration_ms: float = 0.0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SchemaFieldHit:
+    """필드 색인 검색 결과 1건"""
+
+    subject: str
+    version: int
+    field_path: str
+    field_name: str
+    field_type: str
+    logical_type: str | None = None
+    nullable: bool = False
+    has_default: bool = False
+    has_doc: bool = False
+    depth: int = 0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SchemaFieldSearchPage:
+    """필드 색인 검색 결과 페이지"""
+
+    items: list[SchemaFieldHit] = field(default_factory=list)
+    total: int = 0
+    page: int = 1
+    limit: int = 50
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FieldIndexRebuildSummary:
+    """필드 색인 재구축 결과"""
+
+    versions_indexed: int
+    fields_indexed: int
+    duration_ms: float = 0.0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SchemaDriftReportPage:
+    """저장된 drift 스캔 결과 페이지 (drift가 있는 subject만)"""
+
+    summary: SchemaDriftScanSummary | None
+    items: list[SubjectDriftReport]
+    total: int
+    page: int
+    limit: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RegistrySubjectDiff:
+    """두 registry 간 subject 최신 스키마 차이"""
+
+    subject: str
+    status: str  # only_in_source | only_in_target | different
+    source_version: int | None = None
+    target_version: int | None = None
+    source_canonical_hash: str | None = None
+    target_canonical_hash: str | None = None
+    diff_type: str | None = None
+    changes: list[str] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RegistryComparisonSummary:
+    """Registry 비교 요약 (source 기준으로 target과 비교)"""
+
+    source_registry_id: str
+    target_registry_id: str
+    source_refreshed_at: datetime | None
+    target_refreshed_at: datetime | None
+    identical: int
+    only_in_source: int
+    only_in_target: int
+    different: int
+    # 최신 head 조회에 실패한 subject (only_in_* 집계에서 제외)
+    failed_subjects: list[str] = field(default_factory=list)
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class SchemaVersionExport:
     """스키마 버전 export 정보"""
@@ -161,3 +260,4 @@ class SchemaVersionExport:
     filename: str
     media_type: str
     schema_str: str
+    canonical_hash: str | None = None
@@ -59,3 +59,4 @@ class DomainSchemaDeleteImpact:
     total_versions: int
     warnings: tuple[str, ...] = ()
     safe_to_delete: bool = False
+    dependents: tuple[SubjectName, ...] = ()  # 이 subject를 (전이적으로) 참조하는 subject
@@ -54,3 +54,32 @@ class SchemaPolicyHistoryItem:
     created_by: str
     created_at: str
     description: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class PolicySimulationRuleHit:
+    """정책 시뮬레이션 룰별 적중 결과 - Value Object"""
+
+    rule: str
+    severity: str
+    violation_count: int
+    subjects: tuple[str, ...] = ()
+
+    @property
+    def subject_count(self) -> int:
+        return len(self.subjects)
+
+
+@dataclass(frozen=True, slots=True)
+class PolicySimulationSummary:
+    """정책 시뮬레이션 요약 - Value Object"""
+
+    policy_id: str
+    policy_version: int
+    policy_type: SchemaPolicyType
+    target_environment: str
+    subjects_scanned: int
+    subjects_evaluated: int
+    subjects_flagged: int
+    parse_failures: int
+    duration_ms: float
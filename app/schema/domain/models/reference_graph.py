@@ -0,0 +1,145 @@
+"""Schema Reference Graph Models"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Literal
+
+from .types_enum import SubjectName
+
+ReferenceDirection = Literal["dependents", "dependencies"]
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaReferenceNode:
+    """참조 그래프 탐색 결과 노드 - 시작 subject로부터의 hop 수 포함"""
+
+    subject: SubjectName
+    depth: int
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SchemaReferenceImpact:
+    """subject 기준 참조 영향도 (dependents: 나를 참조하는 subject, dependencies: 내가 참조하는 subject)"""
+
+    subject: SubjectName
+    direction: ReferenceDirection
+    max_depth: int | None = None
+    nodes: list[SchemaReferenceNode] = field(default_factory=list)
+
+
+class SchemaReferenceGraph:
+    """subject 단위 참조 그래프 (간선: 참조하는 subject → 참조되는 subject)
+
+    subject를 정수 id로 바꾼 정방향/역방향 인접 리스트를 한 번 만들어 두고 BFS로 질의한다.
+    버전 단위 참조는 subject 단위로 합쳐진다 (어느 버전이든 참조하면 의존 관계로 본다).
+    """
+
+    __slots__ = ("_forward", "_ids", "_names", "_reverse", "edge_count")
+
+    def __init__(self, edges: Iterable[tuple[SubjectName, SubjectName]] = ()) -> None:
+        self._ids: dict[SubjectName, int] = {}
+        self._names: list[SubjectName] = []
+        forward: list[set[int]] = []
+        reverse: list[set[int]] = []
+
+        def intern(subject: SubjectName) -> int:
+            node = self._ids.get(subject)
+            if node is None:
+                node = self._ids[subject] = len(self._names)
+                self._names.append(subject)
+                forward.append(set())
+                reverse.append(set())
+            return node
+
+        for dependent, dependency in edges:
+            if dependent == dependency:
+                continue
+            source, target = intern(dependent), intern(dependency)
+            forward[source].add(target)
+            reverse[target].add(source)
+
+        self._forward = [tuple(targets) for targets in forward]
+        self._reverse = [tuple(sources) for sources in reverse]
+        self.edge_count = sum(len(targets) for targets in self._forward)
+
+    def __contains__(self, subject: object) -> bool:
+        return subject in self._ids
+
+    def dependents(
+        self, subject: SubjectName, max_depth: int | None = None
+    ) -> list[SchemaReferenceNode]:
+        """subject를 (전이적으로) 참조하는 subject 목록 - hop 수, 이름 순"""
+        return self._walk(self._reverse, subject, max_depth)
+
+    def dependencies(
+        self, subject: SubjectName, max_depth: int | None = None
+    ) -> list[SchemaReferenceNode]:
+        """subject가 (전이적으로) 참조하는 subject 목록 (dependency closure) - hop 수, 이름 순"""
+        return self._walk(self._forward, subject, max_depth)
+
+    def topological_order(self, subjects: Sequence[SubjectName]) -> list[SubjectName]:
+        """참조되는 subject가 먼저 오도록 정렬 (subjects 사이의 간선만 고려)
+
+        의존 관계가 없는 subject끼리는 입력 순서를 유지하고, 순환이 있으면 남은 subject를
+        입력 순서대로 뒤에 붙인다.
+        """
+        position = {subject: index for index, subject in enumerate(subjects)}
+        blockers = dict.fromkeys(subjects, 0)
+        unblocks: dict[SubjectName, list[SubjectName]] = {subject: [] for subject in subjects}
+        for subject in subjects:
+            node = self._ids.get(subject)
+            if node is None:
+                continue
+            for target in self._forward[node]:
+                dependency = self._names[target]
+                if dependency in position:
+                    blockers[subject] += 1
+                    unblocks[dependency].append(subject)
+
+        ordered: list[SubjectName] = []
+        ready = deque(subject for subject in subjects if blockers[subject] == 0)
+        while ready:
+            subject = ready.popleft()
+            ordered.append(subject)
+            released = []
+            for dependent in unblocks[subject]:
+                blockers[dependent] -= 1
+                if blockers[dependent] == 0:
+                    released.append(dependent)
+            ready.extend(sorted(released, key=position.__getitem__))
+
+        if len(ordered) < len(subjects):
+            placed = set(ordered)
+            ordered.extend(subject for subject in subjects if subject not in placed)
+        return ordered
+
+    def _walk(
+        self, adjacency: list[tuple[int, ...]], subject: SubjectName, max_depth: int | None
+    ) -> list[SchemaReferenceNode]:
+        start = self._ids.get(subject)
+        if start is None:
+            return []
+        depths = {start: 0}
+        frontier = [start]
+        depth = 0
+        while frontier and (max_depth is None or depth < max_depth):
+            depth += 1
+            next_frontier = []
+            for node in frontier:
+                for neighbor in adjacency[node]:
+                    if neighbor not in depths:
+                        depths[neighbor] = depth
+                        next_frontier.append(neighbor)
+            frontier = next_frontier
+
+        del depths[start]
+        return sorted(
+            (
+                SchemaReferenceNode(subject=self._names[node], depth=hops)
+                for node, hops in depths.items()
+            ),
+            key=lambda item: (item.depth, item.subject),
+        )
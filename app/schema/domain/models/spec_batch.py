@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import hashlib
+from collections import Counter
 from dataclasses import dataclass
 
 from .types_enum import (
@@ -86,8 +87,8 @@ class DomainSchemaBatch:
         if not self.specs:
             raise ValueError("specs cannot be empty")
 
-        subjects = [spec.subject for spec in self.specs]
-        duplicates = {subject for subject in subjects if subjects.count(subject) > 1}
+        counts = Counter(spec.subject for spec in self.specs)
+        duplicates = {subject for subject, count in counts.items() if count > 1}
         if duplicates:
             raise ValueError(f"duplicate subjects detected: {sorted(duplicates)}")
 
@@ -39,6 +39,14 @@ class DynamicSchemaPolicyEngine:
             # 파싱 에러는 별도 처리 (여기서는 스킵하거나 에러 추가)
             return all_violations
 
+        return self.evaluate_parsed(spec, schema_dict, env)
+
+    def evaluate_parsed(
+        self, spec: DomainSchemaSpec, schema_dict: dict[str, Any], env: str
+    ) -> list[DomainPolicyViolation]:
+        """이미 파싱된 스키마 딕셔너리로 검증 (일괄 평가 시 중복 파싱 방지)"""
+        all_violations: list[DomainPolicyViolation] = []
+
         for policy in self.policies:
             # 1. 환경 체크 (total이거나 현재 환경과 일치하는 경우만)
             if policy.target_environment != "total" and policy.target_environment != env:
@@ -31,10 +31,11 @@ class DefaultSchemaPolicyPackV1:
         custom_rules = tuple(self._build_custom_rules(batch, plan))
         all_rules = base_rules + compatibility_rules + custom_rules
 
+        existing_codes = {violation.rule for violation in plan.violations}
         generated_violations = tuple(
             self._violation_from_rule(rule)
             for rule in compatibility_rules + custom_rules
-            if rule.code not in {violation.rule for violation in plan.violations}
+            if rule.code not in existing_codes
         )
 
         return SchemaPolicyPackResult(
@@ -1,5 +1,7 @@
 """Security Policies"""
 
+import re
+from collections.abc import Iterable
 from typing import Any, ClassVar
 
 from app.schema.domain.models.lint import LintViolation, ViolationSeverity
@@ -7,6 +9,25 @@ from app.schema.domain.models.lint import LintViolation, ViolationSeverity
 from .base import ISchemaLintPolicy
 
 
+class PiiKeywordMatcher:
+    """PII 키워드 다중 패턴 매처
+
+    키워드마다 부분 문자열 검사를 반복하지 않고 하나의 컴파일된 정규식으로 한 번에 찾는다.
+    lookahead로 감싸 서로 겹치는 위치의 키워드도 모두 잡는다 (예: ``cardaccount``).
+    """
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords = tuple(
+            sorted({kw.lower() for kw in keywords if kw}, key=lambda kw: (-len(kw), kw))
+        )
+        alternation = "|".join(re.escape(kw) for kw in self.keywords) or r"(?!)"
+        self.pattern = re.compile(f"(?=({alternation}))")
+
+    def find(self, text: str) -> list[str]:
+        """소문자 변환한 text에 포함된 키워드 목록 (등장 순서, 중복 제거)"""
+        return list(dict.fromkeys(match.group(1) for match in self.pattern.finditer(text.lower())))
+
+
 class PiiCandidatePolicy(ISchemaLintPolicy):
     """PII(개인 식별 정보) 후보 감지 정책"""
 
@@ -24,6 +45,9 @@ class PiiCandidatePolicy(ISchemaLintPolicy):
         "account",
     }
 
+    def __init__(self, matcher: PiiKeywordMatcher | None = None) -> None:
+        self.matcher = matcher or PiiKeywordMatcher(self.PII_KEYWORDS)
+
     @property
     def code(self) -> str:
         return "PII_CANDIDATE"
@@ -42,9 +66,7 @@ class PiiCandidatePolicy(ISchemaLintPolicy):
 
         for field in fields:
             # PII 키워드 매칭
-            matched_keywords = [
-                kw for kw in self.PII_KEYWORDS if kw in field.get("name", "").lower()
-            ]
+            matched_keywords = self.matcher.find(field.get("name", ""))
 
             if matched_keywords:
                 violations.append(
@@ -16,10 +16,12 @@ from ..models import (
     DomainSchemaSpec,
     DomainSchemaUploadResult,
     Reference,
+    SchemaReferenceGraph,
     SchemaVersionInfo,
     SubjectName,
 )
 from ..models.policy_management import DomainSchemaPolicy, SchemaPolicyStatus, SchemaPolicyType
+from ..models.value_objects import DomainSchemaReference
 
 
 class ISchemaRegistryRepository(ABC):
@@ -65,6 +67,10 @@ class ISchemaRegistryRepository(ABC):
     async def get_schema_by_version(self, subject: SubjectName, version: int) -> SchemaVersionInfo:
         """Subject의 특정 버전 상세 조회"""
 
+    @abstractmethod
+    async def get_latest_schema(self, subject: SubjectName) -> SchemaVersionInfo:
+        """Subject의 최신 버전 상세 조회 (단일 요청)"""
+
 
 class ISchemaMetadataRepository(ABC):
     """스키마 메타데이터/Audit Repository 인터페이스"""
@@ -128,6 +134,27 @@ class ISchemaMetadataRepository(ABC):
         """Subject의 메타데이터 조회"""
 
 
+class ISchemaReferenceRepository(ABC):
+    """스키마 참조 그래프 리포지토리 인터페이스"""
+
+    @abstractmethod
+    async def load_graph(self) -> SchemaReferenceGraph:
+        """subject 단위 참조 그래프 조회 (캐시 허용)"""
+
+    @abstractmethod
+    async def record_references(
+        self,
+        subject: SubjectName,
+        version: int,
+        references: Iterable[DomainSchemaReference],
+    ) -> None:
+        """특정 버전이 참조하는 subject 목록 기록 (기존 기록은 교체)"""
+
+    @abstractmethod
+    async def delete_subject(self, subject: SubjectName) -> None:
+        """삭제된 subject의 참조 기록 제거"""
+
+
 class ISchemaAuditRepository(ABC):
     """감사 로그 리포지토리"""
 
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any
+from collections.abc import Callable
+from typing import Any, Protocol, TypeVar
 
 from .models import (
+    DescribeResult,
     DomainEnvironment,
     DomainPlanAction,
     DomainPolicyViolation,
@@ -17,16 +20,32 @@ from .models import (
     DomainSchemaPlanItem,
     DomainSchemaSpec,
     DomainSubjectStrategy,
+    SchemaReferenceNode,
     SchemaVersionInfo,
     SubjectName,
 )
 from .policies.compatibility import CompatibilityGuardrail
 from .policies.dynamic_engine import DynamicSchemaPolicyEngine
-from .repositories.interfaces import ISchemaPolicyRepository, ISchemaRegistryRepository
+from .repositories.interfaces import (
+    ISchemaPolicyRepository,
+    ISchemaReferenceRepository,
+    ISchemaRegistryRepository,
+)
 
 # 스키마 버전 임계값
 HIGH_VERSION_COUNT_THRESHOLD = 10  # 버전이 이 개수를 초과하면 경고
 
+# 계획 수립 시 CPU 실행기로 한 번에 보낼 spec 수 (정책 엔진 pickle/풀 왕복을 청크당 1회로)
+PLAN_ANALYSIS_CHUNK_SIZE = 50
+
+R = TypeVar("R")
+
+
+class CpuTaskRunner(Protocol):
+    """CPU 바운드 작업을 이벤트 루프 밖에서 실행하는 실행기 (app.shared.cpu_executor)"""
+
+    async def run(self, func: Callable[..., R], *args: Any, size_hint: int = 0) -> R: ...
+
 
 class SchemaImpactAnalyzer:
     """스키마 변경 영향도 기본 분석 서비스"""
@@ -45,8 +64,13 @@ class SchemaImpactAnalyzer:
 class SchemaDeleteAnalyzer:
     """스키마 삭제 전 버전/환경 기준 영향도를 분석합니다."""
 
-    def __init__(self, registry_repository: ISchemaRegistryRepository) -> None:
+    def __init__(
+        self,
+        registry_repository: ISchemaRegistryRepository,
+        reference_repository: ISchemaReferenceRepository | None = None,
+    ) -> None:
         self.registry_repository = registry_repository
+        self.reference_repository = reference_repository
         self.impact_analyzer = SchemaImpactAnalyzer(registry_repository)
 
     async def analyze_delete_impact(self, subject: SubjectName) -> DomainSchemaDeleteImpact:
@@ -77,9 +101,20 @@ class SchemaDeleteAnalyzer:
             current_version=current_info.version,
         )
 
-        # 4. 안전 삭제 여부 판단
-        safe_to_delete = self._is_safe_to_delete(
-            subject=subject, current_version=current_info.version
+        # 4. 이 subject를 (전이적으로) 참조하는 subject - 삭제 시 해당 스키마들이 깨진다
+        dependents = await self._find_dependents(subject)
+        if dependents:
+            direct = sum(1 for node in dependents if node.depth == 1)
+            warnings.append(
+                f"{len(dependents)}개의 스키마가 이 스키마를 참조합니다 "
+                f"(직접 {direct}개, 간접 {len(dependents) - direct}개). "
+                f"삭제 시 참조 스키마를 해석할 수 없게 됩니다."
+            )
+
+        # 5. 안전 삭제 여부 판단
+        safe_to_delete = (
+            self._is_safe_to_delete(subject=subject, current_version=current_info.version)
+            and not dependents
         )
 
         return DomainSchemaDeleteImpact(
@@ -88,8 +123,15 @@ class SchemaDeleteAnalyzer:
             total_versions=current_info.version if current_info.version else 0,
             warnings=tuple(warnings),
             safe_to_delete=safe_to_delete,
+            dependents=tuple(node.subject for node in dependents),
         )
 
+    async def _find_dependents(self, subject: SubjectName) -> list[SchemaReferenceNode]:
+        if self.reference_repository is None:
+            return []
+        graph = await self.reference_repository.load_graph()
+        return graph.dependents(subject)
+
     def _generate_delete_warnings(
         self,
         subject: SubjectName,
@@ -136,9 +178,11 @@ class SchemaPlannerService:
         self,
         registry_repository: ISchemaRegistryRepository,
         policy_repository: ISchemaPolicyRepository | None = None,
+        cpu_executor: CpuTaskRunner | None = None,
     ) -> None:
         self.registry_repository = registry_repository
         self.policy_repository = policy_repository
+        self.cpu_executor = cpu_executor
         self.impact_analyzer = SchemaImpactAnalyzer(registry_repository)
         self.compat_guardrail = CompatibilityGuardrail()
 
@@ -161,11 +205,13 @@ class SchemaPlannerService:
         impacts: list[DomainSchemaImpactRecord] = []
         all_violations: list[DomainPolicyViolation] = []
 
-        for spec in batch.specs:
+        # 1. 정규화 비교/diff/동적 정책 평가는 CPU 작업이라 청크 단위로 동시에 오프로딩
+        analyses = await self._analyze_specs(batch, current_subjects, policy_engine)
+
+        for spec, (action, diff, dynamic_violations) in zip(batch.specs, analyses, strict=True):
             current_info = current_subjects.get(spec.subject)
 
-            # 1. 계획 아이템 생성
-            action = self._determine_plan_action(current_info, spec)
+            # 계획 아이템 생성
             current_version = current_info.version if current_info else None
             target_version = (
                 current_version
@@ -175,23 +221,6 @@ class SchemaPlannerService:
                 else 1
             )
 
-            # 스키마 diff 계산
-            diff = (
-                DomainSchemaDiff(
-                    type="no_change",
-                    changes=("No schema change detected",),
-                    current_version=current_version,
-                    target_compatibility=spec.compatibility.value
-                    if hasattr(spec.compatibility, "value")
-                    else spec.compatibility,
-                    schema_type=spec.schema_type.value
-                    if hasattr(spec.schema_type, "value")
-                    else spec.schema_type,
-                )
-                if action is DomainPlanAction.NONE
-                else self._calculate_schema_diff(current_info, spec)
-            )
-
             plan_item = DomainSchemaPlanItem(
                 subject=spec.subject,
                 action=action,
@@ -215,8 +244,7 @@ class SchemaPlannerService:
             )
             all_violations.extend(hardcoded_violations)
 
-            # 3.2 다이내믹 엔진 (사용자 정의 정책)
-            dynamic_violations = policy_engine.evaluate(spec, batch.env.value)
+            # 3.2 다이내믹 엔진 (사용자 정의 정책) - 1단계에서 함께 평가됨
             all_violations.extend(dynamic_violations)
 
             # 4. 영향도 분석
@@ -233,36 +261,46 @@ class SchemaPlannerService:
             requested_total=len(batch.specs),
         )
 
-    def _determine_plan_action(
+    async def _analyze_specs(
         self,
-        current_info: SchemaVersionInfo | None,
-        spec: DomainSchemaSpec,
-    ) -> DomainPlanAction:
-        if current_info is None:
-            return DomainPlanAction.REGISTER
-
-        if self._schema_matches_current(current_info, spec):
-            return DomainPlanAction.NONE
+        batch: DomainSchemaBatch,
+        current_subjects: DescribeResult,
+        policy_engine: DynamicSchemaPolicyEngine,
+    ) -> list[tuple[DomainPlanAction, DomainSchemaDiff, list[DomainPolicyViolation]]]:
+        """spec을 청크로 나눠 CPU 실행기에 한꺼번에 제출하고 입력 순서대로 결과를 모은다"""
+        pairs = [(current_subjects.get(spec.subject), spec) for spec in batch.specs]
+        chunks = [
+            pairs[start : start + PLAN_ANALYSIS_CHUNK_SIZE]
+            for start in range(0, len(pairs), PLAN_ANALYSIS_CHUNK_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._run_cpu(
+                    _analyze_spec_changes,
+                    chunk,
+                    policy_engine,
+                    batch.env.value,
+                    size_hint=sum(
+                        len(spec.schema or "") + len((info.schema if info else None) or "")
+                        for info, spec in chunk
+                    ),
+                )
+                for chunk in chunks
+            )
+        )
+        return [analysis for chunk_result in results for analysis in chunk_result]
 
-        return DomainPlanAction.UPDATE
+    async def _run_cpu(self, func: Callable[..., R], *args: Any, size_hint: int) -> R:
+        if self.cpu_executor is None:
+            return func(*args)
+        return await self.cpu_executor.run(func, *args, size_hint=size_hint)
 
-    def _schema_matches_current(
+    def _determine_plan_action(
         self,
-        current_info: SchemaVersionInfo,
+        current_info: SchemaVersionInfo | None,
         spec: DomainSchemaSpec,
-    ) -> bool:
-        schema_type_value = (
-            spec.schema_type.value if hasattr(spec.schema_type, "value") else str(spec.schema_type)
-        )
-        if current_info.schema_type is not None and current_info.schema_type != schema_type_value:
-            return False
-
-        return _normalize_schema_text(
-            current_info.schema, schema_type_value
-        ) == _normalize_schema_text(
-            spec.schema,
-            schema_type_value,
-        )
+    ) -> DomainPlanAction:
+        return _determine_plan_action(current_info, spec)
 
     def _calculate_schema_diff(
         self,
@@ -270,97 +308,168 @@ class SchemaPlannerService:
         spec: DomainSchemaSpec,
     ) -> DomainSchemaDiff:
         """스키마 변경 사항 계산"""
-        if not current_info:
-            return DomainSchemaDiff(
-                type="new_registration",
-                changes=("New schema registration",),
-                current_version=None,
-                target_compatibility=spec.compatibility.value
-                if hasattr(spec.compatibility, "value")
-                else spec.compatibility,
-                schema_type=spec.schema_type.value
-                if hasattr(spec.schema_type, "value")
-                else spec.schema_type,
-            )
-
-        changes: list[str] = []
-
-        # 1. 메타데이터/타입 변경 확인
-        # 1. 메타데이터/타입 변경 확인
-        schema_type_val = (
-            spec.schema_type.value if hasattr(spec.schema_type, "value") else spec.schema_type
+        return calculate_schema_diff(current_info, spec)
+
+
+def _analyze_spec_change(
+    current_info: SchemaVersionInfo | None,
+    spec: DomainSchemaSpec,
+    policy_engine: DynamicSchemaPolicyEngine,
+    env: str,
+) -> tuple[DomainPlanAction, DomainSchemaDiff, list[DomainPolicyViolation]]:
+    """spec 하나의 계획 액션/diff/동적 정책 위반 계산 (프로세스 풀에서도 실행 가능한 순수 함수)"""
+    action = _determine_plan_action(current_info, spec)
+    if action is DomainPlanAction.NONE:
+        diff = DomainSchemaDiff(
+            type="no_change",
+            changes=("No schema change detected",),
+            current_version=current_info.version if current_info else None,
+            target_compatibility=spec.compatibility.value
+            if hasattr(spec.compatibility, "value")
+            else spec.compatibility,
+            schema_type=spec.schema_type.value
+            if hasattr(spec.schema_type, "value")
+            else spec.schema_type,
         )
-        if current_info.schema_type is not None and current_info.schema_type != schema_type_val:
-            changes.append(f"Type changed: {current_info.schema_type} → {schema_type_val}")
-
-        # 2. 필드 레벨 Diff (JSON/Avro인 경우)
-        if schema_type_val in ["AVRO", "JSON"]:
-            try:
-                old_raw = current_info.schema or "{}"
-                new_raw = spec.schema or "{}"
-                old_json = json.loads(old_raw)
-                new_json = json.loads(new_raw)
-
-                if old_raw != new_raw:
-
-                    def get_field_diff(old_json: Any, new_json: Any, prefix: str = "") -> list[str]:
-                        diffs = []
-                        old_fields = {f["name"]: f for f in old_json.get("fields", [])}
-                        new_fields = {f["name"]: f for f in new_json.get("fields", [])}
-
-                        added = set(new_fields.keys()) - set(old_fields.keys())
-                        removed = set(old_fields.keys()) - set(new_fields.keys())
-                        common = set(old_fields.keys()) & set(new_fields.keys())
-
-                        diffs.extend([f"Added field: {prefix}{name}" for name in added])
-                        diffs.extend([f"Removed field: {prefix}{name}" for name in removed])
-
-                        for name in common:
-                            old_f = old_fields[name]
-                            new_f = new_fields[name]
-                            if old_f != new_f:
-                                # If both are records, recurse
-                                if (
-                                    isinstance(old_f.get("type"), dict)
-                                    and old_f["type"].get("type") == "record"
-                                    and isinstance(new_f.get("type"), dict)
-                                    and new_f["type"].get("type") == "record"
-                                ):
-                                    diffs.extend(
-                                        get_field_diff(
-                                            old_f["type"], new_f["type"], f"{prefix}{name}."
-                                        )
-                                    )
-                                elif old_f.get("type") != new_f.get("type"):
-                                    diffs.append(
-                                        f"Changed type: {prefix}{name} ({old_f.get('type')} -> {new_f.get('type')})"
-                                    )
-                                else:
-                                    diffs.append(f"Modified field: {prefix}{name}")
-                        return diffs
-
-                    changes = get_field_diff(old_json, new_json)
-                    if not changes:
-                        changes.append("Schema structure changed (reordered or metadata updated)")
-            except Exception:
-                changes.append("Schema definition updated")
-        else:
-            changes.append("Schema updated")
-
-        if not changes:
-            changes.append("No changes detected")
-
+    else:
+        diff = calculate_schema_diff(current_info, spec)
+    return action, diff, policy_engine.evaluate(spec, env)
+
+
+def _analyze_spec_changes(
+    pairs: list[tuple[SchemaVersionInfo | None, DomainSchemaSpec]],
+    policy_engine: DynamicSchemaPolicyEngine,
+    env: str,
+) -> list[tuple[DomainPlanAction, DomainSchemaDiff, list[DomainPolicyViolation]]]:
+    """청크 단위 spec 분석 (실행기 왕복과 정책 엔진 직렬화를 청크당 한 번으로 줄인다)"""
+    return [
+        _analyze_spec_change(current_info, spec, policy_engine, env) for current_info, spec in pairs
+    ]
+
+
+def _determine_plan_action(
+    current_info: SchemaVersionInfo | None,
+    spec: DomainSchemaSpec,
+) -> DomainPlanAction:
+    if current_info is None:
+        return DomainPlanAction.REGISTER
+
+    if _schema_matches_current(current_info, spec):
+        return DomainPlanAction.NONE
+
+    return DomainPlanAction.UPDATE
+
+
+def _schema_matches_current(
+    current_info: SchemaVersionInfo,
+    spec: DomainSchemaSpec,
+) -> bool:
+    schema_type_value = (
+        spec.schema_type.value if hasattr(spec.schema_type, "value") else str(spec.schema_type)
+    )
+    if current_info.schema_type is not None and current_info.schema_type != schema_type_value:
+        return False
+
+    return _normalize_schema_text(current_info.schema, schema_type_value) == _normalize_schema_text(
+        spec.schema,
+        schema_type_value,
+    )
+
+
+def calculate_schema_diff(
+    current_info: SchemaVersionInfo | None,
+    spec: DomainSchemaSpec,
+) -> DomainSchemaDiff:
+    """스키마 변경 사항 계산 (current → spec)"""
+    if not current_info:
         return DomainSchemaDiff(
-            type="update",
-            changes=tuple(changes),
-            current_version=current_info.version,
+            type="new_registration",
+            changes=("New schema registration",),
+            current_version=None,
             target_compatibility=spec.compatibility.value
             if hasattr(spec.compatibility, "value")
             else spec.compatibility,
-            schema_type=current_info.schema_type
-            or (spec.schema_type.value if hasattr(spec.schema_type, "value") else spec.schema_type),
+            schema_type=spec.schema_type.value
+            if hasattr(spec.schema_type, "value")
+            else spec.schema_type,
         )
 
+    changes: list[str] = []
+
+    # 1. 메타데이터/타입 변경 확인
+    # 1. 메타데이터/타입 변경 확인
+    schema_type_val = (
+        spec.schema_type.value if hasattr(spec.schema_type, "value") else spec.schema_type
+    )
+    if current_info.schema_type is not None and current_info.schema_type != schema_type_val:
+        changes.append(f"Type changed: {current_info.schema_type} → {schema_type_val}")
+
+    # 2. 필드 레벨 Diff (JSON/Avro인 경우)
+    if schema_type_val in ["AVRO", "JSON"]:
+        try:
+            old_raw = current_info.schema or "{}"
+            new_raw = spec.schema or "{}"
+            old_json = json.loads(old_raw)
+            new_json = json.loads(new_raw)
+
+            if old_raw != new_raw:
+
+                def get_field_diff(old_json: Any, new_json: Any, prefix: str = "") -> list[str]:
+                    diffs = []
+                    old_fields = {f["name"]: f for f in old_json.get("fields", [])}
+                    new_fields = {f["name"]: f for f in new_json.get("fields", [])}
+
+                    added = set(new_fields.keys()) - set(old_fields.keys())
+                    removed = set(old_fields.keys()) - set(new_fields.keys())
+                    common = set(old_fields.keys()) & set(new_fields.keys())
+
+                    diffs.extend([f"Added field: {prefix}{name}" for name in added])
+                    diffs.extend([f"Removed field: {prefix}{name}" for name in removed])
+
+                    for name in common:
+                        old_f = old_fields[name]
+                        new_f = new_fields[name]
+                        if old_f != new_f:
+                            # If both are records, recurse
+                            if (
+                                isinstance(old_f.get("type"), dict)
+                                and old_f["type"].get("type") == "record"
+                                and isinstance(new_f.get("type"), dict)
+                                and new_f["type"].get("type") == "record"
+                            ):
+                                diffs.extend(
+                                    get_field_diff(old_f["type"], new_f["type"], f"{prefix}{name}.")
+                                )
+                            elif old_f.get("type") != new_f.get("type"):
+                                diffs.append(
+                                    f"Changed type: {prefix}{name} ({old_f.get('type')} -> {new_f.get('type')})"
+                                )
+                            else:
+                                diffs.append(f"Modified field: {prefix}{name}")
+                    return diffs
+
+                changes = get_field_diff(old_json, new_json)
+                if not changes:
+                    changes.append("Schema structure changed (reordered or metadata updated)")
+        except Exception:
+            changes.append("Schema definition updated")
+    else:
+        changes.append("Schema updated")
+
+    if not changes:
+        changes.append("No changes detected")
+
+    return DomainSchemaDiff(
+        type="update",
+        changes=tuple(changes),
+        current_version=current_info.version,
+        target_compatibility=spec.compatibility.value
+        if hasattr(spec.compatibility, "value")
+        else spec.compatibility,
+        schema_type=current_info.schema_type
+        or (spec.schema_type.value if hasattr(spec.schema_type, "value") else spec.schema_type),
+    )
+
 
 def _normalize_schema_text(schema_text: str | None, schema_type: str) -> str | None:
     if schema_text is None:
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.shared.database import Base
@@ -13,6 +13,10 @@ class ApprovalRequestModel(Base):
     __tablename__ = "approval_requests"
     __table_args__ = (
         UniqueConstraint("request_id", name="uq_approval_request_request_id"),
+        Index("idx_approval_requests_requested_at", "requested_at"),
+        Index("idx_approval_requests_status_requested_at", "status", "requested_at"),
+        Index("idx_approval_requests_resource_type", "resource_type"),
+        Index("idx_approval_requests_resource_requested_at", "resource_name", "requested_at"),
         {"comment": "승인 요청 상태 저장 테이블"},
     )
 
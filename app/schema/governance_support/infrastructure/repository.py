@@ -1,12 +1,18 @@
 """Shared Infrastructure Repository (Session Factory 패턴)"""
 
+from __future__ import annotations
+
+import base64
+import binascii
 import logging
 from collections.abc import Callable
 from contextlib import AbstractAsyncContextManager
-from datetime import UTC, datetime
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from sqlalchemy import desc, literal, select, union_all
+import orjson
+from sqlalchemy import and_, delete, desc, literal, or_, select, text, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.selectable import Select
 
@@ -17,12 +23,19 @@ from app.schema.governance_support.constants import (
     AuditStatus,
 )
 from app.schema.governance_support.infrastructure.models import ApprovalRequestModel
-from app.schema.governance_support.models import ApprovalRequest, AuditActivity
+from app.schema.governance_support.models import (
+    ApprovalRequest,
+    AuditActivity,
+    AuditActivityPage,
+)
 from app.schema.governance_support.repositories import (
     IApprovalRequestRepository,
     IAuditActivityRepository,
+    IAuditArchiveRepository,
 )
 from app.schema.infrastructure.models import SchemaAuditLogModel
+from app.shared.settings import settings
+from app.shared.tracing import traced_class
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +45,28 @@ ModelsToQuery = list[tuple[type[SchemaAuditLogModel] | type[ApprovalRequestModel
 VISIBLE_AUDIT_STATUSES = (AuditStatus.COMPLETED, AuditStatus.PARTIALLY_COMPLETED)
 
 
+@dataclass(frozen=True, slots=True)
+class _ActivityCursor:
+    """활동 피드 keyset 커서 - (timestamp, activity_type, row_id) 내림차순 위치"""
+
+    timestamp: datetime
+    activity_type: str
+    row_id: int
+
+    def encode(self) -> str:
+        payload = orjson.dumps([self.timestamp.isoformat(), self.activity_type, self.row_id])
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str) -> _ActivityCursor:
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            timestamp, activity_type, row_id = orjson.loads(base64.urlsafe_b64decode(padded))
+            return cls(datetime.fromisoformat(timestamp), str(activity_type), int(row_id))
+        except (ValueError, TypeError, binascii.Error) as exc:
+            raise ValueError(f"Invalid activity cursor: {cursor}") from exc
+
+
 def _subquery_log_model(model: type[SchemaAuditLogModel], activity_type: str) -> Select[Any]:
     """활동 로그 서브쿼리 생성 (모델별)
 
@@ -49,6 +84,7 @@ def _subquery_log_model(model: type[SchemaAuditLogModel], activity_type: str) ->
         team_col = literal(None).label("team")
 
     return select(
+        model.id.label("row_id"),
         model.action,
         model.target,
         model.actor,
@@ -68,6 +104,7 @@ def _subquery_log_model(model: type[SchemaAuditLogModel], activity_type: str) ->
 
 def _approval_request_query() -> Select[Any]:
     return select(
+        ApprovalRequestModel.id.label("row_id"),
         ApprovalRequestModel.status.label("action"),
         ApprovalRequestModel.resource_name.label("target"),
         ApprovalRequestModel.requested_by.label("actor"),
@@ -85,6 +122,58 @@ def _approval_request_query() -> Select[Any]:
     )
 
 
+def _source_columns(model) -> tuple[Any, Any]:
+    """소스 테이블의 (timestamp, id) 정렬 컬럼"""
+    if model is ApprovalRequestModel:
+        return ApprovalRequestModel.requested_at, ApprovalRequestModel.id
+    return model.timestamp, model.id
+
+
+def _after_cursor(query: Select[Any], model, activity_type: str, cursor: _ActivityCursor):
+    """keyset 조건을 소스별 인덱스 범위 조건으로 변환
+
+    전체 정렬은 (timestamp DESC, activity_type DESC, row_id DESC)이고 소스 안에서는
+    activity_type이 상수이므로, 소스별로 timestamp(+id) 범위 조건 하나로 줄어든다.
+    """
+    timestamp_col, id_col = _source_columns(model)
+    if activity_type < cursor.activity_type:
+        return query.where(timestamp_col <= cursor.timestamp)
+    if activity_type > cursor.activity_type:
+        return query.where(timestamp_col < cursor.timestamp)
+    return query.where(
+        or_(
+            timestamp_col < cursor.timestamp,
+            and_(timestamp_col == cursor.timestamp, id_col < cursor.row_id),
+        )
+    )
+
+
+def _top_n_union(sources: list[tuple[Select[Any], Any]], limit: int) -> Select[Any]:
+    """소스별 top-N을 먼저 자른 뒤 UNION → 최종 정렬/limit
+
+    각 소스는 자체 (timestamp, id) 인덱스 순서로 limit 행만 읽으므로 전체 UNION을
+    정렬하지 않는다.
+    """
+    if len(sources) == 1:
+        query, model = sources[0]
+        timestamp_col, id_col = _source_columns(model)
+        return query.order_by(desc(timestamp_col), desc(id_col)).limit(limit)
+
+    subqueries = []
+    for query, model in sources:
+        timestamp_col, id_col = _source_columns(model)
+        top_n = query.order_by(desc(timestamp_col), desc(id_col)).limit(limit).subquery()
+        subqueries.append(select(*top_n.c))
+    combined = union_all(*subqueries).subquery()
+    return (
+        select(*combined.c)
+        .order_by(
+            desc(combined.c.timestamp), desc(combined.c.activity_type), desc(combined.c.row_id)
+        )
+        .limit(limit)
+    )
+
+
 def _get_models_to_query(activity_type: str | None) -> ModelsToQuery:
     """조회할 모델과 활동 타입 결정
 
@@ -102,6 +191,7 @@ def _get_models_to_query(activity_type: str | None) -> ModelsToQuery:
     return models
 
 
+@traced_class("repository")
 class MySQLAuditActivityRepository(IAuditActivityRepository):
     """MySQL 기반 통합 감사 활동 리포지토리 (Session Factory 패턴)"""
 
@@ -111,20 +201,33 @@ class MySQLAuditActivityRepository(IAuditActivityRepository):
         self.session_factory = session_factory
 
     async def get_recent_activities(self, limit: int) -> list[AuditActivity]:
-        """최근 활동 조회 (Schema + Approval 통합) - UNION 쿼리 최적화"""
-        async with self.session_factory() as session:
-            schema_query = _subquery_log_model(SchemaAuditLogModel, ActivityType.SCHEMA)
-            approval_query = _approval_request_query()
-            combined_query = (
-                union_all(schema_query, approval_query).order_by(desc("timestamp")).limit(limit)
-            )
+        """최근 활동 조회 (Schema + Approval 통합) - UNION 쿼리 최적화
 
-            result = await session.execute(combined_query)
-            rows = result.fetchall()
+        먼저 hot window(최근 ``audit_hot_window_days``) 범위만 timestamp 인덱스/파티션으로
+        조회하고, 그 안에 limit만큼 활동이 없을 때만 전체 범위로 다시 조회한다.
+        """
+        hot_since = datetime.now(UTC) - timedelta(days=settings.audit_hot_window_days)
+        async with self.session_factory() as session:
+            rows = await self._fetch_recent(session, limit, since=hot_since)
+            if len(rows) < limit:
+                rows = await self._fetch_recent(session, limit, since=None)
 
             # 도메인 모델로 변환
             return [self._row_to_activity(row) for row in rows]
 
+    @staticmethod
+    async def _fetch_recent(session: AsyncSession, limit: int, *, since: datetime | None):
+        schema_query = _subquery_log_model(SchemaAuditLogModel, ActivityType.SCHEMA)
+        approval_query = _approval_request_query()
+        if since is not None:
+            schema_query = schema_query.where(SchemaAuditLogModel.timestamp >= since)
+            approval_query = approval_query.where(ApprovalRequestModel.requested_at >= since)
+        combined_query = _top_n_union(
+            [(schema_query, SchemaAuditLogModel), (approval_query, ApprovalRequestModel)], limit
+        )
+        result = await session.execute(combined_query)
+        return result.fetchall()
+
     @staticmethod
     def _row_to_activity(row) -> AuditActivity:
         """DB Row → AuditActivity 변환"""
@@ -182,39 +285,70 @@ class MySQLAuditActivityRepository(IAuditActivityRepository):
         actor: str | None = None,
         limit: int = 100,
     ) -> list[AuditActivity]:
-        """활동 히스토리 조회 (필터링 지원) - 개선된 쿼리"""
+        """활동 히스토리 조회 (필터링 지원) - 첫 페이지"""
+        page = await self.get_activity_page(
+            from_date=from_date,
+            to_date=to_date,
+            activity_type=activity_type,
+            action=action,
+            actor=actor,
+            limit=limit,
+        )
+        return page.items
+
+    async def get_activity_page(
+        self,
+        *,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        activity_type: str | None = None,
+        action: str | None = None,
+        actor: str | None = None,
+        target: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> AuditActivityPage:
+        """활동 히스토리 조회 (필터링 + keyset 커서 페이지네이션)
+
+        (timestamp, activity_type, id) 커서 이후 행만 소스별 인덱스 범위로 읽으므로
+        몇 달 전 페이지도 첫 페이지와 같은 비용으로 조회된다.
+        """
+        after = _ActivityCursor.decode(cursor) if cursor else None
         async with self.session_factory() as session:
             # 조회할 모델과 타입 결정
             models_to_query: ModelsToQuery = _get_models_to_query(activity_type)
 
-            # 각 모델별로 필터링된 쿼리 생성
-            queries = [
-                self._build_filtered_query(
+            # 쿼리가 없으면 빈 페이지 반환
+            if not models_to_query:
+                return AuditActivityPage(items=[])
+
+            # 각 모델별로 필터링된 쿼리 생성 (다음 페이지 여부 확인용 +1)
+            sources = []
+            for model, act_type in models_to_query:
+                query = self._build_filtered_query(
                     model=model,
                     activity_type=act_type,
                     from_date=from_date,
                     to_date=to_date,
                     action=action,
                     actor=actor,
-                    limit=limit,
+                    target=target,
                 )
-                for model, act_type in models_to_query
-            ]
-
-            # 쿼리가 없으면 빈 리스트 반환
-            if not queries:
-                return []
+                if after is not None:
+                    query = _after_cursor(query, model, act_type, after)
+                sources.append((query, model))
 
-            # 단일 쿼리면 그대로, 복수면 UNION
-            if len(queries) == 1:
-                final_query = queries[0].order_by(desc("timestamp")).limit(limit)
-            else:
-                final_query = union_all(*queries).order_by(desc("timestamp")).limit(limit)
-
-            result = await session.execute(final_query)
+            result = await session.execute(_top_n_union(sources, limit + 1))
             rows = result.fetchall()
 
-            return [self._row_to_activity(row) for row in rows]
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = _ActivityCursor(last.timestamp, last.activity_type, last.row_id).encode()
+        return AuditActivityPage(
+            items=[self._row_to_activity(row) for row in rows], next_cursor=next_cursor
+        )
 
     @staticmethod
     def _build_filtered_query(
@@ -224,7 +358,7 @@ class MySQLAuditActivityRepository(IAuditActivityRepository):
         to_date: datetime | None,
         action: str | None,
         actor: str | None,
-        limit: int,
+        target: str | None = None,
     ):
         """필터가 적용된 쿼리 빌드"""
         if model is ApprovalRequestModel:
@@ -237,24 +371,11 @@ class MySQLAuditActivityRepository(IAuditActivityRepository):
                 query = query.where(ApprovalRequestModel.status.ilike(action))
             if actor:
                 query = query.where(ApprovalRequestModel.requested_by.like(f"%{actor}%"))
+            if target:
+                query = query.where(ApprovalRequestModel.resource_name == target)
             return query
 
-        query = select(
-            model.action,
-            model.target,
-            model.actor,
-            model.team if hasattr(model, "team") else literal(None).label("team"),
-            model.timestamp,
-            model.message,
-            model.snapshot,
-            literal(activity_type).label("activity_type"),
-            literal(None).label("request_id"),
-            literal(None).label("resource_type"),
-            literal(None).label("change_type"),
-            literal(None).label("change_ref"),
-            literal(None).label("approver"),
-            literal(None).label("decision_reason"),
-        ).where(model.status.in_(VISIBLE_AUDIT_STATUSES))
+        query = _subquery_log_model(model, activity_type)
 
         if from_date:
             query = query.where(model.timestamp >= from_date)
@@ -264,10 +385,13 @@ class MySQLAuditActivityRepository(IAuditActivityRepository):
             query = query.where(model.action == action)
         if actor:
             query = query.where(model.actor.like(f"%{actor}%"))
+        if target:
+            query = query.where(model.target == target)
 
         return query
 
 
+@traced_class("repository")
 class SQLApprovalRequestRepository(IApprovalRequestRepository):
     def __init__(
         self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]
@@ -365,3 +489,124 @@ class SQLApprovalRequestRepository(IApprovalRequestRepository):
             requested_at=model.requested_at,
             decided_at=model.decided_at,
         )
+
+
+def _month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    month_index = value.month - 1 + months
+    return value.replace(year=value.year + month_index // 12, month=month_index % 12 + 1)
+
+
+def _to_days(value: datetime) -> int:
+    """MySQL ``TO_DAYS()`` 와 동일한 일 수"""
+    return value.date().toordinal() + 365
+
+
+@traced_class("repository")
+class MySQLAuditArchiveRepository(IAuditArchiveRepository):
+    """감사 로그 보관 주기 관리 리포지토리
+
+    MySQL에서 ``schema_audit_logs`` 가 월 단위 RANGE 파티션으로 구성되어 있으면
+    미래 파티션을 미리 만들고, 아카이브가 끝난 과거 파티션은 DROP PARTITION으로 정리한다.
+    SQLite 등 파티션이 없는 DB는 행 삭제만으로 hot 데이터 크기를 유지한다.
+    """
+
+    def __init__(
+        self, session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]]
+    ) -> None:
+        self.session_factory = session_factory
+
+    async def fetch_expired(
+        self, cutoff: datetime, *, after_id: int, limit: int
+    ) -> list[dict[str, Any]]:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(
+                    SchemaAuditLogModel.id,
+                    SchemaAuditLogModel.change_id,
+                    SchemaAuditLogModel.action,
+                    SchemaAuditLogModel.target,
+                    SchemaAuditLogModel.actor,
+                    SchemaAuditLogModel.status,
+                    SchemaAuditLogModel.message,
+                    SchemaAuditLogModel.snapshot,
+                    SchemaAuditLogModel.timestamp,
+                )
+                .where(
+                    SchemaAuditLogModel.timestamp < cutoff,
+                    SchemaAuditLogModel.id > after_id,
+                )
+                .order_by(SchemaAuditLogModel.id)
+                .limit(limit)
+            )
+            return [dict(row._mapping) for row in result]
+
+    async def delete_ids(self, ids: list[int]) -> int:
+        if not ids:
+            return 0
+        async with self.session_factory() as session:
+            result = await session.execute(
+                delete(SchemaAuditLogModel).where(SchemaAuditLogModel.id.in_(ids))
+            )
+            return result.rowcount or 0
+
+    async def maintain_partitions(
+        self, cutoff: datetime, *, months_ahead: int
+    ) -> tuple[list[str], list[str]]:
+        async with self.session_factory() as session:
+            if session.bind.dialect.name != "mysql":
+                return [], []
+
+            result = await session.execute(
+                text(
+                    "SELECT PARTITION_NAME, PARTITION_DESCRIPTION "
+                    "FROM information_schema.PARTITIONS "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table_name "
+                    "AND PARTITION_NAME IS NOT NULL"
+                ),
+                {"table_name": SchemaAuditLogModel.__tablename__},
+            )
+            partitions = dict(result.tuples().all())
+            if "pmax" not in partitions:
+                # 파티션이 구성되지 않은 테이블
+                return [], []
+
+            created: list[str] = []
+            current_month = _month_start(datetime.now(UTC))
+            for offset in range(months_ahead + 1):
+                month = _add_months(current_month, offset)
+                name = f"p{month:%Y%m}"
+                if name in partitions:
+                    continue
+                upper = _add_months(month, 1)
+                await session.execute(
+                    text(
+                        f"ALTER TABLE {SchemaAuditLogModel.__tablename__} "
+                        "REORGANIZE PARTITION pmax INTO ("
+                        f"PARTITION {name} VALUES LESS THAN (TO_DAYS('{upper:%Y-%m-%d}')), "
+                        "PARTITION pmax VALUES LESS THAN MAXVALUE)"
+                    )
+                )
+                created.append(name)
+
+            # 상한이 cutoff 이전인 파티션은 아카이브/삭제가 끝난 구간
+            cutoff_days = _to_days(cutoff)
+            dropped = [
+                name
+                for name, description in partitions.items()
+                if name != "pmax" and str(description).isdigit() and int(description) <= cutoff_days
+            ]
+            if dropped:
+                await session.execute(
+                    text(
+                        f"ALTER TABLE {SchemaAuditLogModel.__tablename__} "
+                        f"DROP PARTITION {', '.join(dropped)}"
+                    )
+                )
+
+        if created or dropped:
+            logger.info("Audit log partitions maintained: created=%s dropped=%s", created, dropped)
+        return created, dropped
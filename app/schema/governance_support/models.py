@@ -21,6 +21,14 @@ class AuditActivity:
     metadata: dict[str, Any] | None = None  # 추가 메타데이터
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuditActivityPage:
+    """감사 활동 페이지 (keyset 커서 기반)"""
+
+    items: list[AuditActivity]
+    next_cursor: str | None = None  # 다음 페이지 커서 (마지막 페이지면 None)
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ApprovalRequest:
     request_id: str
@@ -37,3 +45,14 @@ class ApprovalRequest:
     metadata: dict[str, Any] | None = None
     requested_at: datetime
     decided_at: datetime | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuditArchiveResult:
+    """감사 로그 아카이브 실행 결과"""
+
+    cutoff: datetime
+    rows_archived: int
+    files: tuple[str, ...]
+    partitions_dropped: tuple[str, ...]
+    partitions_created: tuple[str, ...]
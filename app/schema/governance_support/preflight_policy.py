@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import defaultdict
+from dataclasses import dataclass, field
 from enum import Enum
 
 from .policy_types import DomainResourceType
@@ -45,23 +46,76 @@ class DomainPolicyRuleResult:
         return self.decision is DomainPolicyDecision.WARN
 
 
+_RISK_ORDER = {
+    DomainRiskLevel.NONE: 0,
+    DomainRiskLevel.LOW: 1,
+    DomainRiskLevel.MEDIUM: 2,
+    DomainRiskLevel.HIGH: 3,
+    DomainRiskLevel.CRITICAL: 4,
+}
+
+
 @dataclass(frozen=True, slots=True)
 class DomainPolicyPackEvaluation:
+    """정책 팩 평가 결과
+
+    생성 시 rule을 decision/risk level/resource 별로 한 번만 분류해 두고,
+    요약 접근자(decision, blocking, risk_level 등)는 모두 O(1)로 동작한다.
+    """
+
     pack_name: str
     resource_type: DomainResourceType
     rules: tuple[DomainPolicyRuleResult, ...] = ()
+    _by_decision: dict[DomainPolicyDecision, tuple[DomainPolicyRuleResult, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+    _by_risk: dict[DomainRiskLevel, tuple[DomainPolicyRuleResult, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+    _by_resource: dict[str, tuple[DomainPolicyRuleResult, ...]] = field(
+        init=False, repr=False, compare=False
+    )
+    _risk_level: DomainRiskLevel = field(init=False, repr=False, compare=False)
+    _reasons: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        rules = tuple(self.rules)
+        by_decision: dict[DomainPolicyDecision, list[DomainPolicyRuleResult]] = defaultdict(list)
+        by_risk: dict[DomainRiskLevel, list[DomainPolicyRuleResult]] = defaultdict(list)
+        by_resource: dict[str, list[DomainPolicyRuleResult]] = defaultdict(list)
+        risk_rank = 0
+        for rule in rules:
+            by_decision[rule.decision].append(rule)
+            by_risk[rule.risk_level].append(rule)
+            by_resource[rule.resource_name].append(rule)
+            risk_rank = max(risk_rank, _RISK_ORDER[rule.risk_level])
+
+        object.__setattr__(self, "rules", rules)
+        object.__setattr__(
+            self, "_by_decision", {key: tuple(value) for key, value in by_decision.items()}
+        )
+        object.__setattr__(self, "_by_risk", {key: tuple(value) for key, value in by_risk.items()})
+        object.__setattr__(
+            self, "_by_resource", {key: tuple(value) for key, value in by_resource.items()}
+        )
+        object.__setattr__(
+            self,
+            "_risk_level",
+            next(level for level, rank in _RISK_ORDER.items() if rank == risk_rank),
+        )
+        object.__setattr__(self, "_reasons", tuple(dict.fromkeys(rule.reason for rule in rules)))
 
     @property
     def blocking_rules(self) -> tuple[DomainPolicyRuleResult, ...]:
-        return tuple(rule for rule in self.rules if rule.is_blocking)
+        return self._by_decision.get(DomainPolicyDecision.REJECT, ())
 
     @property
     def approval_rules(self) -> tuple[DomainPolicyRuleResult, ...]:
-        return tuple(rule for rule in self.rules if rule.requires_approval)
+        return self._by_decision.get(DomainPolicyDecision.APPROVAL_REQUIRED, ())
 
     @property
     def warning_rules(self) -> tuple[DomainPolicyRuleResult, ...]:
-        return tuple(rule for rule in self.rules if rule.is_warning)
+        return self._by_decision.get(DomainPolicyDecision.WARN, ())
 
     @property
     def warning_count(self) -> int:
@@ -87,22 +141,17 @@ class DomainPolicyPackEvaluation:
 
     @property
     def risk_level(self) -> DomainRiskLevel:
-        if not self.rules:
-            return DomainRiskLevel.NONE
-
-        order = {
-            DomainRiskLevel.NONE: 0,
-            DomainRiskLevel.LOW: 1,
-            DomainRiskLevel.MEDIUM: 2,
-            DomainRiskLevel.HIGH: 3,
-            DomainRiskLevel.CRITICAL: 4,
-        }
-        return max(self.rules, key=lambda rule: order[rule.risk_level]).risk_level
+        return self._risk_level
 
     @property
     def reasons(self) -> tuple[str, ...]:
-        ordered_reasons = [rule.reason for rule in self.rules]
-        return tuple(dict.fromkeys(ordered_reasons))
+        return self._reasons
+
+    def rules_for_risk(self, risk_level: DomainRiskLevel) -> tuple[DomainPolicyRuleResult, ...]:
+        return self._by_risk.get(risk_level, ())
+
+    def rules_for_resource(self, resource_name: str) -> tuple[DomainPolicyRuleResult, ...]:
+        return self._by_resource.get(resource_name, ())
 
     def summary(self) -> str:
         if not self.rules:
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import Any
 
-from .models import ApprovalRequest, AuditActivity
+from .models import ApprovalRequest, AuditActivity, AuditActivityPage
 
 
 class IAuditActivityRepository(ABC):
@@ -50,6 +51,31 @@ class IAuditActivityRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_activity_page(
+        self,
+        *,
+        from_date: datetime | None = None,
+        to_date: datetime | None = None,
+        activity_type: str | None = None,
+        action: str | None = None,
+        actor: str | None = None,
+        target: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> AuditActivityPage:
+        """
+        활동 히스토리 페이지 조회 (keyset 커서)
+
+        Args:
+            target: 대상 이름 (정확히 일치)
+            cursor: 이전 페이지의 ``next_cursor`` (None이면 첫 페이지)
+
+        Returns:
+            활동 페이지 (시간 역순) - 잘못된 커서는 ValueError
+        """
+        ...
+
 
 class IApprovalRequestRepository(ABC):
     @abstractmethod
@@ -77,3 +103,26 @@ class IApprovalRequestRepository(ABC):
         approver: str,
         decision_reason: str | None,
     ) -> ApprovalRequest: ...
+
+
+class IAuditArchiveRepository(ABC):
+    """감사 로그 보관 주기 관리 리포지토리 인터페이스"""
+
+    @abstractmethod
+    async def fetch_expired(
+        self, cutoff: datetime, *, after_id: int, limit: int
+    ) -> list[dict[str, Any]]:
+        """cutoff 이전 감사 로그를 id 순으로 조회 (snapshot 포함)"""
+        ...
+
+    @abstractmethod
+    async def delete_ids(self, ids: list[int]) -> int:
+        """아카이브된 감사 로그 삭제"""
+        ...
+
+    @abstractmethod
+    async def maintain_partitions(
+        self, cutoff: datetime, *, months_ahead: int
+    ) -> tuple[list[str], list[str]]:
+        """시간 파티션 유지보수 (생성된 파티션, 삭제된 파티션) - 미지원 DB는 빈 목록"""
+        ...
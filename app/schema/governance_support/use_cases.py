@@ -2,16 +2,33 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import asyncio
+import gzip
+import os
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
 from uuid import uuid4
 
-from app.schema.governance_support.models import ApprovalRequest, AuditActivity
+import orjson
+
+from app.schema.governance_support.models import (
+    ApprovalRequest,
+    AuditActivity,
+    AuditActivityPage,
+    AuditArchiveResult,
+)
 from app.schema.governance_support.repositories import (
     IApprovalRequestRepository,
     IAuditActivityRepository,
+    IAuditArchiveRepository,
 )
+from app.shared.settings import settings
+from app.shared.tracing import traced_class
 
 
+@traced_class("usecase")
 class GetRecentActivitiesUseCase:
     """최근 활동 조회 Use Case"""
 
@@ -40,6 +57,7 @@ class GetRecentActivitiesUseCase:
         return activities
 
 
+@traced_class("usecase")
 class GetActivityHistoryUseCase:
     """활동 히스토리 조회 Use Case"""
 
@@ -54,9 +72,11 @@ class GetActivityHistoryUseCase:
         action: str | None = None,
         actor: str | None = None,
         limit: int = 100,
-    ) -> list[AuditActivity]:
+        target: str | None = None,
+        cursor: str | None = None,
+    ) -> AuditActivityPage:
         """
-        활동 히스토리 조회 (필터링 지원)
+        활동 히스토리 조회 (필터링 + 커서 페이지네이션)
 
         Args:
             from_date: 시작 날짜/시간
@@ -64,10 +84,12 @@ class GetActivityHistoryUseCase:
             activity_type: 활동 타입 (예: schema, approval)
             action: 액션 타입
             actor: 수행자
-            limit: 최대 조회 개수 (기본 100개, 최대 500개)
+            limit: 페이지 크기 (기본 100개, 최대 500개)
+            target: 대상 이름
+            cursor: 이전 페이지의 next_cursor
 
         Returns:
-            필터링된 활동 목록 (시간 역순)
+            활동 페이지 (시간 역순)
         """
         # 입력 검증
         if limit < 1:
@@ -76,18 +98,19 @@ class GetActivityHistoryUseCase:
             limit = 500
 
         # Repository를 통해 조회
-        activities = await self.audit_repository.get_activity_history(
+        return await self.audit_repository.get_activity_page(
             from_date=from_date,
             to_date=to_date,
             activity_type=activity_type,
             action=action,
             actor=actor,
+            target=target,
             limit=limit,
+            cursor=cursor,
         )
 
-        return activities
-
 
+@traced_class("usecase")
 class CreateApprovalRequestUseCase:
     def __init__(self, approval_repository: IApprovalRequestRepository) -> None:
         self.approval_repository = approval_repository
@@ -120,6 +143,7 @@ class CreateApprovalRequestUseCase:
         return await self.approval_repository.create(request)
 
 
+@traced_class("usecase")
 class ListApprovalRequestsUseCase:
     def __init__(self, approval_repository: IApprovalRequestRepository) -> None:
         self.approval_repository = approval_repository
@@ -140,6 +164,7 @@ class ListApprovalRequestsUseCase:
         )
 
 
+@traced_class("usecase")
 class GetApprovalRequestUseCase:
     def __init__(self, approval_repository: IApprovalRequestRepository) -> None:
         self.approval_repository = approval_repository
@@ -151,6 +176,7 @@ class GetApprovalRequestUseCase:
         return request
 
 
+@traced_class("usecase")
 class ApproveApprovalRequestUseCase:
     def __init__(self, approval_repository: IApprovalRequestRepository) -> None:
         self.approval_repository = approval_repository
@@ -166,6 +192,7 @@ class ApproveApprovalRequestUseCase:
         )
 
 
+@traced_class("usecase")
 class RejectApprovalRequestUseCase:
     def __init__(self, approval_repository: IApprovalRequestRepository) -> None:
         self.approval_repository = approval_repository
@@ -179,3 +206,75 @@ class RejectApprovalRequestUseCase:
             approver=approver,
             decision_reason=decision_reason,
         )
+
+
+def _append_archive_files(archive_dir: Path, rows: list[dict[str, Any]]) -> list[str]:
+    """월별 gzip NDJSON 파일에 행을 append하고 fsync (작성된 파일 경로 반환)"""
+    by_month: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for row in rows:
+        by_month[f"{row['timestamp']:%Y-%m}"].append(row)
+
+    written: list[str] = []
+    for month, month_rows in sorted(by_month.items()):
+        path = archive_dir / "schema_audit_logs" / month[:4] / f"{month}.ndjson.gz"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = b"".join(
+            orjson.dumps(row, option=orjson.OPT_NAIVE_UTC) + b"\n" for row in month_rows
+        )
+        # gzip member를 이어 붙이는 방식이라 기존 파일을 다시 쓰지 않는다
+        with path.open("ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="ab") as archive:
+                archive.write(payload)
+            raw.flush()
+            os.fsync(raw.fileno())
+        written.append(str(path))
+    return written
+
+
+@traced_class("usecase")
+class ArchiveAuditLogsUseCase:
+    """보관 주기가 지난 감사 로그 아카이브 Use Case
+
+    ``audit_retention_days`` 이전 로그를 id 순서로 배치 조회해 월별 gzip NDJSON 파일에
+    기록한 뒤 DB에서 삭제한다. 파일 기록(fsync) 후 삭제하므로 중간 실패 시 일부 행이
+    중복 기록될 수는 있어도 유실되지는 않는다 (각 행의 ``id`` 로 중복 제거 가능).
+    """
+
+    def __init__(
+        self,
+        archive_repository: IAuditArchiveRepository,
+        archive_dir: str | None = None,
+        batch_size: int | None = None,
+    ) -> None:
+        self.archive_repository = archive_repository
+        self.archive_dir = Path(archive_dir or settings.audit_archive_dir)
+        self.batch_size = batch_size or settings.audit_archive_batch_size
+
+    async def execute(self, retention_days: int | None = None) -> AuditArchiveResult:
+        days = retention_days or settings.audit_retention_days
+        cutoff = datetime.now(UTC) - timedelta(days=days)
+
+        files: set[str] = set()
+        archived = 0
+        after_id = 0
+        while True:
+            rows = await self.archive_repository.fetch_expired(
+                cutoff, after_id=after_id, limit=self.batch_size
+            )
+            if not rows:
+                break
+            written = await asyncio.to_thread(_append_archive_files, self.archive_dir, rows)
+            files.update(written)
+            archived += await self.archive_repository.delete_ids([row["id"] for row in rows])
+            after_id = rows[-1]["id"]
+
+        created, dropped = await self.archive_repository.maintain_partitions(
+            cutoff, months_ahead=settings.audit_partition_months_ahead
+        )
+        return AuditArchiveResult(
+            cutoff=cutoff,
+            rows_archived=archived,
+            files=tuple(sorted(files)),
+            partitions_dropped=tuple(dropped),
+            partitions_created=tuple(created),
+        )
@@ -111,6 +111,9 @@ class SchemaVersionModel(Base):
     lint_report: Mapped[dict[str, Any] | None] = mapped_column(
         JSON, comment="Lint 리포트 (violations: [{code, severity, rule, hint}])"
     )
+    lint_engine_version: Mapped[int | None] = mapped_column(
+        Integer, comment="lint_report를 만든 lint 엔진 버전 (NULL이면 미실행)"
+    )
 
     # 타임스탬프
     registered_at: Mapped[datetime] = mapped_column(
@@ -130,12 +133,75 @@ class SchemaVersionModel(Base):
         Index("idx_subject_version", "subject", "version"),
         Index("idx_canonical_hash", "schema_canonical_hash"),
         Index("idx_schema_type", "schema_type"),
+        Index("idx_lint_engine_version", "lint_engine_version"),
     )
 
     def __repr__(self) -> str:
         return f"<SchemaVersion(subject={self.subject}, v={self.version}, type={self.schema_type})>"
 
 
+class SchemaFieldIndexModel(Base):
+    """필드 단위 역색인 - 버전별 (중첩 포함) 필드 1행
+
+    "어떤 subject에 customer_id 필드가 있나", "금액을 아직 bytes로 쓰는 스키마는" 같은 질의를
+    스키마 본문을 내려받지 않고 이름/타입 인덱스만으로 답한다.
+    """
+
+    __tablename__ = "schema_field_index"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    subject: Mapped[str] = mapped_column(String(512), comment="Subject 이름")
+    version: Mapped[int] = mapped_column(Integer, comment="버전 번호")
+    field_path: Mapped[str] = mapped_column(String(1024), comment="점(.)으로 이은 필드 경로")
+    field_name: Mapped[str] = mapped_column(String(255), comment="필드 이름 (원본)")
+    name_key: Mapped[str] = mapped_column(
+        String(255), comment="검색용 필드 이름 (camelCase → snake_case 소문자)"
+    )
+    field_type: Mapped[str] = mapped_column(
+        String(255), comment="필드 타입 (nullable union은 null 제외 타입, named type은 이름)"
+    )
+    logical_type: Mapped[str | None] = mapped_column(String(50), comment="Avro logicalType")
+    nullable: Mapped[bool] = mapped_column(Boolean, default=False, comment="null 허용 여부")
+    has_default: Mapped[bool] = mapped_column(Boolean, default=False, comment="default 존재 여부")
+    has_doc: Mapped[bool] = mapped_column(Boolean, default=False, comment="doc 존재 여부")
+    depth: Mapped[int] = mapped_column(Integer, default=0, comment="중첩 깊이 (최상위 0)")
+
+    __table_args__ = (
+        Index("idx_field_index_name", "name_key", "subject", "version"),
+        Index("idx_field_index_type", "field_type", "subject", "version"),
+        Index("idx_field_index_subject_version", "subject", "version"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<SchemaFieldIndex(subject={self.subject}, v={self.version}, path={self.field_path})>"
+        )
+
+
+class SchemaReferenceEdgeModel(Base):
+    """스키마 참조 간선 - 버전이 참조하는 subject/버전 1행
+
+    ``ref_subject`` 인덱스로 역방향(누가 나를 참조하나) 조회를 지원한다.
+    """
+
+    __tablename__ = "schema_reference_edges"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    subject: Mapped[str] = mapped_column(String(512), comment="참조하는 Subject")
+    version: Mapped[int] = mapped_column(Integer, comment="참조하는 버전")
+    ref_name: Mapped[str] = mapped_column(String(512), comment="참조 이름 (import 이름)")
+    ref_subject: Mapped[str] = mapped_column(String(512), comment="참조되는 Subject")
+    ref_version: Mapped[int] = mapped_column(Integer, comment="참조되는 버전")
+
+    __table_args__ = (
+        Index("idx_reference_edges_subject_version", "subject", "version"),
+        Index("idx_reference_edges_ref_subject", "ref_subject"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<SchemaReferenceEdge({self.subject} v{self.version} -> {self.ref_subject})>"
+
+
 class ObservedUsageModel(Base):
     """관측된 스키마 사용 패턴 (Optional)
 
@@ -166,3 +232,77 @@ class ObservedUsageModel(Base):
 
     def __repr__(self) -> str:
         return f"<ObservedUsage(subject={self.subject}, v={self.version}, last_seen={self.last_seen_at})>"
+
+
+class SchemaDriftScanModel(Base):
+    """Registry별 마지막 전체 drift 스캔 요약"""
+
+    __tablename__ = "schema_drift_scans"
+
+    registry_id: Mapped[str] = mapped_column(String(100), primary_key=True, comment="Registry ID")
+    scanned_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), comment="스캔 시각")
+    subjects_scanned: Mapped[int] = mapped_column(Integer, default=0, comment="스캔한 subject 수")
+    drifted_subjects: Mapped[int] = mapped_column(
+        Integer, default=0, comment="drift가 있는 subject 수"
+    )
+    failed_subjects: Mapped[list[str] | None] = mapped_column(
+        JSON, comment="SR 조회에 실패한 subject 목록"
+    )
+    duration_ms: Mapped[float] = mapped_column(Float, default=0.0, comment="스캔 소요 시간(ms)")
+
+    def __repr__(self) -> str:
+        return f"<SchemaDriftScan(registry={self.registry_id}, drifted={self.drifted_subjects})>"
+
+
+class SchemaDriftFindingModel(Base):
+    """전체 drift 스캔 결과 - drift 플래그가 있는 subject만 저장"""
+
+    __tablename__ = "schema_drift_findings"
+
+    registry_id: Mapped[str] = mapped_column(String(100), primary_key=True, comment="Registry ID")
+    subject: Mapped[str] = mapped_column(String(512), primary_key=True, comment="Subject 이름")
+    registry_latest_version: Mapped[int | None] = mapped_column(
+        Integer, comment="라이브 최신 버전 (SR에서 사라진 subject는 NULL)"
+    )
+    registry_canonical_hash: Mapped[str | None] = mapped_column(
+        String(64), comment="라이브 최신 canonical hash"
+    )
+    catalog_latest_version: Mapped[int | None] = mapped_column(Integer, comment="catalog 최신 버전")
+    catalog_canonical_hash: Mapped[str | None] = mapped_column(
+        String(64), comment="catalog canonical hash"
+    )
+    observed_version: Mapped[int | None] = mapped_column(Integer, comment="관측된 사용 버전")
+    last_synced_at: Mapped[str | None] = mapped_column(String(40), comment="catalog 동기화 시각")
+    drift_flags: Mapped[list[str]] = mapped_column(JSON, comment="drift 세부 플래그")
+
+    def __repr__(self) -> str:
+        return f"<SchemaDriftFinding(subject={self.subject}, flags={self.drift_flags})>"
+
+
+class SchemaRegistryHeadModel(Base):
+    """Registry별 subject 최신 버전(head) 인덱스
+
+    catalog(schema_subjects/schema_versions)는 단일 registry 기준이므로, 여러 registry를
+    (subject, canonical_hash)로 집합 비교할 수 있도록 registry_id를 포함한 head만 따로 둔다.
+    """
+
+    __tablename__ = "schema_registry_heads"
+
+    registry_id: Mapped[str] = mapped_column(String(100), primary_key=True, comment="Registry ID")
+    subject: Mapped[str] = mapped_column(String(512), primary_key=True, comment="Subject 이름")
+    version: Mapped[int] = mapped_column(Integer, comment="최신 버전 번호")
+    schema_id: Mapped[int | None] = mapped_column(Integer, comment="SR 스키마 ID")
+    schema_type: Mapped[str | None] = mapped_column(String(20), comment="스키마 타입")
+    canonical_hash: Mapped[str | None] = mapped_column(String(64), comment="정규화 해시")
+    schema_str: Mapped[str | None] = mapped_column(
+        Text, deferred=True, comment="스키마 본문 (구조 diff용)"
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), comment="수집 시각")
+
+    __table_args__ = (
+        Index("idx_registry_heads_subject_hash", "subject", "canonical_hash"),
+        Index("idx_registry_heads_refreshed", "registry_id", "refreshed_at"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<SchemaRegistryHead(registry={self.registry_id}, subject={self.subject}, v={self.version})>"
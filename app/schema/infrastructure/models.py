@@ -5,9 +5,10 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import JSON, DateTime, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy import JSON, DateTime, Index, Integer, String, Text, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column
 
+from ...shared.compressed_json import CompressedJSON
 from ...shared.database import Base
 
 
@@ -51,7 +52,9 @@ class SchemaPlanModel(Base):
 
     # 계획 정보
     env: Mapped[str] = mapped_column(String(50), comment="환경 (dev/stg/prod)")
-    plan_data: Mapped[dict[str, Any]] = mapped_column(JSON, comment="계획 데이터 (JSON)")
+    plan_data: Mapped[dict[str, Any]] = mapped_column(
+        CompressedJSON, deferred=True, comment="계획 데이터 (JSON, 대용량은 압축)"
+    )
 
     # 상태 정보
     status: Mapped[str] = mapped_column(String(20), default="pending", comment="상태")
@@ -71,6 +74,29 @@ class SchemaPlanModel(Base):
         return f"<SchemaPlan(change_id={self.change_id}, env={self.env}, status={self.status})>"
 
 
+class SchemaPlanItemModel(Base):
+    """스키마 계획 항목 테이블 (plan_data.items 정규화)
+
+    subject별 변경 사유/대상 버전을 plan_data JSON 파싱 없이 인덱스로 조회하기 위한 테이블
+    """
+
+    __tablename__ = "schema_plan_items"
+
+    # 기본 키 (복합키)
+    change_id: Mapped[str] = mapped_column(String(100), primary_key=True, comment="변경 ID")
+    subject: Mapped[str] = mapped_column(String(255), primary_key=True, comment="Subject 이름")
+
+    # 항목 정보
+    action: Mapped[str] = mapped_column(String(20), comment="계획 액션")
+    reason: Mapped[str | None] = mapped_column(Text, nullable=True, comment="변경 사유")
+    target_version: Mapped[int | None] = mapped_column(Integer, nullable=True, comment="대상 버전")
+
+    __table_args__ = (Index("idx_schema_plan_items_subject", "subject"),)
+
+    def __repr__(self) -> str:
+        return f"<SchemaPlanItem(change_id={self.change_id}, subject={self.subject})>"
+
+
 class SchemaApplyResultModel(Base):
     """스키마 적용 결과 테이블"""
 
@@ -82,7 +108,9 @@ class SchemaApplyResultModel(Base):
     )  # 36 → 100
 
     # 결과 정보
-    result_data: Mapped[dict[str, Any]] = mapped_column(JSON, comment="적용 결과 (JSON)")
+    result_data: Mapped[dict[str, Any]] = mapped_column(
+        CompressedJSON, deferred=True, comment="적용 결과 (JSON, 대용량은 압축)"
+    )
     registered_count: Mapped[int] = mapped_column(default=0, comment="등록 성공 개수")
     failed_count: Mapped[int] = mapped_column(default=0, comment="실패 개수")
 
@@ -167,13 +195,22 @@ class SchemaAuditLogModel(Base):
     message: Mapped[str | None] = mapped_column(Text, comment="메시지")
 
     # 스냅샷 (변경 전후 상태)
-    snapshot: Mapped[dict[str, Any] | None] = mapped_column(JSON, comment="스냅샷 (JSON)")
+    snapshot: Mapped[dict[str, Any] | None] = mapped_column(
+        CompressedJSON, deferred=True, comment="스냅샷 (JSON, 대용량은 압축)"
+    )
 
     # 타임스탬프
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), comment="로그 시간"
     )
 
+    # 최근 활동(hot window) 조회 / 보관 주기 아카이브 범위 조회용
+    __table_args__ = (
+        Index("idx_schema_audit_logs_timestamp", "timestamp"),
+        Index("idx_schema_audit_logs_status_timestamp", "status", "timestamp"),
+        Index("idx_schema_audit_logs_target_timestamp", "target", "timestamp"),
+    )
+
     def __repr__(self) -> str:
         return f"<SchemaAuditLog(id={self.id}, action={self.action}, target={self.target}, actor={self.actor})>"
 
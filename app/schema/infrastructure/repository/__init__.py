@@ -2,8 +2,10 @@
 
 from .audit_repository import MySQLSchemaAuditRepository
 from .mysql_repository import MySQLSchemaMetadataRepository
+from .reference_repository import MySQLSchemaReferenceRepository
 
 __all__ = [
     "MySQLSchemaAuditRepository",
     "MySQLSchemaMetadataRepository",
+    "MySQLSchemaReferenceRepository",
 ]
@@ -12,10 +12,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.schema.domain.models import ChangeId, SubjectName
 from app.schema.domain.repositories.interfaces import ISchemaAuditRepository
 from app.schema.infrastructure.models import SchemaAuditLogModel
+from app.shared.tracing import traced_class
 
 logger = logging.getLogger(__name__)
 
 
+@traced_class("repository")
 class MySQLSchemaAuditRepository(ISchemaAuditRepository):
     """MySQL 기반 스키마 감사 로그 리포지토리 (Session Factory 패턴)
 
@@ -56,11 +58,16 @@ class MySQLSchemaAuditRepository(ISchemaAuditRepository):
 
                 log_id = str(audit_log.id)
                 logger.info(
-                    f"Schema audit log recorded: {log_id} - {action} {target} by {actor} ({status})"
+                    "Schema audit log recorded: %s - %s %s by %s (%s)",
+                    log_id,
+                    action,
+                    target,
+                    actor,
+                    status,
                 )
 
                 return log_id
 
             except Exception as e:
-                logger.error(f"Failed to record schema audit log: {e}")
+                logger.error("Failed to record schema audit log: %s", e)
                 raise
@@ -7,10 +7,11 @@ from collections.abc import Callable
 from contextlib import AbstractAsyncContextManager
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.dialects.mysql import insert as mysql_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
 
 from app.schema.domain.models import (
     ChangeId,
@@ -33,9 +34,11 @@ from app.schema.infrastructure.models import (
     SchemaApplyResultModel,
     SchemaArtifactModel,
     SchemaMetadataModel,
+    SchemaPlanItemModel,
     SchemaPlanModel,
     SchemaUploadResultModel,
 )
+from app.shared.tracing import traced_class
 
 logger = logging.getLogger(__name__)
 
@@ -112,6 +115,7 @@ def _build_tags_payload(
     return payload
 
 
+@traced_class("repository")
 class MySQLSchemaMetadataRepository(ISchemaMetadataRepository):
     """MySQL 기반 스키마 메타데이터 리포지토리 (Session Factory 패턴)
 
@@ -215,19 +219,42 @@ class MySQLSchemaMetadataRepository(ISchemaMetadataRepository):
                     )
 
                 await session.execute(upsert_stmt)
+
+                # subject별 사유 조회용 정규화 항목 (재계획 시 교체)
+                await session.execute(
+                    delete(SchemaPlanItemModel).where(
+                        SchemaPlanItemModel.change_id == plan.change_id
+                    )
+                )
+                plan_items = {
+                    item.subject: {
+                        "change_id": plan.change_id,
+                        "subject": item.subject,
+                        "action": item.action.value,
+                        "reason": item.reason or None,
+                        "target_version": item.target_version,
+                    }
+                    for item in plan.items
+                }
+                if plan_items:
+                    await session.execute(insert(SchemaPlanItemModel), list(plan_items.values()))
                 await session.flush()
 
-                logger.info(f"Schema plan saved: {plan.change_id}")
+                logger.info("Schema plan saved: %s", plan.change_id)
 
             except Exception as e:
-                logger.error(f"Failed to save schema plan {plan.change_id}: {e}")
+                logger.error("Failed to save schema plan %s: %s", plan.change_id, e)
                 raise
 
     async def get_plan(self, change_id: ChangeId) -> DomainSchemaPlan | None:
         """계획 조회"""
         async with self.session_factory() as session:
             try:
-                stmt = select(SchemaPlanModel).where(SchemaPlanModel.change_id == change_id)
+                stmt = (
+                    select(SchemaPlanModel)
+                    .options(undefer(SchemaPlanModel.plan_data))
+                    .where(SchemaPlanModel.change_id == change_id)
+                )
                 result = await session.execute(stmt)
                 plan_model = result.scalar_one_or_none()
 
@@ -297,7 +324,7 @@ class MySQLSchemaMetadataRepository(ISchemaMetadataRepository):
                 )
 
             except Exception as e:
-                logger.error(f"Failed to get schema plan {change_id}: {e}")
+                logger.error("Failed to get schema plan %s: %s", change_id, e)
                 raise
 
     async def save_apply_result(self, result: DomainSchemaApplyResult, applied_by: str) -> None:
@@ -346,10 +373,10 @@ class MySQLSchemaMetadataRepository(ISchemaMetadataRepository):
                 session.add(result_model)
                 await session.flush()
 
-                logger.info(f"Schema apply result saved: {result.change_id}")
+                logger.info("Schema apply result saved: %s", result.change_id)
 
             except Exception as e:
-                logger.error(f"Failed to save schema apply result {result.change_id}: {e}")
+                logger.error("Failed to save schema apply result %s: %s", result.change_id, e)
                 raise
 
     async def record_artifact(self, artifact: DomainSchemaArtifact, change_id: ChangeId) -> None:
@@ -399,10 +426,10 @@ class MySQLSchemaMetadataRepository(ISchemaMetadataRepository):
                 await session.execute(stmt)
                 await session.flush()
 
-                logger.info(f"Schema artifact recorded: {artifact.subject} v{artifact.version}")
+                logger.info("Schema artifact recorded: %s v%s", artifact.subject, artifact.version)
 
             except Exception as e:
-                logger.error(f"Failed to record schema artifact {artifact.subject}: {e}")
+                logger.error("Failed to record schema artifact %s: %s", artifact.subject, e)
                 raise
 
     async def save_upload_result(self, upload: DomainSchemaUploadResult, uploaded_by: str) -> None:
@@ -435,12 +462,16 @@ class MySQLSchemaMetadataRepository(ISchemaMetadataRepository):
                 await session.flush()
 
                 logger.info(
-                    f"Upload result saved: {upload.upload_id} ({len(upload.artifacts)} artifacts)"
+                    "Upload result saved: %s (%d artifacts)",
+                    upload.upload_id,
+                    len(upload.artifacts),
                 )
 
             except Exception as e:
                 logger.error(
-                    f"Failed to save upload result {upload.upload_id if hasattr(upload, 'upload_id') else 'unknown'}: {e}"
+                    "Failed to save upload result %s: %s",
+                    getattr(upload, "upload_id", "unknown"),
+                    e,
                 )
                 # 업로드 결과 저장 실패는 치명적이지 않으므로 예외를 발생시키지 않음
 
@@ -487,7 +518,7 @@ class MySQLSchemaMetadataRepository(ISchemaMetadataRepository):
                 ]
 
             except Exception as e:
-                logger.error(f"Failed to list schema artifacts: {e}")
+                logger.error("Failed to list schema artifacts: %s", e)
                 raise
 
     async def delete_artifact_by_subject(self, subject: str) -> None:
@@ -511,12 +542,14 @@ class MySQLSchemaMetadataRepository(ISchemaMetadataRepository):
                 await session.flush()
 
                 logger.info(
-                    f"Deleted {result_artifact.rowcount} artifact(s) and "
-                    f"{result_metadata.rowcount} metadata for subject: {subject}"
+                    "Deleted %s artifact(s) and %s metadata for subject: %s",
+                    result_artifact.rowcount,
+                    result_metadata.rowcount,
+                    subject,
                 )
 
             except Exception as e:
-                logger.error(f"Failed to delete artifacts for subject {subject}: {e}")
+                logger.error("Failed to delete artifacts for subject %s: %s", subject, e)
                 raise
 
     async def delete_artifacts_newer_than(self, subject: str, version: int) -> None:
@@ -602,11 +635,11 @@ class MySQLSchemaMetadataRepository(ISchemaMetadataRepository):
 
                 await session.flush()
                 logger.info(
-                    f"Schema metadata saved: {subject} (compatibility: {compatibility_str})"
+                    "Schema metadata saved: %s (compatibility: %s)", subject, compatibility_str
                 )
 
             except Exception as e:
-                logger.error(f"Failed to save schema metadata {subject}: {e}")
+                logger.error("Failed to save schema metadata %s: %s", subject, e)
                 raise
 
     async def search_artifacts(
@@ -695,7 +728,7 @@ class MySQLSchemaMetadataRepository(ISchemaMetadataRepository):
                 return domain_artifacts, total_count
 
             except Exception as e:
-                logger.error(f"Failed to search artifacts: {e}")
+                logger.error("Failed to search artifacts: %s", e)
                 return [], 0
 
     async def get_latest_artifact(self, subject: str) -> DomainSchemaArtifact | None:
@@ -741,7 +774,7 @@ class MySQLSchemaMetadataRepository(ISchemaMetadataRepository):
                 )
 
             except Exception as e:
-                logger.error(f"Failed to get latest artifact for {subject}: {e}")
+                logger.error("Failed to get latest artifact for %s: %s", subject, e)
                 return None
 
     async def get_schema_metadata(self, subject: str) -> dict[str, Any] | None:
@@ -771,7 +804,7 @@ class MySQLSchemaMetadataRepository(ISchemaMetadataRepository):
                     else None,
                 }
             except Exception as e:
-                logger.error(f"Failed to get schema metadata for {subject}: {e}")
+                logger.error("Failed to get schema metadata for %s: %s", subject, e)
                 return None
 
     def _to_domain_schema_type(self, type_str: str | None) -> DomainSchemaType | None:
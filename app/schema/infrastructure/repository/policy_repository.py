@@ -16,8 +16,10 @@ from app.schema.domain.models.policy_management import (
 )
 from app.schema.domain.repositories.interfaces import ISchemaPolicyRepository
 from app.schema.infrastructure.models import SchemaPolicyModel
+from app.shared.tracing import traced_class
 
 
+@traced_class("repository")
 class MySQLSchemaPolicyRepository(ISchemaPolicyRepository):
     """MySQL 기반 스키마 정책 리포지토리"""
 
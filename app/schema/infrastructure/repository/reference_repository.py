@@ -0,0 +1,135 @@
+"""Schema Reference Graph Repository"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Iterable
+from contextlib import AbstractAsyncContextManager
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schema.domain.models import SchemaReferenceGraph, SubjectName
+from app.schema.domain.models.value_objects import DomainSchemaReference
+from app.schema.domain.repositories.interfaces import ISchemaReferenceRepository
+from app.schema.infrastructure.catalog_models import SchemaReferenceEdgeModel
+from app.shared.database import run_after_commit
+
+
+class _ReferenceGraphCache:
+    """프로세스 단위 참조 그래프 캐시 (로컬 기록 시 즉시 무효화, 다른 인스턴스 기록은 TTL로 반영)"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._graph: SchemaReferenceGraph | None = None
+        self._loaded_at = 0.0
+        self._generation = 0
+
+    def get(self, ttl_seconds: float) -> SchemaReferenceGraph | None:
+        with self._lock:
+            if self._graph is None or time.monotonic() - self._loaded_at > ttl_seconds:
+                return None
+            return self._graph
+
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def put(self, graph: SchemaReferenceGraph, generation: int) -> None:
+        with self._lock:
+            # 로딩 중에 무효화되었으면 오래된 그래프를 저장하지 않는다
+            if generation == self._generation:
+                self._graph = graph
+                self._loaded_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._graph = None
+            self._generation += 1
+
+
+_graph_cache = _ReferenceGraphCache()
+
+
+def invalidate_reference_graph() -> None:
+    """참조 간선이 바뀐 뒤 호출 (다음 조회 시 DB에서 다시 구성)"""
+    _graph_cache.invalidate()
+
+
+async def replace_reference_edges(
+    session: AsyncSession,
+    subject: SubjectName,
+    version: int,
+    references: Iterable[tuple[str, SubjectName, int]],
+) -> None:
+    """(subject, version)의 참조 간선 교체 - (이름, subject, 버전) 목록, 커밋은 호출자가 수행"""
+    edges = SchemaReferenceEdgeModel.__table__
+    await session.execute(
+        delete(edges).where(edges.c.subject == subject, edges.c.version == version)
+    )
+    rows = [
+        {
+            "subject": subject,
+            "version": version,
+            "ref_name": name,
+            "ref_subject": ref_subject,
+            "ref_version": ref_version,
+        }
+        for name, ref_subject, ref_version in references
+    ]
+    if rows:
+        await session.execute(insert(edges), rows)
+
+
+class MySQLSchemaReferenceRepository(ISchemaReferenceRepository):
+    """``schema_reference_edges`` 기반 참조 그래프 리포지토리"""
+
+    def __init__(
+        self,
+        session_factory: Callable[..., AbstractAsyncContextManager[AsyncSession]],
+        cache_ttl_seconds: float = 30.0,
+    ) -> None:
+        self.session_factory = session_factory
+        self.cache_ttl_seconds = cache_ttl_seconds
+
+    async def load_graph(self) -> SchemaReferenceGraph:
+        graph = _graph_cache.get(self.cache_ttl_seconds)
+        if graph is not None:
+            return graph
+
+        generation = _graph_cache.generation()
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(
+                    SchemaReferenceEdgeModel.subject, SchemaReferenceEdgeModel.ref_subject
+                ).distinct()
+            )
+            graph = SchemaReferenceGraph(result.tuples())
+        _graph_cache.put(graph, generation)
+        return graph
+
+    async def record_references(
+        self,
+        subject: SubjectName,
+        version: int,
+        references: Iterable[DomainSchemaReference],
+    ) -> None:
+        async with self.session_factory() as session:
+            await replace_reference_edges(
+                session,
+                subject,
+                version,
+                [
+                    (reference.name, reference.subject, reference.version)
+                    for reference in references
+                ],
+            )
+            run_after_commit(session, invalidate_reference_graph)
+
+    async def delete_subject(self, subject: SubjectName) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(SchemaReferenceEdgeModel).where(SchemaReferenceEdgeModel.subject == subject)
+            )
+            run_after_commit(session, invalidate_reference_graph)
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+from app.shared.json_response import DomainJSONResponse
+
 from ..domain.models import (
     DomainCompatibilityMode,
     DomainEnvironment,
@@ -17,17 +21,11 @@ from ..domain.models import (
     DomainSubjectStrategy,
 )
 from .schemas import (
-    SchemaArtifact,
     SchemaBatchApplyResponse,
     SchemaBatchDryRunResponse,
     SchemaBatchItem,
     SchemaBatchRequest,
-    SchemaCompatibilityIssue,
-    SchemaCompatibilityReport,
-    SchemaImpactRecord,
-    SchemaPlanItem,
 )
-from .types.enums import CompatibilityMode, Environment
 
 
 class SchemaConverter:
@@ -134,12 +132,85 @@ class SchemaConverter:
             specs=specs,
         )
 
+    @staticmethod
+    def plan_to_payload(plan: DomainSchemaPlan) -> dict[str, Any]:
+        """Domain Plan → ``SchemaBatchDryRunResponse`` 와 같은 모양의 JSON payload
+
+        응답 모델을 거치지 않고 바로 직렬화할 수 있도록 필드 이름/순서를 응답 모델에 맞춘다
+        (``schema_definition`` 은 직렬화 별칭 ``schema``).
+        """
+        return {
+            "env": plan.env.value,
+            "change_id": plan.change_id,
+            "plan": [
+                {
+                    "subject": item.subject,
+                    "action": item.action.value,
+                    "current_version": item.current_version,
+                    "target_version": item.target_version,
+                    "diff": {
+                        "type": item.diff.type,
+                        "changes": item.diff.changes,
+                        "current_version": item.diff.current_version,
+                        "target_compatibility": item.diff.target_compatibility,
+                        "schema_type": item.diff.schema_type,
+                    },
+                    "schema": item.schema,
+                    "current_schema": item.current_schema,
+                    "reason": item.reason,
+                }
+                for item in plan.items
+            ],
+            "violations": [],
+            "compatibility": [
+                {
+                    "subject": report.subject,
+                    "mode": report.mode.value,
+                    "is_compatible": report.is_compatible,
+                    "issues": [
+                        {"path": issue.path, "message": issue.message, "type": issue.issue_type}
+                        for issue in report.issues
+                    ],
+                }
+                for report in plan.compatibility_reports
+            ],
+            "impacts": [
+                {
+                    "subject": impact.subject,
+                    "status": getattr(impact, "status", "success"),
+                    "error_message": getattr(impact, "error_message", None),
+                }
+                for impact in plan.impacts
+            ],
+            "summary": plan.summary(),
+        }
+
+    @staticmethod
+    def apply_result_to_payload(result: DomainSchemaApplyResult) -> dict[str, Any]:
+        """DomainSchemaApplyResult → ``SchemaBatchApplyResponse`` 와 같은 모양의 JSON payload"""
+        return {
+            "env": result.env.value,
+            "change_id": result.change_id,
+            "registered": result.registered,
+            "skipped": result.skipped,
+            "failed": result.failed,
+            "details": result.details,
+            "audit_id": result.audit_id,
+            "artifacts": [
+                {
+                    "subject": artifact.subject,
+                    "version": artifact.version,
+                    "storage_url": artifact.storage_url,
+                    "checksum": artifact.checksum,
+                }
+                for artifact in result.artifacts
+            ],
+            "summary": result.summary(),
+        }
+
     @classmethod
     def convert_plan_to_response(cls, plan: DomainSchemaPlan) -> SchemaBatchDryRunResponse:
-        """Domain Model을 Pydantic 응답으로 변환
-
-        Domain Model → Pydantic Response
-        dataclass와 Pydantic은 호환되므로 필드 매핑만 수행
+        """Domain Model을 Pydantic 응답으로 변환 (검증 포함)
 
         Args:
             plan: Domain Plan Model
@@ -147,70 +218,13 @@ class SchemaConverter:
         Returns:
             Pydantic 응답 DTO
         """
-        # 계획 아이템 변환
-        plan_items: list[SchemaPlanItem] = [
-            SchemaPlanItem(
-                subject=item.subject,
-                action=item.action.value,
-                current_version=item.current_version,
-                target_version=item.target_version,
-                diff={
-                    "type": item.diff.type,
-                    "changes": list(item.diff.changes),
-                    "current_version": item.diff.current_version,
-                    "target_compatibility": item.diff.target_compatibility,
-                    "schema_type": item.diff.schema_type,
-                },
-                schema_definition=item.schema,
-                current_schema=item.current_schema,
-                reason=item.reason,
-            )
-            for item in plan.items
-        ]
-
-        # 호환성 보고서 변환
-        compatibility_reports: list[SchemaCompatibilityReport] = [
-            SchemaCompatibilityReport(
-                subject=report.subject,
-                mode=CompatibilityMode(report.mode.value),
-                is_compatible=report.is_compatible,
-                issues=[
-                    SchemaCompatibilityIssue(
-                        path=issue.path,
-                        message=issue.message,
-                        type=issue.issue_type,
-                    )
-                    for issue in report.issues
-                ],
-            )
-            for report in plan.compatibility_reports
-        ]
-
-        # 영향도 변환
-        impacts: list[SchemaImpactRecord] = [
-            SchemaImpactRecord(
-                subject=impact.subject,
-                status=getattr(impact, "status", "success"),
-                error_message=getattr(impact, "error_message", None),
-            )
-            for impact in plan.impacts
-        ]
-
-        return SchemaBatchDryRunResponse(
-            env=Environment(plan.env.value),
-            change_id=plan.change_id,
-            plan=plan_items,
-            violations=[],
-            compatibility=compatibility_reports,
-            impacts=impacts,
-            summary=plan.summary(),
-        )
+        return SchemaBatchDryRunResponse.model_validate(cls.plan_to_payload(plan))
 
     @classmethod
     def convert_apply_result_to_response(
         cls, result: DomainSchemaApplyResult
     ) -> SchemaBatchApplyResponse:
-        """DomainSchemaApplyResult를 SchemaBatchApplyResponse로 변환
+        """DomainSchemaApplyResult를 SchemaBatchApplyResponse로 변환 (검증 포함)
 
         Args:
             result: 변환할 DomainSchemaApplyResult
@@ -218,28 +232,7 @@ class SchemaConverter:
         Returns:
             변환된 SchemaBatchApplyResponse
         """
-        # 아티팩트 변환
-        artifacts: list[SchemaArtifact] = [
-            SchemaArtifact(
-                subject=artifact.subject,
-                version=artifact.version,
-                storage_url=artifact.storage_url,
-                checksum=artifact.checksum,
-            )
-            for artifact in result.artifacts
-        ]
-
-        return SchemaBatchApplyResponse(
-            env=Environment(result.env.value),
-            change_id=result.change_id,
-            registered=list(result.registered),
-            skipped=list(result.skipped),
-            failed=list(result.failed),  # tuple of dicts → list (no copy needed, immutable)
-            details=list(result.details),
-            audit_id=result.audit_id,
-            artifacts=artifacts,
-            summary=result.summary(),
-        )
+        return SchemaBatchApplyResponse.model_validate(cls.apply_result_to_payload(result))
 
 
 # 전역 변환기 인스턴스 (싱글톤 패턴으로 메모리 절약)
@@ -261,3 +254,13 @@ def safe_convert_apply_result_to_response(
 ) -> SchemaBatchApplyResponse:
     """DomainSchemaApplyResult → SchemaBatchApplyResponse 고성능 변환"""
     return _converter.convert_apply_result_to_response(result)
+
+
+def render_plan_response(plan: DomainSchemaPlan) -> DomainJSONResponse:
+    """DomainSchemaPlan → JSON 응답 (응답 모델 검증 없이 바로 직렬화)"""
+    return DomainJSONResponse(_converter.plan_to_payload(plan))
+
+
+def render_apply_result_response(result: DomainSchemaApplyResult) -> DomainJSONResponse:
+    """DomainSchemaApplyResult → JSON 응답 (응답 모델 검증 없이 바로 직렬화)"""
+    return DomainJSONResponse(_converter.apply_result_to_payload(result))
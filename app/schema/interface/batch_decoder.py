@@ -0,0 +1,283 @@
+"""스키마 배치 요청 고속 디코더
+
+대용량 배치(수백 항목, 큰 스키마 본문)는 ``SchemaBatchRequest`` 모델 검증과
+``SchemaConverter`` 복사에만 수 초가 걸린다. 고속 경로는 JSON에서 꺼낸 dict를
+``SchemaBatchRequest``/``SchemaBatchItem`` 과 같은 규칙으로 직접 검사하고 바로
+도메인 모델(``DomainSchemaBatch``)을 만든다.
+
+고속 경로는 "통과 또는 위임"만 한다. 규칙에 맞지 않거나 드문 입력(source, 비ASCII 공백 등)은
+pydantic 모델로 다시 검증하므로, 오류 응답은 항상 기존 경로와 같다.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import ValidationError
+
+from app.schema.governance_support.approval import ApprovalOverride
+from app.shared.interface.type_factory import (
+    COMMON_CHANGE_ID_PATTERN,
+    COMMON_DOCUMENT_URL_PATTERN,
+    COMMON_TAG_NAME_PATTERN,
+    COMMON_TEAM_NAME_PATTERN,
+)
+
+from ..domain.models import (
+    DomainCompatibilityMode,
+    DomainEnvironment,
+    DomainSchemaBatch,
+    DomainSchemaMetadata,
+    DomainSchemaReference,
+    DomainSchemaSpec,
+    DomainSchemaType,
+    DomainSubjectStrategy,
+)
+from .adapters import safe_convert_request_to_batch
+from .schemas import SchemaBatchRequest
+from .types.enums import CompatibilityMode, Environment, SchemaType, SubjectStrategy
+from .types.type_hints import SCHEMA_REFERENCE_NAME_PATTERN, SCHEMA_SUBJECT_PATTERN
+
+_SUBJECT = re.compile(SCHEMA_SUBJECT_PATTERN)
+_REFERENCE_NAME = re.compile(SCHEMA_REFERENCE_NAME_PATTERN)
+_CHANGE_ID = re.compile(COMMON_CHANGE_ID_PATTERN)
+_DOCUMENT_URL = re.compile(COMMON_DOCUMENT_URL_PATTERN)
+_TAG_NAME = re.compile(COMMON_TAG_NAME_PATTERN)
+_TEAM_NAME = re.compile(COMMON_TEAM_NAME_PATTERN)
+
+# pydantic과 확실히 같게 잘라내는 공백 (str.strip()이 그 외 문자까지 잘랐으면 pydantic 경로로 위임)
+_ASCII_WHITESPACE = " \t\n\r\x0b\x0c"
+
+# SchemaBatchRequest / SchemaBatchItem 제약 (request.py, common.py, type_hints.py 와 동일)
+_MAX_ITEMS = 200
+_MAX_REFERENCES = 16
+_MAX_TAGS = 15
+
+_REQUEST_KEYS = frozenset(
+    {
+        "kind",
+        "env",
+        "change_id",
+        "subjectStrategy",
+        "subject_strategy",
+        "items",
+        "specs",
+        "approvalOverride",
+        "approval_override",
+    }
+)
+_ITEM_KEYS = frozenset(
+    {
+        "subject",
+        "type",
+        "schema_type",
+        "compatibility",
+        "schema",
+        "schema_text",
+        "source",
+        "schema_hash",
+        "references",
+        "metadata",
+        "reason",
+        "business_purpose",
+        "businessPurpose",
+        "dry_run_only",
+    }
+)
+_REFERENCE_KEYS = frozenset({"name", "subject", "version"})
+_METADATA_KEYS = frozenset({"owner", "doc", "tags", "description"})
+
+_ENVIRONMENTS = {member.value: DomainEnvironment(member.value) for member in Environment}
+_SCHEMA_TYPES = {member.value: DomainSchemaType(member.value) for member in SchemaType}
+_COMPATIBILITY_MODES = {
+    member.value: DomainCompatibilityMode(member.value) for member in CompatibilityMode
+}
+_SUBJECT_STRATEGIES = {
+    member.value: DomainSubjectStrategy(member.value) for member in SubjectStrategy
+}
+
+_MISSING: Any = object()
+
+
+class _DeferredError(Exception):
+    """고속 경로가 판단하지 않는 입력 - pydantic 경로로 넘긴다"""
+
+
+@dataclass(frozen=True, slots=True)
+class DecodedSchemaBatch:
+    """검증을 마친 배치 요청 (도메인 배치 + 승인 override)"""
+
+    batch: DomainSchemaBatch
+    approval_override: ApprovalOverride | None = None
+
+
+def decode_schema_batch(payload: Any, *, fast_path: bool = True) -> DecodedSchemaBatch:
+    """JSON에서 꺼낸 배치 요청 → 도메인 배치
+
+    Raises:
+        ValidationError: ``SchemaBatchRequest`` 검증 실패 (pydantic 경로의 오류 그대로)
+    """
+    if fast_path:
+        try:
+            return _decode_fast(payload)
+        except (_DeferredError, ValueError):
+            # ValueError: 도메인 모델 불변식 위반 - 기존 경로와 같은 방식으로 처리되게 넘긴다
+            pass
+    request = SchemaBatchRequest.model_validate(payload)
+    return DecodedSchemaBatch(
+        batch=safe_convert_request_to_batch(request),
+        approval_override=request.approval_override,
+    )
+
+
+def _pick(data: dict[str, Any], *aliases: str) -> Any:
+    """AliasChoices 대응 - 별칭이 둘 이상 오면 pydantic은 나머지를 extra로 거부한다"""
+    found = [data[alias] for alias in aliases if alias in data]
+    if len(found) > 1:
+        raise _DeferredError
+    return found[0] if found else _MISSING
+
+
+def _string(
+    value: Any, max_length: int, pattern: re.Pattern[str] | None = None, *, min_length: int = 1
+) -> str:
+    if type(value) is not str:
+        raise _DeferredError
+    stripped = value.strip()
+    if (
+        stripped is not value and stripped != value.strip(_ASCII_WHITESPACE)
+    ) or not min_length <= len(stripped) <= max_length:
+        raise _DeferredError
+    if pattern is not None and pattern.match(stripped) is None:
+        raise _DeferredError
+    return stripped
+
+
+def _optional_string(
+    value: Any, max_length: int, pattern: re.Pattern[str] | None = None, *, min_length: int = 1
+) -> str | None:
+    if value is _MISSING or value is None:
+        return None
+    return _string(value, max_length, pattern, min_length=min_length)
+
+
+def _member[T](members: dict[str, T], value: Any) -> T:
+    if type(value) is not str or value not in members:
+        raise _DeferredError
+    return members[value]
+
+
+def _check_keys(data: Any, allowed: frozenset[str]) -> dict[str, Any]:
+    if type(data) is not dict or not allowed.issuperset(data):
+        raise _DeferredError
+    return data
+
+
+def _decode_reference(data: Any) -> DomainSchemaReference:
+    data = _check_keys(data, _REFERENCE_KEYS)
+    version = data.get("version")
+    if type(version) is not int or version < 1:
+        raise _DeferredError
+    return DomainSchemaReference(
+        name=_string(data.get("name"), 255, _REFERENCE_NAME),
+        subject=_string(data.get("subject"), 255, _SUBJECT),
+        version=version,
+    )
+
+
+def _decode_metadata(data: Any) -> DomainSchemaMetadata | None:
+    if data is _MISSING or data is None:
+        return None
+    data = _check_keys(data, _METADATA_KEYS)
+    tags = data.get("tags", [])
+    if type(tags) is not list or len(tags) > _MAX_TAGS:
+        raise _DeferredError
+    return DomainSchemaMetadata(
+        owner=_string(data.get("owner"), 50, _TEAM_NAME),
+        doc=_optional_string(data.get("doc", _MISSING), 500, _DOCUMENT_URL),
+        tags=tuple(_string(tag, 50, _TAG_NAME) for tag in tags),
+        description=_optional_string(data.get("description", _MISSING), 300),
+    )
+
+
+def _decode_item(data: Any, env: DomainEnvironment) -> DomainSchemaSpec:
+    data = _check_keys(data, _ITEM_KEYS)
+    # SchemaSource는 드물게 쓰이므로 모델 검증에 맡긴다
+    if data.get("source") is not None:
+        raise _DeferredError
+
+    subject = _string(data.get("subject"), 255, _SUBJECT)
+    if subject.split(".")[0] != env.value:
+        raise _DeferredError
+    schema_text = _optional_string(_pick(data, "schema", "schema_text"), 262144)
+    if not schema_text:
+        raise _DeferredError
+
+    references = data.get("references", [])
+    if type(references) is not list or len(references) > _MAX_REFERENCES:
+        raise _DeferredError
+    decoded_references = tuple(_decode_reference(reference) for reference in references)
+    if len({reference.name for reference in decoded_references}) != len(decoded_references):
+        raise _DeferredError
+
+    dry_run_only = data.get("dry_run_only", False)
+    if type(dry_run_only) is not bool:
+        raise _DeferredError
+
+    return DomainSchemaSpec(
+        subject=subject,
+        schema_type=_member(_SCHEMA_TYPES, _pick(data, "schema_type", "type")),
+        # 배치에서는 호환성 모드를 반드시 명시해야 한다 (null 불가)
+        compatibility=_member(_COMPATIBILITY_MODES, data.get("compatibility")),
+        schema=schema_text,
+        schema_hash=_optional_string(data.get("schema_hash", _MISSING), 128, min_length=8),
+        references=decoded_references,
+        metadata=_decode_metadata(data.get("metadata", _MISSING)),
+        reason=_optional_string(_pick(data, "reason", "business_purpose", "businessPurpose"), 500),
+        dry_run_only=dry_run_only,
+    )
+
+
+def _decode_fast(payload: Any) -> DecodedSchemaBatch:
+    data = _check_keys(payload, _REQUEST_KEYS)
+
+    kind = data.get("kind", "SchemaBatch")
+    if type(kind) is not str or _string(kind, len(kind)) != "SchemaBatch":
+        raise _DeferredError
+    env = _member(_ENVIRONMENTS, data.get("env"))
+    change_id = _string(data.get("change_id"), 100, _CHANGE_ID)
+    strategy = _pick(data, "subjectStrategy", "subject_strategy")
+    subject_strategy = (
+        DomainSubjectStrategy.SUBJECT_NAME
+        if strategy is _MISSING
+        else _member(_SUBJECT_STRATEGIES, strategy)
+    )
+
+    items = _pick(data, "items", "specs")
+    if type(items) is not list or not 1 <= len(items) <= _MAX_ITEMS:
+        raise _DeferredError
+    specs = tuple(_decode_item(item, env) for item in items)
+    if max(Counter(spec.subject for spec in specs).values()) > 1:
+        raise _DeferredError
+
+    approval_override = _pick(data, "approvalOverride", "approval_override")
+    if approval_override is _MISSING or approval_override is None:
+        approval_override = None
+    else:
+        try:
+            approval_override = ApprovalOverride.model_validate(approval_override)
+        except ValidationError as exc:
+            raise _DeferredError from exc
+
+    return DecodedSchemaBatch(
+        batch=DomainSchemaBatch(
+            change_id=change_id,
+            env=env,
+            subject_strategy=subject_strategy,
+            specs=specs,
+        ),
+        approval_override=approval_override,
+    )
@@ -1,13 +1,15 @@
+from typing import Any
+
+import orjson
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
 from app.container import AppContainer
 from app.schema.governance_support.actor import actor_context_dict, actor_context_from_headers
-from app.schema.interface.adapters import (
-    safe_convert_apply_result_to_response,
-    safe_convert_plan_to_response,
-    safe_convert_request_to_batch,
-)
+from app.schema.interface.adapters import render_apply_result_response, render_plan_response
+from app.schema.interface.batch_decoder import DecodedSchemaBatch, decode_schema_batch
 from app.schema.interface.schemas import (
     SchemaBatchApplyResponse,
     SchemaBatchDryRunResponse,
@@ -15,6 +17,7 @@ from app.schema.interface.schemas import (
 )
 from app.schema.interface.types.type_hints import ChangeId
 from app.shared.error_handlers import handle_api_errors, handle_server_errors
+from app.shared.settings import settings
 
 router = APIRouter(prefix="/v1/schemas", tags=["schema-batch"])
 
@@ -24,26 +27,85 @@ def _resolve_actor(request: Request) -> tuple[str, dict[str, str] | None]:
     return actor_context.actor, actor_context_dict(actor_context)
 
 
+def _inline_refs(schema: dict[str, Any]) -> dict[str, Any]:
+    """``$defs`` 참조를 펼친 JSON Schema (openapi_extra는 components에 등록되지 않으므로)"""
+    definitions = schema.pop("$defs", {})
+
+    def resolve(node: Any) -> Any:
+        if isinstance(node, dict):
+            if "$ref" in node:
+                return resolve(definitions[node["$ref"].rsplit("/", 1)[-1]])
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(value) for value in node]
+        return node
+
+    return resolve(schema)
+
+
+# 본문을 직접 디코딩하므로 요청 스키마 문서는 SchemaBatchRequest에서 가져온다
+_BATCH_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": _inline_refs(SchemaBatchRequest.model_json_schema())}
+        },
+    }
+}
+
+
+async def _decode_batch_body(http_request: Request) -> DecodedSchemaBatch:
+    """요청 본문 → 도메인 배치 (검증 오류는 FastAPI 본문 검증과 같은 422 응답)"""
+    body = await http_request.body()
+    if not body:
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+        )
+    try:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError as exc:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ("body", exc.pos),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": exc.msg},
+                }
+            ],
+            body=body,
+        ) from exc
+
+    try:
+        return decode_schema_batch(payload, fast_path=settings.schema_batch_fast_decode)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)],
+            body=payload,
+        ) from exc
+
+
 @router.post(
     "/batch/dry-run",
     response_model=SchemaBatchDryRunResponse,
     status_code=status.HTTP_200_OK,
     summary="스키마 배치 Dry-Run (멀티 레지스트리)",
     description="스키마 배치 변경 계획을 생성하고 정책 및 호환성을 검증합니다.",
+    openapi_extra=_BATCH_REQUEST_BODY,
 )
 @inject
 @handle_api_errors(validation_error_message="Validation error")
 async def schema_batch_dry_run(
-    request: SchemaBatchRequest,
     http_request: Request,
+    request: DecodedSchemaBatch = Depends(_decode_batch_body),
     registry_id: str = Query(..., description="Schema Registry ID"),
     dry_run_use_case=Depends(Provide[AppContainer.schema_container.dry_run_use_case]),
-) -> SchemaBatchDryRunResponse:
+) -> Response:
     """스키마 배치 Dry-Run 실행"""
-    batch = safe_convert_request_to_batch(request)
     actor, actor_context = _resolve_actor(http_request)
-    plan = await dry_run_use_case.execute(registry_id, batch, actor, actor_context)
-    return safe_convert_plan_to_response(plan)
+    plan = await dry_run_use_case.execute(registry_id, request.batch, actor, actor_context)
+    return render_plan_response(plan)
 
 
 @router.post(
@@ -52,28 +114,28 @@ async def schema_batch_dry_run(
     status_code=status.HTTP_200_OK,
     summary="스키마 배치 Apply (멀티 레지스트리/스토리지)",
     description="Dry-run 결과를 승인하여 스키마를 실제로 등록하고 아티팩트를 저장합니다.",
+    openapi_extra=_BATCH_REQUEST_BODY,
 )
 @inject
 @handle_api_errors(validation_error_message="Policy violation")
 async def schema_batch_apply(
-    request: SchemaBatchRequest,
     http_request: Request,
+    request: DecodedSchemaBatch = Depends(_decode_batch_body),
     registry_id: str = Query(..., description="Schema Registry ID"),
     storage_id: str | None = Query(None, description="Object Storage ID (optional)"),
     apply_use_case=Depends(Provide[AppContainer.schema_container.apply_use_case]),
-) -> SchemaBatchApplyResponse:
+) -> Response:
     """스키마 배치 Apply 실행"""
-    batch = safe_convert_request_to_batch(request)
     actor, actor_context = _resolve_actor(http_request)
     result = await apply_use_case.execute(
         registry_id,
         storage_id,
-        batch,
+        request.batch,
         actor,
         request.approval_override,
         actor_context,
     )
-    return safe_convert_apply_result_to_response(result)
+    return render_apply_result_response(result)
 
 
 @router.get(
@@ -88,7 +150,7 @@ async def schema_batch_apply(
 async def get_schema_plan(
     change_id: ChangeId,
     plan_use_case=Depends(Provide[AppContainer.schema_container.plan_use_case]),
-) -> SchemaBatchDryRunResponse:
+) -> Response:
     """스키마 배치 계획 조회"""
     result = await plan_use_case.execute(change_id)
     if result is None:
@@ -96,4 +158,4 @@ async def get_schema_plan(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Plan '{change_id}' not found",
         )
-    return safe_convert_plan_to_response(result)
+    return render_plan_response(result)
@@ -1,34 +1,60 @@
+from collections.abc import AsyncIterator
 from dataclasses import asdict
+from datetime import UTC, datetime
+from typing import Literal
 
+import orjson
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from app.container import AppContainer
-from app.schema.governance_support.actor import actor_context_dict, actor_context_from_headers
-from app.schema.interface.adapters import (
-    safe_convert_apply_result_to_response,
-    safe_convert_plan_to_response,
+from app.schema.application.use_cases.governance.catalog_export import CatalogExportStream
+from app.schema.application.use_cases.governance.registry_compare import (
+    RegistryComparisonStream,
 )
+from app.schema.domain.models import SchemaVersionExport
+from app.schema.governance_support.actor import actor_context_dict, actor_context_from_headers
+from app.schema.interface.adapters import render_apply_result_response, render_plan_response
 from app.schema.interface.schemas import (
+    CatalogRescoreRequest,
+    CatalogRescoreResponse,
     DashboardResponse,
+    FieldIndexRebuildResponse,
     RollbackExecuteRequest,
     RollbackRequest,
     SchemaBatchApplyResponse,
     SchemaBatchDryRunResponse,
     SchemaChangeRequest,
+    SchemaDriftReportResponse,
     SchemaDriftResponse,
+    SchemaDriftScanResponse,
+    SchemaFieldSearchResponse,
     SchemaHistoryResponse,
+    SchemaReferenceImpactResponse,
     SchemaSettingsResponse,
     SchemaSettingsUpdateRequest,
     SchemaVersionCompareResponse,
     SchemaVersionDetailResponse,
     SchemaVersionListResponse,
 )
+from app.shared.archive import ARCHIVE_MEDIA_TYPES, ArchiveFormat, ArchiveMember, stream_archive
 from app.shared.error_handlers import (
     endpoint_error_handler,
     handle_api_errors,
     handle_server_errors,
 )
+from app.shared.http_cache import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    conditional_json_response,
+    conditional_response,
+    etag_matches,
+    latest_cache_control,
+    not_modified,
+    strong_etag,
+)
+from app.shared.json_response import DomainJSONResponse
 
 router = APIRouter(prefix="/v1/schemas", tags=["schema-governance"])
 
@@ -38,6 +64,24 @@ def _resolve_actor(request: Request) -> tuple[str, dict[str, str] | None]:
     return actor_context.actor, actor_context_dict(actor_context)
 
 
+def _version_etag(registry_id: str, subject: str, version: int, *revision: object) -> str:
+    """정확한 버전 응답의 ETag (버전 본문은 불변이므로 식별자로 충분)"""
+    return strong_etag(registry_id, subject, version, *revision)
+
+
+def _export_response(
+    request: Request, exported: SchemaVersionExport, *, etag: str, cache_control: str
+) -> Response:
+    return conditional_response(
+        request,
+        content=exported.schema_str,
+        media_type=exported.media_type,
+        etag=etag,
+        cache_control=cache_control,
+        headers={"Content-Disposition": f'attachment; filename="{exported.filename}"'},
+    )
+
+
 @router.get(
     "/governance/dashboard",
     response_model=DashboardResponse,
@@ -68,9 +112,142 @@ async def get_schema_history(
     subject: str,
     registry_id: str = Query(..., description="Schema Registry ID"),
     history_use_case=Depends(Provide[AppContainer.schema_container.schema_history_use_case]),
-) -> SchemaHistoryResponse:
+) -> Response:
     history = await history_use_case.execute(registry_id=registry_id, subject=subject)
-    return SchemaHistoryResponse.model_validate(asdict(history))
+    return DomainJSONResponse(history)
+
+
+@router.post(
+    "/drift/scan",
+    response_model=SchemaDriftScanResponse,
+    status_code=status.HTTP_200_OK,
+    summary="전체 subject drift 스캔",
+    description="Registry 전체 subject의 drift를 스캔하고 drift가 있는 subject만 저장합니다.",
+)
+@inject
+@endpoint_error_handler(default_message="Failed to scan schema drift")
+async def scan_schema_drift(
+    registry_id: str = Query(..., description="Schema Registry ID"),
+    scan_use_case=Depends(Provide[AppContainer.schema_container.scan_schema_drift_use_case]),
+) -> Response:
+    summary = await scan_use_case.execute(registry_id=registry_id)
+    return DomainJSONResponse(summary)
+
+
+@router.post(
+    "/catalog/rescore",
+    response_model=CatalogRescoreResponse,
+    status_code=status.HTTP_200_OK,
+    summary="catalog PII/리스크 점수 재계산",
+    description="저장된 최신 스키마로 전체 subject의 PII/리스크 점수를 다시 계산합니다.",
+)
+@inject
+@endpoint_error_handler(default_message="Failed to rescore schema catalog")
+async def rescore_schema_catalog(
+    request: CatalogRescoreRequest | None = None,
+    rescore_use_case=Depends(Provide[AppContainer.schema_container.rescore_catalog_use_case]),
+) -> Response:
+    summary = await rescore_use_case.execute(keywords=request.keywords if request else None)
+    return DomainJSONResponse(summary)
+
+
+@router.get(
+    "/fields/search",
+    response_model=SchemaFieldSearchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="필드 이름/타입으로 스키마 검색",
+    description=(
+        "필드 색인에서 이름(camelCase/snake_case 무관) 또는 타입으로 필드를 찾습니다. "
+        "기본은 subject별 최신 버전만 검색합니다."
+    ),
+)
+@inject
+@endpoint_error_handler(default_message="Failed to search schema fields")
+async def search_schema_fields(
+    name: str | None = Query(None, description="필드 이름 (정확히 일치)"),
+    name_prefix: str | None = Query(None, description="필드 이름 접두사"),
+    field_type: str | None = Query(None, alias="type", description="필드 타입 (예: bytes)"),
+    logical_type: str | None = Query(None, description="Avro logicalType (예: decimal)"),
+    nullable: bool | None = Query(None, description="null 허용 여부"),
+    subject_prefix: str | None = Query(None, description="Subject 접두사"),
+    latest_only: bool = Query(True, description="subject별 최신 버전만 검색"),
+    page: int = Query(1, ge=1),
+    limit: int = Query(50, ge=1, le=500),
+    search_use_case=Depends(Provide[AppContainer.schema_container.search_schema_fields_use_case]),
+) -> Response:
+    result = await search_use_case.execute(
+        name=name,
+        name_prefix=name_prefix,
+        field_type=field_type,
+        logical_type=logical_type,
+        nullable=nullable,
+        subject_prefix=subject_prefix,
+        latest_only=latest_only,
+        page=page,
+        limit=limit,
+    )
+    return DomainJSONResponse(result)
+
+
+@router.post(
+    "/fields/reindex",
+    response_model=FieldIndexRebuildResponse,
+    status_code=status.HTTP_200_OK,
+    summary="필드 색인 재구축",
+    description="저장된 스키마 버전 전체로 필드 색인을 다시 만듭니다.",
+)
+@inject
+@endpoint_error_handler(default_message="Failed to rebuild schema field index")
+async def rebuild_schema_field_index(
+    rebuild_use_case=Depends(Provide[AppContainer.schema_container.rebuild_field_index_use_case]),
+) -> Response:
+    summary = await rebuild_use_case.execute()
+    return DomainJSONResponse(summary)
+
+
+@router.get(
+    "/subjects/{subject}/references",
+    response_model=SchemaReferenceImpactResponse,
+    status_code=status.HTTP_200_OK,
+    summary="스키마 참조 영향도 조회",
+    description=(
+        "참조 그래프에서 subject를 (전이적으로) 참조하는 subject(dependents) 또는 "
+        "subject가 참조하는 subject(dependencies)를 hop 수와 함께 조회합니다."
+    ),
+)
+@inject
+@endpoint_error_handler(default_message="Failed to load schema reference impact")
+async def get_schema_reference_impact(
+    subject: str,
+    direction: Literal["dependents", "dependencies"] = Query(
+        "dependents", description="dependents 또는 dependencies"
+    ),
+    max_depth: int | None = Query(None, ge=1, le=100, description="탐색 최대 hop 수"),
+    reference_use_case=Depends(
+        Provide[AppContainer.schema_container.schema_reference_impact_use_case]
+    ),
+) -> Response:
+    impact = await reference_use_case.execute(subject, direction=direction, max_depth=max_depth)
+    return DomainJSONResponse(impact)
+
+
+@router.get(
+    "/drift",
+    response_model=SchemaDriftReportResponse,
+    status_code=status.HTTP_200_OK,
+    summary="저장된 drift 스캔 결과 조회",
+    description="마지막 전체 스캔에서 drift가 발견된 subject를 페이지 단위로 조회합니다.",
+)
+@inject
+@endpoint_error_handler(default_message="Failed to load schema drift report")
+async def get_schema_drift_report(
+    registry_id: str = Query(..., description="Schema Registry ID"),
+    page: int = Query(1, ge=1),
+    limit: int = Query(50, ge=1, le=500),
+    report_use_case=Depends(Provide[AppContainer.schema_container.schema_drift_report_use_case]),
+) -> Response:
+    report = await report_use_case.execute(registry_id, page=page, limit=limit)
+    return DomainJSONResponse(report)
 
 
 @router.get(
@@ -89,9 +266,9 @@ async def get_schema_drift(
     subject: str,
     registry_id: str = Query(..., description="Schema Registry ID"),
     drift_use_case=Depends(Provide[AppContainer.schema_container.schema_drift_use_case]),
-) -> SchemaDriftResponse:
+) -> Response:
     drift = await drift_use_case.execute(registry_id=registry_id, subject=subject)
-    return SchemaDriftResponse.model_validate(asdict(drift))
+    return DomainJSONResponse(drift)
 
 
 @router.patch(
@@ -142,11 +319,16 @@ async def update_schema_settings(
 )
 async def list_schema_versions(
     subject: str,
+    request: Request,
     registry_id: str = Query(..., description="Schema Registry ID"),
     versions_use_case=Depends(Provide[AppContainer.schema_container.schema_versions_use_case]),
-) -> SchemaVersionListResponse:
+) -> Response:
     versions = await versions_use_case.execute(registry_id=registry_id, subject=subject)
-    return SchemaVersionListResponse.model_validate(asdict(versions))
+    return conditional_json_response(
+        request,
+        versions,
+        cache_control=latest_cache_control(),
+    )
 
 
 @router.get(
@@ -163,20 +345,25 @@ async def list_schema_versions(
 )
 async def compare_schema_versions(
     subject: str,
+    request: Request,
     from_version: int = Query(..., ge=1, description="기준 버전"),
     to_version: int = Query(..., ge=1, description="비교 대상 버전"),
     registry_id: str = Query(..., description="Schema Registry ID"),
     compare_use_case=Depends(
         Provide[AppContainer.schema_container.compare_schema_versions_use_case]
     ),
-) -> SchemaVersionCompareResponse:
+) -> Response:
     comparison = await compare_use_case.execute(
         registry_id=registry_id,
         subject=subject,
         from_version=from_version,
         to_version=to_version,
     )
-    return SchemaVersionCompareResponse.model_validate(asdict(comparison))
+    return conditional_json_response(
+        request,
+        comparison,
+        cache_control=REVALIDATE_CACHE_CONTROL,
+    )
 
 
 @router.get(
@@ -194,15 +381,28 @@ async def compare_schema_versions(
 async def get_schema_version(
     subject: str,
     version: int,
+    request: Request,
     registry_id: str = Query(..., description="Schema Registry ID"),
     version_use_case=Depends(Provide[AppContainer.schema_container.schema_version_use_case]),
-) -> SchemaVersionDetailResponse:
+) -> Response:
+    # 재검증 요청은 DB 리비전만으로 판정해 SR 조회 없이 304를 돌려준다
+    etag = _version_etag(
+        registry_id, subject, version, *await version_use_case.revision(subject, version)
+    )
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag, REVALIDATE_CACHE_CONTROL)
+
     detail = await version_use_case.execute(
         registry_id=registry_id,
         subject=subject,
         version=version,
     )
-    return SchemaVersionDetailResponse.model_validate(asdict(detail))
+    return conditional_json_response(
+        request,
+        detail,
+        cache_control=REVALIDATE_CACHE_CONTROL,
+        etag=etag,
+    )
 
 
 @router.get(
@@ -219,19 +419,20 @@ async def get_schema_version(
 async def export_schema_version(
     subject: str,
     version: int,
+    request: Request,
     registry_id: str = Query(..., description="Schema Registry ID"),
     export_use_case=Depends(Provide[AppContainer.schema_container.export_schema_version_use_case]),
 ) -> Response:
+    etag = _version_etag(registry_id, subject, version)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag, IMMUTABLE_CACHE_CONTROL)
+
     exported = await export_use_case.execute(
         registry_id=registry_id,
         subject=subject,
         version=version,
     )
-    return Response(
-        content=exported.schema_str,
-        media_type=exported.media_type,
-        headers={"Content-Disposition": f'attachment; filename="{exported.filename}"'},
-    )
+    return _export_response(request, exported, etag=etag, cache_control=IMMUTABLE_CACHE_CONTROL)
 
 
 @router.get(
@@ -247,6 +448,7 @@ async def export_schema_version(
 )
 async def export_latest_schema(
     subject: str,
+    request: Request,
     registry_id: str = Query(..., description="Schema Registry ID"),
     export_use_case=Depends(Provide[AppContainer.schema_container.export_schema_version_use_case]),
 ) -> Response:
@@ -254,13 +456,112 @@ async def export_latest_schema(
         registry_id=registry_id,
         subject=subject,
     )
-    return Response(
-        content=exported.schema_str,
-        media_type=exported.media_type,
-        headers={"Content-Disposition": f'attachment; filename="{exported.filename}"'},
+    # 최신 포인터는 버전을 알아야 하므로 조회 후 판정 (ETag는 해당 버전 export와 동일)
+    return _export_response(
+        request,
+        exported,
+        etag=_version_etag(registry_id, exported.subject, exported.version),
+        cache_control=latest_cache_control(),
     )
 
 
+def _archive_path_segment(name: str) -> str:
+    segment = name.replace("/", "_").replace("\\", "_")
+    return "_" if segment in {"", ".", ".."} else segment
+
+
+async def _archive_members(stream: CatalogExportStream) -> AsyncIterator[ArchiveMember]:
+    async for exported in stream.entries:
+        yield ArchiveMember(
+            path=f"{_archive_path_segment(exported.subject)}/"
+            f"{_archive_path_segment(exported.filename)}",
+            data=exported.schema_str.encode(),
+        )
+    # 스트림 소비가 끝난 뒤 확정되는 건수/실패 목록은 마지막 항목으로 기록
+    yield ArchiveMember(
+        path="manifest.json",
+        data=orjson.dumps(stream.manifest(), option=orjson.OPT_INDENT_2),
+    )
+
+
+@router.get(
+    "/export",
+    status_code=status.HTTP_200_OK,
+    summary="스키마 카탈로그 일괄 export",
+    description=(
+        "전체(또는 필터링된) Subject의 최신 스키마 또는 전체 버전 이력을 zip/tar.gz로 "
+        "스트리밍합니다. 카탈로그가 해당 Registry로 최근에 동기화되었으면 DB에서, 아니면 "
+        "Schema Registry에서 제한된 동시성으로 조회합니다."
+    ),
+)
+@inject
+@endpoint_error_handler(default_message="Failed to export schema catalog")
+async def export_schema_catalog(
+    registry_id: str = Query(..., description="Schema Registry ID"),
+    archive_format: ArchiveFormat = Query("zip", alias="format", description="zip | tar.gz"),
+    include_history: bool = Query(False, description="true면 전체 버전, false면 최신 버전만"),
+    subjects: list[str] | None = Query(None, alias="subject", description="포함할 Subject"),
+    subject_prefix: str | None = Query(None, alias="prefix", description="Subject prefix 필터"),
+    source: Literal["auto", "catalog", "registry"] = Query(
+        "auto",
+        description="auto면 카탈로그 최신 여부로 결정, catalog는 최신이 아니면 422",
+    ),
+    catalog_export_use_case=Depends(
+        Provide[AppContainer.schema_container.export_schema_catalog_use_case]
+    ),
+) -> StreamingResponse:
+    stream = await catalog_export_use_case.execute(
+        registry_id,
+        include_history=include_history,
+        subjects=subjects,
+        subject_prefix=subject_prefix,
+        source=source,
+    )
+    timestamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%SZ")
+    filename = f"schemas-{_archive_path_segment(registry_id)}-{timestamp}.{archive_format}"
+    return StreamingResponse(
+        stream_archive(_archive_members(stream), archive_format),
+        media_type=ARCHIVE_MEDIA_TYPES[archive_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "X-Export-Source": stream.source,
+        },
+    )
+
+
+async def _ndjson_comparison(stream: RegistryComparisonStream) -> AsyncIterator[bytes]:
+    yield orjson.dumps({"kind": "summary", **asdict(stream.summary)}) + b"\n"
+    async for diff in stream.entries:
+        yield orjson.dumps({"kind": "subject", **asdict(diff)}) + b"\n"
+
+
+@router.get(
+    "/registries/compare",
+    status_code=status.HTTP_200_OK,
+    summary="Registry 간 스키마 비교",
+    description=(
+        "두 Schema Registry의 subject 최신 스키마를 canonical hash로 비교하고, 차이가 있는 "
+        "subject만 구조 diff와 함께 NDJSON으로 스트리밍합니다. 첫 줄은 요약입니다."
+    ),
+)
+@inject
+@endpoint_error_handler(default_message="Failed to compare schema registries")
+async def compare_registries(
+    source_registry_id: str = Query(..., alias="source", description="비교 기준 Registry ID"),
+    target_registry_id: str = Query(..., alias="target", description="비교 대상 Registry ID"),
+    subject_prefix: str | None = Query(None, alias="prefix", description="Subject prefix 필터"),
+    refresh: bool = Query(False, description="true면 head 인덱스를 즉시 다시 수집"),
+    compare_use_case=Depends(Provide[AppContainer.schema_container.compare_registries_use_case]),
+) -> StreamingResponse:
+    stream = await compare_use_case.execute(
+        source_registry_id,
+        target_registry_id,
+        subject_prefix=subject_prefix,
+        refresh=refresh,
+    )
+    return StreamingResponse(_ndjson_comparison(stream), media_type="application/x-ndjson")
+
+
 @router.post(
     "/plan-change",
     response_model=SchemaBatchDryRunResponse,
@@ -275,7 +576,7 @@ async def plan_schema_change(
     http_request: Request,
     registry_id: str = Query(..., description="Schema Registry ID"),
     plan_change_use_case=Depends(Provide[AppContainer.schema_container.plan_change_use_case]),
-) -> SchemaBatchDryRunResponse:
+) -> Response:
     actor, actor_context = _resolve_actor(http_request)
     plan = await plan_change_use_case.execute(
         registry_id=registry_id,
@@ -288,7 +589,7 @@ async def plan_schema_change(
         reason=request.reason,
         actor_context=actor_context,
     )
-    return safe_convert_plan_to_response(plan)
+    return render_plan_response(plan)
 
 
 @router.post(
@@ -305,7 +606,7 @@ async def plan_schema_rollback(
     http_request: Request,
     registry_id: str = Query(..., description="Schema Registry ID"),
     rollback_use_case=Depends(Provide[AppContainer.schema_container.rollback_use_case]),
-) -> SchemaBatchDryRunResponse:
+) -> Response:
     actor, actor_context = _resolve_actor(http_request)
     plan = await rollback_use_case.execute(
         registry_id=registry_id,
@@ -315,7 +616,7 @@ async def plan_schema_rollback(
         reason=request.reason,
         actor_context=actor_context,
     )
-    return safe_convert_plan_to_response(plan)
+    return render_plan_response(plan)
 
 
 @router.post(
@@ -334,7 +635,7 @@ async def execute_schema_rollback(
     execute_rollback_use_case=Depends(
         Provide[AppContainer.schema_container.execute_rollback_use_case]
     ),
-) -> SchemaBatchApplyResponse:
+) -> Response:
     actor, actor_context = _resolve_actor(http_request)
     result = await execute_rollback_use_case.execute(
         registry_id=registry_id,
@@ -345,4 +646,4 @@ async def execute_schema_rollback(
         reason=request.reason,
         actor_context=actor_context,
     )
-    return safe_convert_apply_result_to_response(result)
+    return render_apply_result_response(result)
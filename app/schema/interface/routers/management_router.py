@@ -153,6 +153,7 @@ async def analyze_schema_delete_impact(
         total_versions=impact.total_versions,
         warnings=list(impact.warnings),
         safe_to_delete=impact.safe_to_delete,
+        dependents=list(impact.dependents),
     )
 
 
@@ -193,6 +194,7 @@ async def delete_schema(
         total_versions=impact.total_versions,
         warnings=list(impact.warnings),
         safe_to_delete=impact.safe_to_delete,
+        dependents=list(impact.dependents),
     )
 
 
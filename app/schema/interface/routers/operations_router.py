@@ -1,19 +1,22 @@
-from dataclasses import asdict
 from datetime import datetime
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Body, Depends, Query, status
+from fastapi import APIRouter, Body, Depends, Query, Response, status
 
 from app.container import AppContainer
 from app.schema.interface.schemas import (
     ApprovalDecisionRequest,
     ApprovalRequestResponse,
     AuditActivityResponse,
+    AuditArchiveResponse,
 )
 from app.shared.error_handlers import endpoint_error_handler
+from app.shared.json_response import DomainJSONResponse
 
 router = APIRouter(prefix="/v1", tags=["schema-governance-operations"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 @router.get(
     "/approval-requests",
@@ -29,14 +32,14 @@ async def list_approval_requests(
     requested_by: str | None = Query(None),
     limit: int = Query(100, ge=1, le=500),
     use_case=Depends(Provide[AppContainer.schema_container.list_approval_requests_use_case]),
-) -> list[ApprovalRequestResponse]:
+) -> Response:
     requests = await use_case.execute(
         status=status_filter,
         resource_type=resource_type,
         requested_by=requested_by,
         limit=limit,
     )
-    return [ApprovalRequestResponse.model_validate(asdict(item)) for item in requests]
+    return DomainJSONResponse(requests)
 
 
 @router.get(
@@ -53,9 +56,9 @@ async def list_approval_requests(
 async def get_approval_request(
     request_id: str,
     use_case=Depends(Provide[AppContainer.schema_container.get_approval_request_use_case]),
-) -> ApprovalRequestResponse:
+) -> Response:
     request = await use_case.execute(request_id)
-    return ApprovalRequestResponse.model_validate(asdict(request))
+    return DomainJSONResponse(request)
 
 
 @router.post(
@@ -73,13 +76,13 @@ async def approve_approval_request(
     request_id: str,
     payload: ApprovalDecisionRequest = Body(...),
     use_case=Depends(Provide[AppContainer.schema_container.approve_approval_request_use_case]),
-) -> ApprovalRequestResponse:
+) -> Response:
     request = await use_case.execute(
         request_id=request_id,
         approver=payload.approver,
         decision_reason=payload.decision_reason,
     )
-    return ApprovalRequestResponse.model_validate(asdict(request))
+    return DomainJSONResponse(request)
 
 
 @router.post(
@@ -97,13 +100,13 @@ async def reject_approval_request(
     request_id: str,
     payload: ApprovalDecisionRequest = Body(...),
     use_case=Depends(Provide[AppContainer.schema_container.reject_approval_request_use_case]),
-) -> ApprovalRequestResponse:
+) -> Response:
     request = await use_case.execute(
         request_id=request_id,
         approver=payload.approver,
         decision_reason=payload.decision_reason,
     )
-    return ApprovalRequestResponse.model_validate(asdict(request))
+    return DomainJSONResponse(request)
 
 
 @router.get(
@@ -117,9 +120,9 @@ async def reject_approval_request(
 async def get_recent_audit_activities(
     limit: int = Query(20, ge=1, le=100),
     use_case=Depends(Provide[AppContainer.schema_container.recent_activities_use_case]),
-) -> list[AuditActivityResponse]:
+) -> Response:
     activities = await use_case.execute(limit=limit)
-    return [AuditActivityResponse.model_validate(asdict(item)) for item in activities]
+    return DomainJSONResponse(activities)
 
 
 @router.get(
@@ -136,15 +139,36 @@ async def get_audit_history(
     activity_type: str | None = Query(None),
     action: str | None = Query(None),
     actor: str | None = Query(None),
+    target: str | None = Query(None),
     limit: int = Query(100, ge=1, le=500),
+    cursor: str | None = Query(None, description="이전 응답의 X-Next-Cursor 값"),
     use_case=Depends(Provide[AppContainer.schema_container.activity_history_use_case]),
-) -> list[AuditActivityResponse]:
-    activities = await use_case.execute(
+) -> Response:
+    page = await use_case.execute(
         from_date=from_date,
         to_date=to_date,
         activity_type=activity_type,
         action=action,
         actor=actor,
         limit=limit,
+        target=target,
+        cursor=cursor,
     )
-    return [AuditActivityResponse.model_validate(asdict(item)) for item in activities]
+    headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else None
+    return DomainJSONResponse(page.items, headers=headers)
+
+
+@router.post(
+    "/audit/archive",
+    response_model=AuditArchiveResponse,
+    status_code=status.HTTP_200_OK,
+    summary="보관 주기가 지난 감사 로그 아카이브",
+)
+@inject
+@endpoint_error_handler(default_message="Failed to archive audit logs")
+async def archive_audit_logs(
+    retention_days: int | None = Query(None, ge=1),
+    use_case=Depends(Provide[AppContainer.schema_container.archive_audit_logs_use_case]),
+) -> Response:
+    result = await use_case.execute(retention_days=retention_days)
+    return DomainJSONResponse(result)
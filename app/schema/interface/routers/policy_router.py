@@ -1,14 +1,26 @@
 """Schema Policy Management API Router"""
 
+from collections.abc import AsyncIterator
+from dataclasses import asdict
 from typing import Any
 
+import orjson
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from app.container import AppContainer
 from app.schema.application.use_cases import SchemaPolicyUseCase
-from app.schema.domain.models.policy_management import SchemaPolicyStatus, SchemaPolicyType
+from app.schema.application.use_cases.policy.simulation import (
+    PolicySimulationResult,
+    SimulateSchemaPolicyUseCase,
+)
+from app.schema.domain.models.policy_management import (
+    DomainSchemaPolicy,
+    SchemaPolicyStatus,
+    SchemaPolicyType,
+)
 
 router = APIRouter(prefix="/v1/schemas/policies", tags=["Schema Policies"])
 
@@ -28,6 +40,21 @@ class PolicyStatusUpdateRequest(BaseModel):
     status: SchemaPolicyStatus
 
 
+class PolicySimulationRequest(BaseModel):
+    policy_type: SchemaPolicyType
+    content: dict[str, Any]
+    target_environment: str = "total"
+
+
+async def _ndjson_simulation(result: PolicySimulationResult) -> AsyncIterator[bytes]:
+    yield orjson.dumps({"kind": "summary", **asdict(result.summary)}) + b"\n"
+    for hit in result.rule_hits:
+        yield (
+            orjson.dumps({"kind": "rule", "subject_count": hit.subject_count, **asdict(hit)})
+            + b"\n"
+        )
+
+
 @router.post("")
 @inject
 async def create_policy(
@@ -56,6 +83,46 @@ async def list_policies(
     return await use_case.list_policies(env=env, policy_type=policy_type)
 
 
+@router.post("/simulate")
+@inject
+async def simulate_draft_policy(
+    request: PolicySimulationRequest,
+    use_case: SimulateSchemaPolicyUseCase = Depends(
+        Provide[AppContainer.schema_container.policy_simulation_use_case]
+    ),
+):
+    """저장하지 않은 정책 초안을 catalog 전체 최신 스키마에 적용해 보기 (NDJSON: 요약 + 룰별 적중)"""
+    draft = DomainSchemaPolicy(
+        policy_id="draft",
+        policy_type=request.policy_type,
+        name="draft",
+        description="",
+        version=0,
+        status=SchemaPolicyStatus.DRAFT,
+        content=request.content,
+        target_environment=request.target_environment,
+    )
+    result = await use_case.execute(draft)
+    return StreamingResponse(_ndjson_simulation(result), media_type="application/x-ndjson")
+
+
+@router.post("/{policy_id}/simulate")
+@inject
+async def simulate_policy(
+    policy_id: str,
+    version: int | None = None,
+    use_case: SimulateSchemaPolicyUseCase = Depends(
+        Provide[AppContainer.schema_container.policy_simulation_use_case]
+    ),
+):
+    """저장된 정책 버전을 활성화 전에 catalog 전체에 시뮬레이션 (NDJSON: 요약 + 룰별 적중)"""
+    try:
+        result = await use_case.execute_stored(policy_id, version)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail="Policy not found") from exc
+    return StreamingResponse(_ndjson_simulation(result), media_type="application/x-ndjson")
+
+
 @router.get("/{policy_id}")
 @inject
 async def get_policy_detail(
@@ -12,11 +12,20 @@ from .common import (
     SchemaSource,
 )
 from .governance import (
+    CatalogRescoreRequest,
+    CatalogRescoreResponse,
     DashboardResponse,
+    FieldIndexRebuildResponse,
     GovernanceScore,
+    SchemaDriftReportResponse,
     SchemaDriftResponse,
+    SchemaDriftScanResponse,
+    SchemaFieldHitResponse,
+    SchemaFieldSearchResponse,
     SchemaHistoryItem,
     SchemaHistoryResponse,
+    SchemaReferenceImpactResponse,
+    SchemaReferenceNodeResponse,
     SchemaSettingsResponse,
     SchemaVersionCompareResponse,
     SchemaVersionDetailResponse,
@@ -25,7 +34,12 @@ from .governance import (
     SchemaVersionSummaryResponse,
     SubjectStat,
 )
-from .operations import ApprovalDecisionRequest, ApprovalRequestResponse, AuditActivityResponse
+from .operations import (
+    ApprovalDecisionRequest,
+    ApprovalRequestResponse,
+    AuditActivityResponse,
+    AuditArchiveResponse,
+)
 from .request import (
     RollbackExecuteRequest,
     RollbackRequest,
@@ -48,7 +62,11 @@ __all__ = [
     "ApprovalDecisionRequest",
     "ApprovalRequestResponse",
     "AuditActivityResponse",
+    "AuditArchiveResponse",
+    "CatalogRescoreRequest",
+    "CatalogRescoreResponse",
     "DashboardResponse",
+    "FieldIndexRebuildResponse",
     "GovernanceScore",
     "PolicyViolation",
     "RollbackExecuteRequest",
@@ -62,13 +80,19 @@ __all__ = [
     "SchemaCompatibilityIssue",
     "SchemaCompatibilityReport",
     "SchemaDeleteImpactResponse",
+    "SchemaDriftReportResponse",
     "SchemaDriftResponse",
+    "SchemaDriftScanResponse",
+    "SchemaFieldHitResponse",
+    "SchemaFieldSearchResponse",
     "SchemaHistoryItem",
     "SchemaHistoryResponse",
     "SchemaImpactRecord",
     "SchemaMetadata",
     "SchemaPlanItem",
     "SchemaReference",
+    "SchemaReferenceImpactResponse",
+    "SchemaReferenceNodeResponse",
     "SchemaSearchResponse",
     "SchemaSettingsResponse",
     "SchemaSettingsUpdateRequest",
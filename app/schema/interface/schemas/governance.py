@@ -1,5 +1,8 @@
 """Schema Governance DTOs."""
 
+from datetime import datetime
+from typing import Literal
+
 from pydantic import BaseModel, ConfigDict, Field
 
 from app.schema.interface.types.enums import CompatibilityMode
@@ -176,7 +179,9 @@ class SchemaDriftResponse(BaseModel):
     model_config = ConfigDict(frozen=True)
 
     subject: str = Field(..., description="Subject 이름")
-    registry_latest_version: int = Field(..., description="라이브 registry 최신 버전")
+    registry_latest_version: int | None = Field(
+        None, description="라이브 registry 최신 버전 (SR에서 사라진 subject는 null)"
+    )
     registry_canonical_hash: str | None = Field(None, description="라이브 최신 canonical hash")
     catalog_latest_version: int | None = Field(None, description="로컬 catalog 최신 버전")
     catalog_canonical_hash: str | None = Field(None, description="로컬 catalog canonical hash")
@@ -186,6 +191,98 @@ class SchemaDriftResponse(BaseModel):
     has_drift: bool = Field(..., description="drift 존재 여부")
 
 
+class SchemaDriftScanResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    registry_id: str = Field(..., description="Schema Registry ID")
+    scanned_at: datetime = Field(..., description="스캔 시각")
+    subjects_scanned: int = Field(..., description="스캔한 subject 수")
+    drifted_subjects: int = Field(..., description="drift가 있는 subject 수")
+    failed_subjects: list[str] = Field(default_factory=list, description="SR 조회 실패 subject")
+    duration_ms: float = Field(..., description="스캔 소요 시간(ms)")
+
+
+class CatalogRescoreRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    keywords: list[str] | None = Field(
+        None, description="PII 키워드 (생략 시 설정값 또는 기본 사전)"
+    )
+
+
+class CatalogRescoreResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    subjects_scored: int = Field(..., description="점수를 갱신한 subject 수")
+    fields_scanned: int = Field(..., description="검사한 필드 수 (중첩 필드 포함)")
+    pii_subjects: int = Field(..., description="PII 후보 필드가 있는 subject 수")
+    keywords: list[str] = Field(default_factory=list, description="적용한 PII 키워드")
+    duration_ms: float = Field(..., description="재계산 소요 시간(ms)")
+
+
+class SchemaFieldHitResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    subject: str = Field(..., description="Subject 이름")
+    version: int = Field(..., description="버전 번호")
+    field_path: str = Field(..., description="점(.)으로 이은 필드 경로")
+    field_name: str = Field(..., description="필드 이름")
+    field_type: str = Field(..., description="필드 타입")
+    logical_type: str | None = Field(None, description="Avro logicalType")
+    nullable: bool = Field(..., description="null 허용 여부")
+    has_default: bool = Field(..., description="default 존재 여부")
+    has_doc: bool = Field(..., description="doc 존재 여부")
+    depth: int = Field(..., description="중첩 깊이 (최상위 0)")
+
+
+class SchemaFieldSearchResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    items: list[SchemaFieldHitResponse] = Field(default_factory=list, description="검색된 필드")
+    total: int = Field(..., description="검색된 필드 총 개수")
+    page: int = Field(..., description="페이지 번호")
+    limit: int = Field(..., description="페이지 크기")
+
+
+class FieldIndexRebuildResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    versions_indexed: int = Field(..., description="색인한 스키마 버전 수")
+    fields_indexed: int = Field(..., description="색인한 필드 수")
+    duration_ms: float = Field(..., description="재구축 소요 시간(ms)")
+
+
+class SchemaReferenceNodeResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    subject: str = Field(..., description="Subject 이름")
+    depth: int = Field(..., description="기준 subject로부터의 참조 hop 수 (직접 참조 1)")
+
+
+class SchemaReferenceImpactResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    subject: str = Field(..., description="기준 Subject 이름")
+    direction: Literal["dependents", "dependencies"] = Field(
+        ...,
+        description="dependents: 기준을 참조하는 subject, dependencies: 기준이 참조하는 subject",
+    )
+    max_depth: int | None = Field(None, description="탐색 최대 hop 수 (없으면 전체)")
+    nodes: list[SchemaReferenceNodeResponse] = Field(
+        default_factory=list, description="참조 관계 subject (hop 수, 이름 순)"
+    )
+
+
+class SchemaDriftReportResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    summary: SchemaDriftScanResponse | None = Field(None, description="마지막 스캔 요약")
+    items: list[SchemaDriftResponse] = Field(default_factory=list, description="drift subject")
+    total: int = Field(..., description="drift subject 총 개수")
+    page: int = Field(..., description="페이지 번호")
+    limit: int = Field(..., description="페이지 크기")
+
+
 class SchemaSettingsResponse(BaseModel):
     model_config = ConfigDict(frozen=True)
 
@@ -45,3 +45,13 @@ class AuditActivityResponse(BaseModel):
     team: str | None = None
     timestamp: datetime
     metadata: dict[str, Any] | None = None
+
+
+class AuditArchiveResponse(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    cutoff: datetime
+    rows_archived: int
+    files: list[str]
+    partitions_dropped: list[str]
+    partitions_created: list[str]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from collections.abc import Iterable
 from typing import Annotated
 
@@ -180,8 +181,8 @@ class SchemaBatchRequest(BaseModel):
     @classmethod
     def validate_unique_subjects(cls, items: list[SchemaBatchItem]) -> list[SchemaBatchItem]:
         """subject 중복 검증"""
-        subjects = [item.subject for item in items]
-        duplicates = {subject for subject in subjects if subjects.count(subject) > 1}
+        counts = Counter(item.subject for item in items)
+        duplicates = {subject for subject, count in counts.items() if count > 1}
         if duplicates:
             raise ValueError(f"duplicate subjects detected: {sorted(duplicates)}")
         return items
@@ -83,6 +83,7 @@ class SchemaDeleteImpactResponse(BaseModel):
                     "프로덕션 환경의 스키마입니다. 삭제 전 반드시 영향도를 확인하세요.",
                 ],
                 "safe_to_delete": False,
+                "dependents": [],
             }
         },
     )
@@ -91,7 +92,10 @@ class SchemaDeleteImpactResponse(BaseModel):
     current_version: int | None = Field(description="현재 버전 번호")
     total_versions: int = Field(description="총 버전 개수")
     warnings: list[str] = Field(default_factory=list, description="경고 메시지 목록")
-    safe_to_delete: bool = Field(description="버전/환경 기준 안전 삭제 가능 여부")
+    safe_to_delete: bool = Field(description="버전/환경/참조 기준 안전 삭제 가능 여부")
+    dependents: list[SubjectName] = Field(
+        default_factory=list, description="이 스키마를 (전이적으로) 참조하는 subject 목록"
+    )
 
 
 class SchemaBatchApplyResponse(BaseModel):
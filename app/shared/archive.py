@@ -0,0 +1,97 @@
+"""스트리밍 아카이브(zip / tar.gz) 생성
+
+항목을 하나씩 받아 압축 결과를 바로 청크로 내보낸다. 전체 아카이브를 메모리나 임시
+파일에 만들지 않으므로 항목 수와 무관하게 버퍼 크기는 항목 1개 수준으로 유지된다.
+(zip은 central directory용 항목 헤더만 끝까지 보관)
+"""
+
+from __future__ import annotations
+
+import io
+import tarfile
+import time
+import zipfile
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+from typing import Literal
+
+type ArchiveFormat = Literal["zip", "tar.gz"]
+
+ARCHIVE_MEDIA_TYPES: dict[str, str] = {
+    "zip": "application/zip",
+    "tar.gz": "application/gzip",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ArchiveMember:
+    """아카이브에 기록할 파일 1개"""
+
+    path: str
+    data: bytes
+
+
+class _ChunkSink(io.RawIOBase):
+    """쓰기 결과를 모아두었다가 drain() 시 비우는 non-seekable 출력 스트림"""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:  # type: ignore[override]
+        chunk = bytes(data)
+        if chunk:
+            self._chunks.append(chunk)
+        return len(chunk)
+
+    def drain(self) -> bytes:
+        chunk = b"".join(self._chunks)
+        self._chunks.clear()
+        return chunk
+
+
+async def stream_zip(members: AsyncIterable[ArchiveMember]) -> AsyncIterator[bytes]:
+    sink = _ChunkSink()
+    # non-seekable 출력이므로 zipfile이 data descriptor 방식으로 기록
+    archive = zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED)
+    date_time = time.localtime()[:6]
+    try:
+        async for member in members:
+            info = zipfile.ZipInfo(member.path, date_time=date_time)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, member.data)
+            if chunk := sink.drain():
+                yield chunk
+    finally:
+        archive.close()
+    if chunk := sink.drain():
+        yield chunk
+
+
+async def stream_tar_gz(members: AsyncIterable[ArchiveMember]) -> AsyncIterator[bytes]:
+    sink = _ChunkSink()
+    archive = tarfile.open(fileobj=sink, mode="w|gz")  # noqa: SIM115 - 스트림 모드
+    mtime = time.time()
+    try:
+        async for member in members:
+            info = tarfile.TarInfo(member.path)
+            info.size = len(member.data)
+            info.mtime = mtime
+            archive.addfile(info, io.BytesIO(member.data))
+            if chunk := sink.drain():
+                yield chunk
+    finally:
+        archive.close()
+    if chunk := sink.drain():
+        yield chunk
+
+
+def stream_archive(
+    members: AsyncIterable[ArchiveMember], archive_format: ArchiveFormat
+) -> AsyncIterator[bytes]:
+    if archive_format == "zip":
+        return stream_zip(members)
+    return stream_tar_gz(members)
@@ -0,0 +1,77 @@
+"""압축 JSON 컬럼 타입
+
+대용량 JSON payload(plan_data, result_data, snapshot)를 임계값 이상일 때만 zlib으로
+압축해 binary 컬럼에 저장한다. 임계값 미만은 평문 JSON 그대로 저장되므로 작은 행은
+DB 도구로 바로 읽을 수 있다.
+
+저장 포맷:
+- 평문: JSON 바이트 그대로 (첫 바이트는 절대 NUL이 아님)
+- 압축: ``b"\\x00" + codec(1 byte) + 압축 데이터``
+
+읽을 때는 기존 JSON 컬럼에서 변환된 평문(str/bytes)과 이미 파싱된 값도 그대로 허용한다.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Any
+
+import orjson
+from sqlalchemy import LargeBinary
+from sqlalchemy.dialects import mysql
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+from .settings import settings
+
+_COMPRESSED_MARKER = b"\x00"
+_CODEC_ZLIB = b"z"
+
+
+def encode_json(value: Any, *, threshold: int | None = None, level: int | None = None) -> bytes:
+    """JSON 직렬화 후 임계값 이상이면 압축"""
+    payload = orjson.dumps(value)
+    limit = settings.json_compression_threshold_bytes if threshold is None else threshold
+    if len(payload) < limit:
+        return payload
+    compressed = zlib.compress(payload, settings.json_compression_level if level is None else level)
+    if len(compressed) + 2 >= len(payload):
+        return payload
+    return _COMPRESSED_MARKER + _CODEC_ZLIB + compressed
+
+
+def decode_json(raw: Any) -> Any:
+    """평문/압축 payload를 모두 해석"""
+    if raw is None or isinstance(raw, dict | list):
+        return raw
+    data = raw.encode() if isinstance(raw, str) else bytes(raw)
+    if data[:1] == _COMPRESSED_MARKER:
+        codec = data[1:2]
+        if codec != _CODEC_ZLIB:
+            raise ValueError(f"Unsupported JSON compression codec: {codec!r}")
+        data = zlib.decompress(data[2:])
+    return orjson.loads(data)
+
+
+def is_compressed(raw: bytes | None) -> bool:
+    return raw is not None and raw[:1] == _COMPRESSED_MARKER
+
+
+class CompressedJSON(TypeDecorator[Any]):
+    """임계값 이상 payload를 투명하게 압축하는 JSON 타입 (MySQL: LONGBLOB)"""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect: Dialect) -> TypeEngine[Any]:
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(mysql.LONGBLOB())
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> bytes | None:
+        if value is None:
+            return None
+        return encode_json(value)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> Any:
+        return decode_json(value)
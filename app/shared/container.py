@@ -4,12 +4,13 @@ from __future__ import annotations
 
 from dependency_injector import containers, providers
 
+from .cpu_executor import cpu_executor_resource
 from .database import DatabaseManager
 from .settings import settings
 
 
 class InfrastructureContainer(containers.DeclarativeContainer):
-    """현재는 데이터베이스 매니저만 제공하는 공통 인프라 컨테이너."""
+    """데이터베이스 매니저와 CPU 작업 실행기를 제공하는 공통 인프라 컨테이너."""
 
     infra_container = providers.Object(settings)
 
@@ -18,3 +19,5 @@ class InfrastructureContainer(containers.DeclarativeContainer):
         database_url=infra_container.provided.database.url,
         echo=infra_container.provided.database.echo,
     )
+
+    cpu_executor = providers.Resource(cpu_executor_resource)
@@ -0,0 +1,134 @@
+"""CPU 바운드 작업 실행기
+
+스키마 파싱/정규화/diff/lint 같은 CPU 작업을 이벤트 루프 밖에서 실행한다.
+payload가 작으면 스레드 풀(직렬화 비용 없음), ``cpu_process_threshold_bytes`` 이상이면
+프로세스 풀(GIL 회피)로 보낸다. 프로세스 풀로 보내는 함수와 인자는 pickle 가능해야 하므로
+모듈 수준 함수만 사용한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Literal
+
+from .metrics import observe_cpu_task, track_cpu_queue_depth
+from .settings import settings
+
+PoolKind = Literal["thread", "process"]
+
+
+def _timed_call[R](func: Callable[..., R], args: tuple[Any, ...]) -> tuple[float, R]:
+    """워커에서 실제 실행이 시작된 시각(wall clock)과 결과를 함께 반환"""
+    started_at = time.time()
+    return started_at, func(*args)
+
+
+class CpuTaskExecutor:
+    """payload 크기에 따라 스레드/프로세스 풀을 고르는 CPU 작업 실행기
+
+    풀은 첫 사용 시점에 만들어진다. 프로세스 풀은 이벤트 루프/DB 드라이버 스레드가 떠 있는
+    프로세스를 fork하지 않도록 spawn 컨텍스트를 사용한다.
+    """
+
+    def __init__(
+        self,
+        *,
+        process_threshold_bytes: int,
+        thread_workers: int,
+        process_workers: int | None = None,
+    ) -> None:
+        self.process_threshold_bytes = process_threshold_bytes
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers or os.cpu_count() or 1
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def choose_pool(self, size_hint: int) -> PoolKind:
+        return "process" if size_hint >= self.process_threshold_bytes else "thread"
+
+    def _pool(self, kind: PoolKind) -> Executor:
+        with self._lock:
+            if kind == "process":
+                if self._process_pool is None:
+                    self._process_pool = ProcessPoolExecutor(
+                        max_workers=self.process_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                return self._process_pool
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self.thread_workers, thread_name_prefix="cpu-task"
+                )
+            return self._thread_pool
+
+    async def run[R](
+        self,
+        func: Callable[..., R],
+        *args: Any,
+        size_hint: int = 0,
+        pool: PoolKind | None = None,
+    ) -> R:
+        """CPU 작업을 풀에서 실행
+
+        Args:
+            func: 실행할 함수 (프로세스 풀로 갈 수 있으면 모듈 수준 함수여야 함)
+            size_hint: 입력 payload 크기(bytes), 풀 선택 기준
+            pool: 풀 강제 지정 (지정 시 size_hint 무시)
+        """
+        kind = pool or self.choose_pool(size_hint)
+        submitted_at = time.time()
+        with track_cpu_queue_depth(kind):
+            started_at, result = await asyncio.get_running_loop().run_in_executor(
+                self._pool(kind), _timed_call, func, args
+            )
+        observe_cpu_task(
+            kind,
+            wait_seconds=max(started_at - submitted_at, 0.0),
+            run_seconds=max(time.time() - started_at, 0.0),
+        )
+        return result
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for pool in (self._thread_pool, self._process_pool):
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+            self._thread_pool = None
+            self._process_pool = None
+
+
+_default_executor: CpuTaskExecutor | None = None
+
+
+def get_cpu_executor() -> CpuTaskExecutor:
+    """애플리케이션 공용 CPU 작업 실행기"""
+    global _default_executor
+    if _default_executor is None:
+        _default_executor = CpuTaskExecutor(
+            process_threshold_bytes=settings.cpu_process_threshold_bytes,
+            thread_workers=settings.cpu_thread_workers,
+            process_workers=settings.cpu_process_workers,
+        )
+    return _default_executor
+
+
+def shutdown_cpu_executor() -> None:
+    global _default_executor
+    if _default_executor is not None:
+        _default_executor.shutdown()
+        _default_executor = None
+
+
+def cpu_executor_resource() -> Iterator[CpuTaskExecutor]:
+    """DI Resource: 공용 실행기를 제공하고 종료(shutdown_resources) 시 풀을 정리"""
+    try:
+        yield get_cpu_executor()
+    finally:
+        shutdown_cpu_executor()
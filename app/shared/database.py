@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from typing import Any
 
-from sqlalchemy import MetaData
+from sqlalchemy import MetaData, event
 from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -17,6 +20,9 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import DeclarativeBase
 
+from .metrics import instrument_engine
+from .tracing import trace_engine
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,6 +40,68 @@ class Base(DeclarativeBase):
     )
 
 
+@dataclass(slots=True)
+class _UnitOfWork:
+    manager: DatabaseManager
+    session: AsyncSession
+    owner: asyncio.Task[Any] | None
+    read_only: bool
+
+
+# ``DatabaseManager.unit_of_work`` 와 같은 모양의 팩토리 (유스케이스 주입용)
+UnitOfWorkFactory = Callable[..., AbstractAsyncContextManager[Any]]
+# ``DatabaseManager.get_db_session`` 과 같은 모양의 세션 팩토리 (유스케이스 주입용)
+SessionFactory = Callable[[], AbstractAsyncContextManager[AsyncSession]]
+
+
+@asynccontextmanager
+async def no_unit_of_work(*, read_only: bool = False) -> AsyncGenerator[None, None]:
+    """unit of work 미주입 시 기본값 - repository 호출마다 각자 세션/커밋"""
+    yield
+
+
+# 현재 task에서 진행 중인 unit of work (repository 세션이 여기에 합류한다)
+_current_unit_of_work: ContextVar[_UnitOfWork | None] = ContextVar(
+    "database_unit_of_work", default=None
+)
+
+
+def run_after_commit(session: AsyncSession, callback: Callable[[], None]) -> None:
+    """세션의 바깥 트랜잭션이 커밋된 뒤 콜백 실행 (롤백되면 실행하지 않음)
+
+    unit of work에 합류한 세션이면 범위 끝의 커밋 시점에 실행되므로, 캐시 무효화 등이
+    커밋 전에 일어나 다른 요청이 이전 상태를 다시 캐시하는 일을 막는다.
+    """
+    sync_session = session.sync_session
+    done = False
+
+    def after_commit(_session: Any) -> None:
+        nonlocal done
+        # SAVEPOINT 해제에도 after_commit이 발생하므로 바깥 트랜잭션 커밋까지 기다린다
+        if done or sync_session.in_nested_transaction():
+            return
+        done = True
+        callback()
+
+    event.listen(sync_session, "after_commit", after_commit)
+
+
+def _emit_sqlite_begin(sync_engine: Any) -> None:
+    """pysqlite 드라이버의 암묵적 트랜잭션 처리를 끄고 BEGIN을 직접 보낸다
+
+    드라이버는 DML 직전에만 BEGIN을 보내므로, unit of work의 첫 호출이 SAVEPOINT로 시작하면
+    SAVEPOINT가 트랜잭션을 열고 RELEASE가 곧바로 커밋해 버린다 (SQLAlchemy 문서의 권장 설정).
+    """
+
+    @event.listens_for(sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection: Any, _: Any) -> None:
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(sync_engine, "begin")
+    def _begin(connection: Any) -> None:
+        connection.exec_driver_sql("BEGIN")
+
+
 class DatabaseManager:
     """데이터베이스 연결 관리자"""
 
@@ -58,6 +126,7 @@ class DatabaseManager:
         if backend == "sqlite":
             # SQLite는 기본 풀 설정만 사용 (파일 기반 로컬 DB)
             self._engine = create_async_engine(self.database_url, **engine_kwargs)
+            _emit_sqlite_begin(self._engine.sync_engine)
         else:
             # MySQL/PostgreSQL 등 네트워크 DB는 풀/타임아웃 최적화
             engine_kwargs.update(
@@ -80,6 +149,10 @@ class DatabaseManager:
 
             self._engine = create_async_engine(self.database_url, **engine_kwargs)
 
+        # 풀 checkout 대기 / 구문 실행 시간 메트릭 및 트레이싱 수집
+        instrument_engine(self._engine.sync_engine)
+        trace_engine(self._engine.sync_engine)
+
         self._session_factory = async_sessionmaker(
             bind=self._engine,
             class_=AsyncSession,
@@ -130,9 +203,82 @@ class DatabaseManager:
             await conn.run_sync(Base.metadata.drop_all)
             logger.info("Database tables dropped")
 
+    @asynccontextmanager
+    async def unit_of_work(self, *, read_only: bool = False) -> AsyncGenerator[AsyncSession, None]:
+        """요청/유스케이스 단위 작업 범위 - 세션 하나, 커밋 한 번
+
+        범위 안의 ``get_db_session`` 호출은 새 세션을 열지 않고 이 세션에 합류하므로,
+        repository 호출이 여러 번이어도 커넥션 checkout과 커밋은 한 번씩만 일어난다.
+
+        - 합류한 호출은 SAVEPOINT로 감싸므로 실패한 호출의 변경만 되돌려진다.
+        - 범위가 예외로 끝나도 완료된 호출의 변경은 커밋한다 (실패 감사 로그, 승인 요청 등은
+          호출마다 커밋하던 기존 동작처럼 남아야 한다).
+        - ``read_only`` 면 SAVEPOINT 없이 합류하고 마지막에 롤백한다.
+        - 이미 진행 중인 범위 안에서 다시 호출하면 바깥 범위를 그대로 쓴다.
+        - ``asyncio.gather`` 등으로 만든 다른 task는 세션을 동시에 쓸 수 없으므로 합류하지 않는다.
+        """
+        current = self._joined_unit_of_work()
+        if current is not None:
+            yield current.session
+            return
+
+        await self.initialize()
+        if self._session_factory is None:
+            raise RuntimeError("Database not initialized. Call initialize() first.")
+
+        session = self._session_factory()
+        token = _current_unit_of_work.set(
+            _UnitOfWork(
+                manager=self,
+                session=session,
+                owner=asyncio.current_task(),
+                read_only=read_only,
+            )
+        )
+        try:
+            yield session
+        except BaseException:
+            _current_unit_of_work.reset(token)
+            try:
+                await self._end_unit_of_work(session, commit=not read_only)
+            except Exception:
+                # 커밋 실패가 원래 예외를 가리지 않도록 기록만 한다
+                logger.exception("Failed to commit unit of work after error")
+            raise
+        _current_unit_of_work.reset(token)
+        await self._end_unit_of_work(session, commit=not read_only)
+
+    def _joined_unit_of_work(self) -> _UnitOfWork | None:
+        current = _current_unit_of_work.get()
+        if current is None or current.manager is not self:
+            return None
+        return current if current.owner is asyncio.current_task() else None
+
+    @staticmethod
+    async def _end_unit_of_work(session: AsyncSession, *, commit: bool) -> None:
+        try:
+            if commit:
+                await session.commit()
+            else:
+                await session.rollback()
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
     @asynccontextmanager
     async def get_db_session(self) -> AsyncGenerator[AsyncSession, None]:
-        """의존성 주입용 데이터베이스 세션 팩토리"""
+        """의존성 주입용 데이터베이스 세션 팩토리 (진행 중인 unit of work가 있으면 합류)"""
+        current = self._joined_unit_of_work()
+        if current is not None:
+            if current.read_only:
+                yield current.session
+            else:
+                async with current.session.begin_nested():
+                    yield current.session
+            return
+
         await self.initialize()
         async with self.get_session() as session:
             yield session
@@ -0,0 +1,88 @@
+"""HTTP 조건부 요청 / 캐시 헤더 유틸리티
+
+- strong ETag 생성 (리소스 식별자/리비전 또는 직렬화된 응답 본문 기반)
+- ``If-None-Match`` 일치 시 304 Not Modified 응답
+- 정확한 버전(immutable) / 최신 포인터(짧은 max-age + 재검증) Cache-Control
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Mapping
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from .json_response import dump_json
+from .settings import settings
+
+# 정확한 (subject, version) 원본 스키마처럼 절대 바뀌지 않는 응답
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 버전은 고정이지만 거버넌스 메타데이터(owner, 호환성 모드 등)가 함께 포함되는 응답
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+def latest_cache_control() -> str:
+    """최신 포인터 응답용 Cache-Control (짧은 max-age + 만료 후 재검증)"""
+    return f"public, max-age={settings.http_cache_latest_max_age}, must-revalidate"
+
+
+def strong_etag(*parts: object) -> str:
+    """구성 요소로부터 strong ETag 생성"""
+    digest = hashlib.sha256("\x1f".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """``If-None-Match`` 헤더가 ETag와 일치하는지 (weak 비교, RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    if "*" in candidates:
+        return True
+    return etag in {candidate.removeprefix("W/") for candidate in candidates}
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(
+        status_code=304,
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+def conditional_response(
+    request: Request,
+    *,
+    content: bytes | str,
+    media_type: str,
+    etag: str,
+    cache_control: str,
+    headers: Mapping[str, str] | None = None,
+) -> Response:
+    """ETag가 일치하면 304, 아니면 캐시 헤더를 포함한 200 응답"""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag, cache_control)
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={**(headers or {}), "ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+def conditional_json_response(
+    request: Request, payload: object, *, cache_control: str, etag: str | None = None
+) -> Response:
+    """JSON 조건부 응답 (``etag`` 를 주지 않으면 직렬화 결과로 strong ETag를 계산)
+
+    ``payload`` 는 응답 모델 또는 도메인 dataclass (후자는 검증 없이 바로 직렬화)
+    """
+    content = dump_json(
+        payload.model_dump(mode="json") if isinstance(payload, BaseModel) else payload
+    )
+    return conditional_response(
+        request,
+        content=content,
+        media_type="application/json",
+        etag=etag or strong_etag(hashlib.sha256(content).hexdigest()),
+        cache_control=cache_control,
+    )
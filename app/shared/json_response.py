@@ -0,0 +1,35 @@
+"""도메인 모델 직접 JSON 응답
+
+use case가 돌려주는 frozen dataclass는 서버가 직접 만든 값이라 다시 검증할 필요가 없다.
+``Model.model_validate(asdict(x))`` 는 ``asdict`` 깊은 복사 → 응답 모델 검증 → FastAPI의
+response_model 재검증/직렬화를 차례로 거치므로, 수천 항목짜리 plan 응답에서는 계획 수립보다
+응답 모델링이 더 오래 걸린다.
+
+여기서는 dataclass/enum/datetime을 orjson으로 곧바로 bytes로 만든다. 라우트의
+``response_model`` 은 OpenAPI 문서용으로 그대로 두며, ``Response`` 를 반환하면 FastAPI는
+응답 모델 검증과 직렬화를 건너뛴다.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi import Response
+
+# UTC datetime을 pydantic JSON 직렬화와 같은 "Z" 접미사로 출력
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+def dump_json(value: Any) -> bytes:
+    """dataclass(slots 포함)/enum/datetime/tuple을 그대로 JSON bytes로 직렬화"""
+    return orjson.dumps(value, option=_ORJSON_OPTIONS)
+
+
+class DomainJSONResponse(Response):
+    """도메인 모델을 검증 없이 바로 직렬화하는 JSON 응답"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
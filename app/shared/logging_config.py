@@ -5,6 +5,8 @@ structlog를 사용하여 JSON 기반 구조화 로깅 제공:
 - 프로덕션: JSON 출력
 - trace_id 자동 전파 (asyncio context variables)
 - 민감 정보 마스킹
+- 큐 기반 비동기 출력: 렌더링/stdout 쓰기는 백그라운드 listener 스레드에서 수행
+- 고빈도 DEBUG/INFO 이벤트 샘플링, 큐 포화 시 drop (요청 처리를 절대 막지 않음)
 
 Usage:
     from app.shared.logging_config import get_logger
@@ -15,14 +17,26 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+import threading
+import time
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any
 
 import structlog
 
+from .metrics import LOG_RECORDS_DROPPED
 from .settings import settings
 
+# 샘플링 카운터 키 상한 (보간된 메시지처럼 키가 무한히 늘어나는 경우 대비)
+_MAX_SAMPLER_KEYS = 10_000
+
+_listener: QueueListener | None = None
+
 
 def mask_sensitive_keys(logger: Any, method_name: str, event_dict: dict) -> dict:
     """민감 정보 마스킹 processor
@@ -57,12 +71,99 @@ def add_app_context(logger: Any, method_name: str, event_dict: dict) -> dict:
     return event_dict
 
 
+def add_record_timestamp(logger: Any, method_name: str, event_dict: dict) -> dict:
+    """stdlib 레코드의 생성 시각을 timestamp로 사용하는 processor
+
+    렌더링이 listener 스레드에서 늦게 수행되어도 실제 발생 시각이 기록되도록 한다.
+    """
+    record = event_dict.get("_record")
+    if record is not None and "timestamp" not in event_dict:
+        created = datetime.fromtimestamp(record.created, UTC)
+        event_dict["timestamp"] = created.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    return event_dict
+
+
+class LogSampler(logging.Filter):
+    """고빈도 DEBUG/INFO 이벤트 샘플링 필터
+
+    (logger, level, 이벤트 템플릿) 단위로 window 마다 처음 ``burst`` 건은 그대로 기록하고,
+    이후에는 ``rate`` 비율만 기록한다. WARNING 이상은 항상 기록.
+    """
+
+    def __init__(self, burst: int, rate: float, window_seconds: float = 1.0) -> None:
+        super().__init__()
+        self.burst = burst
+        self.window_seconds = window_seconds
+        self._every = round(1 / rate) if rate > 0 else 0
+        self._counters: dict[tuple[str, int, str], list[float]] = {}
+        self._lock = threading.Lock()
+        self.sampled_out = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+
+        # structlog 레코드는 msg가 event_dict, stdlib 레코드는 보간 전 템플릿
+        event = record.msg.get("event") if isinstance(record.msg, dict) else record.msg
+        key = (record.name, record.levelno, str(event))
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._counters.get(key)
+            if entry is None or now - entry[0] >= self.window_seconds:
+                if len(self._counters) >= _MAX_SAMPLER_KEYS:
+                    self._counters.clear()
+                entry = [now, 0]
+                self._counters[key] = entry
+            entry[1] += 1
+            overflow = int(entry[1]) - self.burst
+
+        if overflow <= 0 or (self._every and overflow % self._every == 0):
+            return True
+
+        self.sampled_out += 1
+        LOG_RECORDS_DROPPED.labels(reason="sampled").inc()
+        return False
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """큐가 가득 차면 대기하지 않고 레코드를 버리는 QueueHandler
+
+    ``prepare`` 에서 포맷하지 않고 레코드를 그대로 넘겨 문자열 보간/렌더링을
+    listener 스레드로 미룬다 (lazy formatting).
+    """
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord]) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            LOG_RECORDS_DROPPED.labels(reason="queue_full").inc()
+
+
+def shutdown_logging() -> None:
+    """listener 스레드를 정지하고 큐에 남은 레코드를 모두 출력"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def configure_structlog() -> None:
     """structlog 전역 설정
 
     개발 환경: 컬러 콘솔 렌더러
     프로덕션: JSON 렌더러
     """
+    global _listener
+
     # 개발 환경: 가독성 좋은 콘솔 출력
     if settings.is_development:
         processors = [
@@ -83,7 +184,7 @@ def configure_structlog() -> None:
             # 표준 logging에서 들어온 로그도 structlog 스타일로 처리
             foreign_pre_chain=[
                 structlog.stdlib.add_log_level,
-                structlog.processors.TimeStamper(fmt="iso", utc=True),
+                add_record_timestamp,
             ],
             processors=[
                 structlog.stdlib.ProcessorFormatter.remove_processors_meta,
@@ -110,7 +211,7 @@ def configure_structlog() -> None:
         formatter = structlog.stdlib.ProcessorFormatter(
             foreign_pre_chain=[
                 structlog.stdlib.add_log_level,
-                structlog.processors.TimeStamper(fmt="iso", utc=True),
+                add_record_timestamp,
             ],
             processors=[
                 structlog.stdlib.ProcessorFormatter.remove_processors_meta,
@@ -128,8 +229,25 @@ def configure_structlog() -> None:
     )
 
     # 표준 logging 설정
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+
+    shutdown_logging()
+    handler: logging.Handler = stream_handler
+    if settings.log_queue_enabled:
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=settings.log_queue_size)
+        handler = NonBlockingQueueHandler(log_queue)
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+
+    if settings.log_sample_rate < 1.0:
+        handler.addFilter(
+            LogSampler(
+                burst=settings.log_sample_burst,
+                rate=settings.log_sample_rate,
+                window_seconds=settings.log_sample_window_seconds,
+            )
+        )
 
     root_logger = logging.getLogger()
     root_logger.handlers.clear()  # 기존 핸들러 제거
@@ -160,6 +278,9 @@ def configure_structlog() -> None:
         logging.getLogger(logger_name).setLevel(logging.WARNING)
 
 
+atexit.register(shutdown_logging)
+
+
 def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
     """구조화 로거 인스턴스 반환
 
@@ -0,0 +1,303 @@
+"""Prometheus 메트릭 - HTTP / Schema Registry / DB / Catalog Sync / CPU 작업
+
+`/metrics` 엔드포인트에서 노출되는 지표 정의 및 계측 헬퍼
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Awaitable, Callable, Coroutine, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# 지연 시간 버킷 (초) - 로컬 DB 쿼리부터 느린 SR 호출까지 포괄
+_LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "kafka_gov_http_request_duration_seconds",
+    "HTTP 요청 처리 시간 (라우트 템플릿 기준)",
+    ("method", "route", "status_code"),
+    buckets=_LATENCY_BUCKETS,
+)
+
+HTTP_TIME_TO_FIRST_BYTE = Histogram(
+    "kafka_gov_http_time_to_first_byte_seconds",
+    "요청 수신부터 응답 헤더 전송까지의 시간",
+    ("method", "route"),
+    buckets=_LATENCY_BUCKETS,
+)
+
+HTTP_RESPONSE_SIZE = Histogram(
+    "kafka_gov_http_response_size_bytes",
+    "HTTP 응답 본문 크기",
+    ("method", "route"),
+    buckets=(256, 1_024, 4_096, 16_384, 65_536, 262_144, 1_048_576, 4_194_304, 16_777_216),
+)
+
+SCHEMA_REGISTRY_CALL_DURATION = Histogram(
+    "kafka_gov_schema_registry_call_duration_seconds",
+    "Schema Registry 어댑터 호출 시간",
+    ("operation", "outcome"),
+    buckets=_LATENCY_BUCKETS,
+)
+
+SCHEMA_REGISTRY_CALL_ERRORS = Counter(
+    "kafka_gov_schema_registry_call_errors_total",
+    "Schema Registry 어댑터 호출 실패 횟수",
+    ("operation", "error_type"),
+)
+
+DB_POOL_CHECKOUT_DURATION = Histogram(
+    "kafka_gov_db_pool_checkout_duration_seconds",
+    "DB 커넥션 풀 checkout 대기 시간",
+    buckets=_LATENCY_BUCKETS,
+)
+
+DB_POOL_CHECKED_OUT = Gauge(
+    "kafka_gov_db_pool_checked_out_connections",
+    "현재 checkout된 DB 커넥션 수",
+)
+
+DB_STATEMENT_DURATION = Histogram(
+    "kafka_gov_db_statement_duration_seconds",
+    "SQL 구문 실행 시간",
+    ("statement_type",),
+    buckets=_LATENCY_BUCKETS,
+)
+
+CATALOG_SYNC_DURATION = Histogram(
+    "kafka_gov_catalog_sync_duration_seconds",
+    "카탈로그 동기화 1회 소요 시간",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+
+CATALOG_SYNC_SUBJECTS = Counter(
+    "kafka_gov_catalog_sync_subjects_total",
+    "카탈로그 동기화 처리 subject 수",
+    ("result",),
+)
+
+CATALOG_SYNC_VERSIONS = Counter(
+    "kafka_gov_catalog_sync_versions_total",
+    "카탈로그 동기화 처리 버전 수",
+    ("result",),
+)
+
+CATALOG_SYNC_ERRORS = Counter(
+    "kafka_gov_catalog_sync_errors_total",
+    "카탈로그 동기화 오류 횟수",
+)
+
+CPU_TASK_QUEUE_DEPTH = Gauge(
+    "kafka_gov_cpu_task_queue_depth",
+    "CPU 작업 풀에 제출되어 아직 끝나지 않은 작업 수 (대기 + 실행 중)",
+    ("pool",),
+)
+
+CPU_TASK_WAIT_DURATION = Histogram(
+    "kafka_gov_cpu_task_wait_seconds",
+    "CPU 작업이 제출 후 워커에서 실행되기까지 기다린 시간",
+    ("pool",),
+    buckets=_LATENCY_BUCKETS,
+)
+
+CPU_TASK_RUN_DURATION = Histogram(
+    "kafka_gov_cpu_task_run_seconds",
+    "CPU 작업 실행 시간 (워커 내부)",
+    ("pool",),
+    buckets=_LATENCY_BUCKETS,
+)
+
+LOG_RECORDS_DROPPED = Counter(
+    "kafka_gov_log_records_dropped_total",
+    "기록되지 않고 버려진 로그 레코드 수 (queue_full: 큐 포화, sampled: 샘플링)",
+    ("reason",),
+)
+
+_STATEMENT_START_KEY = "kafka_gov_statement_start"
+_INSTRUMENTED_ATTR = "_kafka_gov_metrics_instrumented"
+
+
+def render_metrics(registry: CollectorRegistry = REGISTRY) -> bytes:
+    """Prometheus text exposition 포맷으로 직렬화"""
+    return generate_latest(registry)
+
+
+def observe_http_request(
+    method: str,
+    route: str,
+    status_code: int,
+    duration: float,
+    *,
+    ttfb: float | None = None,
+    response_bytes: int | None = None,
+) -> None:
+    """HTTP 요청 지연 시간 / TTFB / 응답 크기 기록"""
+    HTTP_REQUEST_DURATION.labels(method=method, route=route, status_code=str(status_code)).observe(
+        duration
+    )
+    if ttfb is not None:
+        HTTP_TIME_TO_FIRST_BYTE.labels(method=method, route=route).observe(ttfb)
+    if response_bytes is not None:
+        HTTP_RESPONSE_SIZE.labels(method=method, route=route).observe(response_bytes)
+
+
+def observe_schema_registry_call(
+    operation: str,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Coroutine[Any, Any, R]]]:
+    """Schema Registry 어댑터 메서드의 지연 시간/오류를 기록하는 데코레이터
+
+    Args:
+        operation: 메트릭 label로 사용할 작업 이름 (예: "register_schema")
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Coroutine[Any, Any, R]]:
+        @wraps(func)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            start = time.perf_counter()
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as exc:
+                SCHEMA_REGISTRY_CALL_DURATION.labels(operation=operation, outcome="error").observe(
+                    time.perf_counter() - start
+                )
+                SCHEMA_REGISTRY_CALL_ERRORS.labels(
+                    operation=operation, error_type=exc.__class__.__name__
+                ).inc()
+                raise
+            SCHEMA_REGISTRY_CALL_DURATION.labels(operation=operation, outcome="success").observe(
+                time.perf_counter() - start
+            )
+            return result
+
+        return async_wrapper
+
+    return decorator
+
+
+def observe_catalog_sync(
+    *,
+    duration_seconds: float,
+    subjects_total: int,
+    subjects_new: int,
+    subjects_removed: int,
+    versions_new: int,
+    versions_removed: int,
+    errors: int,
+) -> None:
+    """카탈로그 동기화 처리량 기록"""
+    CATALOG_SYNC_DURATION.observe(duration_seconds)
+    CATALOG_SYNC_SUBJECTS.labels(result="scanned").inc(subjects_total)
+    CATALOG_SYNC_SUBJECTS.labels(result="new").inc(subjects_new)
+    CATALOG_SYNC_SUBJECTS.labels(result="removed").inc(subjects_removed)
+    CATALOG_SYNC_VERSIONS.labels(result="new").inc(versions_new)
+    CATALOG_SYNC_VERSIONS.labels(result="removed").inc(versions_removed)
+    CATALOG_SYNC_ERRORS.inc(errors)
+
+
+@contextmanager
+def track_cpu_queue_depth(pool: str) -> Iterator[None]:
+    """CPU 작업 제출~완료 구간 동안 queue depth gauge 증가"""
+    gauge = CPU_TASK_QUEUE_DEPTH.labels(pool=pool)
+    gauge.inc()
+    try:
+        yield
+    finally:
+        gauge.dec()
+
+
+def observe_cpu_task(pool: str, *, wait_seconds: float, run_seconds: float) -> None:
+    """CPU 작업 대기/실행 시간 기록"""
+    CPU_TASK_WAIT_DURATION.labels(pool=pool).observe(wait_seconds)
+    CPU_TASK_RUN_DURATION.labels(pool=pool).observe(run_seconds)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """SQLAlchemy (sync) 엔진에 풀 checkout / 구문 실행 계측 등록
+
+    AsyncEngine은 ``async_engine.sync_engine`` 을 전달한다.
+    """
+    if getattr(engine, _INSTRUMENTED_ATTR, False):
+        return
+    setattr(engine, _INSTRUMENTED_ATTR, True)
+
+    pool = engine.pool
+    pool_connect = pool.connect
+
+    # 풀 이벤트에는 checkout 시작 시점 훅이 없으므로 connect 호출 자체를 측정
+    def timed_connect() -> Any:
+        start = time.perf_counter()
+        try:
+            return pool_connect()
+        finally:
+            DB_POOL_CHECKOUT_DURATION.observe(time.perf_counter() - start)
+
+    pool.connect = timed_connect  # type: ignore[method-assign]
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(*_: Any) -> None:
+        DB_POOL_CHECKED_OUT.inc()
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(*_: Any) -> None:
+        DB_POOL_CHECKED_OUT.dec()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault(_STATEMENT_START_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        starts = conn.info.get(_STATEMENT_START_KEY)
+        if not starts:
+            return
+        DB_STATEMENT_DURATION.labels(statement_type=_statement_type(statement)).observe(
+            time.perf_counter() - starts.pop()
+        )
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context) -> None:
+        connection = exception_context.connection
+        if connection is not None:
+            starts = connection.info.get(_STATEMENT_START_KEY)
+            if starts:
+                starts.pop()
+
+
+def _statement_type(statement: str) -> str:
+    keyword = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+    if keyword in {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}:
+        return keyword.lower()
+    return "other"
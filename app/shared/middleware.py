@@ -1,74 +1,170 @@
-"""FastAPI Middleware - 구조화 로깅 지원
+"""ASGI Middleware - 구조화 로깅 지원
 
-trace_id 전파 및 요청/응답 로깅
+trace_id 전파, 요청/응답 로깅 및 요청 단위 root span 생성
+
+``BaseHTTPMiddleware`` 와 달리 요청마다 별도 task/stream을 만들지 않고
+send 메시지를 그대로 통과시키므로 chunked/streaming 응답이 버퍼링 없이 전달된다.
 """
 
 from __future__ import annotations
 
 import time
 import uuid
-from collections.abc import Callable
+from typing import Any
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from .logging_config import bind_context, clear_context, get_logger
+from .metrics import observe_http_request
+from .tracing import (
+    Span,
+    format_traceparent,
+    parse_traceparent,
+    remote_context,
+    start_span,
+    trace_id_from_request_id,
+)
 
 logger = get_logger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """요청/응답 로깅 및 trace_id 전파 Middleware
+class RequestLoggingMiddleware:
+    """요청/응답 로깅 및 trace_id 전파 Middleware (pure ASGI)
 
     모든 요청에 trace_id를 할당하고 context에 바인딩하여
-    해당 요청의 모든 로그에 자동으로 trace_id가 포함되도록 함
+    해당 요청의 모든 로그에 자동으로 trace_id가 포함되도록 함.
+    응답 헤더 전송 시점(TTFB)과 본문 크기도 함께 기록한다.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        method: str = scope["method"]
+        path: str = scope["path"]
+
         # trace_id 생성 또는 헤더에서 추출
-        trace_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
+        trace_id = headers.get("x-request-id") or str(uuid.uuid4())
 
         # trace_id를 context에 바인딩 (모든 로그에 자동 포함)
+        client = scope.get("client")
         bind_context(
             trace_id=trace_id,
-            method=request.method,
-            path=request.url.path,
-            client_ip=request.client.host if request.client else "unknown",
+            method=method,
+            path=path,
+            client_ip=client[0] if client else "unknown",
         )
 
+        # W3C traceparent가 있으면 이어받고, 없으면 X-Request-ID 기반 trace_id 사용
+        remote_parent = parse_traceparent(headers.get("traceparent"))
+        span_trace_id, parent_span_id = remote_parent or (trace_id_from_request_id(trace_id), None)
+
         start_time = time.perf_counter()
+        exchange = _ResponseExchange()
 
         try:
-            response = await call_next(request)
+            with (
+                remote_context(span_trace_id, parent_span_id),
+                start_span(
+                    method,
+                    kind="SERVER",
+                    attributes={
+                        "http.request.method": method,
+                        "url.path": path,
+                        "http.request_id": trace_id,
+                    },
+                ) as span,
+            ):
+
+                async def send_wrapper(message: Message) -> None:
+                    if message["type"] == "http.response.start":
+                        exchange.status_code = message["status"]
+                        exchange.ttfb = time.perf_counter() - start_time
+
+                        # 응답 헤더에 trace_id / traceparent 추가
+                        response_headers = MutableHeaders(scope=message)
+                        response_headers["X-Request-ID"] = trace_id
+                        if span is not None:
+                            _name_server_span(span, method, _route_template(scope))
+                            response_headers["traceparent"] = format_traceparent(span)
+
+                    elif message["type"] == "http.response.body":
+                        exchange.response_bytes += len(message.get("body", b""))
+
+                    await send(message)
+
+                try:
+                    await self.app(scope, receive, send_wrapper)
+                except Exception as exc:
+                    # 예외 발생 시 로깅
+                    duration = time.perf_counter() - start_time
+
+                    logger.error(
+                        "request_failed",
+                        error_type=exc.__class__.__name__,
+                        error_message=str(exc),
+                        duration_ms=round(duration * 1000, 2),
+                        exc_info=True,
+                    )
+                    observe_http_request(method, _route_template(scope), 500, duration)
+
+                    raise
+
+                # 요청 완료 로깅 (streaming 응답은 마지막 chunk 전송 후)
+                duration = time.perf_counter() - start_time
+                route = _route_template(scope)
+                status_code = exchange.status_code or 500
+
+                logger.info(
+                    "request_completed",
+                    status_code=status_code,
+                    duration_ms=round(duration * 1000, 2),
+                    ttfb_ms=round(exchange.ttfb * 1000, 2) if exchange.ttfb is not None else None,
+                    response_bytes=exchange.response_bytes,
+                )
+                observe_http_request(
+                    method,
+                    route,
+                    status_code,
+                    duration,
+                    ttfb=exchange.ttfb,
+                    response_bytes=exchange.response_bytes,
+                )
+
+                if span is not None:
+                    _name_server_span(span, method, route)
+                    span.set_attribute("http.response.status_code", status_code)
+                    span.set_attribute("http.response.body.size", exchange.response_bytes)
+
+        finally:
+            # context 정리 (메모리 누수 방지)
+            clear_context()
 
-            # 응답 헤더에 trace_id 추가
-            response.headers["X-Request-ID"] = trace_id
 
-            # 요청 완료 로깅
-            duration_ms = (time.perf_counter() - start_time) * 1000
+class _ResponseExchange:
+    """send 래퍼가 관찰한 응답 정보"""
 
-            logger.info(
-                "request_completed",
-                status_code=response.status_code,
-                duration_ms=round(duration_ms, 2),
-            )
+    __slots__ = ("response_bytes", "status_code", "ttfb")
 
-            return response
+    def __init__(self) -> None:
+        self.status_code: int | None = None
+        self.ttfb: float | None = None
+        self.response_bytes = 0
 
-        except Exception as exc:
-            # 예외 발생 시 로깅
-            duration_ms = (time.perf_counter() - start_time) * 1000
 
-            logger.error(
-                "request_failed",
-                error_type=exc.__class__.__name__,
-                error_message=str(exc),
-                duration_ms=round(duration_ms, 2),
-                exc_info=True,
-            )
+def _name_server_span(span: Span, method: str, route: str) -> None:
+    span.name = f"{method} {route}"
+    span.set_attribute("http.route", route)
 
-            raise
 
-        finally:
-            # context 정리 (메모리 누수 방지)
-            clear_context()
+def _route_template(scope: dict[str, Any]) -> str:
+    """메트릭 label용 라우트 템플릿 (path parameter로 인한 cardinality 폭증 방지)"""
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    return path if isinstance(path, str) else "unmatched"
@@ -116,6 +116,123 @@ class AppSettings(BaseSettings):
             return [origin.strip() for origin in v.split(",") if origin.strip()]
         return v
 
+    # Schema Registry Client 캐시 설정
+    registry_client_max_size: int = Field(
+        default=32, ge=1, le=1024, description="캐시할 Schema Registry Client 최대 개수"
+    )
+    registry_client_idle_timeout: float = Field(
+        default=600.0, gt=0, description="유휴 Schema Registry Client 제거 기준 시간(초)"
+    )
+
+    # 트레이싱 설정 (외부 collector 없이 프로세스 내 exporter 사용)
+    tracing_exporter: str = Field(
+        default="none", description="트레이싱 exporter (none/console/file/memory)"
+    )
+    tracing_file_path: str = Field(
+        default="./traces/spans.jsonl", description="file exporter 사용 시 span 기록 경로"
+    )
+
+    # 로그 파이프라인 설정 (큐 기반 비동기 출력 + 고빈도 이벤트 샘플링)
+    log_queue_enabled: bool = Field(
+        default=True, description="큐 + 백그라운드 스레드로 로그 출력 (요청 처리 비차단)"
+    )
+    log_queue_size: int = Field(
+        default=10_000, ge=100, description="로그 큐 최대 크기 (가득 차면 drop)"
+    )
+    log_sample_burst: int = Field(
+        default=100, ge=0, description="이벤트별 window 당 샘플링 없이 기록할 DEBUG/INFO 건수"
+    )
+    log_sample_rate: float = Field(
+        default=0.01, ge=0.0, le=1.0, description="burst 초과 DEBUG/INFO 이벤트 기록 비율"
+    )
+    log_sample_window_seconds: float = Field(
+        default=1.0, gt=0, description="샘플링 카운터 window 길이(초)"
+    )
+
+    # HTTP 캐시 설정 (정확한 버전은 immutable, 최신 포인터는 짧은 max-age + 재검증)
+    http_cache_latest_max_age: int = Field(
+        default=15, ge=0, description="최신 스키마/버전 목록 응답의 Cache-Control max-age(초)"
+    )
+
+    # 일괄 export 설정 (카탈로그가 최신이면 DB, 아니면 SR에서 제한된 동시성으로 조회)
+    schema_export_catalog_max_age_seconds: int = Field(
+        default=900, ge=0, description="카탈로그를 최신으로 간주할 마지막 동기화 경과 시간(초)"
+    )
+    schema_export_registry_concurrency: int = Field(
+        default=8, ge=1, le=64, description="SR에서 export 시 동시 요청 수"
+    )
+    schema_drift_scan_concurrency: int = Field(
+        default=16, ge=1, le=64, description="전체 drift 스캔 시 SR 최신 버전 동시 조회 수"
+    )
+    registry_heads_max_age_seconds: int = Field(
+        default=900, ge=0, description="registry 비교 시 head 인덱스를 재사용할 최대 경과 시간(초)"
+    )
+
+    # CPU 작업 오프로딩 (스키마 파싱/정규화/diff/lint)
+    cpu_process_threshold_bytes: int = Field(
+        default=262_144, ge=0, description="이 크기(bytes) 이상 payload는 프로세스 풀에서 처리"
+    )
+    cpu_thread_workers: int = Field(default=4, ge=1, description="소형 payload용 스레드 수")
+    cpu_process_workers: int | None = Field(
+        default=None, ge=1, description="대형 payload용 프로세스 수 (미지정 시 CPU 코어 수)"
+    )
+
+    # catalog PII/리스크 점수 (None이면 PiiCandidatePolicy 기본 키워드 사전)
+    schema_pii_keywords: list[str] | None = Field(
+        default=None, description="PII 후보로 판단할 필드명 키워드 목록"
+    )
+
+    # 스키마 참조 그래프 (다른 인스턴스의 기록을 반영하는 최대 지연)
+    schema_reference_graph_cache_ttl_seconds: float = Field(
+        default=30.0, ge=0, description="메모리 참조 그래프 캐시 유지 시간(초)"
+    )
+
+    # 백그라운드 lint 워커 (schema_versions.lint_report 채움)
+    # 잠금 없이 밀린 버전을 조회/갱신하므로 프로세스 하나에서만 켠다
+    schema_lint_worker_enabled: bool = Field(
+        default=False,
+        description="앱 기동 시 백그라운드 lint 워커 실행 여부 (단일 인스턴스에서만 활성화)",
+    )
+    schema_lint_batch_size: int = Field(
+        default=200, ge=1, description="lint 배치 하나에서 처리할 고유 스키마 본문 수"
+    )
+    schema_lint_interval_seconds: float = Field(
+        default=60.0, gt=0, description="밀린 lint를 처리한 뒤 다음 확인까지 대기 시간(초)"
+    )
+
+    # 배치 요청 고속 디코딩 (끄면 SchemaBatchRequest 모델 검증 경로만 사용)
+    schema_batch_fast_decode: bool = Field(
+        default=True, description="배치 dry-run/apply 요청을 도메인 모델로 직접 디코딩"
+    )
+
+    # 정책 what-if 시뮬레이션 (catalog 최신 스키마 전체를 프로세스 풀에서 평가)
+    policy_simulation_chunk_size: int = Field(
+        default=500, ge=1, description="프로세스 풀 작업 하나에 담을 subject 수"
+    )
+
+    # 대용량 JSON 컬럼 압축 설정 (plan_data, result_data, snapshot)
+    json_compression_threshold_bytes: int = Field(
+        default=4096, ge=0, description="이 크기(bytes) 이상인 JSON payload만 zlib 압축"
+    )
+    json_compression_level: int = Field(default=6, ge=1, le=9, description="zlib 압축 레벨")
+
+    # 감사 로그 보관 설정 (hot window 조회 + 오래된 행 NDJSON 아카이브)
+    audit_hot_window_days: int = Field(
+        default=30, ge=1, description="최근 활동 조회가 우선 탐색하는 기간(일)"
+    )
+    audit_retention_days: int = Field(
+        default=180, ge=1, description="DB에 유지할 감사 로그 기간(일), 초과분은 아카이브"
+    )
+    audit_archive_dir: str = Field(
+        default="./archive/audit", description="아카이브 NDJSON(gzip) 파일 저장 경로"
+    )
+    audit_archive_batch_size: int = Field(
+        default=5_000, ge=100, description="아카이브 시 한 번에 옮길 행 수"
+    )
+    audit_partition_months_ahead: int = Field(
+        default=3, ge=1, description="MySQL 월 단위 파티션을 미리 만들어 둘 개월 수"
+    )
+
     # 데이터베이스 설정 (유일한 하위 설정)
     database: DatabaseSettings = Field(default_factory=DatabaseSettings)
 
@@ -0,0 +1,383 @@
+"""분산 트레이싱 - OpenTelemetry 호환 span 모델 + 프로세스 내 exporter
+
+외부 collector 없이도 요청 1건의 시간 분포(use case → SR 호출 → DB 구문)를
+하나의 trace로 확인할 수 있도록 span을 JSON Lines로 내보낸다.
+
+- trace_id / span_id 포맷과 JSON 필드는 OTLP span 구조를 따름
+- W3C ``traceparent`` 헤더 수신/발신 지원
+- ``X-Request-ID`` 가 UUID이면 그대로 trace_id로 사용 (로그 trace_id와 일치)
+
+Usage:
+    from app.shared.tracing import traced_class
+
+    @traced_class("usecase")
+    class MyUseCase:
+        async def execute(self) -> None: ...
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import re
+import secrets
+import sys
+import threading
+import time
+from collections.abc import Awaitable, Callable, Coroutine, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from pathlib import Path
+from typing import Any, ParamSpec, Protocol, TextIO, TypeVar
+
+import orjson
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+P = ParamSpec("P")
+R = TypeVar("R")
+T = TypeVar("T")
+
+type AttributeValue = str | int | float | bool | None
+
+_TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_HEX_32_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+_SPAN_STACK_KEY = "kafka_gov_trace_spans"
+_TRACED_ENGINE_ATTR = "_kafka_gov_tracing_instrumented"
+_MAX_STATEMENT_LENGTH = 512
+
+
+@dataclass(slots=True)
+class Span:
+    """단일 작업 구간 (OTLP span 구조)"""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None
+    kind: str = "INTERNAL"
+    start_time_unix_nano: int = field(default_factory=time.time_ns)
+    end_time_unix_nano: int | None = None
+    attributes: dict[str, AttributeValue] = field(default_factory=dict)
+    status_code: str = "UNSET"
+    status_message: str | None = None
+
+    @property
+    def duration_ms(self) -> float | None:
+        if self.end_time_unix_nano is None:
+            return None
+        return (self.end_time_unix_nano - self.start_time_unix_nano) / 1_000_000
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.status_code = "ERROR"
+        self.status_message = str(exc)
+        self.attributes["exception.type"] = exc.__class__.__name__
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "kind": f"SPAN_KIND_{self.kind}",
+            "startTimeUnixNano": self.start_time_unix_nano,
+            "endTimeUnixNano": self.end_time_unix_nano,
+            "durationMs": self.duration_ms,
+            "attributes": self.attributes,
+            "status": {"code": f"STATUS_CODE_{self.status_code}", "message": self.status_message},
+        }
+
+
+class SpanExporter(Protocol):
+    """종료된 span을 내보내는 exporter 인터페이스"""
+
+    def export(self, span: Span) -> None: ...
+
+
+class ConsoleSpanExporter:
+    """stdout(또는 지정 스트림)에 JSON Lines로 출력"""
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        self._stream = stream or sys.stdout
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = orjson.dumps(span.to_dict()).decode()
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+
+class FileSpanExporter:
+    """파일에 JSON Lines로 추가 기록"""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = orjson.dumps(span.to_dict()) + b"\n"
+        with self._lock, self._path.open("ab") as file:
+            file.write(line)
+
+
+class InMemorySpanExporter:
+    """메모리에 span 보관 (테스트/디버깅용)"""
+
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+_exporter: SpanExporter | None = None
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+_remote_parent: ContextVar[tuple[str, str | None] | None] = ContextVar(
+    "remote_parent", default=None
+)
+
+
+def set_span_exporter(exporter: SpanExporter | None) -> None:
+    """전역 exporter 설정 (None이면 트레이싱 비활성화)"""
+    global _exporter
+    _exporter = exporter
+
+
+def get_span_exporter() -> SpanExporter | None:
+    return _exporter
+
+
+def is_tracing_enabled() -> bool:
+    return _exporter is not None
+
+
+def configure_tracing(exporter_name: str, file_path: str | None = None) -> None:
+    """설정값으로 exporter 구성
+
+    Args:
+        exporter_name: "none" | "console" | "file" | "memory"
+        file_path: exporter_name="file" 일 때 기록할 파일 경로
+    """
+    name = exporter_name.lower()
+    if name == "console":
+        set_span_exporter(ConsoleSpanExporter())
+    elif name == "file":
+        if not file_path:
+            raise ValueError("tracing file exporter requires a file path")
+        set_span_exporter(FileSpanExporter(file_path))
+    elif name == "memory":
+        set_span_exporter(InMemorySpanExporter())
+    elif name == "none":
+        set_span_exporter(None)
+    else:
+        raise ValueError(f"Unknown tracing exporter: {exporter_name}")
+
+
+def get_current_span() -> Span | None:
+    return _current_span.get()
+
+
+def trace_id_from_request_id(request_id: str) -> str:
+    """X-Request-ID → 32자리 hex trace_id 변환
+
+    UUID 형식이면 하이픈만 제거해 그대로 사용하고, 그 외 값은 해시로 변환한다.
+    """
+    candidate = request_id.replace("-", "").lower()
+    if _HEX_32_PATTERN.match(candidate) and candidate != "0" * 32:
+        return candidate
+    return hashlib.sha256(request_id.encode()).hexdigest()[:32]
+
+
+def parse_traceparent(header: str | None) -> tuple[str, str] | None:
+    """W3C traceparent 헤더 파싱 → (trace_id, parent_span_id)"""
+    if not header:
+        return None
+    matched = _TRACEPARENT_PATTERN.match(header.strip().lower())
+    if matched is None:
+        return None
+    trace_id, span_id, _ = matched.groups()
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    return trace_id, span_id
+
+
+def format_traceparent(span: Span) -> str:
+    return f"00-{span.trace_id}-{span.span_id}-01"
+
+
+@contextmanager
+def remote_context(trace_id: str, parent_span_id: str | None = None) -> Iterator[None]:
+    """요청 경계에서 상위 trace 컨텍스트를 지정 (다음 root span이 이어받음)"""
+    token = _remote_parent.set((trace_id, parent_span_id))
+    try:
+        yield
+    finally:
+        _remote_parent.reset(token)
+
+
+@contextmanager
+def start_span(
+    name: str,
+    *,
+    kind: str = "INTERNAL",
+    attributes: dict[str, AttributeValue] | None = None,
+) -> Iterator[Span | None]:
+    """span 시작 컨텍스트 매니저 (트레이싱 비활성화 시 None 반환)"""
+    exporter = _exporter
+    if exporter is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    if parent is not None:
+        trace_id, parent_span_id = parent.trace_id, parent.span_id
+    else:
+        remote = _remote_parent.get()
+        trace_id, parent_span_id = remote if remote is not None else (secrets.token_hex(16), None)
+
+    span = Span(
+        name=name,
+        trace_id=trace_id,
+        span_id=secrets.token_hex(8),
+        parent_span_id=parent_span_id,
+        kind=kind,
+        attributes=dict(attributes) if attributes else {},
+    )
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as exc:
+        span.record_exception(exc)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end_time_unix_nano = time.time_ns()
+        if span.status_code == "UNSET":
+            span.status_code = "OK"
+        exporter.export(span)
+
+
+def begin_span(
+    name: str,
+    *,
+    kind: str = "INTERNAL",
+    attributes: dict[str, AttributeValue] | None = None,
+) -> Span | None:
+    """현재 span의 자식 leaf span 생성 (컨텍스트 전환 없음, ``end_span`` 으로 종료)
+
+    이벤트 훅처럼 with 블록으로 감쌀 수 없는 구간(DB 구문 실행 등)에 사용한다.
+    """
+    if _exporter is None:
+        return None
+    parent = _current_span.get()
+    if parent is None:
+        return None
+    return Span(
+        name=name,
+        trace_id=parent.trace_id,
+        span_id=secrets.token_hex(8),
+        parent_span_id=parent.span_id,
+        kind=kind,
+        attributes=dict(attributes) if attributes else {},
+    )
+
+
+def end_span(span: Span, exc: BaseException | None = None) -> None:
+    """``begin_span`` 으로 시작한 span 종료 및 export"""
+    exporter = _exporter
+    span.end_time_unix_nano = time.time_ns()
+    if exc is not None:
+        span.record_exception(exc)
+    elif span.status_code == "UNSET":
+        span.status_code = "OK"
+    if exporter is not None:
+        exporter.export(span)
+
+
+def trace_engine(engine: Engine) -> None:
+    """SQLAlchemy (sync) 엔진의 구문 실행을 ``db.<statement>`` span으로 기록
+
+    상위 span(요청/유스케이스)이 있을 때만 생성되며 AsyncEngine은 ``sync_engine`` 을 전달한다.
+    """
+    if getattr(engine, _TRACED_ENGINE_ATTR, False):
+        return
+    setattr(engine, _TRACED_ENGINE_ATTR, True)
+    db_system = engine.dialect.name
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "SQL"
+        span = begin_span(
+            f"db.{operation.lower()}",
+            kind="CLIENT",
+            attributes={
+                "db.system": db_system,
+                "db.operation": operation,
+                "db.statement": statement[:_MAX_STATEMENT_LENGTH],
+            },
+        )
+        conn.info.setdefault(_SPAN_STACK_KEY, []).append(span)
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        spans = conn.info.get(_SPAN_STACK_KEY)
+        if spans:
+            span = spans.pop()
+            if span is not None:
+                end_span(span)
+
+    @event.listens_for(engine, "handle_error")
+    def _handle_error(exception_context) -> None:
+        connection = exception_context.connection
+        spans = connection.info.get(_SPAN_STACK_KEY) if connection is not None else None
+        if spans:
+            span = spans.pop()
+            if span is not None:
+                end_span(span, exception_context.original_exception)
+
+
+def traced(
+    name: str,
+) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Coroutine[Any, Any, R]]]:
+    """비동기 함수를 span으로 감싸는 데코레이터"""
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Coroutine[Any, Any, R]]:
+        @wraps(func)
+        async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _exporter is None:
+                return await func(*args, **kwargs)
+            with start_span(name):
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    return decorator
+
+
+def traced_class(layer: str) -> Callable[[type[T]], type[T]]:
+    """클래스에 정의된 public async 메서드 전부를 span으로 감싸는 클래스 데코레이터
+
+    span 이름: ``{layer}.{ClassName}.{method}`` (예: ``usecase.SchemaBatchApplyUseCase.execute``)
+
+    Args:
+        layer: 계층 이름 ("usecase" | "adapter" | "repository")
+    """
+
+    def decorator(cls: type[T]) -> type[T]:
+        for attr_name, attr in list(vars(cls).items()):
+            if attr_name.startswith("_") or not inspect.iscoroutinefunction(attr):
+                continue
+            setattr(cls, attr_name, traced(f"{layer}.{cls.__name__}.{attr_name}")(attr))
+        return cls
+
+    return decorator
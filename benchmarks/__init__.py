@@ -0,0 +1 @@
+"""성능 벤치마크 스위트 - 합성 Schema Registry / 카탈로그 기반"""
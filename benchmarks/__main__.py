@@ -0,0 +1,220 @@
+"""벤치마크 CLI
+
+Usage:
+    # 1k 규모 전체 시나리오 실행 후 결과 저장
+    python -m benchmarks run --scale 1k --output benchmarks/results/current.json
+
+    # baseline과 비교 (회귀 발견 시 exit code 1)
+    python -m benchmarks run --scale 1k --baseline benchmarks/results/baseline.json
+
+    # 저장된 두 결과 파일 비교
+    python -m benchmarks compare benchmarks/results/baseline.json benchmarks/results/current.json
+
+    # fake Schema Registry 서버를 통한 HTTP 경로 측정 (지연/에러 주입)
+    python -m benchmarks run --scale 1k --transport http --registry-latency-ms 2
+
+    # fake Schema Registry 단독 실행 (앱에서 http://127.0.0.1:8081 로 등록)
+    python -m benchmarks serve --scale 10k --port 8081 --error-rate 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+
+import structlog
+import uvicorn
+
+from .fake_registry import (
+    FakeSchemaRegistryApp,
+    FakeSchemaRegistryServer,
+    FaultInjection,
+    load_exported_catalog,
+)
+from .harness import (
+    BenchmarkResult,
+    compare_results,
+    format_comparisons,
+    format_results,
+    load_results,
+    write_results,
+)
+from .scenarios import SCENARIOS, build_context
+from .synthetic import SCALES, SyntheticCatalogSpec, generate_registry_state
+
+
+def _parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="벤치마크 실행")
+    run.add_argument(
+        "--scale",
+        action="append",
+        choices=sorted(SCALES),
+        help="합성 카탈로그 규모 (반복 지정 가능, 기본값: 1k)",
+    )
+    run.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="실행할 시나리오 (반복 지정 가능, 기본값: 전체)",
+    )
+    run.add_argument("--seed", type=int, default=None, help="합성 데이터 seed 재정의")
+    run.add_argument(
+        "--transport",
+        choices=("memory", "http"),
+        default="memory",
+        help="memory: in-memory client, http: fake Schema Registry 서버 + 실제 client",
+    )
+    run.add_argument(
+        "--registry-latency-ms",
+        type=float,
+        default=0.0,
+        help="합성 Schema Registry 호출당 지연(ms)",
+    )
+    run.add_argument(
+        "--registry-error-rate",
+        type=float,
+        default=0.0,
+        help="fake Schema Registry 에러 응답 비율 (--transport http 전용)",
+    )
+    run.add_argument("--output", type=Path, default=None, help="결과 JSON 저장 경로")
+    run.add_argument("--baseline", type=Path, default=None, help="비교할 baseline JSON")
+    run.add_argument("--threshold", type=float, default=0.15, help="회귀 판정 변화율")
+    run.add_argument("--work-dir", type=Path, default=None, help="임시 SQLite DB 디렉터리")
+
+    serve = subparsers.add_parser("serve", help="fake Schema Registry 서버 실행")
+    source = serve.add_mutually_exclusive_group()
+    source.add_argument("--scale", choices=sorted(SCALES), default="1k", help="합성 카탈로그 규모")
+    source.add_argument("--catalog", type=Path, default=None, help="export된 카탈로그 JSON")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8081)
+    serve.add_argument("--latency-ms", type=float, default=0.0, help="요청당 고정 지연(ms)")
+    serve.add_argument("--jitter-ms", type=float, default=0.0, help="요청당 추가 랜덤 지연(ms)")
+    serve.add_argument("--error-rate", type=float, default=0.0, help="에러 응답 비율 (0~1)")
+    serve.add_argument("--error-status", type=int, default=500, help="주입 에러 HTTP status")
+    serve.add_argument("--seed", type=int, default=None, help="합성 데이터/주입 seed")
+
+    compare = subparsers.add_parser("compare", help="저장된 결과 비교")
+    compare.add_argument("baseline", type=Path)
+    compare.add_argument("current", type=Path)
+    compare.add_argument("--threshold", type=float, default=0.15, help="회귀 판정 변화율")
+
+    return parser.parse_args(argv)
+
+
+async def _run(args: argparse.Namespace) -> list[BenchmarkResult]:
+    scales = args.scale or ["1k"]
+    scenario_names = args.scenario or list(SCENARIOS)
+    results: list[BenchmarkResult] = []
+
+    with tempfile.TemporaryDirectory(prefix="kafka-gov-bench-") as temp_dir:
+        work_dir = args.work_dir or Path(temp_dir)
+        for scale in scales:
+            spec = _resolve_spec(scale, args.seed)
+            state = generate_registry_state(spec)
+            server: FakeSchemaRegistryServer | None = None
+            if args.transport == "http":
+                server = FakeSchemaRegistryServer(
+                    state,
+                    FaultInjection(
+                        latency_ms=args.registry_latency_ms,
+                        error_rate=args.registry_error_rate,
+                        seed=spec.seed,
+                    ),
+                )
+                server.start()
+
+            context = await build_context(
+                scale,
+                spec,
+                work_dir,
+                registry_latency_seconds=args.registry_latency_ms / 1000,
+                state=state,
+                registry_url=server.url if server else None,
+            )
+            try:
+                for name in scenario_names:
+                    print(f"[{scale}] {name} ...", file=sys.stderr)
+                    results.extend(await SCENARIOS[name](context))
+            finally:
+                await context.aclose()
+                if server is not None:
+                    server.stop()
+
+    return results
+
+
+def _resolve_spec(scale: str, seed: int | None) -> SyntheticCatalogSpec:
+    spec = SCALES[scale]
+    return spec if seed is None else replace(spec, seed=seed)
+
+
+def _serve(args: argparse.Namespace) -> int:
+    if args.catalog is not None:
+        state = load_exported_catalog(args.catalog)
+    else:
+        state = generate_registry_state(_resolve_spec(args.scale, args.seed))
+
+    app = FakeSchemaRegistryApp(
+        state,
+        FaultInjection(
+            latency_ms=args.latency_ms,
+            latency_jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            error_status=args.error_status,
+            seed=args.seed,
+        ),
+    )
+    print(
+        f"Fake Schema Registry: {state.subject_count} subjects / {state.version_count} versions "
+        f"on http://{args.host}:{args.port}",
+        file=sys.stderr,
+    )
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning", lifespan="off")
+    return 0
+
+
+def _report_comparison(
+    baseline: list[BenchmarkResult], current: list[BenchmarkResult], threshold: float
+) -> int:
+    comparisons = compare_results(baseline, current, threshold=threshold)
+    print(format_comparisons(comparisons))
+    regressions = [comparison for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) over {threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    # 시나리오 실행 중 애플리케이션 INFO 로그는 측정을 왜곡하므로 억제
+    logging.disable(logging.INFO)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+    if args.command == "serve":
+        return _serve(args)
+    if args.command == "compare":
+        return _report_comparison(
+            load_results(args.baseline), load_results(args.current), args.threshold
+        )
+
+    results = asyncio.run(_run(args))
+    print(format_results(results))
+    if args.output:
+        write_results(args.output, results)
+    if args.baseline:
+        print()
+        return _report_comparison(load_results(args.baseline), results, args.threshold)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
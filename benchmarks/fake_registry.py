@@ -0,0 +1,617 @@
+"""In-process fake Schema Registry 서버
+
+``AsyncSchemaRegistryClient`` 가 사용하는 REST 표면(subjects / versions / register /
+compatibility / config / mode / delete)을 ``SyntheticRegistryState`` 위에 구현한 ASGI 앱.
+uvicorn을 백그라운드 스레드로 띄워 실제 HTTP URL을 제공하므로 ``ConnectionManager`` 에
+레지스트리 URL로 그대로 연결할 수 있다.
+
+- 지연(latency + jitter) / 에러율 주입
+- 합성 생성기(``generate_registry_state``) 또는 export된 카탈로그(JSON)로 초기화
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, unquote
+
+import orjson
+import uvicorn
+
+from .synthetic import SyntheticReference, SyntheticRegistryState, SyntheticSchemaVersion
+
+type Receive = Callable[[], Awaitable[dict[str, Any]]]
+type Send = Callable[[dict[str, Any]], Awaitable[None]]
+type Payload = dict[str, Any] | list[Any] | int
+type Response = tuple[int, Payload]
+
+_CONTENT_TYPE = b"application/vnd.schemaregistry.v1+json"
+_COMPATIBILITY_LEVELS = frozenset(
+    {
+        "NONE",
+        "BACKWARD",
+        "BACKWARD_TRANSITIVE",
+        "FORWARD",
+        "FORWARD_TRANSITIVE",
+        "FULL",
+        "FULL_TRANSITIVE",
+    }
+)
+_MODES = frozenset({"READWRITE", "READONLY", "READONLY_OVERRIDE", "IMPORT"})
+
+
+@dataclass(frozen=True, slots=True)
+class FaultInjection:
+    """요청 단위 지연/에러 주입 설정 - Value Object"""
+
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.latency_ms < 0 or self.latency_jitter_ms < 0:
+            raise ValueError("latency must be >= 0")
+        if not 0.0 <= self.error_rate <= 1.0:
+            raise ValueError("error_rate must be between 0 and 1")
+
+
+class RegistryError(Exception):
+    """Schema Registry 에러 응답 (HTTP status + error_code)"""
+
+    def __init__(self, status: int, error_code: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.error_code = error_code
+        self.message = message
+
+
+def _subject_not_found(subject: str) -> RegistryError:
+    return RegistryError(404, 40401, f"Subject '{subject}' not found.")
+
+
+def _version_not_found(version: int | str) -> RegistryError:
+    return RegistryError(404, 40402, f"Version {version} not found.")
+
+
+class FakeSchemaRegistryApp:
+    """Schema Registry REST API의 ASGI 구현
+
+    subject 이름은 URL 인코딩된 ``/`` 를 포함할 수 있으므로 Starlette 라우터 대신
+    ``raw_path`` 를 세그먼트 단위로 디코딩하여 직접 분기한다.
+    """
+
+    def __init__(self, state: SyntheticRegistryState, faults: FaultInjection | None = None) -> None:
+        self.state = state
+        self.faults = faults or FaultInjection()
+        self.request_count = 0
+        self.injected_errors = 0
+        self._rng = random.Random(self.faults.seed)
+
+    async def __call__(self, scope: dict[str, Any], receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            return
+
+        self.request_count += 1
+        await self._inject_latency()
+
+        if self.faults.error_rate and self._rng.random() < self.faults.error_rate:
+            self.injected_errors += 1
+            status = self.faults.error_status
+            await _send_json(
+                send, status, {"error_code": status * 100 + 1, "message": "Injected fault"}
+            )
+            return
+
+        raw_path = scope.get("raw_path") or scope["path"].encode()
+        segments = [unquote(part) for part in raw_path.decode("latin-1").split("/") if part]
+        query = {
+            key: values[-1]
+            for key, values in parse_qs(scope.get("query_string", b"").decode()).items()
+        }
+        body = await _read_body(receive)
+
+        try:
+            status, payload = self._dispatch(scope["method"], segments, query, body)
+        except RegistryError as exc:
+            status, payload = exc.status, {"error_code": exc.error_code, "message": exc.message}
+        except (orjson.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+            status, payload = 422, {"error_code": 42201, "message": f"Invalid request: {exc}"}
+
+        await _send_json(send, status, payload)
+
+    async def _inject_latency(self) -> None:
+        delay_ms = self.faults.latency_ms
+        if self.faults.latency_jitter_ms:
+            delay_ms += self._rng.uniform(0, self.faults.latency_jitter_ms)
+        if delay_ms:
+            await asyncio.sleep(delay_ms / 1000)
+
+    def _dispatch(
+        self, method: str, segments: list[str], query: dict[str, str], body: bytes
+    ) -> Response:
+        match segments:
+            case ["subjects"] if method == "GET":
+                return 200, list(self.state.subjects)
+            case ["subjects", subject] if method == "POST":
+                return self._lookup_schema(subject, _load_body(body))
+            case ["subjects", subject] if method == "DELETE":
+                return self._delete_subject(subject)
+            case ["subjects", subject, "versions"] if method == "GET":
+                return 200, [registered.version for registered in self._versions(subject)]
+            case ["subjects", subject, "versions"] if method == "POST":
+                return self._register(subject, _load_body(body))
+            case ["subjects", subject, "versions", version] if method == "GET":
+                return 200, _registered_payload(self._get_version(subject, version))
+            case ["subjects", subject, "versions", version] if method == "DELETE":
+                return self._delete_version(subject, version)
+            case ["subjects", subject, "versions", version, "referencedby"] if method == "GET":
+                return self._referenced_by(subject, version)
+            case ["schemas", "types"] if method == "GET":
+                return 200, ["AVRO", "JSON", "PROTOBUF"]
+            case ["schemas", "ids", schema_id] if method == "GET":
+                return 200, _schema_payload(self._get_by_id(schema_id))
+            case ["schemas", "ids", schema_id, "subjects"] if method == "GET":
+                return 200, sorted({item.subject for item in self._find_by_id(schema_id)})
+            case ["schemas", "ids", schema_id, "versions"] if method == "GET":
+                return 200, [
+                    {"subject": item.subject, "version": item.version}
+                    for item in self._find_by_id(schema_id)
+                ]
+            case ["config", *rest] if len(rest) <= 1:
+                return self._config(method, rest[0] if rest else None, query, body)
+            case ["mode", *rest] if len(rest) <= 1:
+                return self._mode(method, rest[0] if rest else None, query, body)
+            case ["compatibility", "subjects", subject, "versions", *rest] if (
+                method == "POST" and len(rest) <= 1
+            ):
+                return self._test_compatibility(
+                    subject, rest[0] if rest else None, query, _load_body(body)
+                )
+        return 404, {"error_code": 404, "message": "HTTP 404 Not Found"}
+
+    # ------------------------------------------------------------------
+    # subjects / versions
+    # ------------------------------------------------------------------
+
+    def _versions(self, subject: str) -> list[SyntheticSchemaVersion]:
+        versions = self.state.subjects.get(subject)
+        if not versions:
+            raise _subject_not_found(subject)
+        return versions
+
+    def _get_version(self, subject: str, version: str) -> SyntheticSchemaVersion:
+        versions = self._versions(subject)
+        if version in ("latest", "-1"):
+            return versions[-1]
+        registered = self.state.get_version(subject, _parse_int(version, "version"))
+        if registered is None:
+            raise _version_not_found(version)
+        return registered
+
+    def _register(self, subject: str, request: dict[str, Any]) -> Response:
+        if self._effective_mode(subject).startswith("READONLY"):
+            raise RegistryError(422, 42205, f"Subject {subject} is in read-only mode")
+
+        schema_str = request.get("schema")
+        if not schema_str:
+            raise RegistryError(422, 42201, "Empty schema")
+        schema_type = request.get("schemaType") or "AVRO"
+        references = self._resolve_references(request.get("references") or [])
+
+        if schema_type == "AVRO":
+            _parse_avro(schema_str)
+            latest = self.state.latest(subject)
+            if latest is not None and latest.schema_str != schema_str:
+                messages = self._incompatibilities(subject, schema_str, schema_type, None)
+                if messages:
+                    raise RegistryError(
+                        409,
+                        409,
+                        "Schema being registered is incompatible with an earlier schema; "
+                        + "; ".join(messages),
+                    )
+
+        registered = self.state.register(subject, schema_str, schema_type, references)
+        return 200, {
+            "id": registered.schema_id,
+            "subject": subject,
+            "version": registered.version,
+        }
+
+    def _lookup_schema(self, subject: str, request: dict[str, Any]) -> Response:
+        versions = self._versions(subject)
+        schema_str = request.get("schema")
+        schema_type = request.get("schemaType") or "AVRO"
+        for registered in versions:
+            if registered.schema_str == schema_str and registered.schema_type == schema_type:
+                return 200, _registered_payload(registered)
+        raise RegistryError(404, 40403, "Schema not found")
+
+    def _delete_subject(self, subject: str) -> Response:
+        self._versions(subject)
+        return 200, self.state.delete_subject(subject)
+
+    def _delete_version(self, subject: str, version: str) -> Response:
+        registered = self._get_version(subject, version)
+        self.state.delete_version(subject, registered.version)
+        return 200, registered.version
+
+    def _referenced_by(self, subject: str, version: str) -> Response:
+        target = self._get_version(subject, version)
+        schema_ids = sorted(
+            {
+                registered.schema_id
+                for versions in self.state.subjects.values()
+                for registered in versions
+                for ref in registered.references
+                if ref.subject == target.subject and ref.version == target.version
+            }
+        )
+        return 200, schema_ids
+
+    def _resolve_references(self, raw_references: list[dict[str, Any]]) -> list[SyntheticReference]:
+        references: list[SyntheticReference] = []
+        for raw in raw_references:
+            reference = SyntheticReference(
+                name=raw["name"], subject=raw["subject"], version=int(raw["version"])
+            )
+            if self.state.get_version(reference.subject, reference.version) is None:
+                raise RegistryError(
+                    422,
+                    42201,
+                    f"Invalid schema reference {reference.subject}:{reference.version}",
+                )
+            references.append(reference)
+        return references
+
+    # ------------------------------------------------------------------
+    # schemas by id
+    # ------------------------------------------------------------------
+
+    def _get_by_id(self, raw_id: str) -> SyntheticSchemaVersion:
+        registered = self.state.schemas_by_id.get(_parse_int(raw_id, "schema id"))
+        if registered is None:
+            raise RegistryError(404, 40403, "Schema not found")
+        return registered
+
+    def _find_by_id(self, raw_id: str) -> list[SyntheticSchemaVersion]:
+        self._get_by_id(raw_id)
+        return self.state.find_by_id(int(raw_id))
+
+    # ------------------------------------------------------------------
+    # config / mode
+    # ------------------------------------------------------------------
+
+    def _config(
+        self, method: str, subject: str | None, query: dict[str, str], body: bytes
+    ) -> Response:
+        if method == "GET":
+            if subject is None:
+                return 200, {"compatibilityLevel": self.state.global_compatibility}
+            level = self.state.compatibility.get(subject)
+            if level is None:
+                if query.get("defaultToGlobal", "").lower() != "true":
+                    raise RegistryError(
+                        404,
+                        40408,
+                        f"Subject '{subject}' does not have subject-level compatibility configured",
+                    )
+                level = self.state.global_compatibility
+            return 200, {"compatibilityLevel": level}
+
+        if method == "PUT":
+            level = str(_load_body(body).get("compatibility", "")).upper()
+            if level not in _COMPATIBILITY_LEVELS:
+                raise RegistryError(422, 42203, f"Invalid compatibility level: {level}")
+            if subject is None:
+                self.state.global_compatibility = level
+            else:
+                self.state.compatibility[subject] = level
+            return 200, {"compatibility": level}
+
+        if method == "DELETE":
+            if subject is None:
+                previous = self.state.global_compatibility
+                self.state.global_compatibility = "BACKWARD"
+            else:
+                previous = self.state.compatibility.pop(subject, None)
+                if previous is None:
+                    raise _subject_not_found(subject)
+            return 200, {"compatibilityLevel": previous}
+
+        return 405, {"error_code": 405, "message": "HTTP 405 Method Not Allowed"}
+
+    def _mode(
+        self, method: str, subject: str | None, query: dict[str, str], body: bytes
+    ) -> Response:
+        if method == "GET":
+            if subject is None:
+                return 200, {"mode": self.state.global_mode}
+            mode = self.state.modes.get(subject)
+            if mode is None:
+                if query.get("defaultToGlobal", "").lower() != "true":
+                    raise RegistryError(
+                        404, 40409, f"Subject '{subject}' does not have subject-level mode"
+                    )
+                mode = self.state.global_mode
+            return 200, {"mode": mode}
+
+        if method == "PUT":
+            mode = str(_load_body(body).get("mode", "")).upper()
+            if mode not in _MODES:
+                raise RegistryError(422, 42204, f"Invalid mode: {mode}")
+            if subject is None:
+                self.state.global_mode = mode
+            else:
+                self.state.modes[subject] = mode
+            return 200, {"mode": mode}
+
+        if method == "DELETE" and subject is not None:
+            previous = self.state.modes.pop(subject, None)
+            if previous is None:
+                raise _subject_not_found(subject)
+            return 200, {"mode": previous}
+
+        return 405, {"error_code": 405, "message": "HTTP 405 Method Not Allowed"}
+
+    def _effective_mode(self, subject: str) -> str:
+        return self.state.modes.get(subject, self.state.global_mode)
+
+    # ------------------------------------------------------------------
+    # compatibility
+    # ------------------------------------------------------------------
+
+    def _test_compatibility(
+        self,
+        subject: str,
+        version: str | None,
+        query: dict[str, str],
+        request: dict[str, Any],
+    ) -> Response:
+        schema_str = request.get("schema")
+        if not schema_str:
+            raise RegistryError(422, 42201, "Empty schema")
+        schema_type = request.get("schemaType") or "AVRO"
+
+        if subject not in self.state.subjects:
+            # 존재하지 않는 subject는 신규 등록으로 간주 (호환)
+            return 200, {"is_compatible": True}
+        if version is not None and version not in ("latest", "-1"):
+            self._get_version(subject, version)
+
+        messages = self._incompatibilities(subject, schema_str, schema_type, version)
+        payload: dict[str, Any] = {"is_compatible": not messages}
+        if query.get("verbose", "").lower() == "true":
+            payload["messages"] = messages
+        return 200, payload
+
+    def _incompatibilities(
+        self, subject: str, schema_str: str, schema_type: str, version: str | None
+    ) -> list[str]:
+        """호환성 수준에 따른 비교 대상 버전과의 Avro record 필드 호환성 위반 목록"""
+        if schema_type != "AVRO":
+            return []
+
+        level = self.state.compatibility.get(subject, self.state.global_compatibility)
+        if level == "NONE":
+            return []
+
+        versions = self._versions(subject)
+        if version not in (None, "latest", "-1"):
+            targets = [self._get_version(subject, str(version))]
+        elif level.endswith("_TRANSITIVE"):
+            targets = list(versions)
+        else:
+            targets = [versions[-1]]
+
+        candidate = _parse_avro(schema_str)
+        messages: list[str] = []
+        for target in targets:
+            existing = _parse_avro(target.schema_str)
+            if level.startswith(("BACKWARD", "FULL")):
+                messages.extend(_avro_read_errors(reader=candidate, writer=existing))
+            if level.startswith(("FORWARD", "FULL")):
+                messages.extend(_avro_read_errors(reader=existing, writer=candidate))
+        return messages
+
+
+def _avro_read_errors(reader: dict[str, Any], writer: dict[str, Any]) -> list[str]:
+    """reader 스키마로 writer 데이터를 읽을 수 있는지 (top-level record 필드 기준 근사)"""
+    if reader.get("type") != "record" or writer.get("type") != "record":
+        return []
+
+    writer_fields = {item["name"]: item for item in writer.get("fields", [])}
+    errors: list[str] = []
+    for item in reader.get("fields", []):
+        name = item["name"]
+        written = writer_fields.get(name)
+        if written is None:
+            if "default" not in item:
+                errors.append(f"READER_FIELD_MISSING_DEFAULT_VALUE: {name}")
+            continue
+        if not _type_readable(item["type"], written["type"]):
+            errors.append(f"TYPE_MISMATCH: {name}")
+    return errors
+
+
+def _type_readable(reader_type: Any, writer_type: Any) -> bool:
+    if reader_type == writer_type:
+        return True
+    if isinstance(reader_type, list):
+        writer_types = writer_type if isinstance(writer_type, list) else [writer_type]
+        return all(candidate in reader_type for candidate in writer_types)
+    return False
+
+
+def _parse_avro(schema_str: str) -> dict[str, Any]:
+    try:
+        parsed = orjson.loads(schema_str)
+    except orjson.JSONDecodeError as exc:
+        raise RegistryError(422, 42201, f"Invalid schema: {exc}") from exc
+    return parsed if isinstance(parsed, dict) else {"type": parsed}
+
+
+def _parse_int(raw: str, label: str) -> int:
+    try:
+        return int(raw)
+    except ValueError as exc:
+        raise RegistryError(422, 42202, f"Invalid {label}: {raw}") from exc
+
+
+def _load_body(body: bytes) -> dict[str, Any]:
+    return orjson.loads(body) if body else {}
+
+
+def _schema_payload(registered: SyntheticSchemaVersion) -> dict[str, Any]:
+    payload: dict[str, Any] = {"schema": registered.schema_str}
+    if registered.schema_type != "AVRO":
+        payload["schemaType"] = registered.schema_type
+    if registered.references:
+        payload["references"] = [
+            {"name": ref.name, "subject": ref.subject, "version": ref.version}
+            for ref in registered.references
+        ]
+    return payload
+
+
+def _registered_payload(registered: SyntheticSchemaVersion) -> dict[str, Any]:
+    return {
+        "subject": registered.subject,
+        "version": registered.version,
+        "id": registered.schema_id,
+        **_schema_payload(registered),
+    }
+
+
+async def _read_body(receive: Receive) -> bytes:
+    chunks: list[bytes] = []
+    while True:
+        message = await receive()
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            return b"".join(chunks)
+
+
+async def _send_json(send: Send, status: int, payload: Payload) -> None:
+    body = orjson.dumps(payload)
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", _CONTENT_TYPE),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+def load_exported_catalog(path: Path) -> SyntheticRegistryState:
+    """export된 카탈로그 JSON으로 상태 구성
+
+    지원 포맷:
+    - Schema Registry ``GET /schemas`` 응답 (``[{subject, version, id, schema, ...}]``)
+    - ``{"schemas": [...], "config": {subject: level}, "compatibilityLevel": "BACKWARD"}``
+    """
+    payload = orjson.loads(path.read_bytes())
+    entries = payload if isinstance(payload, list) else payload.get("schemas", [])
+
+    state = SyntheticRegistryState()
+    for entry in sorted(entries, key=lambda item: (item["subject"], int(item["version"]))):
+        state.restore(
+            SyntheticSchemaVersion(
+                subject=entry["subject"],
+                version=int(entry["version"]),
+                schema_id=int(entry["id"]),
+                schema_str=entry["schema"],
+                schema_type=entry.get("schemaType") or "AVRO",
+                references=[
+                    SyntheticReference(
+                        name=ref["name"], subject=ref["subject"], version=int(ref["version"])
+                    )
+                    for ref in entry.get("references") or []
+                ],
+            )
+        )
+
+    if isinstance(payload, dict):
+        state.compatibility.update(payload.get("config") or {})
+        state.modes.update(payload.get("modes") or {})
+        state.global_compatibility = payload.get("compatibilityLevel", state.global_compatibility)
+        state.global_mode = payload.get("mode", state.global_mode)
+    return state
+
+
+class FakeSchemaRegistryServer:
+    """백그라운드 스레드에서 uvicorn으로 fake Schema Registry를 서빙
+
+    Usage:
+        with FakeSchemaRegistryServer(generate_registry_state(SCALES["1k"])) as server:
+            client = AsyncSchemaRegistryClient({"url": server.url})
+    """
+
+    def __init__(
+        self,
+        state: SyntheticRegistryState,
+        faults: FaultInjection | None = None,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.app = FakeSchemaRegistryApp(state, faults)
+        self.host = host
+        self.port = port
+        self._server: uvicorn.Server | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def start(self, timeout_seconds: float = 10.0) -> str:
+        """서버 기동 후 URL 반환 (port=0이면 임의 포트 할당)"""
+        if self._thread is not None:
+            return self.url
+
+        config = uvicorn.Config(
+            self.app, host=self.host, port=self.port, log_level="warning", lifespan="off"
+        )
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(
+            target=self._server.run, name="fake-schema-registry", daemon=True
+        )
+        self._thread.start()
+
+        deadline = time.monotonic() + timeout_seconds
+        while not self._server.started:
+            if not self._thread.is_alive() or time.monotonic() > deadline:
+                self.stop()
+                raise RuntimeError("Fake Schema Registry failed to start")
+            time.sleep(0.01)
+
+        self.port = self._server.servers[0].sockets[0].getsockname()[1]
+        return self.url
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> FakeSchemaRegistryServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
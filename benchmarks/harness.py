@@ -0,0 +1,191 @@
+"""벤치마크 측정/저장/비교 유틸리티"""
+
+from __future__ import annotations
+
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+# 한 번의 호출이 처리한 항목 수를 반환 (None이면 1건으로 간주)
+type Operation = Callable[[], Awaitable[int | None]]
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkResult:
+    """시나리오 1건의 측정 결과"""
+
+    name: str
+    scale: str
+    iterations: int
+    items: int
+    total_seconds: float
+    ops_per_sec: float
+    p50_ms: float
+    p99_ms: float
+    peak_memory_mb: float
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{self.scale}:{self.name}"
+
+
+@dataclass(frozen=True, slots=True)
+class BenchmarkComparison:
+    """baseline 대비 변화율"""
+
+    key: str
+    metric: str
+    baseline: float
+    current: float
+    change_ratio: float
+    regressed: bool
+
+
+def percentile(samples: list[float], ratio: float) -> float:
+    """nearest-rank 방식 백분위수"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(ratio * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+async def measure(
+    name: str,
+    scale: str,
+    operation: Operation,
+    *,
+    iterations: int,
+    warmup: int = 0,
+    measure_memory: bool = True,
+    extra: dict[str, Any] | None = None,
+) -> BenchmarkResult:
+    """operation을 반복 실행해 처리량/지연/최대 메모리 측정
+
+    메모리 추적(tracemalloc)은 지연 시간을 왜곡하므로 타이밍 측정과 분리하여
+    별도 1회 실행에서만 peak를 기록한다.
+    """
+    for _ in range(warmup):
+        await operation()
+
+    durations: list[float] = []
+    items = 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        processed = await operation()
+        durations.append(time.perf_counter() - start)
+        items += 1 if processed is None else processed
+
+    peak_memory_mb = 0.0
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            await operation()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peak_memory_mb = peak / (1024 * 1024)
+
+    total_seconds = sum(durations)
+    return BenchmarkResult(
+        name=name,
+        scale=scale,
+        iterations=iterations,
+        items=items,
+        total_seconds=round(total_seconds, 6),
+        ops_per_sec=round(items / total_seconds, 3) if total_seconds else 0.0,
+        p50_ms=round(statistics.median(durations) * 1000, 3) if durations else 0.0,
+        p99_ms=round(percentile(durations, 0.99) * 1000, 3),
+        peak_memory_mb=round(peak_memory_mb, 3),
+        extra=dict(extra or {}),
+    )
+
+
+def write_results(path: Path, results: list[BenchmarkResult]) -> None:
+    """결과를 baseline JSON 포맷으로 저장"""
+    payload = {
+        "generated_at": datetime.now(UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+
+
+def load_results(path: Path) -> list[BenchmarkResult]:
+    payload = orjson.loads(path.read_bytes())
+    return [BenchmarkResult(**item) for item in payload.get("results", [])]
+
+
+def compare_results(
+    baseline: list[BenchmarkResult],
+    current: list[BenchmarkResult],
+    *,
+    threshold: float = 0.15,
+) -> list[BenchmarkComparison]:
+    """baseline 대비 처리량 감소 / p99 증가 / 메모리 증가가 threshold를 넘으면 회귀로 판정"""
+    baseline_map = {result.key: result for result in baseline}
+    comparisons: list[BenchmarkComparison] = []
+
+    for result in current:
+        reference = baseline_map.get(result.key)
+        if reference is None:
+            continue
+
+        # (지표, baseline, current, 값이 클수록 좋은지)
+        metrics = (
+            ("ops_per_sec", reference.ops_per_sec, result.ops_per_sec, True),
+            ("p99_ms", reference.p99_ms, result.p99_ms, False),
+            ("peak_memory_mb", reference.peak_memory_mb, result.peak_memory_mb, False),
+        )
+        for metric, before, after, higher_is_better in metrics:
+            if before <= 0:
+                continue
+            change_ratio = (after - before) / before
+            regressed = change_ratio < -threshold if higher_is_better else change_ratio > threshold
+            comparisons.append(
+                BenchmarkComparison(
+                    key=result.key,
+                    metric=metric,
+                    baseline=before,
+                    current=after,
+                    change_ratio=round(change_ratio, 4),
+                    regressed=regressed,
+                )
+            )
+
+    return comparisons
+
+
+def format_results(results: list[BenchmarkResult]) -> str:
+    header = f"{'scenario':<40} {'ops/s':>12} {'p50 ms':>10} {'p99 ms':>10} {'peak MB':>9}"
+    lines = [header, "-" * len(header)]
+    lines.extend(
+        f"{result.key:<40} {result.ops_per_sec:>12.1f} {result.p50_ms:>10.2f} "
+        f"{result.p99_ms:>10.2f} {result.peak_memory_mb:>9.1f}"
+        for result in results
+    )
+    return "\n".join(lines)
+
+
+def format_comparisons(comparisons: list[BenchmarkComparison]) -> str:
+    lines = []
+    for comparison in comparisons:
+        marker = "REGRESSION" if comparison.regressed else "ok"
+        lines.append(
+            f"{comparison.key:<40} {comparison.metric:<15} "
+            f"{comparison.baseline:>12.2f} -> {comparison.current:>12.2f} "
+            f"({comparison.change_ratio:+.1%}) {marker}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,140 @@
+"""In-memory Schema Registry client (AsyncSchemaRegistryClient 호환 subset)
+
+네트워크 없이 ``CatalogSyncService`` / ``ConfluentSchemaRegistryAdapter`` 를
+구동하기 위해 합성 상태(``SyntheticRegistryState``)를 그대로 노출한다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from confluent_kafka.schema_registry import RegisteredSchema, Schema, SchemaReference
+from confluent_kafka.schema_registry.common.schema_registry_client import ServerConfig
+from confluent_kafka.schema_registry.error import SchemaRegistryError
+
+from .synthetic import SyntheticReference, SyntheticRegistryState, SyntheticSchemaVersion
+
+_SUBJECT_NOT_FOUND = 40401
+_VERSION_NOT_FOUND = 40402
+
+
+class InMemorySchemaRegistryClient:
+    """``AsyncSchemaRegistryClient`` 가 제공하는 메서드 중 앱이 사용하는 부분만 구현"""
+
+    def __init__(self, state: SyntheticRegistryState, latency_seconds: float = 0.0) -> None:
+        self.state = state
+        self.latency_seconds = latency_seconds
+        self.call_count = 0
+
+    async def _tick(self) -> None:
+        self.call_count += 1
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        else:
+            await asyncio.sleep(0)
+
+    async def get_subjects(self) -> list[str]:
+        await self._tick()
+        return list(self.state.subjects)
+
+    async def get_versions(self, subject_name: str) -> list[int]:
+        await self._tick()
+        versions = self.state.subjects.get(subject_name)
+        if not versions:
+            raise SchemaRegistryError(
+                404, _SUBJECT_NOT_FOUND, f"Subject '{subject_name}' not found"
+            )
+        return [registered.version for registered in versions]
+
+    async def get_version(self, subject_name: str, version: int) -> RegisteredSchema:
+        await self._tick()
+        registered = self.state.get_version(subject_name, version)
+        if registered is None:
+            raise SchemaRegistryError(404, _VERSION_NOT_FOUND, f"Version {version} not found")
+        return _to_registered_schema(registered)
+
+    async def get_latest_version(self, subject_name: str) -> RegisteredSchema:
+        await self._tick()
+        registered = self.state.latest(subject_name)
+        if registered is None:
+            raise SchemaRegistryError(
+                404, _SUBJECT_NOT_FOUND, f"Subject '{subject_name}' not found"
+            )
+        return _to_registered_schema(registered)
+
+    async def get_config(self, subject_name: str | None = None) -> ServerConfig:
+        await self._tick()
+        level = (
+            self.state.compatibility.get(subject_name, self.state.global_compatibility)
+            if subject_name
+            else self.state.global_compatibility
+        )
+        return ServerConfig.from_dict({"compatibilityLevel": level})
+
+    async def set_config(
+        self, subject_name: str | None = None, config: ServerConfig | None = None
+    ) -> ServerConfig:
+        await self._tick()
+        if config is not None and config.compatibility is not None:
+            level = str(getattr(config.compatibility, "value", config.compatibility))
+            if subject_name:
+                self.state.compatibility[subject_name] = level
+            else:
+                self.state.global_compatibility = level
+        return await self.get_config(subject_name)
+
+    async def get_mode(self, subject_name: str) -> str:
+        await self._tick()
+        return self.state.modes.get(subject_name, self.state.global_mode)
+
+    async def test_compatibility(
+        self, subject_name: str, schema: Schema, version: int | str = "latest"
+    ) -> bool:
+        await self._tick()
+        return True
+
+    async def register_schema(
+        self, subject_name: str, schema: Schema, normalize_schemas: bool = False
+    ) -> int:
+        await self._tick()
+        registered = self.state.register(
+            subject_name,
+            schema.schema_str or "",
+            schema.schema_type or "AVRO",
+            [
+                SyntheticReference(name=ref.name, subject=ref.subject, version=ref.version)
+                for ref in schema.references or []
+                if ref.name and ref.subject and ref.version is not None
+            ],
+        )
+        return registered.schema_id
+
+    async def delete_subject(self, subject_name: str, permanent: bool = False) -> list[int]:
+        await self._tick()
+        return self.state.delete_subject(subject_name)
+
+    async def delete_version(
+        self, subject_name: str, version: int, permanent: bool = False
+    ) -> int | None:
+        await self._tick()
+        return self.state.delete_version(subject_name, version)
+
+    async def aclose(self) -> None:
+        return None
+
+
+def _to_registered_schema(registered: SyntheticSchemaVersion) -> RegisteredSchema:
+    return RegisteredSchema(
+        subject=registered.subject,
+        version=registered.version,
+        schema_id=registered.schema_id,
+        guid=None,
+        schema=Schema(
+            schema_str=registered.schema_str,
+            schema_type=registered.schema_type,
+            references=[
+                SchemaReference(name=ref.name, subject=ref.subject, version=ref.version)
+                for ref in registered.references
+            ],
+        ),
+    )
@@ -0,0 +1,442 @@
+"""벤치마크 시나리오
+
+합성 카탈로그를 대상으로 실제 애플리케이션 코드 경로를 구동한다.
+- CatalogSyncService.sync_all (전체 / 증분)
+- SchemaPlannerService.create_plan
+- 배치 요청 디코딩 (SchemaBatchRequest 모델 경로 / 고속 경로)
+- plan 응답 직렬화 (응답 모델 경로 / 도메인 직접 직렬화)
+- SchemaLintService.lint_avro_schema
+- MySQLSchemaMetadataRepository.search_artifacts
+- GetGovernanceStatsUseCase.execute
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import orjson
+from confluent_kafka.schema_registry import AsyncSchemaRegistryClient
+from sqlalchemy import insert
+
+from app.infra.kafka.schema_registry_adapter import ConfluentSchemaRegistryAdapter
+from app.schema.application.services.catalog_sync import CatalogSyncService
+from app.schema.application.services.schema_lint import SchemaLintService
+from app.schema.application.use_cases.governance.stats import GetGovernanceStatsUseCase
+from app.schema.domain.models import (
+    DomainCompatibilityMode,
+    DomainEnvironment,
+    DomainSchemaBatch,
+    DomainSchemaMetadata,
+    DomainSchemaPlan,
+    DomainSchemaSpec,
+    DomainSchemaType,
+    DomainSubjectStrategy,
+)
+from app.schema.domain.services import SchemaPlannerService
+from app.schema.infrastructure.models import SchemaArtifactModel, SchemaMetadataModel
+from app.schema.infrastructure.repository.mysql_repository import MySQLSchemaMetadataRepository
+from app.schema.interface.adapters import render_plan_response, safe_convert_plan_to_response
+from app.schema.interface.batch_decoder import decode_schema_batch
+from app.shared.database import DatabaseManager
+
+from .harness import BenchmarkResult, measure
+from .registry import InMemorySchemaRegistryClient
+from .synthetic import SyntheticCatalogSpec, SyntheticRegistryState, generate_registry_state
+
+_PLAN_BATCH_SIZE = 100
+_DECODE_BATCH_SIZE = 200  # SchemaBatchRequest.items 최대 개수
+_INSERT_CHUNK_SIZE = 1_000
+
+
+@dataclass(slots=True)
+class BenchmarkContext:
+    """시나리오 공통 실행 환경 (합성 레지스트리 + 임시 SQLite DB)
+
+    ``registry_url`` 이 지정되면 in-memory client 대신 해당 URL(fake Schema Registry
+    서버)에 실제 ``AsyncSchemaRegistryClient`` 로 접속한다.
+    """
+
+    scale: str
+    spec: SyntheticCatalogSpec
+    state: SyntheticRegistryState
+    database_manager: DatabaseManager
+    registry_latency_seconds: float = 0.0
+    registry_url: str | None = None
+    _http_clients: list[AsyncSchemaRegistryClient] = field(default_factory=list)
+
+    def client(self) -> Any:
+        if self.registry_url is None:
+            return InMemorySchemaRegistryClient(
+                self.state, latency_seconds=self.registry_latency_seconds
+            )
+        client = AsyncSchemaRegistryClient({"url": self.registry_url})
+        self._http_clients.append(client)
+        return client
+
+    async def aclose(self) -> None:
+        for client in self._http_clients:
+            await client.aclose()
+        self._http_clients.clear()
+        await self.database_manager.close()
+
+
+class _StaticConnectionManager:
+    """registry_id와 무관하게 동일한 in-memory client를 반환"""
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    async def get_schema_registry_client(self, registry_id: str) -> Any:
+        return self.client
+
+    @asynccontextmanager
+    async def borrow_schema_registry_client(self, registry_id: str) -> AsyncIterator[Any]:
+        yield await self.get_schema_registry_client(registry_id)
+
+
+async def build_context(
+    scale: str,
+    spec: SyntheticCatalogSpec,
+    work_dir: Path,
+    *,
+    registry_latency_seconds: float = 0.0,
+    state: SyntheticRegistryState | None = None,
+    registry_url: str | None = None,
+) -> BenchmarkContext:
+    work_dir.mkdir(parents=True, exist_ok=True)
+    db_path = work_dir / f"bench_{scale}.db"
+    if db_path.exists():
+        db_path.unlink()
+
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{db_path}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    return BenchmarkContext(
+        scale=scale,
+        spec=spec,
+        state=state if state is not None else generate_registry_state(spec),
+        database_manager=database_manager,
+        registry_latency_seconds=registry_latency_seconds,
+        registry_url=registry_url,
+    )
+
+
+async def bench_catalog_sync(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """전체 동기화(빈 카탈로그) 1회 + 증분 동기화(변경 없음) 반복"""
+    client = context.client()
+
+    async def full_sync() -> int:
+        async with context.database_manager.get_db_session() as session:
+            metrics = await CatalogSyncService(client, session).sync_all()
+        return metrics.versions_new
+
+    full = await measure(
+        "catalog_sync.full",
+        context.scale,
+        full_sync,
+        iterations=1,
+        measure_memory=False,
+        extra={"versions": context.state.version_count, "subjects": context.state.subject_count},
+    )
+
+    async def incremental_sync() -> int:
+        async with context.database_manager.get_db_session() as session:
+            metrics = await CatalogSyncService(client, session).sync_all()
+        return metrics.subjects_total
+
+    incremental = await measure(
+        "catalog_sync.incremental",
+        context.scale,
+        incremental_sync,
+        iterations=3,
+    )
+    return [full, incremental]
+
+
+def _evolve_schema(schema_str: str, suffix: int) -> str:
+    schema = orjson.loads(schema_str)
+    schema["fields"].append(
+        {"name": f"bench_field_{suffix}", "type": ["null", "string"], "default": None}
+    )
+    return orjson.dumps(schema).decode()
+
+
+def _build_plan_batches(context: BenchmarkContext, batch_count: int) -> list[DomainSchemaBatch]:
+    prod_subjects = [subject for subject in context.state.subjects if subject.startswith("prod.")]
+    batches: list[DomainSchemaBatch] = []
+    for batch_index in range(batch_count):
+        chunk = prod_subjects[batch_index * _PLAN_BATCH_SIZE : (batch_index + 1) * _PLAN_BATCH_SIZE]
+        if not chunk:
+            break
+        specs = []
+        for subject in chunk:
+            latest = context.state.latest(subject)
+            if latest is None:
+                continue
+            specs.append(
+                DomainSchemaSpec(
+                    subject=subject,
+                    schema_type=DomainSchemaType.AVRO,
+                    compatibility=DomainCompatibilityMode.FULL,
+                    schema=_evolve_schema(latest.schema_str, batch_index),
+                    metadata=DomainSchemaMetadata(owner="team-bench", doc="benchmark"),
+                )
+            )
+        batches.append(
+            DomainSchemaBatch(
+                change_id=f"bench-{context.scale}-{batch_index}",
+                env=DomainEnvironment.PROD,
+                subject_strategy=DomainSubjectStrategy.SUBJECT_NAME,
+                specs=tuple(specs),
+            )
+        )
+    return batches
+
+
+async def bench_planner(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """100개 subject 배치의 create_plan 지연 시간"""
+    batches = _build_plan_batches(context, batch_count=10)
+    planner = SchemaPlannerService(ConfluentSchemaRegistryAdapter(context.client()))  # type: ignore[arg-type]
+    cursor = iter(range(1_000_000))
+
+    async def create_plan() -> int:
+        batch = batches[next(cursor) % len(batches)]
+        plan = await planner.create_plan(batch)
+        return len(plan.items)
+
+    return [
+        await measure(
+            "planner.create_plan",
+            context.scale,
+            create_plan,
+            iterations=len(batches),
+            warmup=1,
+            extra={"batch_size": _PLAN_BATCH_SIZE},
+        )
+    ]
+
+
+def _build_batch_body(context: BenchmarkContext) -> bytes:
+    subjects = [subject for subject in context.state.subjects if subject.startswith("prod.")]
+    items = []
+    for subject in subjects[:_DECODE_BATCH_SIZE]:
+        latest = context.state.latest(subject)
+        if latest is None:
+            continue
+        items.append(
+            {
+                "subject": subject,
+                "type": "AVRO",
+                "compatibility": "FULL",
+                "schema": _evolve_schema(latest.schema_str, 0),
+                "references": [
+                    {"name": ref.name, "subject": ref.subject, "version": ref.version}
+                    for ref in latest.references
+                ],
+                "metadata": {"owner": "team-bench", "tags": ["bench"]},
+                "reason": "benchmark",
+            }
+        )
+    return orjson.dumps(
+        {
+            "kind": "SchemaBatch",
+            "env": "prod",
+            "change_id": f"bench-{context.scale}",
+            "items": items,
+        }
+    )
+
+
+async def bench_batch_decode(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """최대 크기 배치 요청 본문 → DomainSchemaBatch (모델 검증 경로 vs 고속 경로)"""
+    body = _build_batch_body(context)
+    results = []
+    for name, fast_path in (("batch_decode.model", False), ("batch_decode.fast", True)):
+
+        async def decode(fast_path: bool = fast_path) -> int:
+            return len(decode_schema_batch(orjson.loads(body), fast_path=fast_path).batch.specs)
+
+        results.append(
+            await measure(
+                name,
+                context.scale,
+                decode,
+                iterations=50,
+                warmup=3,
+                extra={"body_bytes": len(body)},
+            )
+        )
+    return results
+
+
+async def bench_plan_response(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """대형 plan(배치 10개를 합친 최대 1,000 항목) → 응답 JSON bytes
+
+    ``plan_response.model`` 은 응답 모델 생성 + JSON 덤프만 잰 하한값이다 (FastAPI의
+    response_model 재검증은 포함하지 않음).
+    """
+    planner = SchemaPlannerService(ConfluentSchemaRegistryAdapter(context.client()))  # type: ignore[arg-type]
+    plans = [await planner.create_plan(batch) for batch in _build_plan_batches(context, 10)]
+    plan = DomainSchemaPlan(
+        change_id=f"bench-{context.scale}",
+        env=plans[0].env,
+        items=tuple(item for part in plans for item in part.items),
+        compatibility_reports=tuple(
+            report for part in plans for report in part.compatibility_reports
+        ),
+        impacts=tuple(impact for part in plans for impact in part.impacts),
+    )
+
+    async def model_path() -> int:
+        response = safe_convert_plan_to_response(plan)
+        orjson.dumps(response.model_dump(mode="json", by_alias=True))
+        return len(plan.items)
+
+    async def direct_path() -> int:
+        render_plan_response(plan)
+        return len(plan.items)
+
+    return [
+        await measure(
+            name,
+            context.scale,
+            operation,
+            iterations=20,
+            warmup=2,
+            extra={"plan_items": len(plan.items)},
+        )
+        for name, operation in (
+            ("plan_response.model", model_path),
+            ("plan_response.direct", direct_path),
+        )
+    ]
+
+
+async def bench_lint(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """최신 스키마 샘플(최대 2,000개)에 대한 lint 처리량"""
+    rng = random.Random(context.spec.seed)
+    subjects = list(context.state.subjects)
+    sample = [
+        latest.schema_str
+        for subject in rng.sample(subjects, min(2_000, len(subjects)))
+        if (latest := context.state.latest(subject)) is not None
+    ]
+    service = SchemaLintService()
+    cursor = iter(range(10_000_000))
+
+    async def lint_one() -> int:
+        service.lint_avro_schema(sample[next(cursor) % len(sample)])
+        return 1
+
+    return [
+        await measure(
+            "lint.avro_schema",
+            context.scale,
+            lint_one,
+            iterations=len(sample),
+            extra={"sample_size": len(sample)},
+        )
+    ]
+
+
+async def _seed_artifacts(context: BenchmarkContext) -> None:
+    rows_metadata = []
+    rows_artifacts = []
+    for index, (subject, versions) in enumerate(context.state.subjects.items()):
+        rows_metadata.append(
+            {
+                "subject": subject,
+                "owner": f"team-{index % 25}",
+                "doc": f"{subject} doc",
+                "tags": None,
+                "description": None,
+                "created_by": "bench",
+                "updated_by": "bench",
+            }
+        )
+        rows_artifacts.extend(
+            {
+                "subject": subject,
+                "version": registered.version,
+                "storage_url": None,
+                "checksum": None,
+                "change_id": f"bench-{index}",
+                "schema_type": registered.schema_type,
+                "file_size": len(registered.schema_str),
+            }
+            for registered in versions
+        )
+
+    async with context.database_manager.get_db_session() as session:
+        for offset in range(0, len(rows_metadata), _INSERT_CHUNK_SIZE):
+            await session.execute(
+                insert(SchemaMetadataModel), rows_metadata[offset : offset + _INSERT_CHUNK_SIZE]
+            )
+        for offset in range(0, len(rows_artifacts), _INSERT_CHUNK_SIZE):
+            await session.execute(
+                insert(SchemaArtifactModel), rows_artifacts[offset : offset + _INSERT_CHUNK_SIZE]
+            )
+
+
+async def bench_search(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """부분 문자열 / owner 필터 검색 지연 시간"""
+    await _seed_artifacts(context)
+    repository = MySQLSchemaMetadataRepository(context.database_manager.get_db_session)
+    rng = random.Random(context.spec.seed)
+    queries: list[tuple[str | None, str | None]] = [
+        (rng.choice(("orders", "payments", "users", "event1", "prod.")), None) for _ in range(100)
+    ] + [(None, f"team-{rng.randrange(25)}") for _ in range(100)]
+    cursor = iter(range(1_000_000))
+
+    async def search() -> int:
+        query, owner = queries[next(cursor) % len(queries)]
+        items, _ = await repository.search_artifacts(query=query, owner=owner, limit=20)
+        return 1 if items is not None else 0
+
+    return [
+        await measure(
+            "repository.search_artifacts",
+            context.scale,
+            search,
+            iterations=len(queries),
+            warmup=5,
+        )
+    ]
+
+
+async def bench_governance_stats(context: BenchmarkContext) -> list[BenchmarkResult]:
+    """거버넌스 대시보드 통계 유스케이스 지연 시간"""
+    use_case = GetGovernanceStatsUseCase(
+        connection_manager=_StaticConnectionManager(context.client()),  # type: ignore[arg-type]
+        metadata_repository=MySQLSchemaMetadataRepository(context.database_manager.get_db_session),
+    )
+
+    async def stats() -> int:
+        result = await use_case.execute("bench")
+        return 1 if result.total_subjects else 0
+
+    return [
+        await measure(
+            "usecase.governance_stats",
+            context.scale,
+            stats,
+            iterations=10,
+            warmup=1,
+        )
+    ]
+
+
+SCENARIOS: dict[str, Callable[[BenchmarkContext], Awaitable[list[BenchmarkResult]]]] = {
+    "catalog_sync": bench_catalog_sync,
+    "planner": bench_planner,
+    "batch_decode": bench_batch_decode,
+    "plan_response": bench_plan_response,
+    "lint": bench_lint,
+    "search": bench_search,
+    "governance_stats": bench_governance_stats,
+}
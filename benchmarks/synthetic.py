@@ -0,0 +1,270 @@
+"""합성 Schema Registry 카탈로그 생성기
+
+subject 수 / 버전 수 / 필드 수 / 참조 깊이를 조절하여 재현 가능한(seed 고정)
+Avro 스키마 카탈로그를 만든다. 생성된 ``SyntheticRegistryState`` 는
+in-memory Schema Registry client와 벤치마크 시나리오가 공유하는 저장소다.
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+
+import orjson
+
+_ENVS = ("dev", "stg", "prod")
+_DOMAINS = ("orders", "payments", "users", "inventory", "shipping", "billing", "search", "audit")
+_FIELD_NAMES = (
+    "id",
+    "created_at",
+    "updated_at",
+    "status",
+    "amount",
+    "currency",
+    "email",
+    "phone_number",
+    "customer_name",
+    "address",
+    "quantity",
+    "sku",
+    "region",
+    "score",
+    "payload",
+    "tags",
+)
+_PRIMITIVE_TYPES = ("string", "long", "int", "double", "boolean", "bytes")
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticCatalogSpec:
+    """합성 카탈로그 규모 정의 - Value Object"""
+
+    subjects: int
+    max_versions: int = 5
+    min_fields: int = 5
+    max_fields: int = 40
+    reference_depth: int = 2
+    reference_ratio: float = 0.1
+    seed: int = 42
+
+    def __post_init__(self) -> None:
+        if self.subjects < 1:
+            raise ValueError("subjects must be >= 1")
+        if self.max_versions < 1:
+            raise ValueError("max_versions must be >= 1")
+        if not 1 <= self.min_fields <= self.max_fields:
+            raise ValueError("field range must satisfy 1 <= min_fields <= max_fields")
+        if self.reference_depth < 0:
+            raise ValueError("reference_depth must be >= 0")
+
+
+SCALES: dict[str, SyntheticCatalogSpec] = {
+    "1k": SyntheticCatalogSpec(subjects=1_000),
+    "10k": SyntheticCatalogSpec(subjects=10_000, max_versions=4),
+    "50k": SyntheticCatalogSpec(subjects=50_000, max_versions=3, max_fields=30),
+}
+
+
+@dataclass(slots=True)
+class SyntheticReference:
+    name: str
+    subject: str
+    version: int
+
+
+@dataclass(slots=True)
+class SyntheticSchemaVersion:
+    """등록된 스키마 버전 1건"""
+
+    subject: str
+    version: int
+    schema_id: int
+    schema_str: str
+    schema_type: str = "AVRO"
+    references: list[SyntheticReference] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class SyntheticRegistryState:
+    """합성 Schema Registry 상태 (subject → 버전 목록, 설정, 모드)
+
+    Schema Registry와 같이 동일한 스키마는 subject가 달라도 같은 ID를 공유하고,
+    subject/버전이 삭제되어도 ID는 재사용하지 않는다.
+    """
+
+    subjects: dict[str, list[SyntheticSchemaVersion]] = field(default_factory=dict)
+    schemas_by_id: dict[int, SyntheticSchemaVersion] = field(default_factory=dict)
+    ids_by_schema: dict[tuple[str, str], int] = field(default_factory=dict)
+    compatibility: dict[str, str] = field(default_factory=dict)
+    modes: dict[str, str] = field(default_factory=dict)
+    global_compatibility: str = "BACKWARD"
+    global_mode: str = "READWRITE"
+    next_schema_id: int = 1
+
+    @property
+    def subject_count(self) -> int:
+        return len(self.subjects)
+
+    @property
+    def version_count(self) -> int:
+        return sum(len(versions) for versions in self.subjects.values())
+
+    def latest(self, subject: str) -> SyntheticSchemaVersion | None:
+        versions = self.subjects.get(subject)
+        return versions[-1] if versions else None
+
+    def get_version(self, subject: str, version: int) -> SyntheticSchemaVersion | None:
+        for registered in self.subjects.get(subject, ()):
+            if registered.version == version:
+                return registered
+        return None
+
+    def register(
+        self,
+        subject: str,
+        schema_str: str,
+        schema_type: str = "AVRO",
+        references: list[SyntheticReference] | None = None,
+    ) -> SyntheticSchemaVersion:
+        """스키마 등록 (동일 스키마 재등록 시 기존 버전 반환)"""
+        versions = self.subjects.setdefault(subject, [])
+        for registered in versions:
+            if registered.schema_str == schema_str and registered.schema_type == schema_type:
+                return registered
+
+        schema_id = self.ids_by_schema.get((schema_type, schema_str))
+        if schema_id is None:
+            schema_id = self.next_schema_id
+            self.next_schema_id += 1
+
+        return self.restore(
+            SyntheticSchemaVersion(
+                subject=subject,
+                version=(versions[-1].version + 1) if versions else 1,
+                schema_id=schema_id,
+                schema_str=schema_str,
+                schema_type=schema_type,
+                references=list(references or []),
+            )
+        )
+
+    def restore(self, registered: SyntheticSchemaVersion) -> SyntheticSchemaVersion:
+        """ID/버전을 그대로 유지하여 추가 (export된 카탈로그 적재용)"""
+        versions = self.subjects.setdefault(registered.subject, [])
+        versions.append(registered)
+        versions.sort(key=lambda item: item.version)
+        self.schemas_by_id.setdefault(registered.schema_id, registered)
+        self.ids_by_schema.setdefault(
+            (registered.schema_type, registered.schema_str), registered.schema_id
+        )
+        self.next_schema_id = max(self.next_schema_id, registered.schema_id + 1)
+        return registered
+
+    def find_by_id(self, schema_id: int) -> list[SyntheticSchemaVersion]:
+        """schema ID를 사용하는 모든 subject-version"""
+        return [
+            registered
+            for versions in self.subjects.values()
+            for registered in versions
+            if registered.schema_id == schema_id
+        ]
+
+    def delete_subject(self, subject: str) -> list[int]:
+        versions = self.subjects.pop(subject, [])
+        self.compatibility.pop(subject, None)
+        self.modes.pop(subject, None)
+        return [registered.version for registered in versions]
+
+    def delete_version(self, subject: str, version: int) -> int | None:
+        versions = self.subjects.get(subject)
+        if not versions:
+            return None
+        for index, registered in enumerate(versions):
+            if registered.version == version:
+                del versions[index]
+                if not versions:
+                    del self.subjects[subject]
+                return version
+        return None
+
+
+def build_avro_schema(
+    name: str,
+    namespace: str,
+    field_count: int,
+    rng: random.Random,
+    *,
+    referenced_types: list[str] | None = None,
+    extra_fields: int = 0,
+) -> dict[str, object]:
+    """필드 수/참조 타입을 지정한 Avro record 스키마 dict 생성"""
+    fields: list[dict[str, object]] = []
+    for index in range(field_count + extra_fields):
+        base_name = _FIELD_NAMES[index % len(_FIELD_NAMES)]
+        field_name = base_name if index < len(_FIELD_NAMES) else f"{base_name}_{index}"
+        field_type: object = rng.choice(_PRIMITIVE_TYPES)
+        entry: dict[str, object] = {"name": field_name, "type": field_type}
+        if index >= field_count:
+            # 진화된 버전에서 추가되는 필드는 호환성을 위해 optional + default
+            entry = {"name": field_name, "type": ["null", field_type], "default": None}
+        elif rng.random() < 0.3:
+            entry["doc"] = f"{field_name} field"
+        fields.append(entry)
+
+    for index, type_name in enumerate(referenced_types or []):
+        fields.append({"name": f"ref_{index}", "type": ["null", type_name], "default": None})
+
+    return {
+        "type": "record",
+        "name": name,
+        "namespace": namespace,
+        "doc": f"Synthetic {name} schema",
+        "fields": fields,
+    }
+
+
+def generate_registry_state(spec: SyntheticCatalogSpec) -> SyntheticRegistryState:
+    """규모 정의에 따라 합성 Schema Registry 상태 생성 (seed 고정 → 재현 가능)"""
+    rng = random.Random(spec.seed)
+    state = SyntheticRegistryState()
+    # 참조 체인: 일부 subject는 직전 subject들을 reference_depth 만큼 참조
+    recent_subjects: list[tuple[str, str]] = []
+
+    for index in range(spec.subjects):
+        env = _ENVS[index % len(_ENVS)]
+        domain = _DOMAINS[(index // len(_ENVS)) % len(_DOMAINS)]
+        subject = f"{env}.{domain}.event{index}-value"
+        record_name = f"Event{index}"
+        namespace = f"com.example.{domain}"
+        field_count = rng.randint(spec.min_fields, spec.max_fields)
+        version_count = rng.randint(1, spec.max_versions)
+
+        references: list[SyntheticReference] = []
+        referenced_types: list[str] = []
+        if spec.reference_depth and recent_subjects and rng.random() < spec.reference_ratio:
+            for ref_subject, ref_type in recent_subjects[-spec.reference_depth :]:
+                references.append(SyntheticReference(name=ref_type, subject=ref_subject, version=1))
+                referenced_types.append(ref_type)
+
+        for version_index in range(version_count):
+            # 버전마다 같은 seed로 기본 필드를 재생성 → 버전 간 필드 타입 유지
+            schema = build_avro_schema(
+                record_name,
+                namespace,
+                field_count,
+                random.Random(f"{spec.seed}-{index}"),
+                referenced_types=referenced_types,
+                extra_fields=version_index,
+            )
+            state.register(
+                subject,
+                orjson.dumps(schema).decode(),
+                references=references,
+            )
+
+        state.compatibility[subject] = "FULL" if env == "prod" else "BACKWARD"
+        recent_subjects.append((subject, f"{namespace}.{record_name}"))
+        if len(recent_subjects) > max(spec.reference_depth, 1):
+            recent_subjects.pop(0)
+
+    return state
@@ -83,7 +83,7 @@ export interface SchemaVersionCompareResponse {
 
 export interface SchemaDriftResponse {
     subject: string;
-    registry_latest_version: number;
+    registry_latest_version: number | null;
     registry_canonical_hash: string | null;
     catalog_latest_version: number | null;
     catalog_canonical_hash: string | null;
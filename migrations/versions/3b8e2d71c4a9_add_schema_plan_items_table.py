@@ -0,0 +1,67 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+revision: str = "3b8e2d71c4a9"
+down_revision: str | Sequence[str] | None = "6f5f0c8f6c1f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_BACKFILL_CHUNK_SIZE = 1_000
+
+
+def upgrade() -> None:
+    plan_items = op.create_table(
+        "schema_plan_items",
+        sa.Column("change_id", sa.String(length=100), nullable=False, comment="변경 ID"),
+        sa.Column("subject", sa.String(length=255), nullable=False, comment="Subject 이름"),
+        sa.Column("action", sa.String(length=20), nullable=False, comment="계획 액션"),
+        sa.Column("reason", sa.Text(), nullable=True, comment="변경 사유"),
+        sa.Column("target_version", sa.Integer(), nullable=True, comment="대상 버전"),
+        sa.PrimaryKeyConstraint("change_id", "subject", name=op.f("pk_schema_plan_items")),
+    )
+    op.create_index(
+        "idx_schema_plan_items_subject",
+        "schema_plan_items",
+        ["subject"],
+        unique=False,
+    )
+
+    # 기존 plan_data.items 백필
+    schema_plans = sa.table(
+        "schema_plans",
+        sa.column("change_id", sa.String()),
+        sa.column("plan_data", sa.JSON()),
+    )
+    bind = op.get_bind()
+    rows: list[dict[str, object]] = []
+    for change_id, plan_data in bind.execute(
+        sa.select(schema_plans.c.change_id, schema_plans.c.plan_data)
+    ):
+        items = {
+            item["subject"]: item
+            for item in (plan_data or {}).get("items", [])
+            if isinstance(item, dict) and isinstance(item.get("subject"), str)
+        }
+        rows.extend(
+            {
+                "change_id": change_id,
+                "subject": subject,
+                "action": str(item.get("action") or "UNKNOWN"),
+                "reason": item.get("reason") or None,
+                "target_version": item.get("target_version"),
+            }
+            for subject, item in items.items()
+        )
+        if len(rows) >= _BACKFILL_CHUNK_SIZE:
+            op.bulk_insert(plan_items, rows)
+            rows = []
+    if rows:
+        op.bulk_insert(plan_items, rows)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_schema_plan_items_subject", table_name="schema_plan_items")
+    op.drop_table("schema_plan_items")
@@ -0,0 +1,46 @@
+from collections.abc import Sequence
+from datetime import UTC, date, datetime
+
+from alembic import op
+
+revision: str = "5c7a1e9d3f20"
+down_revision: str | Sequence[str] | None = "8d41c9e0a7b2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLE = "schema_audit_logs"
+_MONTHS_AHEAD = 3
+
+
+def _add_months(value: date, months: int) -> date:
+    month_index = value.month - 1 + months
+    return value.replace(year=value.year + month_index // 12, month=month_index % 12 + 1)
+
+
+def _partition_clause() -> str:
+    """현재 월 이전(p_legacy) + 현재/향후 월 + pmax 파티션 정의"""
+    current_month = datetime.now(UTC).date().replace(day=1)
+    partitions = [f"PARTITION p_legacy VALUES LESS THAN (TO_DAYS('{current_month:%Y-%m-%d}'))"]
+    for offset in range(_MONTHS_AHEAD + 1):
+        month = _add_months(current_month, offset)
+        upper = _add_months(month, 1)
+        partitions.append(f"PARTITION p{month:%Y%m} VALUES LESS THAN (TO_DAYS('{upper:%Y-%m-%d}'))")
+    partitions.append("PARTITION pmax VALUES LESS THAN MAXVALUE")
+    return f"PARTITION BY RANGE (TO_DAYS(timestamp)) ({', '.join(partitions)})"
+
+
+def upgrade() -> None:
+    op.create_index("idx_schema_audit_logs_timestamp", _TABLE, ["timestamp"], unique=False)
+
+    if op.get_bind().dialect.name != "mysql":
+        return
+    # 파티션 키는 모든 unique 키에 포함되어야 하므로 PK를 (id, timestamp)로 확장
+    op.execute(f"ALTER TABLE {_TABLE} DROP PRIMARY KEY, ADD PRIMARY KEY (id, timestamp)")
+    op.execute(f"ALTER TABLE {_TABLE} {_partition_clause()}")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "mysql":
+        op.execute(f"ALTER TABLE {_TABLE} REMOVE PARTITIONING")
+        op.execute(f"ALTER TABLE {_TABLE} DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
+    op.drop_index("idx_schema_audit_logs_timestamp", table_name=_TABLE)
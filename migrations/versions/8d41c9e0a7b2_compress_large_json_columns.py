@@ -0,0 +1,92 @@
+from collections.abc import Sequence
+
+import orjson
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import mysql
+
+from app.shared.compressed_json import decode_json, encode_json, is_compressed
+
+
+revision: str = "8d41c9e0a7b2"
+down_revision: str | Sequence[str] | None = "3b8e2d71c4a9"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (테이블, 기본 키 컬럼, JSON 컬럼, nullable, 코멘트)
+_COLUMNS = (
+    ("schema_plans", "change_id", "plan_data", False, "계획 데이터 (JSON, 대용량은 압축)"),
+    (
+        "schema_apply_results",
+        "change_id",
+        "result_data",
+        False,
+        "적용 결과 (JSON, 대용량은 압축)",
+    ),
+    ("schema_audit_logs", "id", "snapshot", True, "스냅샷 (JSON, 대용량은 압축)"),
+)
+_REWRITE_CHUNK_SIZE = 500
+
+
+def _binary_type() -> sa.types.TypeEngine:
+    return sa.LargeBinary().with_variant(mysql.LONGBLOB(), "mysql")
+
+
+def _rewrite(table_name: str, key_column: str, column: str, *, compress: bool) -> None:
+    """기존 행을 (압축 / 평문) 포맷으로 다시 기록"""
+    table = sa.table(table_name, sa.column(key_column), sa.column(column, sa.LargeBinary()))
+    bind = op.get_bind()
+    updates: list[dict[str, object]] = []
+
+    def flush() -> None:
+        if updates:
+            bind.execute(
+                table.update()
+                .where(table.c[key_column] == sa.bindparam("_key"))
+                .values({column: sa.bindparam("_value")}),
+                updates,
+            )
+            updates.clear()
+
+    for key, raw in bind.execute(sa.select(table.c[key_column], table.c[column])):
+        if raw is None:
+            continue
+        raw_bytes = raw.encode() if isinstance(raw, str) else bytes(raw)
+        if compress:
+            encoded = encode_json(decode_json(raw_bytes))
+            if encoded == raw_bytes:
+                continue
+        elif is_compressed(raw_bytes):
+            encoded = orjson.dumps(decode_json(raw_bytes))
+        else:
+            continue
+        updates.append({"_key": key, "_value": encoded})
+        if len(updates) >= _REWRITE_CHUNK_SIZE:
+            flush()
+    flush()
+
+
+def upgrade() -> None:
+    for table_name, key_column, column, nullable, comment in _COLUMNS:
+        # 기존 JSON 텍스트는 그대로 binary로 변환되어 평문 payload로 읽힌다
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=sa.JSON(),
+                type_=_binary_type(),
+                existing_nullable=nullable,
+                comment=comment,
+            )
+        _rewrite(table_name, key_column, column, compress=True)
+
+
+def downgrade() -> None:
+    for table_name, key_column, column, nullable, _comment in _COLUMNS:
+        _rewrite(table_name, key_column, column, compress=False)
+        with op.batch_alter_table(table_name) as batch_op:
+            batch_op.alter_column(
+                column,
+                existing_type=_binary_type(),
+                type_=sa.JSON(),
+                existing_nullable=nullable,
+            )
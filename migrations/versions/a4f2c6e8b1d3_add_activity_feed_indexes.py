@@ -0,0 +1,31 @@
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "a4f2c6e8b1d3"
+down_revision: str | Sequence[str] | None = "5c7a1e9d3f20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (인덱스, 테이블, 컬럼) - 활동 피드 keyset 페이지네이션용
+# (status, requested_at) 인덱스는 a6f4f39b9c12에서 이미 만든다
+_INDEXES = (
+    ("idx_schema_audit_logs_status_timestamp", "schema_audit_logs", ["status", "timestamp"]),
+    ("idx_schema_audit_logs_target_timestamp", "schema_audit_logs", ["target", "timestamp"]),
+    ("idx_approval_requests_requested_at", "approval_requests", ["requested_at"]),
+    (
+        "idx_approval_requests_resource_requested_at",
+        "approval_requests",
+        ["resource_name", "requested_at"],
+    ),
+)
+
+
+def upgrade() -> None:
+    for index_name, table_name, columns in _INDEXES:
+        op.create_index(index_name, table_name, columns, unique=False)
+
+
+def downgrade() -> None:
+    for index_name, table_name, _columns in reversed(_INDEXES):
+        op.drop_index(index_name, table_name=table_name)
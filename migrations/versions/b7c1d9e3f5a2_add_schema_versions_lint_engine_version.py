@@ -0,0 +1,29 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "b7c1d9e3f5a2"
+down_revision: str | Sequence[str] | None = "e6b0d2f4a8c5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "schema_versions",
+        sa.Column(
+            "lint_engine_version",
+            sa.Integer(),
+            nullable=True,
+            comment="lint_report를 만든 lint 엔진 버전 (NULL이면 미실행)",
+        ),
+    )
+    op.create_index(
+        "idx_lint_engine_version", "schema_versions", ["lint_engine_version"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_lint_engine_version", table_name="schema_versions")
+    op.drop_column("schema_versions", "lint_engine_version")
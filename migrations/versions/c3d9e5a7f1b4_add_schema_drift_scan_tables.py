@@ -0,0 +1,63 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "c3d9e5a7f1b4"
+down_revision: str | Sequence[str] | None = "a4f2c6e8b1d3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "schema_drift_scans",
+        sa.Column("registry_id", sa.String(length=100), nullable=False, comment="Registry ID"),
+        sa.Column("scanned_at", sa.DateTime(timezone=True), nullable=False, comment="스캔 시각"),
+        sa.Column("subjects_scanned", sa.Integer(), nullable=False, comment="스캔한 subject 수"),
+        sa.Column(
+            "drifted_subjects", sa.Integer(), nullable=False, comment="drift가 있는 subject 수"
+        ),
+        sa.Column(
+            "failed_subjects", sa.JSON(), nullable=True, comment="SR 조회에 실패한 subject 목록"
+        ),
+        sa.Column("duration_ms", sa.Float(), nullable=False, comment="스캔 소요 시간(ms)"),
+        sa.PrimaryKeyConstraint("registry_id", name=op.f("pk_schema_drift_scans")),
+    )
+    op.create_table(
+        "schema_drift_findings",
+        sa.Column("registry_id", sa.String(length=100), nullable=False, comment="Registry ID"),
+        sa.Column("subject", sa.String(length=512), nullable=False, comment="Subject 이름"),
+        sa.Column(
+            "registry_latest_version",
+            sa.Integer(),
+            nullable=True,
+            comment="라이브 최신 버전 (SR에서 사라진 subject는 NULL)",
+        ),
+        sa.Column(
+            "registry_canonical_hash",
+            sa.String(length=64),
+            nullable=True,
+            comment="라이브 최신 canonical hash",
+        ),
+        sa.Column(
+            "catalog_latest_version", sa.Integer(), nullable=True, comment="catalog 최신 버전"
+        ),
+        sa.Column(
+            "catalog_canonical_hash",
+            sa.String(length=64),
+            nullable=True,
+            comment="catalog canonical hash",
+        ),
+        sa.Column("observed_version", sa.Integer(), nullable=True, comment="관측된 사용 버전"),
+        sa.Column(
+            "last_synced_at", sa.String(length=40), nullable=True, comment="catalog 동기화 시각"
+        ),
+        sa.Column("drift_flags", sa.JSON(), nullable=False, comment="drift 세부 플래그"),
+        sa.PrimaryKeyConstraint("registry_id", "subject", name=op.f("pk_schema_drift_findings")),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("schema_drift_findings")
+    op.drop_table("schema_drift_scans")
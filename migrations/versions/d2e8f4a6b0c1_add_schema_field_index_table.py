@@ -0,0 +1,65 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "d2e8f4a6b0c1"
+down_revision: str | Sequence[str] | None = "b7c1d9e3f5a2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "schema_field_index",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("subject", sa.String(length=512), nullable=False, comment="Subject 이름"),
+        sa.Column("version", sa.Integer(), nullable=False, comment="버전 번호"),
+        sa.Column(
+            "field_path", sa.String(length=1024), nullable=False, comment="점(.)으로 이은 필드 경로"
+        ),
+        sa.Column("field_name", sa.String(length=255), nullable=False, comment="필드 이름 (원본)"),
+        sa.Column(
+            "name_key",
+            sa.String(length=255),
+            nullable=False,
+            comment="검색용 필드 이름 (camelCase → snake_case 소문자)",
+        ),
+        sa.Column(
+            "field_type",
+            sa.String(length=255),
+            nullable=False,
+            comment="필드 타입 (nullable union은 null 제외 타입, named type은 이름)",
+        ),
+        sa.Column("logical_type", sa.String(length=50), nullable=True, comment="Avro logicalType"),
+        sa.Column("nullable", sa.Boolean(), nullable=False, comment="null 허용 여부"),
+        sa.Column("has_default", sa.Boolean(), nullable=False, comment="default 존재 여부"),
+        sa.Column("has_doc", sa.Boolean(), nullable=False, comment="doc 존재 여부"),
+        sa.Column("depth", sa.Integer(), nullable=False, comment="중첩 깊이 (최상위 0)"),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_schema_field_index")),
+    )
+    op.create_index(
+        "idx_field_index_name",
+        "schema_field_index",
+        ["name_key", "subject", "version"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_field_index_type",
+        "schema_field_index",
+        ["field_type", "subject", "version"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_field_index_subject_version",
+        "schema_field_index",
+        ["subject", "version"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_field_index_subject_version", table_name="schema_field_index")
+    op.drop_index("idx_field_index_type", table_name="schema_field_index")
+    op.drop_index("idx_field_index_name", table_name="schema_field_index")
+    op.drop_table("schema_field_index")
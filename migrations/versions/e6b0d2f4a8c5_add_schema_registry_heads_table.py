@@ -0,0 +1,42 @@
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "e6b0d2f4a8c5"
+down_revision: str | Sequence[str] | None = "c3d9e5a7f1b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "schema_registry_heads",
+        sa.Column("registry_id", sa.String(length=100), nullable=False, comment="Registry ID"),
+        sa.Column("subject", sa.String(length=512), nullable=False, comment="Subject 이름"),
+        sa.Column("version", sa.Integer(), nullable=False, comment="최신 버전 번호"),
+        sa.Column("schema_id", sa.Integer(), nullable=True, comment="SR 스키마 ID"),
+        sa.Column("schema_type", sa.String(length=20), nullable=True, comment="스키마 타입"),
+        sa.Column("canonical_hash", sa.String(length=64), nullable=True, comment="정규화 해시"),
+        sa.Column("schema_str", sa.Text(), nullable=True, comment="스키마 본문 (구조 diff용)"),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False, comment="수집 시각"),
+        sa.PrimaryKeyConstraint("registry_id", "subject", name=op.f("pk_schema_registry_heads")),
+    )
+    op.create_index(
+        "idx_registry_heads_subject_hash",
+        "schema_registry_heads",
+        ["subject", "canonical_hash"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_registry_heads_refreshed",
+        "schema_registry_heads",
+        ["registry_id", "refreshed_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_registry_heads_refreshed", table_name="schema_registry_heads")
+    op.drop_index("idx_registry_heads_subject_hash", table_name="schema_registry_heads")
+    op.drop_table("schema_registry_heads")
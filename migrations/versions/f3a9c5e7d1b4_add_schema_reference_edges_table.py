@@ -0,0 +1,91 @@
+from collections.abc import Sequence
+
+import orjson
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "f3a9c5e7d1b4"
+down_revision: str | Sequence[str] | None = "d2e8f4a6b0c1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_BACKFILL_CHUNK_SIZE = 1000
+
+
+def _backfill_edges() -> None:
+    """기존 schema_versions.references(JSON)로 참조 간선을 채운다"""
+    versions = sa.table(
+        "schema_versions",
+        sa.column("subject"),
+        sa.column("version"),
+        sa.column("references", sa.Text()),
+    )
+    edges = sa.table(
+        "schema_reference_edges",
+        sa.column("subject"),
+        sa.column("version"),
+        sa.column("ref_name"),
+        sa.column("ref_subject"),
+        sa.column("ref_version"),
+    )
+    bind = op.get_bind()
+    rows: list[dict[str, object]] = []
+
+    def flush() -> None:
+        if rows:
+            bind.execute(edges.insert(), rows)
+            rows.clear()
+
+    for subject, version, raw in bind.execute(
+        sa.select(versions.c.subject, versions.c.version, versions.c.references).where(
+            versions.c.references.is_not(None)
+        )
+    ):
+        references = orjson.loads(raw) if isinstance(raw, str | bytes) else raw
+        for reference in references or []:
+            rows.append(
+                {
+                    "subject": subject,
+                    "version": version,
+                    "ref_name": reference["name"],
+                    "ref_subject": reference["subject"],
+                    "ref_version": reference["version"],
+                }
+            )
+        if len(rows) >= _BACKFILL_CHUNK_SIZE:
+            flush()
+    flush()
+
+
+def upgrade() -> None:
+    op.create_table(
+        "schema_reference_edges",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("subject", sa.String(length=512), nullable=False, comment="참조하는 Subject"),
+        sa.Column("version", sa.Integer(), nullable=False, comment="참조하는 버전"),
+        sa.Column(
+            "ref_name", sa.String(length=512), nullable=False, comment="참조 이름 (import 이름)"
+        ),
+        sa.Column("ref_subject", sa.String(length=512), nullable=False, comment="참조되는 Subject"),
+        sa.Column("ref_version", sa.Integer(), nullable=False, comment="참조되는 버전"),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_schema_reference_edges")),
+    )
+    op.create_index(
+        "idx_reference_edges_subject_version",
+        "schema_reference_edges",
+        ["subject", "version"],
+        unique=False,
+    )
+    op.create_index(
+        "idx_reference_edges_ref_subject",
+        "schema_reference_edges",
+        ["ref_subject"],
+        unique=False,
+    )
+    _backfill_edges()
+
+
+def downgrade() -> None:
+    op.drop_index("idx_reference_edges_ref_subject", table_name="schema_reference_edges")
+    op.drop_index("idx_reference_edges_subject_version", table_name="schema_reference_edges")
+    op.drop_table("schema_reference_edges")
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from app.schema.governance_support.infrastructure.models import ApprovalRequestModel
+from app.schema.governance_support.infrastructure.repository import (
+    MySQLAuditActivityRepository,
+)
+from app.schema.infrastructure.models import SchemaAuditLogModel
+from app.shared.database import DatabaseManager
+
+
+@pytest.mark.asyncio
+async def test_activity_feed_pages_with_keyset_cursor(tmp_path: Path) -> None:
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'feed.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    repository = MySQLAuditActivityRepository(database_manager.get_db_session)
+    base = datetime(2026, 1, 1, 12, 0, 0)
+
+    try:
+        async with database_manager.get_db_session() as session:
+            # 같은 timestamp가 소스 안/소스 간에 겹쳐도 순서가 결정적이어야 한다
+            for index in range(5):
+                timestamp = base - timedelta(days=index // 2)
+                session.add(
+                    SchemaAuditLogModel(
+                        change_id=f"chg-{index}",
+                        action="APPLY",
+                        target=f"prod.s{index}-value",
+                        actor="tester",
+                        status="COMPLETED",
+                        timestamp=timestamp,
+                    )
+                )
+                session.add(
+                    ApprovalRequestModel(
+                        request_id=f"req-{index}",
+                        resource_type="schema",
+                        resource_name=f"prod.s{index}-value",
+                        change_type="apply",
+                        summary="apply",
+                        justification="test",
+                        requested_by="tester",
+                        status="pending",
+                        requested_at=timestamp,
+                    )
+                )
+            session.add(
+                SchemaAuditLogModel(
+                    change_id="chg-failed",
+                    action="APPLY",
+                    target="prod.failed-value",
+                    actor="tester",
+                    status="FAILED",
+                    timestamp=base,
+                )
+            )
+
+        full = await repository.get_activity_page(limit=50)
+        paged = []
+        cursor = None
+        pages = 0
+        while True:
+            page = await repository.get_activity_page(limit=3, cursor=cursor)
+            paged.extend(page.items)
+            pages += 1
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        by_target = await repository.get_activity_page(target="prod.s3-value", limit=10)
+        with pytest.raises(ValueError):
+            await repository.get_activity_page(cursor="not-a-cursor")
+    finally:
+        await database_manager.close()
+
+    def key(activity):
+        return (activity.activity_type, activity.target)
+
+    assert len(full.items) == 10
+    assert full.next_cursor is None
+    assert pages == 4
+    assert [key(item) for item in paged] == [key(item) for item in full.items]
+    assert [item.timestamp for item in paged] == sorted(
+        (item.timestamp for item in paged), reverse=True
+    )
+    assert {item.activity_type for item in by_target.items} == {"schema", "approval"}
+    assert {item.target for item in by_target.items} == {"prod.s3-value"}
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import cast
 
@@ -30,10 +31,10 @@ from app.schema.domain.repositories.interfaces import (
     ISchemaMetadataRepository,
 )
 from app.schema.domain.services import SchemaPlannerService
-from app.schema.governance_support.use_cases import CreateApprovalRequestUseCase
 from app.schema.governance_support.approval import ApprovalRequiredError
-from app.shared.database import DatabaseManager
 from app.schema.governance_support.infrastructure.repository import SQLApprovalRequestRepository
+from app.schema.governance_support.use_cases import CreateApprovalRequestUseCase
+from app.shared.database import DatabaseManager
 
 
 class _SchemaAuditRepository:
@@ -60,6 +61,10 @@ class _SchemaConnectionManager:
         _ = registry_id
         return object()
 
+    @asynccontextmanager
+    async def borrow_schema_registry_client(self, registry_id: str) -> AsyncIterator[object]:
+        yield await self.get_schema_registry_client(registry_id)
+
 
 @pytest.fixture
 async def approval_repository(tmp_path: Path) -> AsyncGenerator[SQLApprovalRequestRepository, None]:
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import gzip
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import orjson
+import pytest
+from sqlalchemy import select
+
+from app.schema.governance_support.infrastructure.repository import (
+    MySQLAuditActivityRepository,
+    MySQLAuditArchiveRepository,
+)
+from app.schema.governance_support.use_cases import ArchiveAuditLogsUseCase
+from app.schema.infrastructure.models import SchemaAuditLogModel
+from app.shared.database import DatabaseManager
+
+
+def _log(change_id: str, timestamp: datetime) -> SchemaAuditLogModel:
+    return SchemaAuditLogModel(
+        change_id=change_id,
+        action="APPLY",
+        target="prod.orders-value",
+        actor="tester",
+        status="COMPLETED",
+        message=None,
+        snapshot={"change_id": change_id},
+        timestamp=timestamp,
+    )
+
+
+@pytest.mark.asyncio
+async def test_archive_moves_expired_logs_to_ndjson(tmp_path: Path) -> None:
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'audit.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    now = datetime.now(UTC)
+    use_case = ArchiveAuditLogsUseCase(
+        MySQLAuditArchiveRepository(database_manager.get_db_session),
+        archive_dir=str(tmp_path / "archive"),
+        batch_size=2,
+    )
+
+    try:
+        async with database_manager.get_db_session() as session:
+            session.add_all(
+                [
+                    _log("chg-old-1", now - timedelta(days=400)),
+                    _log("chg-old-2", now - timedelta(days=300)),
+                    _log("chg-old-3", now - timedelta(days=200)),
+                    _log("chg-new", now - timedelta(days=1)),
+                ]
+            )
+
+        result = await use_case.execute(retention_days=180)
+
+        async with database_manager.get_db_session() as session:
+            remaining = (await session.scalars(select(SchemaAuditLogModel.change_id))).all()
+        activities = await MySQLAuditActivityRepository(
+            database_manager.get_db_session
+        ).get_recent_activities(limit=5)
+    finally:
+        await database_manager.close()
+
+    archived = [
+        orjson.loads(line)
+        for path in result.files
+        for line in gzip.decompress(Path(path).read_bytes()).splitlines()
+    ]
+    assert result.rows_archived == 3
+    assert len(result.files) == 3
+    assert all(Path(path).name.endswith(".ndjson.gz") for path in result.files)
+    assert sorted(row["change_id"] for row in archived) == ["chg-old-1", "chg-old-2", "chg-old-3"]
+    assert archived[0]["snapshot"] == {"change_id": archived[0]["change_id"]}
+    assert result.partitions_created == result.partitions_dropped == ()
+    assert remaining == ["chg-new"]
+    assert [activity.target for activity in activities] == ["prod.orders-value"]
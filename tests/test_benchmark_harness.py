@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from benchmarks.harness import BenchmarkResult, compare_results, load_results, write_results
+from benchmarks.scenarios import bench_catalog_sync, build_context
+from benchmarks.synthetic import SyntheticCatalogSpec, generate_registry_state
+
+
+def _result(ops_per_sec: float, p99_ms: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        name="planner.create_plan",
+        scale="1k",
+        iterations=10,
+        items=1000,
+        total_seconds=1.0,
+        ops_per_sec=ops_per_sec,
+        p50_ms=1.0,
+        p99_ms=p99_ms,
+        peak_memory_mb=1.0,
+    )
+
+
+def test_synthetic_catalog_is_reproducible() -> None:
+    spec = SyntheticCatalogSpec(subjects=50, max_versions=3, seed=7)
+
+    first = generate_registry_state(spec)
+    second = generate_registry_state(spec)
+
+    assert first.subject_count == 50
+    assert list(first.subjects) == list(second.subjects)
+    assert first.version_count == second.version_count
+    assert all(len(versions) <= 3 for versions in first.subjects.values())
+
+
+def test_compare_results_flags_regressions(tmp_path: Path) -> None:
+    baseline_path = tmp_path / "baseline.json"
+    write_results(baseline_path, [_result(ops_per_sec=1000.0, p99_ms=10.0)])
+
+    comparisons = compare_results(
+        load_results(baseline_path), [_result(ops_per_sec=800.0, p99_ms=10.5)], threshold=0.15
+    )
+
+    by_metric = {comparison.metric: comparison for comparison in comparisons}
+    assert by_metric["ops_per_sec"].regressed is True
+    assert by_metric["p99_ms"].regressed is False
+
+
+@pytest.mark.asyncio
+async def test_catalog_sync_scenario_runs_against_synthetic_registry(tmp_path: Path) -> None:
+    spec = SyntheticCatalogSpec(subjects=20, max_versions=2, max_fields=8)
+    context = await build_context("tiny", spec, tmp_path)
+    try:
+        full, incremental = await bench_catalog_sync(context)
+    finally:
+        await context.aclose()
+
+    assert full.items == context.state.version_count
+    assert incremental.items == 3 * context.state.subject_count
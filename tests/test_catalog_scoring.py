@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+
+import orjson
+import pytest
+from sqlalchemy import select
+
+from app.schema.application.services.catalog_scoring import (
+    CatalogScoringService,
+    build_feature_table,
+    score_catalog,
+)
+from app.schema.domain.policies.security import PiiCandidatePolicy, PiiKeywordMatcher
+from app.schema.infrastructure.catalog_models import SchemaSubjectModel, SchemaVersionModel
+from app.shared.cpu_executor import CpuTaskExecutor
+from app.shared.database import DatabaseManager
+
+
+def _schema(*fields: dict[str, object]) -> str:
+    return orjson.dumps({"type": "record", "name": "Event", "fields": list(fields)}).decode()
+
+
+NESTED = _schema(
+    {"name": "id", "type": "string"},
+    {
+        "name": "customer",
+        "type": {
+            "type": "record",
+            "name": "Customer",
+            "fields": [
+                {"name": "emailAddress", "type": "string"},
+                {"name": "tier", "type": ["null", "string"]},
+            ],
+        },
+    },
+)
+
+
+def test_pii_keyword_matcher_reports_overlapping_keywords_in_order() -> None:
+    matcher = PiiKeywordMatcher(["name", "email", "address", "phone"])
+
+    assert matcher.find("email_address") == ["email", "address"]
+    assert matcher.find("order_id") == []
+
+
+def test_feature_table_flattens_nested_records_and_scores_subjects() -> None:
+    table = build_feature_table([("prod.orders-value", NESTED)])
+
+    assert table.path == ["id", "customer", "customer.emailAddress", "customer.tier"]
+    assert table.match_names[2] == "emailaddress"
+    assert table.depth.tolist() == [0, 0, 1, 1]
+    assert table.nullable_without_default.tolist() == [False, False, False, True]
+
+    scores, fields_scanned = score_catalog(
+        [
+            ("prod.orders-value", NESTED),
+            ("prod.plain-value", _schema({"name": "id", "type": "long"})),
+        ],
+        ["email"],
+    )
+
+    assert fields_scanned == 5
+    # PII 1/4 필드, 리스크 = PII(0.1) + nullable without default(0.3)
+    assert scores == [("prod.orders-value", 0.25, 0.4), ("prod.plain-value", 0.0, 0.0)]
+
+
+def test_pii_scoring_matches_compound_keywords_like_the_lint_policy() -> None:
+    keywords = ["phonenumber"]
+    schema = _schema({"name": "phoneNumber", "type": "string"}, {"name": "id", "type": "long"})
+
+    violations = PiiCandidatePolicy(PiiKeywordMatcher(keywords)).check(orjson.loads(schema))
+    scores, _ = score_catalog([("prod.contacts-value", schema)], keywords)
+
+    assert [violation.actual for violation in violations] == [
+        "필드: phoneNumber, 키워드: ['phonenumber']"
+    ]
+    # lint와 같은 필드를 PII 후보로 본다 (1/2 필드, 리스크 = PII 0.1)
+    assert scores == [("prod.contacts-value", 0.5, 0.1)]
+
+
+@pytest.mark.asyncio
+async def test_rescore_updates_scores_and_keeps_sync_timestamp(tmp_path: Path) -> None:
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'scoring.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    synced_at = datetime(2026, 1, 1, 12, 0, 0)
+
+    async with database_manager.get_db_session() as session:
+        session.add(
+            SchemaVersionModel(
+                subject="prod.orders-value", version=1, schema_type="AVRO", schema_str=_schema()
+            )
+        )
+        session.add(
+            SchemaVersionModel(
+                subject="prod.orders-value", version=2, schema_type="AVRO", schema_str=NESTED
+            )
+        )
+        session.add(
+            SchemaSubjectModel(subject="prod.orders-value", latest_version=2, updated_at=synced_at)
+        )
+
+    executor = CpuTaskExecutor(process_threshold_bytes=1 << 30, thread_workers=1)
+    try:
+        async with database_manager.get_db_session() as session:
+            summary = await CatalogScoringService(session, cpu_executor=executor).rescore(
+                keywords=["email"]
+            )
+        async with database_manager.get_db_session() as session:
+            subject = await session.scalar(select(SchemaSubjectModel))
+    finally:
+        executor.shutdown()
+        await database_manager.close()
+
+    assert summary.subjects_scored == 1
+    assert summary.fields_scanned == 4
+    assert summary.pii_subjects == 1
+    assert subject is not None
+    assert (subject.pii_score, subject.risk_score) == (0.25, 0.4)
+    assert subject.updated_at == synced_at
@@ -2,11 +2,18 @@ from __future__ import annotations
 
 from collections.abc import AsyncGenerator
 from pathlib import Path
+from types import SimpleNamespace
 
+import orjson
 import pytest
+from sqlalchemy import select
 
 from app.schema.application.services.catalog_sync import CatalogSyncService
-from app.schema.infrastructure.catalog_models import SchemaSubjectModel, SchemaVersionModel
+from app.schema.infrastructure.catalog_models import (
+    SchemaFieldIndexModel,
+    SchemaSubjectModel,
+    SchemaVersionModel,
+)
 from app.schema.infrastructure.models import SchemaArtifactModel, SchemaMetadataModel
 from app.shared.database import DatabaseManager
 
@@ -16,6 +23,37 @@ class _FakeSchemaRegistryClient:
         return []
 
 
+class _SingleSubjectRegistryClient:
+    schema_str = orjson.dumps(
+        {
+            "type": "record",
+            "name": "User",
+            "fields": [
+                {"name": "userId", "type": "long"},
+                {"name": "email", "type": ["null", "string"]},
+            ],
+        }
+    ).decode()
+
+    async def get_subjects(self) -> list[str]:
+        return ["prod.users-value"]
+
+    async def get_latest_version(self, subject: str) -> SimpleNamespace:
+        return SimpleNamespace(version=1)
+
+    async def get_version(self, subject: str, version: int) -> SimpleNamespace:
+        return SimpleNamespace(
+            schema=SimpleNamespace(schema_str=self.schema_str, schema_type="AVRO"),
+            schema_id=10,
+            references=[],
+            rule_set=None,
+            metadata=None,
+        )
+
+    async def get_config(self, subject: str) -> dict[str, str]:
+        return {"compatibilityLevel": "BACKWARD"}
+
+
 @pytest.fixture
 async def database_manager(tmp_path: Path) -> AsyncGenerator[DatabaseManager, None]:
     db_path = tmp_path / "catalog_sync.db"
@@ -98,3 +136,29 @@ async def test_catalog_sync_removes_stale_subject_metadata(
     assert metrics.versions_removed == 1
     assert metrics.artifacts_removed == 1
     assert metrics.metadata_removed == 1
+
+
+@pytest.mark.asyncio
+async def test_catalog_sync_indexes_fields_and_scores_new_versions(
+    database_manager: DatabaseManager,
+) -> None:
+    async with database_manager.get_db_session() as session:
+        service = CatalogSyncService(sr_client=_SingleSubjectRegistryClient(), session=session)
+        metrics = await service.sync_all()
+
+    async with database_manager.get_db_session() as session:
+        subject = await session.get(SchemaSubjectModel, "prod.users-value")
+        fields = (
+            await session.scalars(
+                select(SchemaFieldIndexModel).order_by(SchemaFieldIndexModel.field_path)
+            )
+        ).all()
+
+    assert metrics.versions_new == 1
+    assert subject is not None
+    # email: PII 후보 1/2, 리스크 = PII(0.1) + nullable without default(0.3)
+    assert (subject.pii_score, subject.risk_score) == (0.5, 0.4)
+    assert [(field.field_path, field.name_key, field.nullable) for field in fields] == [
+        ("email", "email", True),
+        ("userId", "user_id", False),
+    ]
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import inspect, select, text
+
+from app.schema.domain.models import (
+    DomainEnvironment,
+    DomainPlanAction,
+    DomainSchemaDiff,
+    DomainSchemaPlan,
+    DomainSchemaPlanItem,
+)
+from app.schema.governance_support.constants import AuditAction, AuditStatus, AuditTarget
+from app.schema.governance_support.infrastructure.repository import (
+    MySQLAuditActivityRepository,
+)
+from app.schema.infrastructure.models import SchemaAuditLogModel
+from app.schema.infrastructure.repository.audit_repository import MySQLSchemaAuditRepository
+from app.schema.infrastructure.repository.mysql_repository import MySQLSchemaMetadataRepository
+from app.shared.compressed_json import decode_json, encode_json, is_compressed
+from app.shared.database import DatabaseManager
+
+
+def test_encode_json_compresses_only_above_threshold() -> None:
+    small = {"subject": "prod.orders-value"}
+    large = {
+        "items": [{"subject": f"prod.s{index}-value", "reason": "x" * 40} for index in range(200)]
+    }
+
+    assert encode_json(small, threshold=1024) == b'{"subject":"prod.orders-value"}'
+    encoded = encode_json(large, threshold=1024)
+    assert is_compressed(encoded)
+    assert decode_json(encoded) == large
+    # 기존 JSON 컬럼에서 변환된 평문도 그대로 읽힌다
+    assert decode_json('{"a": 1}') == {"a": 1}
+
+
+def _plan(size: int) -> DomainSchemaPlan:
+    return DomainSchemaPlan(
+        change_id="chg-big",
+        env=DomainEnvironment.PROD,
+        items=tuple(
+            DomainSchemaPlanItem(
+                subject=f"prod.subject{index}-value",
+                action=DomainPlanAction.UPDATE,
+                current_version=1,
+                target_version=2,
+                diff=DomainSchemaDiff(
+                    type="update",
+                    changes=tuple(f"Field added: field_{n}" for n in range(10)),
+                    current_version=1,
+                    target_compatibility="BACKWARD",
+                    schema_type="AVRO",
+                ),
+                reason="bulk change",
+            )
+            for index in range(size)
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_round_trip_compressed(tmp_path: Path) -> None:
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'compressed.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    metadata_repository = MySQLSchemaMetadataRepository(database_manager.get_db_session)
+    audit_repository = MySQLSchemaAuditRepository(database_manager.get_db_session)
+    snapshot = {"requested_items": [f"prod.subject{index}-value" for index in range(500)]}
+
+    try:
+        await metadata_repository.save_plan(_plan(300), created_by="tester")
+        await audit_repository.log_operation(
+            change_id="chg-big",
+            action=AuditAction.DRY_RUN,
+            target=AuditTarget.BATCH,
+            actor="tester",
+            status=AuditStatus.COMPLETED,
+            snapshot=snapshot,
+        )
+        plan = await metadata_repository.get_plan("chg-big")
+
+        async with database_manager.get_db_session() as session:
+            raw_plan = await session.scalar(text("SELECT plan_data FROM schema_plans"))
+            raw_snapshot = await session.scalar(text("SELECT snapshot FROM schema_audit_logs"))
+            audit_log = await session.scalar(select(SchemaAuditLogModel))
+            unloaded = inspect(audit_log).unloaded
+
+        activities = await MySQLAuditActivityRepository(
+            database_manager.get_db_session
+        ).get_recent_activities(limit=5)
+    finally:
+        await database_manager.close()
+
+    assert plan is not None
+    assert len(plan.items) == 300
+    assert is_compressed(raw_plan)
+    assert is_compressed(raw_snapshot)
+    # 목록/엔티티 조회는 blob을 읽지 않는다
+    assert "snapshot" in unloaded
+    assert activities[0].actor == "tester"
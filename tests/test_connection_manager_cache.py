@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+
+import pytest
+
+import app.infra.kafka.connection_manager as connection_manager_module
+from app.infra.kafka.connection_manager import ConnectionManager
+
+
+class _FakeClient:
+    def __init__(self, config: dict[str, object]) -> None:
+        self.config = config
+        self.closed = False
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@dataclass
+class _FakeRegistry:
+    registry_id: str
+    is_active: bool = True
+
+    def to_client_config(self) -> dict[str, object]:
+        return {"url": f"http://{self.registry_id}:8081"}
+
+
+@dataclass
+class _FakeRegistryRepository:
+    lookups: list[str] = field(default_factory=list)
+
+    async def get_by_id(self, registry_id: str) -> _FakeRegistry:
+        self.lookups.append(registry_id)
+        await asyncio.sleep(0)
+        return _FakeRegistry(registry_id=registry_id)
+
+
+@pytest.fixture(autouse=True)
+def _fake_client(monkeypatch) -> None:
+    monkeypatch.setattr(connection_manager_module, "AsyncSchemaRegistryClient", _FakeClient)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_requests_build_single_client() -> None:
+    repository = _FakeRegistryRepository()
+    manager = ConnectionManager(schema_registry_repo=repository)  # type: ignore[arg-type]
+
+    clients = await asyncio.gather(
+        *(manager.get_schema_registry_client("registry-a") for _ in range(10))
+    )
+
+    assert len({id(client) for client in clients}) == 1
+    assert repository.lookups == ["registry-a"]
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_closes_least_recently_used_client() -> None:
+    manager = ConnectionManager(
+        schema_registry_repo=_FakeRegistryRepository(),  # type: ignore[arg-type]
+        max_clients=2,
+    )
+
+    client_a = await manager.get_schema_registry_client("registry-a")
+    client_b = await manager.get_schema_registry_client("registry-b")
+    await manager.get_schema_registry_client("registry-a")
+    await manager.get_schema_registry_client("registry-c")
+
+    assert manager.cached_registry_ids == ["registry-a", "registry-c"]
+    assert client_b.closed is True  # type: ignore[attr-defined]
+    assert client_a.closed is False  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_idle_client_is_replaced_and_closed(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(connection_manager_module.time, "monotonic", lambda: now[0])
+    manager = ConnectionManager(
+        schema_registry_repo=_FakeRegistryRepository(),  # type: ignore[arg-type]
+        idle_timeout_seconds=60.0,
+    )
+
+    first = await manager.get_schema_registry_client("registry-a")
+    now[0] += 61.0
+    second = await manager.get_schema_registry_client("registry-a")
+    await asyncio.sleep(0)
+
+    assert first is not second
+    assert first.closed is True  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_and_drain_close_clients() -> None:
+    manager = ConnectionManager(
+        schema_registry_repo=_FakeRegistryRepository(),  # type: ignore[arg-type]
+    )
+    client_a = await manager.get_schema_registry_client("registry-a")
+    client_b = await manager.get_schema_registry_client("registry-b")
+
+    manager.invalidate_cache("schema_registry", "registry-a")
+    await manager.aclose()
+
+    assert client_a.closed is True  # type: ignore[attr-defined]
+    assert client_b.closed is True  # type: ignore[attr-defined]
+    assert manager.cached_registry_ids == []
+
+
+@pytest.mark.asyncio
+async def test_evicted_client_stays_open_until_last_borrow_released() -> None:
+    manager = ConnectionManager(
+        schema_registry_repo=_FakeRegistryRepository(),  # type: ignore[arg-type]
+        max_clients=1,
+    )
+
+    async with manager.borrow_schema_registry_client("registry-a") as client_a:
+        async with manager.borrow_schema_registry_client("registry-a") as same_client:
+            # 대여 중 다른 레지스트리 조회로 LRU eviction 발생
+            await manager.get_schema_registry_client("registry-b")
+
+            assert same_client is client_a
+            assert manager.cached_registry_ids == ["registry-b"]
+            assert client_a.closed is False  # type: ignore[attr-defined]
+
+        assert client_a.closed is False  # type: ignore[attr-defined]
+
+    assert client_a.closed is True  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_borrowed_client_is_not_idle_evicted(monkeypatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(connection_manager_module.time, "monotonic", lambda: now[0])
+    manager = ConnectionManager(
+        schema_registry_repo=_FakeRegistryRepository(),  # type: ignore[arg-type]
+        idle_timeout_seconds=60.0,
+    )
+
+    async with manager.borrow_schema_registry_client("registry-a") as client_a:
+        now[0] += 61.0
+        # 긴 작업 도중 다른 조회가 들어와도 대여 중인 Client는 그대로 재사용된다
+        await manager.get_schema_registry_client("registry-b")
+        assert await manager.get_schema_registry_client("registry-a") is client_a
+        assert client_a.closed is False  # type: ignore[attr-defined]
+
+    manager.invalidate_cache("schema_registry", "registry-a")
+    await asyncio.sleep(0)
+    assert client_a.closed is True  # type: ignore[attr-defined]
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from app.container import AppContainer
+from app.infra.kafka.schema_registry_adapter import ConfluentSchemaRegistryAdapter
+from app.schema.application.services.schema_lint import SchemaLintService
+from app.schema.domain.models import (
+    DomainCompatibilityMode,
+    DomainEnvironment,
+    DomainPlanAction,
+    DomainSchemaBatch,
+    DomainSchemaSpec,
+    DomainSchemaType,
+    DomainSubjectStrategy,
+)
+from app.schema.domain.services import PLAN_ANALYSIS_CHUNK_SIZE, SchemaPlannerService
+from app.shared.cpu_executor import CpuTaskExecutor
+from app.shared.metrics import CPU_TASK_QUEUE_DEPTH, CPU_TASK_RUN_DURATION
+from benchmarks.registry import InMemorySchemaRegistryClient
+from benchmarks.synthetic import SyntheticCatalogSpec, generate_registry_state
+
+
+def _sample_count(pool: str) -> float:
+    for metric in CPU_TASK_RUN_DURATION.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_count") and sample.labels == {"pool": pool}:
+                return sample.value
+    return 0.0
+
+
+@pytest.mark.asyncio
+async def test_cpu_executor_routes_by_payload_size() -> None:
+    executor = CpuTaskExecutor(process_threshold_bytes=1024, thread_workers=2, process_workers=1)
+    thread_runs = _sample_count("thread")
+    process_runs = _sample_count("process")
+
+    try:
+        small_pid = await executor.run(os.getpid, size_hint=10)
+        large_pid = await executor.run(os.getpid, size_hint=4096)
+        report = await SchemaLintService().lint_avro_schema_async(
+            '{"type":"record","name":"Order","fields":[{"name":"email","type":"string"}]}',
+            cpu_executor=executor,
+        )
+    finally:
+        executor.shutdown()
+
+    assert small_pid == os.getpid()
+    assert large_pid != os.getpid()
+    assert any(violation.code == "PII_CANDIDATE" for violation in report.violations)
+    assert _sample_count("thread") == thread_runs + 2
+    assert _sample_count("process") == process_runs + 1
+    assert CPU_TASK_QUEUE_DEPTH.labels(pool="thread")._value.get() == 0
+
+
+class _CountingExecutor:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def run(self, func: Callable[..., Any], *args: Any, size_hint: int = 0) -> Any:
+        self.calls += 1
+        return func(*args)
+
+
+@pytest.mark.asyncio
+async def test_planner_submits_spec_analysis_in_chunks() -> None:
+    state = generate_registry_state(SyntheticCatalogSpec(subjects=12, max_versions=1))
+    existing = sorted(subject for subject in state.subjects if subject.startswith("dev."))
+    new_subjects = [f"dev.new-{index}-value" for index in range(PLAN_ANALYSIS_CHUNK_SIZE * 2)]
+    specs = [
+        DomainSchemaSpec(
+            subject=subject,
+            schema_type=DomainSchemaType.AVRO,
+            compatibility=DomainCompatibilityMode.BACKWARD,
+            schema=state.latest(subject).schema_str  # type: ignore[union-attr]
+            if subject in state.subjects
+            else '{"type":"record","name":"New","fields":[]}',
+        )
+        for subject in [*existing, *new_subjects]
+    ]
+    executor = _CountingExecutor()
+    planner = SchemaPlannerService(
+        ConfluentSchemaRegistryAdapter(InMemorySchemaRegistryClient(state)),  # type: ignore[arg-type]
+        cpu_executor=executor,
+    )
+
+    plan = await planner.create_plan(
+        DomainSchemaBatch(
+            change_id="chg-chunks",
+            env=DomainEnvironment.DEV,
+            subject_strategy=DomainSubjectStrategy.SUBJECT_NAME,
+            specs=tuple(specs),
+        )
+    )
+
+    # spec마다가 아니라 청크마다 한 번씩 실행기로 보낸다
+    assert executor.calls == 3
+    assert [item.subject for item in plan.items] == [spec.subject for spec in specs]
+    assert {item.action for item in plan.items[: len(existing)]} == {DomainPlanAction.NONE}
+    assert {item.action for item in plan.items[len(existing) :]} == {DomainPlanAction.REGISTER}
+
+
+def test_container_injects_cpu_executor_and_shuts_it_down() -> None:
+    container = AppContainer()
+
+    executor = container.infrastructure_container.cpu_executor()
+    compare = container.schema_container.compare_registries_use_case()
+    plan_change = container.schema_container.plan_change_use_case()
+    executor._pool("thread")
+    container.shutdown_resources()
+
+    assert compare.cpu_executor is executor
+    assert plan_change.cpu_executor is executor
+    assert executor._thread_pool is None
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.schema.application.use_cases.batch.apply import SchemaBatchApplyUseCase
+from app.schema.domain.models import (
+    DomainCompatibilityMode,
+    DomainEnvironment,
+    DomainSchemaBatch,
+    DomainSchemaSpec,
+    DomainSchemaType,
+    DomainSubjectStrategy,
+)
+from app.schema.domain.models.value_objects import DomainSchemaReference
+from app.schema.infrastructure.models import SchemaArtifactModel, SchemaAuditLogModel
+from app.schema.infrastructure.repository import (
+    MySQLSchemaAuditRepository,
+    MySQLSchemaReferenceRepository,
+)
+from app.schema.infrastructure.repository.mysql_repository import MySQLSchemaMetadataRepository
+from app.schema.infrastructure.repository.reference_repository import invalidate_reference_graph
+from app.shared.database import DatabaseManager
+from benchmarks.registry import InMemorySchemaRegistryClient
+from benchmarks.synthetic import SyntheticCatalogSpec, generate_registry_state
+
+
+@pytest.fixture
+async def database_manager(tmp_path: Path) -> AsyncIterator[DatabaseManager]:
+    manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'uow.db'}")
+    await manager.initialize()
+    await manager.create_tables()
+    try:
+        yield manager
+    finally:
+        await manager.close()
+
+
+def _count_events(manager: DatabaseManager) -> dict[str, int]:
+    counts = {"checkout": 0, "commit": 0}
+    engine = manager._engine
+    assert engine is not None
+
+    def on_checkout(*_: object) -> None:
+        counts["checkout"] += 1
+
+    def on_commit(*_: object) -> None:
+        counts["commit"] += 1
+
+    event.listen(engine.sync_engine.pool, "checkout", on_checkout)
+    event.listen(engine.sync_engine, "commit", on_commit)
+    return counts
+
+
+async def _log(repository: MySQLSchemaAuditRepository, status: str) -> str:
+    return await repository.log_operation(
+        change_id="chg-1", action="APPLY", target="BATCH", actor="tester", status=status
+    )
+
+
+async def _audit_statuses(manager: DatabaseManager) -> list[str]:
+    async with manager.get_db_session() as session:
+        result = await session.execute(
+            select(SchemaAuditLogModel.status).order_by(SchemaAuditLogModel.id)
+        )
+        return list(result.scalars())
+
+
+@pytest.mark.asyncio
+async def test_repository_calls_share_one_connection_and_commit(
+    database_manager: DatabaseManager,
+) -> None:
+    repository = MySQLSchemaAuditRepository(database_manager.get_db_session)
+    counts = _count_events(database_manager)
+
+    async with database_manager.unit_of_work():
+        for status in ("STARTED", "IN_PROGRESS", "COMPLETED"):
+            await _log(repository, status)
+
+    assert counts == {"checkout": 1, "commit": 1}
+    assert await _audit_statuses(database_manager) == ["STARTED", "IN_PROGRESS", "COMPLETED"]
+
+
+@pytest.mark.asyncio
+async def test_failed_call_rolls_back_to_savepoint_and_completed_work_is_kept(
+    database_manager: DatabaseManager,
+) -> None:
+    repository = MySQLSchemaAuditRepository(database_manager.get_db_session)
+
+    with pytest.raises(RuntimeError, match="apply failed"):
+        async with database_manager.unit_of_work():
+            await _log(repository, "STARTED")
+            with pytest.raises(RuntimeError):
+                async with database_manager.get_db_session() as session:
+                    session.add(
+                        SchemaAuditLogModel(
+                            change_id="chg-1",
+                            action="APPLY",
+                            target="BATCH",
+                            actor="tester",
+                            status="PARTIAL",
+                        )
+                    )
+                    await session.flush()
+                    raise RuntimeError("repository failed")
+            await _log(repository, "FAILED")
+            raise RuntimeError("apply failed")
+
+    # 실패한 호출만 되돌리고, 유스케이스가 예외로 끝나도 감사 로그는 남는다
+    assert await _audit_statuses(database_manager) == ["STARTED", "FAILED"]
+
+
+@pytest.mark.asyncio
+async def test_read_only_unit_of_work_rolls_back(database_manager: DatabaseManager) -> None:
+    repository = MySQLSchemaAuditRepository(database_manager.get_db_session)
+
+    async with database_manager.unit_of_work(read_only=True):
+        await _log(repository, "STARTED")
+
+    assert await _audit_statuses(database_manager) == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_tasks_do_not_share_the_unit_of_work_session(
+    database_manager: DatabaseManager,
+) -> None:
+    async def session_id() -> int:
+        async with database_manager.get_db_session() as session:
+            await session.execute(select(func.count(SchemaAuditLogModel.id)))
+            return id(session)
+
+    async with database_manager.unit_of_work() as session:
+        joined = await session_id()
+        gathered = await asyncio.gather(session_id(), session_id())
+
+    assert joined == id(session)
+    assert id(session) not in gathered
+
+
+@pytest.mark.asyncio
+async def test_reference_graph_is_invalidated_after_unit_of_work_commit(
+    database_manager: DatabaseManager,
+) -> None:
+    invalidate_reference_graph()
+    repository = MySQLSchemaReferenceRepository(
+        database_manager.get_db_session, cache_ttl_seconds=300
+    )
+    try:
+        assert (await repository.load_graph()).edge_count == 0
+
+        async with database_manager.unit_of_work():
+            await repository.record_references(
+                "dev.order-value",
+                1,
+                [DomainSchemaReference(name="Customer", subject="dev.customer-value", version=1)],
+            )
+            # 커밋 전에 다른 task가 읽으면 이전 그래프가 캐시된다
+            stale = await asyncio.create_task(repository.load_graph())
+            assert stale.edge_count == 0
+
+        assert (await repository.load_graph()).edge_count == 1
+    finally:
+        invalidate_reference_graph()
+
+
+class _ConnectionManager:
+    def __init__(self, client: InMemorySchemaRegistryClient) -> None:
+        self.client = client
+
+    async def get_schema_registry_client(self, registry_id: str) -> InMemorySchemaRegistryClient:
+        return self.client
+
+    @asynccontextmanager
+    async def borrow_schema_registry_client(
+        self, registry_id: str
+    ) -> AsyncIterator[InMemorySchemaRegistryClient]:
+        yield await self.get_schema_registry_client(registry_id)
+
+
+@pytest.mark.asyncio
+async def test_apply_keeps_registered_artifacts_when_the_final_write_fails(
+    database_manager: DatabaseManager,
+) -> None:
+    state = generate_registry_state(SyntheticCatalogSpec(subjects=1, max_versions=1))
+    client = InMemorySchemaRegistryClient(state)
+    metadata_repository = MySQLSchemaMetadataRepository(database_manager.get_db_session)
+    use_case = SchemaBatchApplyUseCase(
+        connection_manager=_ConnectionManager(client),  # type: ignore[arg-type]
+        metadata_repository=metadata_repository,
+        audit_repository=MySQLSchemaAuditRepository(database_manager.get_db_session),
+        unit_of_work=database_manager.unit_of_work,
+    )
+    subjects = ["dev.orders-value", "dev.users-value"]
+    batch = DomainSchemaBatch(
+        change_id="chg-apply",
+        env=DomainEnvironment.DEV,
+        subject_strategy=DomainSubjectStrategy.SUBJECT_NAME,
+        specs=tuple(
+            DomainSchemaSpec(
+                subject=subject,
+                schema_type=DomainSchemaType.AVRO,
+                compatibility=DomainCompatibilityMode.BACKWARD,
+                schema='{"type":"record","name":"Event","fields":[{"name":"id","type":"long"}]}',
+            )
+            for subject in subjects
+        ),
+    )
+
+    # 결과 저장 뒤의 커밋이 실패하는 상황 (긴 등록 루프 뒤 연결 끊김/락 타임아웃)
+    fail_next_commit = False
+    save_apply_result = metadata_repository.save_apply_result
+    end_unit_of_work = database_manager._end_unit_of_work
+
+    async def save_then_break_commit(result: object, actor: str) -> None:
+        nonlocal fail_next_commit
+        await save_apply_result(result, actor)  # type: ignore[arg-type]
+        fail_next_commit = True
+
+    async def end_or_fail(session: AsyncSession, *, commit: bool) -> None:
+        nonlocal fail_next_commit
+        if commit and fail_next_commit:
+            fail_next_commit = False
+            await end_unit_of_work(session, commit=False)
+            raise RuntimeError("connection dropped")
+        await end_unit_of_work(session, commit=commit)
+
+    metadata_repository.save_apply_result = save_then_break_commit  # type: ignore[method-assign]
+    database_manager._end_unit_of_work = end_or_fail  # type: ignore[method-assign]
+    with pytest.raises(RuntimeError, match="connection dropped"):
+        await use_case.execute("registry-1", None, batch, "tester")
+
+    async with database_manager.get_db_session() as session:
+        artifacts = (
+            await session.execute(select(SchemaArtifactModel.subject, SchemaArtifactModel.version))
+        ).all()
+
+    # Registry 등록은 되돌릴 수 없으므로 등록 직후 기록한 아티팩트와 감사 로그는 남는다
+    assert all(state.latest(subject) is not None for subject in subjects)
+    assert sorted(artifacts) == [(subject, 1) for subject in subjects]
+    assert await _audit_statuses(database_manager) == ["STARTED", "FAILED"]
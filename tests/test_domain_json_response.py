@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import dataclasses
+import enum
+import types
+import typing
+from dataclasses import asdict
+from datetime import UTC, datetime
+from typing import Any
+
+import orjson
+import pytest
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from app.main import create_app
+from app.schema.domain.models import (
+    CatalogRescoreSummary,
+    DomainCompatibilityMode,
+    DomainEnvironment,
+    DomainPlanAction,
+    DomainSchemaApplyResult,
+    DomainSchemaArtifact,
+    DomainSchemaCompatibilityReport,
+    DomainSchemaDiff,
+    DomainSchemaImpactRecord,
+    DomainSchemaPlan,
+    DomainSchemaPlanItem,
+    FieldIndexRebuildSummary,
+    SchemaDriftReportPage,
+    SchemaDriftScanSummary,
+    SchemaFieldSearchPage,
+    SchemaReferenceImpact,
+    SubjectDriftReport,
+    SubjectHistory,
+    SubjectVersionComparison,
+    SubjectVersionDetail,
+    SubjectVersionList,
+)
+from app.schema.domain.models.policy import DomainSchemaCompatibilityIssue
+from app.schema.governance_support.models import (
+    ApprovalRequest,
+    AuditActivity,
+    AuditActivityPage,
+    AuditArchiveResult,
+)
+from app.schema.interface import schemas
+from app.schema.interface.adapters import SchemaConverter
+from app.shared.json_response import dump_json
+
+_SUBJECT = "dev.orders-value"
+_NOW = datetime(2025, 9, 25, 12, 30, 45, 123456, tzinfo=UTC)
+# 도메인에서는 느슨한 타입(str, dict)이지만 응답 모델은 enum/모델로 받는 필드
+_FIELD_SAMPLES: dict[str, Any] = {
+    "compatibility_mode": "BACKWARD",
+    "references": [{"name": "Address", "subject": "dev.address-value", "version": 1}],
+}
+
+
+def _sample(annotation: Any, name: str) -> Any:
+    """타입 힌트로 응답 모델 제약(subject 패턴 등)을 통과하는 샘플 값 생성"""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin in (typing.Union, types.UnionType):
+        return _sample(next(arg for arg in args if arg is not type(None)), name)
+    if origin is typing.Annotated:
+        return _sample(args[0], name)
+    if origin is typing.Literal:
+        return args[0]
+    if origin in (list, tuple):
+        return origin([_sample(args[0], name)]) if args else origin()
+    if origin is dict:
+        return {"key": _sample(args[1], name)}
+    if hasattr(annotation, "__value__"):
+        return _sample(annotation.__value__, name)
+    if dataclasses.is_dataclass(annotation):
+        return _instance(annotation)
+    if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+        return next(iter(annotation))
+    if annotation is bool:
+        return True
+    if annotation is int:
+        return 3
+    if annotation is float:
+        return 0.35
+    if annotation is datetime:
+        return _NOW
+    if annotation is str:
+        return _SUBJECT if "subject" in name else f"{name}-value"
+    return None
+
+
+def _instance(cls: Any) -> Any:
+    hints = typing.get_type_hints(cls)
+    return cls(
+        **{
+            field.name: _FIELD_SAMPLES.get(field.name) or _sample(hints[field.name], field.name)
+            for field in dataclasses.fields(cls)
+            if field.init
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    ("domain_type", "response_model"),
+    [
+        (SubjectHistory, schemas.SchemaHistoryResponse),
+        (CatalogRescoreSummary, schemas.CatalogRescoreResponse),
+        (SubjectDriftReport, schemas.SchemaDriftResponse),
+        (SchemaDriftScanSummary, schemas.SchemaDriftScanResponse),
+        (SchemaDriftReportPage, schemas.SchemaDriftReportResponse),
+        (SubjectVersionList, schemas.SchemaVersionListResponse),
+        (SubjectVersionDetail, schemas.SchemaVersionDetailResponse),
+        (SubjectVersionComparison, schemas.SchemaVersionCompareResponse),
+        (SchemaReferenceImpact, schemas.SchemaReferenceImpactResponse),
+        (SchemaFieldSearchPage, schemas.SchemaFieldSearchResponse),
+        (FieldIndexRebuildSummary, schemas.FieldIndexRebuildResponse),
+        (ApprovalRequest, schemas.ApprovalRequestResponse),
+        (AuditActivity, schemas.AuditActivityResponse),
+        (AuditArchiveResult, schemas.AuditArchiveResponse),
+    ],
+)
+def test_direct_serialization_matches_response_model(
+    domain_type: Any, response_model: type[BaseModel]
+) -> None:
+    value = _instance(domain_type)
+
+    expected = response_model.model_validate(asdict(value)).model_dump(mode="json", by_alias=True)
+
+    assert orjson.loads(dump_json(value)) == expected
+
+
+def _plan() -> DomainSchemaPlan:
+    item = DomainSchemaPlanItem(
+        subject=_SUBJECT,
+        action=DomainPlanAction.UPDATE,
+        current_version=1,
+        target_version=2,
+        diff=DomainSchemaDiff(
+            type="update",
+            changes=("필드 추가: email",),
+            current_version=1,
+            target_compatibility="BACKWARD",
+            schema_type="AVRO",
+        ),
+        schema='{"type":"string"}',
+        current_schema='"string"',
+        reason="add email",
+    )
+    return DomainSchemaPlan(
+        change_id="2025-09-25_001",
+        env=DomainEnvironment.DEV,
+        items=(item,) * 3,
+        compatibility_reports=(
+            DomainSchemaCompatibilityReport(
+                subject=_SUBJECT,
+                mode=DomainCompatibilityMode.BACKWARD,
+                is_compatible=False,
+                issues=(
+                    DomainSchemaCompatibilityIssue(
+                        path="$.fields[1]", message="missing default", issue_type="AVRO"
+                    ),
+                ),
+            ),
+        ),
+        impacts=(DomainSchemaImpactRecord(subject=_SUBJECT, status="failure", error_message="x"),),
+    )
+
+
+def test_plan_and_apply_payloads_match_response_models() -> None:
+    plan = _plan()
+    result = DomainSchemaApplyResult(
+        change_id="2025-09-25_001",
+        env=DomainEnvironment.DEV,
+        registered=(_SUBJECT,),
+        skipped=(),
+        failed=({"subject": "dev.other-value", "error": "boom"},),
+        audit_id="audit_1",
+        artifacts=(
+            DomainSchemaArtifact(
+                subject=_SUBJECT, storage_url=None, version=2, checksum="0123456789abcdef"
+            ),
+        ),
+        details=({"subject": _SUBJECT, "status": "registered", "reason": None},),
+    )
+
+    plan_json = orjson.loads(dump_json(SchemaConverter.plan_to_payload(plan)))
+    apply_json = orjson.loads(dump_json(SchemaConverter.apply_result_to_payload(result)))
+
+    assert plan_json == SchemaConverter.convert_plan_to_response(plan).model_dump(
+        mode="json", by_alias=True
+    )
+    assert plan_json["plan"][0]["schema"] == '{"type":"string"}'
+    assert apply_json == SchemaConverter.convert_apply_result_to_response(result).model_dump(
+        mode="json", by_alias=True
+    )
+
+
+class _HistoryUseCase:
+    async def execute(self, **_: Any) -> AuditActivityPage:
+        return AuditActivityPage(items=[_instance(AuditActivity)], next_cursor="cursor-2")
+
+
+def test_direct_response_keeps_headers_and_openapi_schema() -> None:
+    app = create_app()
+    container = app.state.container
+    client = TestClient(app)
+    container.schema_container.activity_history_use_case.override(
+        providers.Object(_HistoryUseCase())
+    )
+
+    try:
+        response = client.get("/api/v1/audit/history")
+        openapi = client.get("/openapi.json").json()
+    finally:
+        container.schema_container.activity_history_use_case.reset_override()
+        client.close()
+
+    assert response.status_code == 200
+    assert response.headers["X-Next-Cursor"] == "cursor-2"
+    assert response.json()[0]["timestamp"] == "2025-09-25T12:30:45.123456Z"
+    history_schema = openapi["paths"]["/api/v1/audit/history"]["get"]["responses"]["200"]
+    assert history_schema["content"]["application/json"]["schema"]["items"] == {
+        "$ref": "#/components/schemas/AuditActivityResponse"
+    }
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import orjson
+import pytest
+from confluent_kafka.schema_registry import AsyncSchemaRegistryClient, Schema
+from confluent_kafka.schema_registry.error import SchemaRegistryError
+
+from app.infra.kafka.connection_manager import ConnectionManager
+from app.registry_connections.domain.models import SchemaRegistry
+from benchmarks.fake_registry import FakeSchemaRegistryServer, FaultInjection
+from benchmarks.synthetic import SyntheticCatalogSpec, generate_registry_state
+
+
+@dataclass
+class _UrlRegistryRepository:
+    url: str
+
+    async def get_by_id(self, registry_id: str) -> SchemaRegistry:
+        now = datetime.now(UTC)
+        return SchemaRegistry(
+            registry_id=registry_id,
+            name="fake",
+            url=self.url,
+            created_at=now,
+            updated_at=now,
+        )
+
+
+@pytest.fixture
+def server() -> Iterator[FakeSchemaRegistryServer]:
+    state = generate_registry_state(SyntheticCatalogSpec(subjects=12, max_versions=2))
+    with FakeSchemaRegistryServer(state) as running:
+        yield running
+
+
+@pytest.mark.asyncio
+async def test_connection_manager_reads_catalog_by_url(server: FakeSchemaRegistryServer) -> None:
+    manager = ConnectionManager(schema_registry_repo=_UrlRegistryRepository(server.url))  # type: ignore[arg-type]
+    try:
+        client = await manager.get_schema_registry_client("fake")
+        subjects = await client.get_subjects()
+        subject = subjects[0]
+        latest = await client.get_latest_version(subject)
+        versions = await client.get_versions(subject)
+    finally:
+        await manager.aclose()
+
+    assert len(subjects) == 12
+    assert latest.version == versions[-1]
+    assert latest.schema_id == server.app.state.latest(subject).schema_id
+
+
+@pytest.mark.asyncio
+async def test_register_and_compatibility_follow_subject_level(
+    server: FakeSchemaRegistryServer,
+) -> None:
+    subject = next(name for name in server.app.state.subjects if name.startswith("prod."))
+    schema = orjson.loads(server.app.state.latest(subject).schema_str)
+    compatible = {
+        **schema,
+        "fields": [
+            *schema["fields"],
+            {"name": "note", "type": ["null", "string"], "default": None},
+        ],
+    }
+    breaking = {**schema, "fields": [*schema["fields"], {"name": "required", "type": "string"}]}
+
+    client = AsyncSchemaRegistryClient({"url": server.url})
+    try:
+        assert await client.test_compatibility(
+            subject, Schema(orjson.dumps(compatible).decode(), "AVRO")
+        )
+        assert not await client.test_compatibility(
+            subject, Schema(orjson.dumps(breaking).decode(), "AVRO")
+        )
+
+        schema_id = await client.register_schema(
+            subject, Schema(orjson.dumps(compatible).decode(), "AVRO")
+        )
+        with pytest.raises(SchemaRegistryError) as exc_info:
+            await client.register_schema(subject, Schema(orjson.dumps(breaking).decode(), "AVRO"))
+    finally:
+        await client.aclose()
+
+    assert server.app.state.latest(subject).schema_id == schema_id
+    assert exc_info.value.http_status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_error_injection_surfaces_as_registry_errors() -> None:
+    state = generate_registry_state(SyntheticCatalogSpec(subjects=3))
+    faults = FaultInjection(error_rate=1.0, error_status=503, seed=1)
+
+    with FakeSchemaRegistryServer(state, faults) as server:
+        client = AsyncSchemaRegistryClient({"url": server.url, "max.retries": 0})
+        try:
+            with pytest.raises(SchemaRegistryError) as exc_info:
+                await client.get_subjects()
+        finally:
+            await client.aclose()
+
+    assert exc_info.value.http_status_code == 503
+    assert server.app.injected_errors >= 1
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import logging
+import queue
+from collections.abc import Iterator
+
+import pytest
+
+from app.shared.logging_config import (
+    LogSampler,
+    NonBlockingQueueHandler,
+    configure_structlog,
+    get_logger,
+    shutdown_logging,
+)
+
+
+def _record(msg: str, *args: object, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord("app.test", level, __file__, 1, msg, args, None)
+
+
+@pytest.fixture
+def restore_root_handlers() -> Iterator[None]:
+    root_logger = logging.getLogger()
+    handlers, level = list(root_logger.handlers), root_logger.level
+    try:
+        yield
+    finally:
+        shutdown_logging()
+        root_logger.handlers[:] = handlers
+        root_logger.setLevel(level)
+
+
+def test_sampler_keeps_burst_then_every_nth_per_template() -> None:
+    sampler = LogSampler(burst=3, rate=0.5, window_seconds=60)
+
+    kept = [sampler.filter(_record("[%s] v%s synced", "orders", v)) for v in range(10)]
+    other = sampler.filter(_record("[CatalogSync] Found %d subjects", 10))
+    warning = sampler.filter(_record("[%s] v%s synced", "orders", 99, level=logging.WARNING))
+
+    assert kept == [True, True, True, False, True, False, True, False, True, False]
+    assert sampler.sampled_out == 4
+    assert other is True
+    assert warning is True
+
+
+def test_queue_handler_drops_instead_of_blocking_and_defers_formatting() -> None:
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=1)
+    handler = NonBlockingQueueHandler(log_queue)
+
+    for index in range(3):
+        handler.handle(_record("item %s", index))
+
+    queued = log_queue.get_nowait()
+    assert handler.dropped == 2
+    assert queued.msg == "item %s"
+    assert queued.args == (0,)
+
+
+def test_queue_pipeline_flushes_on_shutdown(restore_root_handlers, capsys) -> None:
+    configure_structlog()
+    get_logger("app.test").warning("queued_event", subject="orders-value")
+    shutdown_logging()
+
+    assert "queued_event" in capsys.readouterr().out
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.main import create_app
+from app.shared.database import DatabaseManager
+from app.shared.metrics import observe_schema_registry_call, render_metrics
+
+
+def test_metrics_endpoint_exposes_route_latency() -> None:
+    client = TestClient(create_app())
+
+    assert client.get("/health").status_code == 200
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'kafka_gov_http_request_duration_seconds_count{method="GET",route="/health",status_code="200"}'
+        in response.text
+    )
+
+
+@pytest.mark.asyncio
+async def test_schema_registry_call_errors_are_counted() -> None:
+    @observe_schema_registry_call("metrics_test_operation")
+    async def _failing_call() -> None:
+        raise RuntimeError("registry unavailable")
+
+    with pytest.raises(RuntimeError):
+        await _failing_call()
+
+    exposition = render_metrics().decode()
+    assert (
+        'kafka_gov_schema_registry_call_errors_total{error_type="RuntimeError",operation="metrics_test_operation"} 1.0'
+        in exposition
+    )
+
+
+@pytest.mark.asyncio
+async def test_database_statements_are_observed(tmp_path: Path) -> None:
+    manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'metrics.db'}")
+    try:
+        async with manager.get_db_session() as session:
+            await session.execute(text("SELECT 1"))
+    finally:
+        await manager.close()
+
+    exposition = render_metrics().decode()
+    assert 'kafka_gov_db_statement_duration_seconds_count{statement_type="select"}' in exposition
+    assert "kafka_gov_db_pool_checkout_duration_seconds_count" in exposition
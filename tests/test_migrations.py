@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+
+from app.schema.governance_support.infrastructure.models import ApprovalRequestModel
+from app.schema.infrastructure.models import SchemaAuditLogModel
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent.parent / "migrations"
+
+# 이 리비전 이후의 마이그레이션은 downgrade → upgrade 왕복까지 검증한다
+# (그 이전 리비전의 downgrade는 토픽 모듈 인덱스 정리 이슈로 왕복 대상에서 제외)
+ROUNDTRIP_BASE_REVISION = "6f5f0c8f6c1f"
+
+
+def _alembic_config() -> Config:
+    config = Config()
+    config.set_main_option("script_location", str(MIGRATIONS_DIR))
+    return config
+
+
+def _sqlite_indexes(db_path: Path, table: str) -> set[str]:
+    with sqlite3.connect(db_path) as connection:
+        rows = connection.execute(f"PRAGMA index_list('{table}')").fetchall()
+    # sqlite_autoindex_* 는 PK/UNIQUE 제약이 만든 내부 인덱스다
+    return {row[1] for row in rows if not row[1].startswith("sqlite_autoindex_")}
+
+
+def _model_indexes(model: type) -> set[str]:
+    return {index.name for index in model.__table__.indexes}
+
+
+def test_alembic_chain_upgrades_to_head_and_matches_models(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    db_path = tmp_path / "migrate.db"
+    monkeypatch.setenv("KAFKA_GOV_DATABASE_URL", f"sqlite+aiosqlite:///{db_path}")
+    config = _alembic_config()
+
+    command.upgrade(config, "head")
+
+    assert _sqlite_indexes(db_path, "approval_requests") == _model_indexes(ApprovalRequestModel)
+    assert _model_indexes(SchemaAuditLogModel) <= _sqlite_indexes(db_path, "schema_audit_logs")
+
+    command.downgrade(config, ROUNDTRIP_BASE_REVISION)
+    command.upgrade(config, "head")
+
+    assert _sqlite_indexes(db_path, "approval_requests") == _model_indexes(ApprovalRequestModel)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import orjson
+import pytest
+
+from app.schema.application.use_cases.policy.simulation import SimulateSchemaPolicyUseCase
+from app.schema.domain.models.policy_management import (
+    DomainSchemaPolicy,
+    SchemaPolicyStatus,
+    SchemaPolicyType,
+)
+from app.schema.infrastructure.catalog_models import SchemaSubjectModel, SchemaVersionModel
+from app.schema.infrastructure.repository.policy_repository import MySQLSchemaPolicyRepository
+from app.shared.cpu_executor import CpuTaskExecutor
+from app.shared.database import DatabaseManager
+from app.shared.settings import settings
+
+
+def _schema(*, documented: bool) -> str:
+    schema: dict[str, object] = {
+        "type": "record",
+        "name": "Event",
+        "fields": [{"name": "id", "type": "string", "doc": "identifier"}],
+    }
+    if documented:
+        schema["doc"] = "event"
+    return orjson.dumps(schema).decode()
+
+
+def _policy(policy_type: SchemaPolicyType, content: dict[str, object]) -> DomainSchemaPolicy:
+    return DomainSchemaPolicy(
+        policy_id="policy-1",
+        policy_type=policy_type,
+        name="draft",
+        description="",
+        version=1,
+        status=SchemaPolicyStatus.DRAFT,
+        content=content,
+        target_environment="prod",
+    )
+
+
+@pytest.mark.asyncio
+async def test_policy_simulation_counts_hits_on_latest_catalog_schemas(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(settings, "policy_simulation_chunk_size", 7)
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'simulation.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+
+    async with database_manager.get_db_session() as session:
+        for index in range(30):
+            subject = f"prod.s{index:02d}-value"
+            session.add(
+                SchemaVersionModel(
+                    subject=subject,
+                    version=1,
+                    schema_type="AVRO",
+                    schema_str=_schema(documented=True),
+                )
+            )
+            session.add(
+                SchemaVersionModel(
+                    subject=subject,
+                    version=2,
+                    schema_type="AVRO",
+                    schema_str=_schema(documented=index % 2 == 1),
+                )
+            )
+            session.add(
+                SchemaSubjectModel(
+                    subject=subject, latest_version=2, compat_level="FULL" if index < 5 else None
+                )
+            )
+        session.add(
+            SchemaVersionModel(
+                subject="prod.broken-value", version=1, schema_type="AVRO", schema_str="{not json"
+            )
+        )
+        session.add(
+            SchemaVersionModel(
+                subject="dev.orders-value",
+                version=1,
+                schema_type="AVRO",
+                schema_str=_schema(documented=False),
+            )
+        )
+
+    executor = CpuTaskExecutor(process_threshold_bytes=0, thread_workers=1, process_workers=2)
+    policy_repository = MySQLSchemaPolicyRepository(database_manager.get_db_session)
+    use_case = SimulateSchemaPolicyUseCase(
+        policy_repository=policy_repository,
+        session_factory=database_manager.get_db_session,
+        cpu_executor=executor,
+    )
+    lint_policy = _policy(SchemaPolicyType.LINT, {"rules": {"MISSING_DOC": {"enabled": True}}})
+
+    try:
+        await policy_repository.save(lint_policy)
+        lint = await use_case.execute_stored("policy-1")
+        guardrail = await use_case.execute(
+            _policy(SchemaPolicyType.GUARDRAIL, {"required_compatibility": "FULL"})
+        )
+        with pytest.raises(ValueError):
+            await use_case.execute_stored("missing")
+    finally:
+        executor.shutdown()
+        await database_manager.close()
+
+    assert lint.summary.subjects_scanned == 32
+    assert lint.summary.subjects_evaluated == 30
+    assert lint.summary.parse_failures == 1
+    assert lint.summary.subjects_flagged == 15
+    [hit] = lint.rule_hits
+    assert hit.rule == "MISSING_DOC"
+    assert hit.violation_count == 15
+    assert hit.subjects == tuple(f"prod.s{index:02d}-value" for index in range(0, 30, 2))
+
+    # compat_level이 없으면 SR 기본값(BACKWARD)으로 간주
+    assert guardrail.summary.subjects_flagged == 25
+    assert guardrail.rule_hits[0].rule == "GUARDRAIL_COMPATIBILITY"
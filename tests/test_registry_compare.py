@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import copy
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import orjson
+import pytest
+from confluent_kafka.schema_registry import RegisteredSchema
+from confluent_kafka.schema_registry.error import SchemaRegistryError
+
+from app.schema.application.use_cases.governance.registry_compare import (
+    CompareRegistriesUseCase,
+    RegistryComparisonStream,
+)
+from app.schema.domain.models import RegistrySubjectDiff
+from app.shared.database import DatabaseManager
+from benchmarks.registry import InMemorySchemaRegistryClient
+from benchmarks.synthetic import SyntheticCatalogSpec, generate_registry_state
+
+
+class _ConnectionManager:
+    def __init__(self, clients: dict[str, InMemorySchemaRegistryClient]) -> None:
+        self.clients = clients
+
+    async def get_schema_registry_client(self, registry_id: str) -> InMemorySchemaRegistryClient:
+        return self.clients[registry_id]
+
+    @asynccontextmanager
+    async def borrow_schema_registry_client(
+        self, registry_id: str
+    ) -> AsyncIterator[InMemorySchemaRegistryClient]:
+        yield await self.get_schema_registry_client(registry_id)
+
+
+async def _collect(stream: RegistryComparisonStream) -> dict[str, RegistrySubjectDiff]:
+    return {diff.subject: diff async for diff in stream.entries}
+
+
+@pytest.mark.asyncio
+async def test_compare_registries_reports_only_mismatched_subjects(tmp_path: Path) -> None:
+    prod_state = generate_registry_state(SyntheticCatalogSpec(subjects=25, max_versions=2))
+    stg_state = copy.deepcopy(prod_state)
+    subjects = sorted(prod_state.subjects)
+    changed, removed = subjects[0], subjects[1]
+
+    latest = stg_state.latest(changed)
+    assert latest is not None
+    schema = orjson.loads(latest.schema_str)
+    schema["fields"].append({"name": "promoted_flag", "type": "boolean", "default": False})
+    stg_state.register(changed, orjson.dumps(schema).decode())
+    stg_state.register("stg.new-value", '{"type":"record","name":"New","fields":[]}')
+    prod_state.delete_subject(removed)
+
+    stg = InMemorySchemaRegistryClient(stg_state)
+    prod = InMemorySchemaRegistryClient(prod_state)
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'compare.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    use_case = CompareRegistriesUseCase(
+        connection_manager=_ConnectionManager({"stg": stg, "prod": prod}),  # type: ignore[arg-type]
+        session_factory=database_manager.get_db_session,
+    )
+
+    try:
+        stream = await use_case.execute("stg", "prod")
+        diffs = await _collect(stream)
+        calls_after_first = stg.call_count + prod.call_count
+        # head 인덱스가 신선하면 SR을 다시 호출하지 않는다
+        cached = await use_case.execute("stg", "prod")
+        cached_diffs = await _collect(cached)
+        calls_after_second = stg.call_count + prod.call_count
+        with pytest.raises(ValueError):
+            await use_case.execute("prod", "prod")
+    finally:
+        await database_manager.close()
+
+    assert stream.summary.identical == 23
+    assert stream.summary.different == 1
+    assert stream.summary.only_in_source == 2
+    assert stream.summary.only_in_target == 0
+    assert diffs[changed].status == "different"
+    assert diffs[changed].changes == ["Added field: promoted_flag"]
+    assert diffs[removed].status == "only_in_source"
+    assert diffs["stg.new-value"].target_version is None
+    assert calls_after_second == calls_after_first
+    assert cached_diffs.keys() == diffs.keys()
+
+
+class _FlakyRegistryClient(InMemorySchemaRegistryClient):
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        super().__init__(*args, **kwargs)  # type: ignore[arg-type]
+        self.failing: set[str] = set()
+
+    async def get_latest_version(self, subject_name: str) -> RegisteredSchema:
+        if subject_name in self.failing:
+            raise SchemaRegistryError(503, 50301, "temporarily unavailable")
+        return await super().get_latest_version(subject_name)
+
+
+@pytest.mark.asyncio
+async def test_compare_registries_keeps_heads_of_subjects_that_failed_to_refresh(
+    tmp_path: Path,
+) -> None:
+    state = generate_registry_state(SyntheticCatalogSpec(subjects=10, max_versions=2))
+    stg = _FlakyRegistryClient(copy.deepcopy(state))
+    prod = _FlakyRegistryClient(copy.deepcopy(state))
+    kept, never_indexed = sorted(state.subjects)[:2]
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'compare.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    use_case = CompareRegistriesUseCase(
+        connection_manager=_ConnectionManager({"stg": stg, "prod": prod}),  # type: ignore[arg-type]
+        session_factory=database_manager.get_db_session,
+    )
+
+    try:
+        prod.failing = {never_indexed}
+        first = await use_case.execute("stg", "prod")
+        first_diffs = await _collect(first)
+
+        prod.failing = {kept, never_indexed}
+        refreshed = await use_case.execute("stg", "prod", refresh=True)
+        refreshed_diffs = await _collect(refreshed)
+        cached = await use_case.execute("stg", "prod")
+    finally:
+        await database_manager.close()
+
+    assert first.summary.failed_subjects == [never_indexed]
+    assert first.summary.only_in_source == 0
+    assert first_diffs == {}
+
+    # 일시 오류로 조회하지 못한 subject는 이전 head를 유지하고 차이로 보고하지 않는다
+    assert refreshed.summary.failed_subjects == [kept, never_indexed]
+    assert refreshed.summary.identical == 9
+    assert refreshed.summary.only_in_source == 0
+    assert refreshed_diffs == {}
+    assert cached.summary.failed_subjects == [kept]
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from app.shared.metrics import render_metrics
+from app.shared.middleware import RequestLoggingMiddleware
+
+
+def _streaming_app(events: list[str]) -> RequestLoggingMiddleware:
+    app = FastAPI()
+
+    @app.get("/stream/{name}")
+    async def export(name: str) -> StreamingResponse:
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b"first,"
+            events.append("generator resumed")
+            yield b"second"
+
+        return StreamingResponse(chunks(), media_type="text/csv")
+
+    return RequestLoggingMiddleware(app)
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_passes_through_chunk_by_chunk() -> None:
+    events: list[str] = []
+    sent: list[dict] = []
+    app = _streaming_app(events)
+
+    disconnected = asyncio.Event()
+    requests = iter([{"type": "http.request", "body": b"", "more_body": False}])
+
+    async def receive() -> dict:
+        message = next(requests, None)
+        if message is None:
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+        return message
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.body" and message.get("body"):
+            events.append(f"sent {message['body'].decode()}")
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/stream/orders",
+        "raw_path": b"/stream/orders",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"x-request-id", b"req-stream-1")],
+        "client": ("127.0.0.1", 5000),
+        "server": ("testserver", 80),
+    }
+    await app(scope, receive, send)
+
+    # 첫 chunk가 전송된 뒤에야 generator가 재개됨 (버퍼링 없음)
+    assert events[:2] == ["sent first,", "generator resumed"]
+    start = next(message for message in sent if message["type"] == "http.response.start")
+    headers = dict(start["headers"])
+    assert headers[b"x-request-id"] == b"req-stream-1"
+
+    exposition = render_metrics().decode()
+    assert (
+        'kafka_gov_http_response_size_bytes_sum{method="GET",route="/stream/{name}"} 12.0'
+        in exposition
+    )
+    assert (
+        'kafka_gov_http_time_to_first_byte_seconds_count{method="GET",route="/stream/{name}"} 1.0'
+        in exposition
+    )
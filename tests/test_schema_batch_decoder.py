@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import copy
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+from app.main import create_app
+from app.schema.domain.models import DomainSchemaBatch, DomainSchemaPlan
+from app.schema.interface.batch_decoder import decode_schema_batch
+
+_SCHEMA = '{"type":"record","name":"Order","fields":[{"name":"id","type":"string"}]}'
+
+
+def _payload() -> dict[str, Any]:
+    return {
+        "kind": "SchemaBatch",
+        "env": "prod",
+        "change_id": "2025-09-25_001",
+        "subjectStrategy": "SubjectNameStrategy",
+        "items": [
+            {
+                "subject": "prod.orders.created-value",
+                "type": "AVRO",
+                "compatibility": "FULL",
+                "schema": f"  {_SCHEMA}\n",
+                "references": [
+                    {"name": "common.Address", "subject": "prod.common.address-value", "version": 5}
+                ],
+                "metadata": {
+                    "owner": " team-data-platform ",
+                    "doc": "https://wiki.company.com/schemas/order",
+                    "tags": ["pii", "critical"],
+                    "description": "주문 이벤트 스키마",
+                },
+                "businessPurpose": "add order event",
+            },
+            {
+                "subject": "prod.orders.cancelled-value",
+                "schema_type": "JSON",
+                "compatibility": "BACKWARD",
+                "schema_text": "{}",
+                "schema_hash": "0123456789abcdef",
+                "dry_run_only": True,
+            },
+        ],
+        "approvalOverride": {
+            "reason": "emergency fix approved",
+            "approver": "lead",
+            "expiresAt": (datetime.now(UTC) + timedelta(hours=1)).isoformat(),
+        },
+    }
+
+
+def _mutated(mutate: Callable[[dict[str, Any]], object]) -> dict[str, Any]:
+    payload = _payload()
+    mutate(payload)
+    return payload
+
+
+def test_fast_path_matches_model_path_for_valid_payload() -> None:
+    payload = _payload()
+
+    fast = decode_schema_batch(copy.deepcopy(payload))
+    model = decode_schema_batch(copy.deepcopy(payload), fast_path=False)
+
+    assert fast == model
+    assert fast.batch.specs[0].schema == _SCHEMA
+    assert fast.batch.specs[0].metadata is not None
+    assert fast.batch.specs[0].metadata.owner == "team-data-platform"
+    assert fast.batch.specs[1].dry_run_only is True
+    assert fast.approval_override is not None
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda p: p.update(kind="Other"),
+        lambda p: p.update(env="qa"),
+        lambda p: p.update(change_id="bad id"),
+        lambda p: p.update(extra=True),
+        lambda p: p.update(items=[]),
+        lambda p: p.update(specs=p["items"]),
+        lambda p: p["items"].append(copy.deepcopy(p["items"][0])),
+        lambda p: p["items"][0].update(subject="dev.orders-value"),
+        lambda p: p["items"][0].update(subject="prod.Orders-value"),
+        lambda p: p["items"][0].update(compatibility=None),
+        lambda p: p["items"][0].update(type="avro"),
+        lambda p: p["items"][0].update(schema="   "),
+        lambda p: p["items"][0].update(schema_text="{}"),
+        lambda p: p["items"][0].update(source={"type": "inline", "inline": "{}"}),
+        lambda p: p["items"][0].update(dry_run_only="true"),
+        lambda p: p["items"][0]["references"].append(
+            {"name": "common.Address", "subject": "prod.common.other-value", "version": 1}
+        ),
+        lambda p: p["items"][0]["references"][0].update(version=True),
+        lambda p: p["items"][0]["metadata"].update(tags=None),
+        lambda p: p["items"][0]["metadata"].update(owner="Team"),
+        lambda p: p["items"][1].update(schema_hash="short"),
+        lambda p: p["approvalOverride"].update(expiresAt="2000-01-01T00:00:00Z"),
+    ],
+)
+def test_fast_path_rejections_report_model_errors(
+    mutate: Callable[[dict[str, Any]], object],
+) -> None:
+    payload = _mutated(mutate)
+
+    with pytest.raises(ValidationError) as fast_error:
+        decode_schema_batch(copy.deepcopy(payload))
+    with pytest.raises(ValidationError) as model_error:
+        decode_schema_batch(copy.deepcopy(payload), fast_path=False)
+
+    assert fast_error.value.errors(include_context=False) == model_error.value.errors(
+        include_context=False
+    )
+
+
+@dataclass
+class _RecordingDryRunUseCase:
+    batches: list[DomainSchemaBatch]
+
+    async def execute(
+        self,
+        registry_id: str,
+        batch: DomainSchemaBatch,
+        actor: str,
+        actor_context: dict[str, str] | None = None,
+    ) -> DomainSchemaPlan:
+        self.batches.append(batch)
+        return DomainSchemaPlan(
+            change_id=batch.change_id, env=batch.env, items=(), compatibility_reports=()
+        )
+
+
+def test_batch_dry_run_route_decodes_body() -> None:
+    app = create_app()
+    container = app.state.container
+    client = TestClient(app)
+    use_case = _RecordingDryRunUseCase(batches=[])
+    container.schema_container.dry_run_use_case.override(providers.Object(use_case))
+
+    try:
+        ok = client.post(
+            "/api/v1/schemas/batch/dry-run",
+            params={"registry_id": "registry-1"},
+            json=_payload(),
+        )
+        invalid = client.post(
+            "/api/v1/schemas/batch/dry-run",
+            params={"registry_id": "registry-1"},
+            json=_mutated(lambda p: p["items"][0].update(subject="prod.Orders-value")),
+        )
+        malformed = client.post(
+            "/api/v1/schemas/batch/dry-run",
+            params={"registry_id": "registry-1"},
+            content=b"{not json",
+            headers={"Content-Type": "application/json"},
+        )
+    finally:
+        container.schema_container.dry_run_use_case.reset_override()
+        client.close()
+
+    assert ok.status_code == 200
+    assert [spec.subject for spec in use_case.batches[0].specs] == [
+        "prod.orders.created-value",
+        "prod.orders.cancelled-value",
+    ]
+    assert invalid.status_code == 422
+    assert "body → items → [1번째 항목] → subject" in invalid.json()["detail"]
+    assert malformed.status_code == 422
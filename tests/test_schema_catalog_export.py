@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import io
+import tarfile
+import zipfile
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import orjson
+import pytest
+from dependency_injector import providers
+from fastapi.testclient import TestClient
+
+from app.main import create_app
+from app.schema.application.services.catalog_sync import CatalogSyncService
+from app.schema.application.use_cases.governance.catalog_export import (
+    CatalogExportStream,
+    ExportSchemaCatalogUseCase,
+)
+from app.schema.domain.models import SchemaVersionExport
+from app.schema.governance_support.constants import AuditAction, AuditStatus, AuditTarget
+from app.schema.infrastructure.models import SchemaAuditLogModel
+from app.shared.database import DatabaseManager
+from benchmarks.registry import InMemorySchemaRegistryClient
+from benchmarks.synthetic import SyntheticCatalogSpec, generate_registry_state
+
+
+class _StaticConnectionManager:
+    def __init__(self, client: InMemorySchemaRegistryClient) -> None:
+        self.client = client
+
+    async def get_schema_registry_client(self, registry_id: str) -> InMemorySchemaRegistryClient:
+        return self.client
+
+    @asynccontextmanager
+    async def borrow_schema_registry_client(
+        self, registry_id: str
+    ) -> AsyncIterator[InMemorySchemaRegistryClient]:
+        yield await self.get_schema_registry_client(registry_id)
+
+
+class _MultiRegistryConnectionManager:
+    def __init__(self, clients: dict[str, InMemorySchemaRegistryClient]) -> None:
+        self.clients = clients
+
+    async def get_schema_registry_client(self, registry_id: str) -> InMemorySchemaRegistryClient:
+        return self.clients[registry_id]
+
+    @asynccontextmanager
+    async def borrow_schema_registry_client(
+        self, registry_id: str
+    ) -> AsyncIterator[InMemorySchemaRegistryClient]:
+        yield await self.get_schema_registry_client(registry_id)
+
+
+def _sync_log(registry_id: str, status: str) -> SchemaAuditLogModel:
+    return SchemaAuditLogModel(
+        change_id=f"sync-{registry_id}",
+        action=AuditAction.SYNC,
+        target=AuditTarget.SCHEMA_REGISTRY,
+        actor="tester",
+        status=status,
+        message="synced",
+        snapshot={"registry_id": registry_id},
+    )
+
+
+async def _collect(stream: CatalogExportStream) -> list[SchemaVersionExport]:
+    return [exported async for exported in stream.entries]
+
+
+@pytest.mark.asyncio
+async def test_catalog_export_uses_registry_until_catalog_is_synced(tmp_path: Path) -> None:
+    state = generate_registry_state(SyntheticCatalogSpec(subjects=20, max_versions=3))
+    client = InMemorySchemaRegistryClient(state)
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'export.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    use_case = ExportSchemaCatalogUseCase(
+        connection_manager=_StaticConnectionManager(client),  # type: ignore[arg-type]
+        session_factory=database_manager.get_db_session,
+    )
+
+    try:
+        registry_latest = await use_case.execute("registry-1")
+        latest_entries = await _collect(registry_latest)
+        registry_history = await use_case.execute("registry-1", include_history=True)
+        history_entries = await _collect(registry_history)
+
+        async with database_manager.get_db_session() as session:
+            await CatalogSyncService(client, session).sync_all()
+            session.add(_sync_log("registry-1", AuditStatus.COMPLETED))
+
+        catalog_history = await use_case.execute("registry-1", include_history=True)
+        catalog_entries = await _collect(catalog_history)
+        prefix = next(iter(state.subjects))[:5]
+        filtered = await use_case.execute("registry-1", subject_prefix=prefix, source="registry")
+        filtered_entries = await _collect(filtered)
+    finally:
+        await database_manager.close()
+
+    assert registry_latest.source == "registry"
+    assert registry_latest.exported == state.subject_count
+    assert {entry.subject for entry in latest_entries} == set(state.subjects)
+    assert all(
+        entry.version == state.latest(entry.subject).version  # type: ignore[union-attr]
+        for entry in latest_entries
+    )
+    assert registry_history.exported == state.version_count
+    assert registry_history.failures == []
+
+    assert catalog_history.source == "catalog"
+    assert catalog_history.catalog_synced_at is not None
+    assert [(e.subject, e.version, e.canonical_hash) for e in catalog_entries] == [
+        (e.subject, e.version, e.canonical_hash) for e in history_entries
+    ]
+
+    assert filtered_entries
+    assert all(entry.subject.startswith(prefix) for entry in filtered_entries)
+
+
+@pytest.mark.asyncio
+async def test_catalog_export_only_uses_catalog_synced_from_the_same_registry(
+    tmp_path: Path,
+) -> None:
+    dev_state = generate_registry_state(SyntheticCatalogSpec(subjects=6, seed=1))
+    prod_state = generate_registry_state(SyntheticCatalogSpec(subjects=4, seed=2))
+    clients = {
+        "dev": InMemorySchemaRegistryClient(dev_state),
+        "prod": InMemorySchemaRegistryClient(prod_state),
+    }
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'export.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    use_case = ExportSchemaCatalogUseCase(
+        connection_manager=_MultiRegistryConnectionManager(clients),  # type: ignore[arg-type]
+        session_factory=database_manager.get_db_session,
+    )
+
+    try:
+        async with database_manager.get_db_session() as session:
+            await CatalogSyncService(clients["dev"], session).sync_all()
+            session.add(_sync_log("dev", AuditStatus.COMPLETED))
+
+        dev_export = await use_case.execute("dev")
+        prod_export = await use_case.execute("prod")
+        prod_entries = await _collect(prod_export)
+        with pytest.raises(ValueError, match="prod"):
+            await use_case.execute("prod", source="catalog")
+
+        # 다른 registry 동기화가 시작되면 카탈로그는 더 이상 dev 것이 아니다
+        async with database_manager.get_db_session() as session:
+            session.add(_sync_log("prod", AuditStatus.STARTED))
+        dev_after_prod_started = await use_case.execute("dev")
+    finally:
+        await database_manager.close()
+
+    assert dev_export.source == "catalog"
+    assert prod_export.source == "registry"
+    assert prod_export.catalog_synced_at is None
+    assert {entry.subject for entry in prod_entries} == set(prod_state.subjects)
+    assert dev_after_prod_started.source == "registry"
+
+
+@dataclass
+class _FakeCatalogExportUseCase:
+    entries: list[SchemaVersionExport]
+
+    async def execute(self, registry_id: str, **kwargs: object) -> CatalogExportStream:
+        assert registry_id == "registry-1"
+        assert kwargs["include_history"] is True
+        stream = CatalogExportStream(source="catalog", include_history=True)
+
+        async def iterate() -> AsyncIterator[SchemaVersionExport]:
+            for entry in self.entries:
+                stream.exported += 1
+                yield entry
+
+        stream.entries = iterate()
+        return stream
+
+
+def _export(subject: str, version: int) -> SchemaVersionExport:
+    return SchemaVersionExport(
+        subject=subject,
+        version=version,
+        schema_type="AVRO",
+        filename=f"{subject}.v{version}.avsc",
+        media_type="application/json",
+        schema_str=f'{{"type":"record","name":"R{version}","fields":[]}}',
+    )
+
+
+@pytest.mark.parametrize("archive_format", ["zip", "tar.gz"])
+def test_catalog_export_route_streams_archive(archive_format: str) -> None:
+    app = create_app()
+    container = app.state.container
+    client = TestClient(app)
+    fake_use_case = _FakeCatalogExportUseCase(
+        entries=[_export("prod.orders-value", 1), _export("prod.orders-value", 2)]
+    )
+    container.schema_container.export_schema_catalog_use_case.override(
+        providers.Object(fake_use_case)
+    )
+
+    try:
+        response = client.get(
+            "/api/v1/schemas/export",
+            params={"registry_id": "registry-1", "format": archive_format, "include_history": True},
+        )
+    finally:
+        container.schema_container.export_schema_catalog_use_case.reset_override()
+        client.close()
+
+    assert response.status_code == 200
+    assert response.headers["x-export-source"] == "catalog"
+    assert f".{archive_format}" in response.headers["content-disposition"]
+
+    if archive_format == "zip":
+        with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+            files = {name: archive.read(name) for name in archive.namelist()}
+    else:
+        with tarfile.open(fileobj=io.BytesIO(response.content), mode="r:gz") as archive:
+            files = {
+                member.name: archive.extractfile(member).read()  # type: ignore[union-attr]
+                for member in archive.getmembers()
+            }
+
+    assert files["prod.orders-value/prod.orders-value.v2.avsc"] == (
+        b'{"type":"record","name":"R2","fields":[]}'
+    )
+    manifest = orjson.loads(files["manifest.json"])
+    assert manifest["exported"] == 2
+    assert manifest["source"] == "catalog"
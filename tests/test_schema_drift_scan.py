@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+import pytest
+from confluent_kafka.schema_registry import RegisteredSchema
+from confluent_kafka.schema_registry.error import SchemaRegistryError
+
+from app.schema.application.services.catalog_sync import CatalogSyncService
+from app.schema.application.use_cases.governance.drift import (
+    GetSchemaDriftReportUseCase,
+    ScanSchemaDriftUseCase,
+)
+from app.schema.infrastructure.catalog_models import ObservedUsageModel
+from app.shared.database import DatabaseManager
+from benchmarks.registry import InMemorySchemaRegistryClient
+from benchmarks.synthetic import SyntheticCatalogSpec, generate_registry_state
+
+
+class _StaticConnectionManager:
+    def __init__(self, client: InMemorySchemaRegistryClient) -> None:
+        self.client = client
+
+    async def get_schema_registry_client(self, registry_id: str) -> InMemorySchemaRegistryClient:
+        return self.client
+
+    @asynccontextmanager
+    async def borrow_schema_registry_client(
+        self, registry_id: str
+    ) -> AsyncIterator[InMemorySchemaRegistryClient]:
+        yield await self.get_schema_registry_client(registry_id)
+
+
+@pytest.mark.asyncio
+async def test_drift_scan_stores_only_drifted_subjects(tmp_path: Path) -> None:
+    state = generate_registry_state(SyntheticCatalogSpec(subjects=30, max_versions=2))
+    client = InMemorySchemaRegistryClient(state)
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'drift.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    scan_use_case = ScanSchemaDriftUseCase(
+        connection_manager=_StaticConnectionManager(client),  # type: ignore[arg-type]
+        session_factory=database_manager.get_db_session,
+    )
+    report_use_case = GetSchemaDriftReportUseCase(session_factory=database_manager.get_db_session)
+    subjects = sorted(state.subjects)
+    advanced, observed = subjects[0], subjects[1]
+
+    try:
+        async with database_manager.get_db_session() as session:
+            await CatalogSyncService(client, session).sync_all()
+        clean_scan = await scan_use_case.execute("registry-1")
+
+        # 동기화 이후 SR에 새 버전 등록 + 이전 버전 사용 관측
+        latest = state.latest(advanced)
+        assert latest is not None
+        state.register(advanced, latest.schema_str.replace("}", " }", 1), "AVRO", [])
+        async with database_manager.get_db_session() as session:
+            session.add(ObservedUsageModel(subject=observed, version=0, topics=["orders"]))
+        scan = await scan_use_case.execute("registry-1")
+
+        first_page = await report_use_case.execute("registry-1", page=1, limit=1)
+        second_page = await report_use_case.execute("registry-1", page=2, limit=1)
+        empty = await report_use_case.execute("registry-unknown")
+    finally:
+        await database_manager.close()
+
+    assert clean_scan.subjects_scanned == 30
+    assert clean_scan.drifted_subjects == 0
+    assert scan.drifted_subjects == 2
+    assert first_page.summary is not None
+    assert first_page.summary.drifted_subjects == 2
+    assert first_page.total == 2
+    reports = {report.subject: report for report in first_page.items + second_page.items}
+    assert reports[advanced].drift_flags == [
+        "catalog_subject_version_mismatch",
+        "catalog_snapshot_version_mismatch",
+    ]
+    assert reports[observed].drift_flags == ["observed_usage_on_non_latest_version"]
+    assert empty.summary is None
+    assert empty.items == []
+
+
+class _FlakyRegistryClient(InMemorySchemaRegistryClient):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.failing: set[str] = set()
+
+    async def get_latest_version(self, subject_name: str) -> RegisteredSchema:
+        if subject_name in self.failing:
+            raise SchemaRegistryError(503, 50301, "temporarily unavailable")
+        return await super().get_latest_version(subject_name)
+
+
+@pytest.mark.asyncio
+async def test_drift_scan_keeps_failed_findings_and_flags_removed_subjects(
+    tmp_path: Path,
+) -> None:
+    state = generate_registry_state(SyntheticCatalogSpec(subjects=10, max_versions=2))
+    client = _FlakyRegistryClient(state)
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'drift.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    scan_use_case = ScanSchemaDriftUseCase(
+        connection_manager=_StaticConnectionManager(client),  # type: ignore[arg-type]
+        session_factory=database_manager.get_db_session,
+    )
+    report_use_case = GetSchemaDriftReportUseCase(session_factory=database_manager.get_db_session)
+    subjects = sorted(state.subjects)
+    advanced, removed = subjects[0], subjects[1]
+
+    try:
+        async with database_manager.get_db_session() as session:
+            await CatalogSyncService(client, session).sync_all()
+        latest = state.latest(advanced)
+        assert latest is not None
+        state.register(advanced, latest.schema_str.replace("}", " }", 1), "AVRO", [])
+        await scan_use_case.execute("registry-1")
+
+        # 일시적 SR 오류로 조회에 실패한 subject의 직전 finding은 지워지지 않아야 한다
+        client.failing.add(advanced)
+        state.delete_subject(removed)
+        scan = await scan_use_case.execute("registry-1")
+        report = await report_use_case.execute("registry-1")
+    finally:
+        await database_manager.close()
+
+    assert scan.failed_subjects == [advanced]
+    assert scan.drifted_subjects == 2
+    assert report.total == 2
+    reports = {item.subject: item for item in report.items}
+    assert reports[advanced].drift_flags == [
+        "catalog_subject_version_mismatch",
+        "catalog_snapshot_version_mismatch",
+    ]
+    assert reports[removed].drift_flags == ["registry_subject_missing"]
+    assert reports[removed].registry_latest_version is None
+    assert reports[removed].catalog_latest_version is not None
@@ -16,11 +16,9 @@ class _FakeSession:
         return None
 
 
-@dataclass
-class _FakeMetadataRepository:
-    @asynccontextmanager
-    async def session_factory(self) -> AsyncIterator[_FakeSession]:
-        yield _FakeSession()
+@asynccontextmanager
+async def _fake_session_factory() -> AsyncIterator[_FakeSession]:
+    yield _FakeSession()
 
 
 @dataclass
@@ -57,7 +55,7 @@ async def test_drift_use_case_uses_highest_live_version(monkeypatch) -> None:
     monkeypatch.setattr(drift_module, "ConfluentSchemaRegistryAdapter", _FakeRegistryAdapter)
     use_case = GetSchemaDriftUseCase(
         connection_manager=_FakeConnectionManager(),  # type: ignore[arg-type]
-        metadata_repository=_FakeMetadataRepository(),  # type: ignore[arg-type]
+        session_factory=_fake_session_factory,  # type: ignore[arg-type]
     )
 
     result = await use_case.execute(registry_id="registry-1", subject="dev.orders-value")
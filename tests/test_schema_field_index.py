@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import orjson
+import pytest
+
+from app.schema.application.services.field_index import CatalogFieldIndexer, extract_field_rows
+from app.schema.application.use_cases.governance.field_search import SearchSchemaFieldsUseCase
+from app.schema.infrastructure.catalog_models import SchemaSubjectModel, SchemaVersionModel
+from app.shared.cpu_executor import CpuTaskExecutor
+from app.shared.database import DatabaseManager
+
+
+def _schema(*fields: dict[str, object]) -> str:
+    return orjson.dumps({"type": "record", "name": "Order", "fields": list(fields)}).decode()
+
+
+def test_extract_field_rows_flattens_nested_fields() -> None:
+    rows = extract_field_rows(
+        _schema(
+            {"name": "customerId", "type": "string", "doc": "id"},
+            {"name": "amount", "type": {"type": "bytes", "logicalType": "decimal"}},
+            {
+                "name": "shipping",
+                "type": [
+                    "null",
+                    {
+                        "type": "record",
+                        "name": "Address",
+                        "fields": [{"name": "zip", "type": "string"}],
+                    },
+                ],
+                "default": None,
+            },
+        )
+    )
+
+    by_path = {row["field_path"]: row for row in rows}
+    assert list(by_path) == ["customerId", "amount", "shipping", "shipping.zip"]
+    assert by_path["customerId"]["name_key"] == "customer_id"
+    assert by_path["customerId"]["has_doc"] is True
+    assert (by_path["amount"]["field_type"], by_path["amount"]["logical_type"]) == (
+        "bytes",
+        "decimal",
+    )
+    assert by_path["shipping"]["field_type"] == "record"
+    assert by_path["shipping"]["nullable"] is True
+    assert by_path["shipping"]["has_default"] is True
+    assert by_path["shipping.zip"]["depth"] == 1
+    assert extract_field_rows("{not json") == []
+
+
+@pytest.mark.asyncio
+async def test_field_search_over_rebuilt_index(tmp_path: Path) -> None:
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'fields.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+
+    async with database_manager.get_db_session() as session:
+        session.add_all(
+            [
+                SchemaVersionModel(
+                    subject="prod.orders-value",
+                    version=1,
+                    schema_type="AVRO",
+                    schema_str=_schema({"name": "customer_id", "type": "long"}),
+                ),
+                SchemaVersionModel(
+                    subject="prod.orders-value",
+                    version=2,
+                    schema_type="AVRO",
+                    schema_str=_schema(
+                        {"name": "customerId", "type": "string"},
+                        {"name": "amount", "type": "bytes"},
+                    ),
+                ),
+                SchemaVersionModel(
+                    subject="prod.payments-value",
+                    version=1,
+                    schema_type="AVRO",
+                    schema_str=_schema({"name": "amount", "type": "bytes"}),
+                ),
+                SchemaVersionModel(
+                    subject="prod.proto-value",
+                    version=1,
+                    schema_type="PROTOBUF",
+                    schema_str="syntax = 'proto3';",
+                ),
+                SchemaSubjectModel(subject="prod.orders-value", latest_version=2),
+                SchemaSubjectModel(subject="prod.payments-value", latest_version=1),
+            ]
+        )
+
+    executor = CpuTaskExecutor(process_threshold_bytes=1 << 30, thread_workers=1)
+    use_case = SearchSchemaFieldsUseCase(database_manager.get_db_session)
+    try:
+        async with database_manager.get_db_session() as session:
+            summary = await CatalogFieldIndexer(session, cpu_executor=executor).rebuild()
+        by_name = await use_case.execute(name="customer_id")
+        all_versions = await use_case.execute(name="customerId", latest_only=False)
+        bytes_fields = await use_case.execute(field_type="bytes", page=2, limit=1)
+        prefixed = await use_case.execute(name_prefix="amo", subject_prefix="prod.pay")
+        with pytest.raises(ValueError):
+            await use_case.execute(subject_prefix="prod.")
+    finally:
+        executor.shutdown()
+        await database_manager.close()
+
+    assert (summary.versions_indexed, summary.fields_indexed) == (3, 4)
+    assert [(hit.subject, hit.version, hit.field_type) for hit in by_name.items] == [
+        ("prod.orders-value", 2, "string")
+    ]
+    assert [hit.version for hit in all_versions.items] == [1, 2]
+    assert bytes_fields.total == 2
+    assert [hit.subject for hit in bytes_fields.items] == ["prod.payments-value"]
+    assert [hit.field_path for hit in prefixed.items] == ["amount"]
+    assert prefixed.items[0].subject == "prod.payments-value"
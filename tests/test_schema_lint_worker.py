@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import orjson
+import pytest
+from sqlalchemy import select
+
+from app.container import AppContainer
+from app.schema.application.services.lint_worker import SchemaLintWorker
+from app.schema.application.services.schema_lint import LINT_ENGINE_VERSION
+from app.schema.infrastructure.catalog_models import SchemaVersionModel
+from app.shared.cpu_executor import CpuTaskExecutor
+from app.shared.database import DatabaseManager
+
+DOCUMENTED = orjson.dumps(
+    {"type": "record", "name": "Event", "doc": "event", "fields": [{"name": "id", "type": "long"}]}
+).decode()
+UNDOCUMENTED = orjson.dumps(
+    {"type": "record", "name": "Event", "fields": [{"name": "email", "type": "string"}]}
+).decode()
+
+
+@pytest.mark.asyncio
+async def test_lint_worker_lints_each_canonical_body_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'lint.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+
+    async with database_manager.get_db_session() as session:
+        for index in range(5):
+            session.add(
+                SchemaVersionModel(
+                    subject=f"prod.s{index}-value",
+                    version=1,
+                    schema_type="AVRO",
+                    schema_str=DOCUMENTED if index < 3 else UNDOCUMENTED,
+                    schema_canonical_hash="hash-a" if index < 3 else "hash-b",
+                )
+            )
+        session.add(
+            SchemaVersionModel(
+                subject="prod.legacy-value", version=1, schema_type="AVRO", schema_str="{bad"
+            )
+        )
+        session.add(
+            SchemaVersionModel(
+                subject="prod.proto-value",
+                version=1,
+                schema_type="PROTOBUF",
+                schema_str="syntax = 'proto3';",
+            )
+        )
+
+    linted: list[list[str]] = []
+    original_lint = SchemaLintWorker._lint
+
+    async def tracking_lint(self: SchemaLintWorker, bodies: dict[str, str]) -> dict:
+        linted.append(sorted(bodies))
+        return await original_lint(self, bodies)
+
+    monkeypatch.setattr(SchemaLintWorker, "_lint", tracking_lint)
+    executor = CpuTaskExecutor(process_threshold_bytes=1 << 30, thread_workers=1)
+    worker = SchemaLintWorker(database_manager.get_db_session, batch_size=1, cpu_executor=executor)
+    try:
+        first = await worker.run_until_idle()
+        async with database_manager.get_db_session() as session:
+            rows = {row.subject: row for row in await session.scalars(select(SchemaVersionModel))}
+            # 같은 본문의 새 버전은 기존 결과 재사용, 엔진 버전이 다르면 재-lint
+            session.add(
+                SchemaVersionModel(
+                    subject="prod.s0-value",
+                    version=2,
+                    schema_type="AVRO",
+                    schema_str=DOCUMENTED,
+                    schema_canonical_hash="hash-a",
+                )
+            )
+            for subject in ("prod.s3-value", "prod.s4-value"):
+                rows[subject].lint_engine_version = LINT_ENGINE_VERSION - 1
+        linted.clear()
+        second = await worker.run_until_idle()
+    finally:
+        executor.shutdown()
+        await database_manager.close()
+
+    assert first.linted_bodies == 3
+    assert first.updated_versions == 6
+    assert rows["prod.s0-value"].lint_report == rows["prod.s2-value"].lint_report
+    assert rows["prod.s0-value"].lint_engine_version == LINT_ENGINE_VERSION
+    codes = {violation["code"] for violation in rows["prod.s4-value"].lint_report["violations"]}
+    assert {"MISSING_DOC", "PII_CANDIDATE"} <= codes
+    assert rows["prod.legacy-value"].lint_report["violations"][0]["code"] == "PARSE_ERROR"
+    assert rows["prod.proto-value"].lint_report is None
+
+    assert second.reused_reports == 1
+    assert second.linted_bodies == 1
+    assert linted == [["hash-b"]]
+
+
+@pytest.mark.asyncio
+async def test_lint_worker_is_not_started_by_default() -> None:
+    container = AppContainer()
+
+    # 배치를 선점하지 않으므로 앱 프로세스마다 워커가 뜨지 않아야 한다
+    assert await container.schema_container.lint_worker_resource() is None
+    await container.schema_container.shutdown_resources()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import select
+
+from app.schema.application.use_cases.governance.versions import GetSchemaVersionUseCase
+from app.schema.domain.models import (
+    DomainEnvironment,
+    DomainPlanAction,
+    DomainSchemaDiff,
+    DomainSchemaPlan,
+    DomainSchemaPlanItem,
+)
+from app.schema.infrastructure.models import SchemaArtifactModel, SchemaPlanItemModel
+from app.schema.infrastructure.repository.mysql_repository import MySQLSchemaMetadataRepository
+from app.shared.database import DatabaseManager
+
+
+def _item(subject: str, reason: str | None) -> DomainSchemaPlanItem:
+    return DomainSchemaPlanItem(
+        subject=subject,
+        action=DomainPlanAction.UPDATE,
+        current_version=1,
+        target_version=2,
+        diff=DomainSchemaDiff(
+            type="update",
+            changes=("Field added: status",),
+            current_version=1,
+            target_compatibility="BACKWARD",
+            schema_type="AVRO",
+        ),
+        reason=reason,
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_plan_indexes_items_for_version_context(tmp_path: Path) -> None:
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'plans.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    repository = MySQLSchemaMetadataRepository(database_manager.get_db_session)
+
+    try:
+        await repository.save_plan(
+            DomainSchemaPlan(
+                change_id="chg-1",
+                env=DomainEnvironment.PROD,
+                items=(_item("prod.orders-value", "draft"), _item("prod.users-value", None)),
+            ),
+            created_by="tester",
+        )
+        # 동일 change_id 재계획 시 항목 교체
+        await repository.save_plan(
+            DomainSchemaPlan(
+                change_id="chg-1",
+                env=DomainEnvironment.PROD,
+                items=(_item("prod.orders-value", "Add status"),),
+            ),
+            created_by="tester",
+        )
+        async with database_manager.get_db_session() as session:
+            session.add(
+                SchemaArtifactModel(
+                    subject="prod.orders-value",
+                    version=2,
+                    change_id="chg-1",
+                    schema_type="AVRO",
+                )
+            )
+
+        async with database_manager.get_db_session() as session:
+            rows = (await session.execute(select(SchemaPlanItemModel))).scalars().all()
+
+        use_case = GetSchemaVersionUseCase(
+            connection_manager=None,  # type: ignore[arg-type]
+            session_factory=database_manager.get_db_session,
+        )
+        context = await use_case._load_context("prod.orders-value")
+    finally:
+        await database_manager.close()
+
+    assert [(row.subject, row.reason, row.target_version) for row in rows] == [
+        ("prod.orders-value", "Add status", 2)
+    ]
+    assert context.plan_reasons == {("chg-1", "prod.orders-value"): "Add status"}
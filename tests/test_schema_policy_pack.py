@@ -10,13 +10,20 @@ from app.schema.domain.models import (
     DomainSchemaDiff,
     DomainSchemaPlan,
     DomainSchemaPlanItem,
-    DomainSchemaSpec,
     DomainSchemaSource,
     DomainSchemaSourceType,
+    DomainSchemaSpec,
     DomainSchemaType,
     DomainSubjectStrategy,
 )
 from app.schema.domain.policies.policy_pack import DefaultSchemaPolicyPackV1
+from app.schema.governance_support.policy_types import DomainResourceType
+from app.schema.governance_support.preflight_policy import (
+    DomainPolicyDecision,
+    DomainPolicyPackEvaluation,
+    DomainPolicyRuleResult,
+    DomainRiskLevel,
+)
 
 
 def _build_plan(
@@ -146,3 +153,44 @@ def test_policy_pack_emits_backward_incompatibility_rule() -> None:
         violation.rule == "schema.compatibility.backward_incompatible"
         for violation in result.violations
     )
+
+
+def test_policy_pack_evaluation_buckets_rules_once() -> None:
+    decisions = (
+        (DomainPolicyDecision.WARN, DomainRiskLevel.LOW),
+        (DomainPolicyDecision.APPROVAL_REQUIRED, DomainRiskLevel.HIGH),
+        (DomainPolicyDecision.WARN, DomainRiskLevel.MEDIUM),
+    )
+    rules = [
+        DomainPolicyRuleResult(
+            code=f"schema.rule.{index % 7}",
+            severity="warning",
+            risk_level=decisions[index % 3][1],
+            decision=decisions[index % 3][0],
+            reason=f"reason {index % 5}",
+            resource_type=DomainResourceType.SCHEMA,
+            resource_name=f"prod.s{index % 100}-value",
+        )
+        for index in range(3000)
+    ]
+
+    evaluation = DomainPolicyPackEvaluation(
+        pack_name="schema-default-v1",
+        resource_type=DomainResourceType.SCHEMA,
+        rules=rules,  # type: ignore[arg-type]
+    )
+
+    assert isinstance(evaluation.rules, tuple)
+    assert len(evaluation.approval_rules) == 1000
+    assert evaluation.warning_count == 2000
+    assert evaluation.blocking_rules == ()
+    assert evaluation.decision is DomainPolicyDecision.APPROVAL_REQUIRED
+    assert evaluation.risk_level is DomainRiskLevel.HIGH
+    assert evaluation.reasons == tuple(f"reason {index}" for index in range(5))
+    assert len(evaluation.rules_for_resource("prod.s1-value")) == 30
+    assert len(evaluation.rules_for_risk(DomainRiskLevel.MEDIUM)) == 1000
+    assert evaluation == DomainPolicyPackEvaluation(
+        pack_name="schema-default-v1",
+        resource_type=DomainResourceType.SCHEMA,
+        rules=tuple(rules),
+    )
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+import pytest
+
+from app.schema.domain.models import (
+    DomainSchemaDeleteImpact,
+    SchemaReferenceGraph,
+    SchemaVersionInfo,
+    SubjectName,
+)
+from app.schema.domain.models.value_objects import DomainSchemaReference
+from app.schema.domain.services import SchemaDeleteAnalyzer
+from app.schema.infrastructure.repository.reference_repository import (
+    MySQLSchemaReferenceRepository,
+    invalidate_reference_graph,
+)
+from app.shared.database import DatabaseManager
+
+
+def _graph() -> SchemaReferenceGraph:
+    # dev.order → dev.customer → dev.address, dev.invoice → dev.order, dev.invoice → dev.address
+    return SchemaReferenceGraph(
+        [
+            ("dev.order-value", "dev.customer-value"),
+            ("dev.customer-value", "dev.address-value"),
+            ("dev.invoice-value", "dev.order-value"),
+            ("dev.invoice-value", "dev.address-value"),
+        ]
+    )
+
+
+def test_reference_graph_transitive_closure_and_depth_limit() -> None:
+    graph = _graph()
+
+    assert [(node.subject, node.depth) for node in graph.dependents("dev.address-value")] == [
+        ("dev.customer-value", 1),
+        ("dev.invoice-value", 1),
+        ("dev.order-value", 2),
+    ]
+    assert [node.subject for node in graph.dependents("dev.address-value", max_depth=1)] == [
+        "dev.customer-value",
+        "dev.invoice-value",
+    ]
+    assert [(node.subject, node.depth) for node in graph.dependencies("dev.invoice-value")] == [
+        ("dev.address-value", 1),
+        ("dev.order-value", 1),
+        ("dev.customer-value", 2),
+    ]
+    assert graph.dependents("dev.unknown-value") == []
+
+
+def test_reference_graph_topological_order_registers_dependencies_first() -> None:
+    graph = _graph()
+
+    order = graph.topological_order(
+        ["dev.invoice-value", "dev.other-value", "dev.order-value", "dev.address-value"]
+    )
+
+    # order는 배치 밖 subject(customer)만 참조하므로 바로 등록 가능
+    assert order == [
+        "dev.other-value",
+        "dev.order-value",
+        "dev.address-value",
+        "dev.invoice-value",
+    ]
+    cyclic = SchemaReferenceGraph([("dev.a-value", "dev.b-value"), ("dev.b-value", "dev.a-value")])
+    assert cyclic.topological_order(["dev.a-value", "dev.b-value"]) == [
+        "dev.a-value",
+        "dev.b-value",
+    ]
+
+
+def test_reference_graph_five_hop_closure_on_large_catalog() -> None:
+    # subject 10,000개, subject당 참조 5개 = 간선 50,000개
+    subjects = [f"dev.s{index}-value" for index in range(10_000)]
+    edges = [
+        (subjects[index], subjects[(index + offset * 1_999) % len(subjects)])
+        for index in range(len(subjects))
+        for offset in range(1, 6)
+    ]
+    graph = SchemaReferenceGraph(edges)
+
+    started = time.perf_counter()
+    dependents = graph.dependents(subjects[0], max_depth=5)
+    elapsed = time.perf_counter() - started
+
+    assert graph.edge_count == 50_000
+    assert dependents and max(node.depth for node in dependents) == 5
+    assert elapsed < 1.0
+
+
+class _RegistryRepository:
+    async def describe_subjects(
+        self, subjects: Iterable[SubjectName]
+    ) -> dict[SubjectName, SchemaVersionInfo]:
+        return {
+            subject: SchemaVersionInfo(
+                version=1,
+                schema_id=1,
+                schema='"string"',
+                schema_type="AVRO",
+                references=[],
+                hash="h",
+            )
+            for subject in subjects
+        }
+
+
+@pytest.mark.asyncio
+async def test_delete_analysis_reports_transitive_dependents(tmp_path: Path) -> None:
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'references.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    invalidate_reference_graph()
+
+    try:
+        repository = MySQLSchemaReferenceRepository(
+            database_manager.get_db_session, cache_ttl_seconds=300
+        )
+        await repository.record_references(
+            "dev.customer-value",
+            1,
+            [DomainSchemaReference(name="Address", subject="dev.address-value", version=1)],
+        )
+        await repository.record_references(
+            "dev.order-value",
+            3,
+            [DomainSchemaReference(name="Customer", subject="dev.customer-value", version=1)],
+        )
+
+        analyzer = SchemaDeleteAnalyzer(_RegistryRepository(), repository)  # type: ignore[arg-type]
+        impact: DomainSchemaDeleteImpact = await analyzer.analyze_delete_impact("dev.address-value")
+
+        assert impact.dependents == ("dev.customer-value", "dev.order-value")
+        assert impact.safe_to_delete is False
+        assert any("직접 1개, 간접 1개" in warning for warning in impact.warnings)
+
+        # 기록/삭제 시 캐시가 무효화되어 바로 반영된다
+        await repository.delete_subject("dev.customer-value")
+        impact = await analyzer.analyze_delete_impact("dev.address-value")
+        assert impact.dependents == ()
+        assert impact.safe_to_delete is True
+    finally:
+        invalidate_reference_graph()
+        await database_manager.close()
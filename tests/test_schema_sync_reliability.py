@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 
 import pytest
@@ -15,6 +17,10 @@ class _FakeConnectionManager:
         assert registry_id == "registry-1"
         return object()
 
+    @asynccontextmanager
+    async def borrow_schema_registry_client(self, registry_id: str) -> AsyncIterator[object]:
+        yield await self.get_schema_registry_client(registry_id)
+
 
 @dataclass
 class _FakeMetadataRepository:
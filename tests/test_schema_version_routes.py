@@ -1,17 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from pathlib import Path
 
+import pytest
 from dependency_injector import providers
 from fastapi.testclient import TestClient
 
 from app.main import create_app
+from app.schema.application.use_cases.governance.versions import GetSchemaVersionUseCase
 from app.schema.domain.models import (
     SchemaVersionExport,
     SubjectVersionDetail,
     SubjectVersionList,
     SubjectVersionSummary,
 )
+from app.schema.infrastructure.models import SchemaArtifactModel
+from app.schema.infrastructure.repository.mysql_repository import MySQLSchemaMetadataRepository
+from app.shared.database import DatabaseManager
 
 
 @dataclass
@@ -27,11 +33,19 @@ class _FakeListVersionsUseCase:
 @dataclass
 class _FakeGetVersionUseCase:
     result: SubjectVersionDetail
+    owner_revision: str = "team-order"
+    calls: int = 0
+
+    async def revision(self, subject: str, version: int) -> tuple[object, ...]:
+        assert subject == "prod.orders-value"
+        assert version == 2
+        return (self.owner_revision,)
 
     async def execute(self, registry_id: str, subject: str, version: int) -> SubjectVersionDetail:
         assert registry_id == "registry-1"
         assert subject == "prod.orders-value"
         assert version == 2
+        self.calls += 1
         return self.result
 
 
@@ -39,11 +53,13 @@ class _FakeGetVersionUseCase:
 class _FakeExportVersionUseCase:
     result: SchemaVersionExport
     latest_result: SchemaVersionExport
+    calls: int = 0
 
     async def execute(self, registry_id: str, subject: str, version: int) -> SchemaVersionExport:
         assert registry_id == "registry-1"
         assert subject == "prod.orders-value"
         assert version == 2
+        self.calls += 1
         return self.result
 
     async def execute_latest(self, registry_id: str, subject: str) -> SchemaVersionExport:
@@ -193,3 +209,153 @@ def test_export_routes_return_download_headers() -> None:
         == 'attachment; filename="prod.orders-value.v3.avsc"'
     )
     assert "status" in response_latest.text
+
+
+def test_export_routes_support_conditional_requests() -> None:
+    client, container = _build_client()
+    fake_use_case = _FakeExportVersionUseCase(
+        result=SchemaVersionExport(
+            subject="prod.orders-value",
+            version=2,
+            schema_type="AVRO",
+            filename="prod.orders-value.v2.avsc",
+            media_type="application/json",
+            schema_str='{"type":"record","name":"Order","fields":[]}',
+            canonical_hash="canonical-2",
+        ),
+        latest_result=SchemaVersionExport(
+            subject="prod.orders-value",
+            version=3,
+            schema_type="AVRO",
+            filename="prod.orders-value.v3.avsc",
+            media_type="application/json",
+            schema_str='{"type":"record","name":"Order","fields":[{"name":"status","type":"string"}]}',
+            canonical_hash="canonical-3",
+        ),
+    )
+    container.schema_container.export_schema_version_use_case.override(
+        providers.Object(fake_use_case)
+    )
+    version_url = "/api/v1/schemas/subjects/prod.orders-value/versions/2/export"
+    latest_url = "/api/v1/schemas/subjects/prod.orders-value/export"
+    params = {"registry_id": "registry-1"}
+
+    try:
+        first = client.get(version_url, params=params)
+        etag = first.headers["etag"]
+        revalidated = client.get(version_url, params=params, headers={"If-None-Match": etag})
+        mismatched = client.get(
+            version_url, params=params, headers={"If-None-Match": '"other", W/"stale"'}
+        )
+        latest = client.get(latest_url, params=params)
+        latest_revalidated = client.get(
+            latest_url, params=params, headers={"If-None-Match": f'"x", {latest.headers["etag"]}'}
+        )
+    finally:
+        container.schema_container.export_schema_version_use_case.reset_override()
+        client.close()
+
+    assert first.status_code == 200
+    assert etag.startswith('"') and not etag.startswith("W/")
+    assert "immutable" in first.headers["cache-control"]
+
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+    assert "immutable" in revalidated.headers["cache-control"]
+    # 정확한 버전의 재검증은 export use case(SR 조회)를 실행하지 않는다
+    assert fake_use_case.calls == 2
+
+    assert mismatched.status_code == 200
+    assert mismatched.headers["etag"] == etag
+
+    assert latest.status_code == 200
+    assert latest.headers["etag"] != etag
+    assert "immutable" not in latest.headers["cache-control"]
+    assert "must-revalidate" in latest.headers["cache-control"]
+    assert latest_revalidated.status_code == 304
+
+
+def test_version_detail_route_returns_304_for_matching_etag() -> None:
+    client, container = _build_client()
+    fake_use_case = _FakeGetVersionUseCase(
+        result=SubjectVersionDetail(
+            subject="prod.orders-value",
+            version=2,
+            schema_id=102,
+            schema_str='{"type":"record","name":"Order","fields":[]}',
+            schema_type="AVRO",
+            hash="hash-2",
+            canonical_hash="canonical-2",
+            references=[],
+            owner="team-order",
+            compatibility_mode="BACKWARD",
+            created_at="2026-04-25T10:00:00Z",
+            author="schema-admin",
+            commit_message=None,
+        )
+    )
+    container.schema_container.schema_version_use_case.override(providers.Object(fake_use_case))
+    url = "/api/v1/schemas/subjects/prod.orders-value/versions/2"
+
+    try:
+        first = client.get(url, params={"registry_id": "registry-1"})
+        second = client.get(
+            url,
+            params={"registry_id": "registry-1"},
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+        calls_after_revalidation = fake_use_case.calls
+        # 메타데이터가 바뀌면 같은 ETag로도 새 응답을 받는다
+        fake_use_case.owner_revision = "team-payment"
+        third = client.get(
+            url,
+            params={"registry_id": "registry-1"},
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+    finally:
+        container.schema_container.schema_version_use_case.reset_override()
+        client.close()
+
+    assert first.status_code == 200
+    assert first.json()["canonical_hash"] == "canonical-2"
+    assert first.headers["cache-control"] == "no-cache"
+    assert second.status_code == 304
+    assert second.headers["etag"] == first.headers["etag"]
+    assert calls_after_revalidation == 1
+    assert third.status_code == 200
+    assert third.headers["etag"] != first.headers["etag"]
+
+
+@pytest.mark.asyncio
+async def test_version_revision_tracks_metadata_without_registry(tmp_path: Path) -> None:
+    database_manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'versions.db'}")
+    await database_manager.initialize()
+    await database_manager.create_tables()
+    repository = MySQLSchemaMetadataRepository(database_manager.get_db_session)
+    # SR을 호출하면 실패하도록 connection_manager 없이 구성
+    use_case = GetSchemaVersionUseCase(
+        connection_manager=None,  # type: ignore[arg-type]
+        session_factory=database_manager.get_db_session,
+    )
+    subject = "prod.orders-value"
+
+    try:
+        empty = await use_case.revision(subject, 2)
+        async with database_manager.get_db_session() as session:
+            session.add(
+                SchemaArtifactModel(
+                    subject=subject, version=2, change_id="chg-1", schema_type="AVRO"
+                )
+            )
+        await repository.save_schema_metadata(subject, {"owner": "team-order"})
+        first = await use_case.revision(subject, 2)
+        other_version = await use_case.revision(subject, 1)
+        await repository.save_schema_metadata(subject, {"compatibility_mode": "FULL"})
+        after_compat = await use_case.revision(subject, 2)
+    finally:
+        await database_manager.close()
+
+    assert empty != first
+    assert first != other_version
+    assert after_compat != first
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.main import create_app
+from app.shared.database import DatabaseManager
+from app.shared.tracing import (
+    InMemorySpanExporter,
+    set_span_exporter,
+    start_span,
+    trace_id_from_request_id,
+    traced_class,
+)
+
+
+@pytest.fixture
+def exporter() -> Iterator[InMemorySpanExporter]:
+    memory_exporter = InMemorySpanExporter()
+    set_span_exporter(memory_exporter)
+    try:
+        yield memory_exporter
+    finally:
+        set_span_exporter(None)
+
+
+@traced_class("usecase")
+class _TracedUseCase:
+    def __init__(self, database_manager: DatabaseManager) -> None:
+        self.database_manager = database_manager
+
+    async def execute(self) -> int:
+        async with self.database_manager.get_db_session() as session:
+            result = await session.execute(text("SELECT 1"))
+            return int(result.scalar_one())
+
+
+@pytest.mark.asyncio
+async def test_use_case_and_db_spans_share_trace(
+    exporter: InMemorySpanExporter, tmp_path: Path
+) -> None:
+    manager = DatabaseManager(f"sqlite+aiosqlite:///{tmp_path / 'tracing.db'}")
+    try:
+        with start_span("request") as root:
+            assert await _TracedUseCase(manager).execute() == 1
+    finally:
+        await manager.close()
+
+    assert root is not None
+    spans = {span.name: span for span in exporter.spans}
+    use_case_span = spans["usecase._TracedUseCase.execute"]
+    db_span = spans["db.select"]
+
+    assert use_case_span.parent_span_id == root.span_id
+    assert db_span.parent_span_id == use_case_span.span_id
+    assert {span.trace_id for span in exporter.spans} == {root.trace_id}
+    assert db_span.attributes["db.system"] == "sqlite"
+
+
+def test_http_span_uses_request_id_as_trace_id(exporter: InMemorySpanExporter) -> None:
+    client = TestClient(create_app())
+    request_id = "0f8fad5b-d9cb-469f-a165-70867728950e"
+
+    response = client.get("/health", headers={"X-Request-ID": request_id})
+
+    trace_id = trace_id_from_request_id(request_id)
+    assert trace_id == "0f8fad5bd9cb469fa16570867728950e"
+    assert response.headers["traceparent"].startswith(f"00-{trace_id}-")
+    server_span = next(span for span in exporter.spans if span.kind == "SERVER")
+    assert server_span.name == "GET /health"
+    assert server_span.trace_id == trace_id
+    assert server_span.attributes["http.response.status_code"] == 200
+
+
+def test_http_span_continues_incoming_traceparent(exporter: InMemorySpanExporter) -> None:
+    client = TestClient(create_app())
+    traceparent = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+    client.get("/health", headers={"traceparent": traceparent})
+
+    server_span = next(span for span in exporter.spans if span.kind == "SERVER")
+    assert server_span.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+    assert server_span.parent_span_id == "00f067aa0ba902b7"